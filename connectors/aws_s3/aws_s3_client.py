@@ -18,7 +18,8 @@ from botocore.exceptions import (
 )
 
 from shared import file_ops
-from shared.file_ops import relpath_matches_filter, compute_prefix_hints
+from shared.file_ops import compile_filter, compute_prefix_hints, disjoint_prefixes
+from shared.listing import DEFAULT_CONCURRENCY, ListingPlan, aiter_plan, iter_plan
 from shared.dsx_logging import dsx_logging
 import tenacity
 
@@ -186,17 +187,14 @@ class AWSS3Client:
         response = self.s3_client.head_object(Bucket=bucket, Key=key)
         return response['ContentLength']
 
-    def keys(self, bucket: str, base_prefix: str = "", filter_str: str = ""):
+    def listing_plan(self, bucket: str, base_prefix: str = "", filter_str: str = "") -> ListingPlan:
         """
-        Yield S3 object keys applying DSXCONNECTOR_FILTER.
-
-        Uses safe prefix narrowing when possible and always verifies with
-        relpath_matches_filter client-side to ensure correctness.
+        Describe the S3 listing for DSXCONNECTOR_FILTER: one ListObjectsV2 paginator per
+        safe prefix hint (or one for the whole base prefix), plus the client-side filter.
         """
         paginator = self.s3_client.get_paginator('list_objects_v2')
         hints = compute_prefix_hints(filter_str or "")
-
-        seen: set[str] = set()
+        matcher = compile_filter(filter_str) if filter_str else None
 
         # Normalize base_prefix to either '' or 'path/'
         bp = (base_prefix or "").strip("/")
@@ -213,33 +211,41 @@ class AWSS3Client:
 
         def _emit(obj):
             key = obj.get('Key') or obj.get('Prefix')
-            if not key or key in seen:
-                return
-            if key.endswith('/'):
-                return
+            if not key or key.endswith('/'):
+                return None
             # Apply filter relative to base_prefix root
             rel = _rel(key)
-            if filter_str and not relpath_matches_filter(rel, filter_str):
-                return
-            seen.add(key)
-            yield obj if 'Size' in obj else {'Key': key}
+            if matcher is not None and not matcher.match(rel):
+                return None
+            return obj if 'Size' in obj else {'Key': key}
+
+        def _source(**paginate_kwargs):
+            def _objects():
+                for page in paginator.paginate(Bucket=bucket, **paginate_kwargs):
+                    yield from page.get('Contents', [])
+            return _objects
 
         if hints:
-            for prefix in sorted(set(hints)):
-                eff = f"{bp}{prefix}" if bp else prefix
-                for page in paginator.paginate(Bucket=bucket, Prefix=eff):
-                    for obj in page.get('Contents', []):
-                        for item in _emit(obj):
-                            yield item
-        else:
-            # Narrow to base_prefix if provided; otherwise whole bucket
-            paginate_kwargs = {'Bucket': bucket}
-            if bp:
-                paginate_kwargs['Prefix'] = bp
-            for page in paginator.paginate(**paginate_kwargs):
-                for obj in page.get('Contents', []):
-                    for item in _emit(obj):
-                        yield item
+            sources = [_source(Prefix=f"{bp}{prefix}" if bp else prefix) for prefix in disjoint_prefixes(hints)]
+            return ListingPlan(sources=sources, emit=_emit)
+        # Narrow to base_prefix if provided; otherwise whole bucket
+        return ListingPlan(sources=[_source(Prefix=bp) if bp else _source()], emit=_emit)
+
+    def keys(self, bucket: str, base_prefix: str = "", filter_str: str = ""):
+        """
+        Yield S3 object keys applying DSXCONNECTOR_FILTER.
+
+        Uses safe prefix narrowing when possible and always verifies with
+        the compiled filter client-side to ensure correctness.
+        """
+        yield from iter_plan(self.listing_plan(bucket, base_prefix, filter_str))
+
+    async def keys_async(self, bucket: str, base_prefix: str = "", filter_str: str = "", *,
+                         concurrency: int = DEFAULT_CONCURRENCY):
+        """Async `keys()`: pages are fetched on the listing pool, prefix hints are listed in parallel."""
+        plan = self.listing_plan(bucket, base_prefix, filter_str)
+        async for item in aiter_plan(plan, concurrency=concurrency):
+            yield item
 
     def list_object_page(
         self,
@@ -277,6 +283,7 @@ class AWSS3Client:
                 return key
             return key[len(bp):] if key.startswith(bp) else key
 
+        matcher = compile_filter(filter_str) if filter_str else None
         page_iterator = paginator.paginate(**paginate_kwargs)
         objects: list[dict[str, Any]] = []
         next_cursor: str | None = None
@@ -285,7 +292,7 @@ class AWSS3Client:
                 key = obj.get("Key")
                 if not key or str(key).endswith("/"):
                     continue
-                if filter_str and not relpath_matches_filter(_rel(str(key)), filter_str):
+                if matcher is not None and not matcher.match(_rel(str(key))):
                     continue
                 objects.append(
                     {
@@ -272,13 +272,23 @@ async def full_scan_handler(
         if getattr(status_response, "status", None) == StatusResponseEnum.SUCCESS:
             count += len(items)
 
-    for key in aws_s3_client.keys(config.asset_bucket, base_prefix=config.asset_prefix_root, filter_str=config.filter):
+    async for key in aws_s3_client.keys_async(
+            config.asset_bucket,
+            base_prefix=config.asset_prefix_root,
+            filter_str=config.filter,
+            concurrency=config.listing_concurrency,
+    ):
         file_name = key['Key']  # full key
         rel_name = _rel(file_name)
         if config.filter and not relpath_matches_filter(rel_name, config.filter):
             continue
         full_path = f"{config.asset_bucket}/{file_name}"
-        req = ScanRequestModel(location=str(file_name), metainfo=full_path)
+        req = ScanRequestModel(
+            location=str(file_name),
+            metainfo=full_path,
+            size_in_bytes=key.get('Size'),
+            object_fingerprint=key.get('ETag'),
+        )
         if use_batch:
             batch_items.append(req)
             if len(batch_items) >= effective_batch_size or (limit and count + len(batch_items) >= limit):
@@ -22,12 +22,12 @@ async def test_full_scan_filters(monkeypatch):
     monkeypatch.setattr(s3c.connector, "scan_file_request", fake_scan)
 
     # Patch client.keys to yield sample keys
-    def fake_keys(bucket, base_prefix: str = "", filter_str: str = ""):
+    async def fake_keys(bucket, base_prefix: str = "", filter_str: str = "", **kwargs):
         yield {"Key": "keep.txt"}
         yield {"Key": "sub/keep2.txt"}
         yield {"Key": "drop.bin"}
 
-    monkeypatch.setattr(s3c.aws_s3_client, "keys", fake_keys)
+    monkeypatch.setattr(s3c.aws_s3_client, "keys_async", fake_keys)
 
     resp = await s3c.full_scan_handler()
     assert resp.status.value == "success"
@@ -54,12 +54,12 @@ async def test_full_scan_batch_filters(monkeypatch):
     monkeypatch.setattr(s3c.connector, "scan_file_request_batch", fake_scan_batch)
     monkeypatch.setattr(s3c.connector, "get_core_scan_batch_capabilities", fake_caps)
 
-    def fake_keys(bucket, base_prefix: str = "", filter_str: str = ""):
+    async def fake_keys(bucket, base_prefix: str = "", filter_str: str = "", **kwargs):
         yield {"Key": "keep.txt"}
         yield {"Key": "sub/keep2.txt"}
         yield {"Key": "drop.bin"}
 
-    monkeypatch.setattr(s3c.aws_s3_client, "keys", fake_keys)
+    monkeypatch.setattr(s3c.aws_s3_client, "keys_async", fake_keys)
 
     resp = await s3c.full_scan_handler(batch=True, batch_size=2)
     assert resp.status.value == "success"
@@ -270,3 +270,24 @@ async def test_write_file_handler_uploads_to_requested_bucket(monkeypatch):
         "uri": "s3://bucket-requested/inbox/payload.txt",
     }
     assert calls == [("bucket-requested", "inbox/payload.txt", b"hello")]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_include_rules_list_each_key_once(monkeypatch):
+    moto = pytest.importorskip("moto")
+    from connectors.aws_s3.aws_s3_client import AWSS3Client
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        client = AWSS3Client()
+        client.s3_client.create_bucket(Bucket="bucket-a")
+        for key in ["a/1.txt", "a/b/2.txt", "a/b/c/3.txt", "ab/4.txt", "z/5.txt"]:
+            client.s3_client.put_object(Bucket="bucket-a", Key=key, Body=b"x")
+
+        filter_str = "a/** a/b/** ab/**"
+        expected = ["a/1.txt", "a/b/2.txt", "a/b/c/3.txt", "ab/4.txt"]
+        assert sorted(k["Key"] for k in client.keys("bucket-a", filter_str=filter_str)) == expected
+        keys = [k["Key"] async for k in client.keys_async("bucket-a", filter_str=filter_str, concurrency=4)]
+        assert sorted(keys) == expected
@@ -20,7 +20,8 @@ from azure.core.exceptions import (
 )
 
 from shared import file_ops
-from shared.file_ops import relpath_matches_filter, compute_prefix_hints
+from shared.file_ops import compile_filter, compute_prefix_hints, disjoint_prefixes
+from shared.listing import DEFAULT_CONCURRENCY, DEFAULT_PAGE_SIZE, ListingPlan, aiter_plan, iter_plan
 from shared.dsx_logging import dsx_logging
 import tenacity
 import base64
@@ -248,112 +249,123 @@ class AzureBlobClient:
 
 
 
+    def listing_plan(self, container: str, base_prefix: str = "", filter_str: str = "",
+                     page_size: int | None = None) -> ListingPlan:
+        """
+        Describe the blob listing for DSXCONNECTOR_FILTER: one list_blobs call per safe
+        name_starts_with hint (or one for the whole base prefix), plus the client-side filter.
+        """
+        self._require_client()
+        container_client = self.service_client.get_container_client(container)
+
+        # Normalize base prefix (virtual folder) to '' or 'path/'
+        bp = (base_prefix or "").strip("/")
+        if bp:
+            bp = bp + "/"
+
+        # Compute conservative name_starts_with hints when possible
+        hints: list[str] = compute_prefix_hints(filter_str or "")
+        matcher = compile_filter(filter_str) if filter_str else None
+
+        def _rel(key: str) -> str:
+            if not bp:
+                return key
+            return key[len(bp):] if key.startswith(bp) else key
+
+        def _emit(blob):
+            key = blob.name
+            rel = _rel(key)
+            if matcher is not None and not matcher.match(rel):
+                return None
+            return {'Key': key, 'Size': getattr(blob, 'size', None), 'ETag': getattr(blob, 'etag', None)}
+
+        def _iter_list(name_starts_with: str | None = None):
+            if page_size and page_size > 0:
+                # Try various SDK signatures for page sizing across azure-core/storage versions
+                if name_starts_with:
+                    try:
+                        pages = container_client.list_blobs(name_starts_with=name_starts_with).by_page(page_size=page_size)
+                        for page in pages:
+                            for blob in page:
+                                yield blob
+                        return
+                    except TypeError:
+                        pass
+                    try:
+                        pages = container_client.list_blobs(name_starts_with=name_starts_with).by_page(results_per_page=page_size)
+                        for page in pages:
+                            for blob in page:
+                                yield blob
+                        return
+                    except TypeError:
+                        pass
+                    try:
+                        # Some versions accept results_per_page on list_blobs directly
+                        for blob in container_client.list_blobs(name_starts_with=name_starts_with, results_per_page=page_size):
+                            yield blob
+                        return
+                    except TypeError:
+                        pass
+                else:
+                    try:
+                        pages = container_client.list_blobs().by_page(page_size=page_size)
+                        for page in pages:
+                            for blob in page:
+                                yield blob
+                        return
+                    except TypeError:
+                        pass
+                    try:
+                        pages = container_client.list_blobs().by_page(results_per_page=page_size)
+                        for page in pages:
+                            for blob in page:
+                                yield blob
+                        return
+                    except TypeError:
+                        pass
+                    try:
+                        for blob in container_client.list_blobs(results_per_page=page_size):
+                            yield blob
+                        return
+                    except TypeError:
+                        pass
+            else:
+                if name_starts_with:
+                    for blob in container_client.list_blobs(name_starts_with=name_starts_with):
+                        yield blob
+                else:
+                    for blob in container_client.list_blobs():
+                        yield blob
+
+        def _source(name_starts_with: str | None):
+            return lambda: _iter_list(name_starts_with=name_starts_with)
+
+        if hints:
+            sources = [_source(f"{bp}{prefix}" if bp else prefix) for prefix in disjoint_prefixes(hints)]
+            return ListingPlan(sources=sources, emit=_emit)
+        return ListingPlan(sources=[_source(bp if bp else None)], emit=_emit)
+
     def keys(self, container: str, base_prefix: str = "", filter_str: str = "", page_size: int | None = None):
         """
         Yield blob keys from a container applying DSXCONNECTOR_FILTER rules.
 
         Uses provider-side prefix narrowing when safe by deriving conservative
         prefixes from the filter (no excludes and only bare path includes), and
-        always applies relpath_matches_filter client-side for correctness.
+        always applies the compiled filter client-side for correctness.
         """
-        self._require_client()
         try:
-            container_client = self.service_client.get_container_client(container)
-
-            # Normalize base prefix (virtual folder) to '' or 'path/'
-            bp = (base_prefix or "").strip("/")
-            if bp:
-                bp = bp + "/"
-
-            # Compute conservative name_starts_with hints when possible
-            hints: list[str] = compute_prefix_hints(filter_str or "")
-
-            seen: set[str] = set()
-
-            def _rel(key: str) -> str:
-                if not bp:
-                    return key
-                return key[len(bp):] if key.startswith(bp) else key
-
-            def _emit(blob):
-                key = blob.name
-                if key in seen:
-                    return
-                rel = _rel(key)
-                if filter_str and not relpath_matches_filter(rel, filter_str):
-                    return
-                seen.add(key)
-                yield {'Key': key, 'Size': getattr(blob, 'size', None)}
-
-            def _iter_list(name_starts_with: str | None = None):
-                if page_size and page_size > 0:
-                    # Try various SDK signatures for page sizing across azure-core/storage versions
-                    if name_starts_with:
-                        try:
-                            pages = container_client.list_blobs(name_starts_with=name_starts_with).by_page(page_size=page_size)
-                            for page in pages:
-                                for blob in page:
-                                    yield blob
-                            return
-                        except TypeError:
-                            pass
-                        try:
-                            pages = container_client.list_blobs(name_starts_with=name_starts_with).by_page(results_per_page=page_size)
-                            for page in pages:
-                                for blob in page:
-                                    yield blob
-                            return
-                        except TypeError:
-                            pass
-                        try:
-                            # Some versions accept results_per_page on list_blobs directly
-                            for blob in container_client.list_blobs(name_starts_with=name_starts_with, results_per_page=page_size):
-                                yield blob
-                            return
-                        except TypeError:
-                            pass
-                    else:
-                        try:
-                            pages = container_client.list_blobs().by_page(page_size=page_size)
-                            for page in pages:
-                                for blob in page:
-                                    yield blob
-                            return
-                        except TypeError:
-                            pass
-                        try:
-                            pages = container_client.list_blobs().by_page(results_per_page=page_size)
-                            for page in pages:
-                                for blob in page:
-                                    yield blob
-                            return
-                        except TypeError:
-                            pass
-                        try:
-                            for blob in container_client.list_blobs(results_per_page=page_size):
-                                yield blob
-                            return
-                        except TypeError:
-                            pass
-                else:
-                    if name_starts_with:
-                        for blob in container_client.list_blobs(name_starts_with=name_starts_with):
-                            yield blob
-                    else:
-                        for blob in container_client.list_blobs():
-                            yield blob
+            yield from iter_plan(self.listing_plan(container, base_prefix, filter_str, page_size))
+        except Exception as e:
+            dsx_logging.error(f"Error listing blobs: {e}")
+            raise
 
-            if hints:
-                for prefix in sorted(set(hints)):
-                    eff = f"{bp}{prefix}" if bp else prefix
-                    for blob in _iter_list(name_starts_with=eff):
-                        for item in _emit(blob):
-                            yield item
-            else:
-                start = bp if bp else None
-                for blob in _iter_list(name_starts_with=start):
-                    for item in _emit(blob):
-                        yield item
+    async def keys_async(self, container: str, base_prefix: str = "", filter_str: str = "",
+                         page_size: int | None = None, *, concurrency: int = DEFAULT_CONCURRENCY):
+        """Async `keys()`: pages are fetched on the listing pool, prefix hints are listed in parallel."""
+        try:
+            plan = self.listing_plan(container, base_prefix, filter_str, page_size)
+            async for item in aiter_plan(plan, concurrency=concurrency, page_size=page_size or DEFAULT_PAGE_SIZE):
+                yield item
         except Exception as e:
             dsx_logging.error(f"Error listing blobs: {e}")
             raise
@@ -198,10 +198,10 @@ async def full_scan_handler(
             )
         batch_items = []
 
-    async def enqueue(key: str, full_path: str):
+    async def enqueue(req: ScanRequestModel, full_path: str):
         nonlocal enq_count, batch_errors
         async with sem:
-            resp = await connector.scan_file_request(ScanRequestModel(location=key, metainfo=full_path))
+            resp = await connector.scan_file_request(req)
             if resp.status == StatusResponseEnum.SUCCESS:
                 enq_count += 1
                 dsx_logging.debug(f"Sent scan request for {full_path}")
@@ -214,18 +214,30 @@ async def full_scan_handler(
             )
 
     page_size = getattr(config, 'list_page_size', None)
-    for blob in abs_client.keys(config.asset_container, base_prefix=config.asset_prefix_root, filter_str=config.filter, page_size=page_size):
+    async for blob in abs_client.keys_async(
+            config.asset_container,
+            base_prefix=config.asset_prefix_root,
+            filter_str=config.filter,
+            page_size=page_size,
+            concurrency=config.listing_concurrency,
+    ):
         key = blob['Key']
         # Final guard with rel path semantics
         if config.filter and not relpath_matches_filter(_rel(key), config.filter):
             continue
         full_path = f"{config.asset_container}/{key}"
+        req = ScanRequestModel(
+            location=key,
+            metainfo=full_path,
+            size_in_bytes=blob.get('Size'),
+            object_fingerprint=blob.get('ETag'),
+        )
         if use_batch:
-            batch_items.append(ScanRequestModel(location=key, metainfo=full_path))
+            batch_items.append(req)
             if len(batch_items) >= effective_batch_size:
                 await _flush_batch()
         else:
-            tasks.append(asyncio.create_task(enqueue(key, full_path)))
+            tasks.append(asyncio.create_task(enqueue(req, full_path)))
 
             # Batch-gather to bound memory and provide steady backpressure
             if len(tasks) >= 200:
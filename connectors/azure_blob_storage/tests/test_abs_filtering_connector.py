@@ -22,12 +22,12 @@ async def test_full_scan_filters(monkeypatch):
     monkeypatch.setattr(ac.abs_client, "is_configured", lambda: True)
     monkeypatch.setattr(ac.connector, "scan_file_request", fake_scan)
 
-    def fake_keys(container, base_prefix: str = "", filter_str: str = "", page_size=None):
+    async def fake_keys(container, base_prefix: str = "", filter_str: str = "", page_size=None, **kwargs):
         yield {"Key": "sub1/a.txt"}
         yield {"Key": "sub1/tmp/skip.txt"}
         yield {"Key": "sub2/z.txt"}
 
-    monkeypatch.setattr(ac.abs_client, "keys", fake_keys)
+    monkeypatch.setattr(ac.abs_client, "keys_async", fake_keys)
 
     resp = await ac.full_scan_handler()
     assert resp.status.value == "success"
@@ -56,13 +56,13 @@ async def test_full_scan_batch_filters(monkeypatch):
     monkeypatch.setattr(ac.connector, "scan_file_request_batch", fake_scan_batch)
     monkeypatch.setattr(ac.connector, "get_core_scan_batch_capabilities", fake_caps)
 
-    def fake_keys(container, base_prefix: str = "", filter_str: str = "", page_size=None):
+    async def fake_keys(container, base_prefix: str = "", filter_str: str = "", page_size=None, **kwargs):
         yield {"Key": "sub1/a.txt"}
         yield {"Key": "sub1/b.txt"}
         yield {"Key": "sub1/tmp/skip.txt"}
         yield {"Key": "sub2/z.txt"}
 
-    monkeypatch.setattr(ac.abs_client, "keys", fake_keys)
+    monkeypatch.setattr(ac.abs_client, "keys_async", fake_keys)
 
     resp = await ac.full_scan_handler(batch=True, batch_size=2)
     assert resp.status.value == "success"
@@ -108,3 +108,30 @@ async def test_item_action_movetag_uses_requested_destination_filename(monkeypat
         ("tag", "container-a", "scan/eicar.txt", {"Verdict": "Malicious"}),
         ("move", "container-a", "scan/eicar.txt", "container-a", "quarantine/eicar.txt_c23bbf85bc"),
     ]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_include_rules_list_each_key_once():
+    from types import SimpleNamespace
+
+    from connectors.azure_blob_storage.azure_blob_storage_client import AzureBlobClient
+
+    names = ["a/1.txt", "a/b/2.txt", "a/b/c/3.txt", "ab/4.txt", "z/5.txt"]
+    listed = []
+
+    class FakeContainerClient:
+        def list_blobs(self, name_starts_with=None, **kwargs):
+            listed.append(name_starts_with)
+            return [SimpleNamespace(name=n, size=1, etag="e") for n in names if n.startswith(name_starts_with or "")]
+
+    client = AzureBlobClient.__new__(AzureBlobClient)
+    client.service_client = SimpleNamespace(get_container_client=lambda container: FakeContainerClient())
+    client.init_error = None
+
+    filter_str = "a/** a/b/** ab/**"
+    expected = ["a/1.txt", "a/b/2.txt", "a/b/c/3.txt", "ab/4.txt"]
+    assert sorted(k["Key"] for k in client.keys("container-a", filter_str=filter_str)) == expected
+    keys = [k["Key"] async for k in client.keys_async("container-a", filter_str=filter_str, concurrency=4)]
+    assert sorted(keys) == expected
+    # 'a/b/' is nested under 'a/' and is not listed separately
+    assert sorted(listed) == ["a/", "a/", "ab/", "ab/"]
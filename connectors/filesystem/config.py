@@ -52,11 +52,36 @@ class FilesystemConnectorConfig(BaseConnectorConfig):
     monitor: bool = False
     monitor_force_polling: bool = False
     monitor_poll_interval_ms: int = 1000
+    monitor_debounce_ms: int = Field(
+        default=1000,
+        ge=0,
+        description="Quiet period after the last event for a file before it is checked and queued for scanning.",
+    )
+    monitor_max_wait_ms: int = Field(
+        default=60000,
+        ge=0,
+        description="Scan a file that is still changing once it has waited this long since its first event.",
+    )
+    monitor_batch_size: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum settled files sent per monitor flush (capped by the core batch max size).",
+    )
+    monitor_max_pending: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum files waiting to settle; when full the monitor waits briefly, then drops events.",
+    )
     full_scan_enqueue_concurrency: int = Field(
         default=8,
         ge=1,
         description="Maximum concurrent single-item enqueue requests during full scan when batch mode is off.",
     )
+    full_scan_walk_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Threads scanning directories in parallel during a full scan (helps most on NFS/SMB mounts).",
+    )
 
     # Quarantine handling
     quarantine_mount: str = Field("/app/quarantine", description="In-container path for quarantine/move destinations")
@@ -4,13 +4,15 @@ import json
 import os
 import pathlib
 import shutil
+import stat
 import time
 
 import uvicorn
 
-from starlette.responses import StreamingResponse
+from starlette.responses import FileResponse
 
 from shared.file_ops import get_filepaths_async
+from shared.fs_walk import WalkFilter, aiter_walk
 from connectors.framework.dsx_connector import DSXConnector, apply_requested_action_config_update, resolve_item_action_request
 from shared.models.connector_models import AssetDiscoveryItem, AssetDiscoveryResponse, ScanRequestModel, ItemActionEnum, \
     ConnectorInstanceModel, ConnectorStatusEnum
@@ -36,8 +38,8 @@ except Exception:
             self.poll_interval_ms = poll_interval_ms
         def start(self):
             dsx_logging.info("FilesystemMonitor not installed; monitor disabled.")
-from shared.async_ops import run_async
 from connectors.filesystem.config import ConfigManager
+from connectors.filesystem.monitor_pipeline import MonitorPipeline
 from connectors.filesystem.version import CONNECTOR_VERSION
 from shared.log_sanitizer import config_for_log
 
@@ -89,6 +91,55 @@ def _quarantine_paths() -> list[pathlib.Path]:
     return uniq
 
 
+async def _full_scan_requests(quarantine_paths: list[pathlib.Path]):
+    """
+    Yield a ScanRequestModel per file in the asset that passes the filter.
+
+    Uses the parallel scandir walker, whose records already carry size and mtime, so no
+    file is stat'ed or resolved here. Quarantine folders inside the asset are pruned from
+    the walk. Filters the walker does not support (includes outside the asset) fall back
+    to get_filepaths_async plus a stat per file.
+    """
+    base = pathlib.Path(config.asset)
+    base_resolved = _normalize_path(base)
+    if WalkFilter(config.filter).supported:
+        skip_dirs: list[str] = []
+        for qp in quarantine_paths:
+            if _is_under(base_resolved, qp):
+                dsx_logging.warning(f"Skipping full scan of {base}: asset is inside quarantine path {qp}")
+                return
+            if _is_under(qp, base_resolved):
+                skip_dirs.append(qp.relative_to(base_resolved).as_posix())
+        async for rec in aiter_walk(base, config.filter, workers=config.full_scan_walk_workers, skip_dirs=skip_dirs):
+            yield ScanRequestModel(
+                location=rec.path,
+                metainfo=rec.name,
+                size_in_bytes=rec.size,
+                object_fingerprint=str(rec.mtime_ns),
+            )
+        return
+
+    async for file_path in get_filepaths_async(base, config.filter):
+        p = _normalize_path(file_path)
+        if any(_is_under(p, qp) for qp in quarantine_paths):
+            dsx_logging.debug(f"Skipping {p} (quarantine path)")
+            continue
+        size_hint = None
+        fingerprint = None
+        try:
+            st = p.stat()
+            size_hint = st.st_size
+            fingerprint = str(st.st_mtime_ns)
+        except Exception:
+            pass
+        yield ScanRequestModel(
+            location=str(file_path),
+            metainfo=file_path.name,
+            size_in_bytes=size_hint,
+            object_fingerprint=fingerprint,
+        )
+
+
 def _resolve_requested_item_action(scan_request: ScanRequestModel) -> tuple[ItemActionEnum, str | None, dict[str, str]]:
     resolved = resolve_item_action_request(
         scan_request,
@@ -183,6 +234,24 @@ def _asset_discovery_item(path: pathlib.Path, *, root: pathlib.Path) -> AssetDis
     )
 
 
+async def _flush_monitor_requests(requests: list[ScanRequestModel]) -> None:
+    """Send settled monitor events: batched when core batch mode is on, one by one otherwise."""
+    caps = await connector.get_core_scan_batch_capabilities() if len(requests) > 1 else {}
+    if bool(caps.get("enabled", False)):
+        size = min(len(requests), max(1, int(caps.get("max_size", 100))))
+        for i in range(0, len(requests), size):
+            chunk = requests[i:i + size]
+            resp = await connector.scan_file_request_batch(chunk, batch_size=size)
+            if resp.status != StatusResponseEnum.SUCCESS:
+                dsx_logging.warning(
+                    f"Monitor batch enqueue failed for {len(chunk)} item(s): {resp.message} ({resp.description})"
+                )
+        return
+    for req in requests:
+        dsx_logging.debug(f"Sending scan request for {req.location}")
+        await connector.webhook_handler(req)
+
+
 # given that this could potentially be a lengthy file iteration, make the iteration asynchronous...
 # TODO possibly should allow startup of FAstAPI to complete, and schedule full scans in the background
 async def start_monitor():
@@ -190,22 +259,21 @@ async def start_monitor():
     Create a filesystem monitor and capture the file information to send to the webhook/event.
     """
     if config.monitor:
+        pipeline = MonitorPipeline(
+            _flush_monitor_requests,
+            debounce_ms=config.monitor_debounce_ms,
+            max_wait_ms=config.monitor_max_wait_ms,
+            batch_size=config.monitor_batch_size,
+            max_pending=config.monitor_max_pending,
+        )
+
         class MonitorCallback(FilesystemMonitorCallback):
             def __init__(self):
                 super().__init__()
 
             def file_modified_callback(self, file_path: pathlib.Path):
-                dsx_logging.debug(f'Sending scan request for {file_path}')
-                size_hint = None
-                try:
-                    size_hint = file_path.stat().st_size
-                except Exception:
-                    pass
-                run_async(
-                    connector.webhook_handler(
-                        ScanRequestModel(location=str(file_path), metainfo=file_path.name, size_in_bytes=size_hint)
-                    )
-                )
+                if not pipeline.submit(file_path):
+                    dsx_logging.warning(f"Monitor queue full; dropped event for {file_path}")
 
         # Determine quarantine path relative to asset if a relative path is supplied
         raw_quarantine = config.item_action_move_metainfo or ""
@@ -241,6 +309,8 @@ async def start_monitor():
             poll_interval_ms=int(getattr(config, 'monitor_poll_interval_ms', 1000)),
             ignore_paths=ignore_paths,
         )
+        connector.monitor_pipeline = pipeline
+        pipeline.start()
         connector.filesystem_monitor.start()
         dsx_logging.info(f"Monitor set on {watch_path} for new or modified files with filter: {config.filter}")
     else:
@@ -276,6 +346,13 @@ async def startup_event(base: ConnectorInstanceModel) -> ConnectorInstanceModel:
 
 @connector.shutdown
 async def shutdown_event():
+    monitor = getattr(connector, "filesystem_monitor", None)
+    if monitor is not None and hasattr(monitor, "stop"):
+        monitor.stop()
+    pipeline = getattr(connector, "monitor_pipeline", None)
+    if pipeline is not None:
+        await asyncio.to_thread(pipeline.stop, drain=True)
+        dsx_logging.info(f"Monitor pipeline stopped: {pipeline.stats()}")
     dsx_logging.info(f"{config.name} shutdown completed.")
 
 
@@ -342,12 +419,12 @@ async def full_scan_handler(
             )
         batch_items = []
 
-    async def _enqueue_single(req: ScanRequestModel, file_path: pathlib.Path) -> bool:
+    async def _enqueue_single(req: ScanRequestModel) -> bool:
         request_started_at = time.perf_counter()
         status_response = await connector.scan_file_request(req)
         request_elapsed_ms = (time.perf_counter() - request_started_at) * 1000.0
         dsx_logging.debug(
-            f"Sent scan request for {file_path}, result: {status_response}, elapsed_ms={request_elapsed_ms:.1f}"
+            f"Sent scan request for {req.location}, result: {status_response}, elapsed_ms={request_elapsed_ms:.1f}"
         )
         return status_response.status == StatusResponseEnum.SUCCESS
 
@@ -366,19 +443,7 @@ async def full_scan_handler(
 
     pending_single: set[asyncio.Task[bool]] = set()
 
-    async for file_path in get_filepaths_async(
-            pathlib.Path(config.asset),
-            config.filter):
-        p = _normalize_path(file_path)
-        if any(_is_under(p, qp) for qp in quarantine_paths):
-            dsx_logging.debug(f"Skipping {p} (quarantine path)")
-            continue
-        size_hint = None
-        try:
-            size_hint = p.stat().st_size
-        except Exception:
-            pass
-        req = ScanRequestModel(location=str(file_path), metainfo=file_path.name, size_in_bytes=size_hint)
+    async for req in _full_scan_requests(quarantine_paths):
         seen += 1
         if use_batch:
             batch_items.append(req)
@@ -386,10 +451,10 @@ async def full_scan_handler(
                 await _flush_batch()
         else:
             if enqueue_concurrency <= 1:
-                if await _enqueue_single(req, file_path):
+                if await _enqueue_single(req):
                     count += 1
             else:
-                pending_single.add(asyncio.create_task(_enqueue_single(req, file_path)))
+                pending_single.add(asyncio.create_task(_enqueue_single(req)))
                 if len(pending_single) >= enqueue_concurrency:
                     pending_single = await _drain_pending(pending_single)
         if seen % progress_log_every == 0:
@@ -655,38 +720,40 @@ async def item_action_handler(scan_event_queue_info: ScanRequestModel) -> Status
                                     message="Item action did nothing or not implemented")
 
 
-def stream_file(file_like, chunk_size: int = 1024 * 1024):
-    while True:
-        chunk = file_like.read(chunk_size)
-        if not chunk:
-            break
-        yield chunk
+_READ_CHUNK_SIZE = 1024 * 1024
 
 
 @connector.read_file
-async def read_file_handler(scan_request_info: ScanRequestModel) -> StreamingResponse | StatusResponse:
+async def read_file_handler(scan_request_info: ScanRequestModel) -> FileResponse | StatusResponse:
+    """
+    Serve the file as-is with FileResponse.
+
+    FileResponse honours Range/If-Range (so proxy readers can fetch parts in parallel),
+    sends Content-Length/ETag/Last-Modified, and hands the path to the server via the
+    ASGI pathsend extension where the server supports it. Otherwise it reads 1 MiB
+    chunks off the event loop rather than iterating a generator through the threadpool.
+    """
     file_path = _normalize_path(scan_request_info.location)
 
-    # Check if the file exists
-    if not file_path.is_file():
+    try:
+        st = file_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         return StatusResponse(status=StatusResponseEnum.ERROR,
                               message=f"File {file_path} not found")
 
     # Provide file size hint to downstream (if not already set)
-    try:
-        if not getattr(scan_request_info, "size_in_bytes", None):
-            size = file_path.stat().st_size
-            scan_request_info.size_in_bytes = size
-    except Exception:
-        pass
+    if not getattr(scan_request_info, "size_in_bytes", None):
+        scan_request_info.size_in_bytes = st.st_size
 
-    # Read the file content
-    try:
-        file_like = file_path.open("rb")  # Open file in binary mode
-        return StreamingResponse(stream_file(file_like), media_type="application/octet-stream")  # Stream file
-    except Exception as e:
+    # Fail here with a JSON error rather than mid-response
+    if not os.access(file_path, os.R_OK):
         return StatusResponse(status=StatusResponseEnum.ERROR,
-                              message=f"Failed to read file: {str(e)}")
+                              message=f"Failed to read file: permission denied: {file_path}")
+    response = FileResponse(file_path, stat_result=st, media_type="application/octet-stream")
+    response.chunk_size = _READ_CHUNK_SIZE
+    return response
 
 
 @connector.repo_check
@@ -0,0 +1,291 @@
+"""
+Coalescing pipeline between the filesystem monitor and the connector.
+
+The monitor reports every added/modified event. A large copy, or a build writing
+into the asset, produces dozens of events per file, and each one used to become
+its own stat() and scan request. `MonitorPipeline` sits between the two:
+
+- `submit()` is called on the monitor thread and only records the path. A path
+  that is already pending is not queued again; its debounce deadline moves out.
+- When a path has been quiet for the debounce window it is stat'ed. If size or
+  mtime changed since the last look, the file is still being written and the
+  path waits another window. A file that keeps changing is sent anyway after
+  `max_wait_ms`, so a growing log is still scanned now and then.
+- Settled files become ScanRequestModel items (size and mtime fingerprint
+  included) and are handed to `flush` in batches of up to `batch_size`.
+- At most `max_pending` paths are held. When full, `submit()` blocks the monitor
+  thread for up to `block_timeout_ms` and then drops the event. Both are counted
+  in `stats()`.
+
+`flush` is an async callable run on the pipeline's own thread and event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from shared.dsx_logging import dsx_logging
+from shared.models.connector_models import ScanRequestModel
+
+FlushFn = Callable[[list[ScanRequestModel]], Awaitable[Any]]
+
+
+@dataclass(slots=True)
+class _Pending:
+    path: str
+    first_seen: float
+    deadline: float
+    size: Optional[int]
+    mtime_ns: Optional[int]
+    events: int = 1
+
+
+class MonitorPipeline:
+
+    def __init__(
+            self,
+            flush: FlushFn,
+            *,
+            debounce_ms: int = 1000,
+            max_wait_ms: int = 60000,
+            batch_size: int = 50,
+            max_pending: int = 10000,
+            block_timeout_ms: int = 1000,
+    ):
+        self._flush = flush
+        self._debounce = max(0.0, debounce_ms / 1000.0)
+        self._max_wait = max(self._debounce, max_wait_ms / 1000.0)
+        self._batch_size = max(1, int(batch_size))
+        self._max_pending = max(1, int(max_pending))
+        self._block_timeout = max(0.0, block_timeout_ms / 1000.0)
+        self._pending: dict[str, _Pending] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._drain = True
+        self._stats = {
+            "events": 0,            # submit() calls
+            "coalesced": 0,         # events for a path that was already pending
+            "unstable": 0,          # settle checks that found the file still changing
+            "forced": 0,            # files sent while still changing, after max_wait_ms
+            "vanished": 0,          # files gone (or unreadable) before they settled
+            "blocked": 0,           # submit() calls that waited for space
+            "blocked_seconds": 0.0,
+            "dropped": 0,           # events dropped because the queue stayed full
+            "flushed": 0,           # scan requests handed to flush
+            "batches": 0,
+            "flush_errors": 0,
+            "max_pending_seen": 0,
+        }
+
+    # -- monitor side --------------------------------------------------------
+
+    def submit(self, path: str | os.PathLike) -> bool:
+        """Record an event for `path`. Returns False if it was dropped."""
+        key = os.fspath(path)
+        now = time.monotonic()
+        with self._lock:
+            self._stats["events"] += 1
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry.events += 1
+                entry.deadline = min(now + self._debounce, entry.first_seen + self._max_wait)
+                self._stats["coalesced"] += 1
+                return True
+            if len(self._pending) >= self._max_pending and not self._stopping:
+                self._stats["blocked"] += 1
+                started = time.monotonic()
+                self._space.wait_for(
+                    lambda: len(self._pending) < self._max_pending or self._stopping,
+                    timeout=self._block_timeout,
+                )
+                self._stats["blocked_seconds"] += time.monotonic() - started
+                now = time.monotonic()
+            if self._stopping or len(self._pending) >= self._max_pending:
+                self._stats["dropped"] += 1
+                return False
+        # Baseline for the settle check; taken once per queued path, outside the lock
+        size, mtime_ns = self._stat(key)
+        with self._lock:
+            if key in self._pending:
+                self._pending[key].events += 1
+                self._stats["coalesced"] += 1
+                return True
+            deadline = now + self._debounce
+            self._pending[key] = _Pending(key, now, deadline, size, mtime_ns)
+            heapq.heappush(self._deadlines, (deadline, key))
+            self._stats["max_pending_seen"] = max(self._stats["max_pending_seen"], len(self._pending))
+        self._notify()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["pending"] = len(self._pending)
+        return out
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        ready = threading.Event()
+
+        def _run():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            self._wake = asyncio.Event()
+            ready.set()
+            try:
+                loop.run_until_complete(self._run())
+            finally:
+                self._loop = None
+                loop.close()
+
+        self._thread = threading.Thread(target=_run, name="filesystem-monitor-pipeline", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self, drain: bool = True, timeout: float = 30.0) -> None:
+        """Stop the pipeline. With `drain`, pending paths are sent without waiting to settle."""
+        with self._lock:
+            self._stopping = True
+            self._drain = drain
+            self._space.notify_all()
+        self._notify()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                dsx_logging.warning("Monitor pipeline did not shut down cleanly within timeout")
+        self._thread = None
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
+
+    # -- flusher -------------------------------------------------------------
+
+    @staticmethod
+    def _stat(path: str) -> tuple[Optional[int], Optional[int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        return st.st_size, st.st_mtime_ns
+
+    def _take_due(self, now: float, everything: bool) -> tuple[list[_Pending], Optional[float]]:
+        """
+        Remove pending entries whose deadline has passed; also return the next deadline.
+
+        Taken entries leave `_pending`, so an event that arrives while one is being
+        settled or sent queues the path again instead of being folded into a scan
+        that already stat'ed the file.
+        """
+        due: list[_Pending] = []
+        with self._lock:
+            while self._deadlines:
+                deadline, key = self._deadlines[0]
+                entry = self._pending.get(key)
+                if entry is None:
+                    heapq.heappop(self._deadlines)
+                    continue
+                if entry.deadline != deadline:
+                    # Deadline moved by a later event; re-file under the new one
+                    heapq.heapreplace(self._deadlines, (entry.deadline, key))
+                    continue
+                if not everything and (deadline > now or len(due) >= self._batch_size):
+                    break
+                heapq.heappop(self._deadlines)
+                del self._pending[key]
+                due.append(entry)
+            if due:
+                self._space.notify_all()
+            return due, (self._deadlines[0][0] if self._deadlines else None)
+
+    def _settle(self, entries: list[_Pending], now: float, everything: bool) -> list[ScanRequestModel]:
+        ready: list[ScanRequestModel] = []
+        requeue: list[_Pending] = []
+        vanished = forced = unstable = 0
+        for entry in entries:
+            size, mtime_ns = self._stat(entry.path)
+            if size is None:
+                vanished += 1
+                dsx_logging.debug(f"Monitor pipeline: {entry.path} is gone; not scanning")
+                continue
+            if (size, mtime_ns) != (entry.size, entry.mtime_ns) and not everything:
+                if now - entry.first_seen < self._max_wait:
+                    entry.size, entry.mtime_ns = size, mtime_ns
+                    entry.deadline = min(now + self._debounce, entry.first_seen + self._max_wait)
+                    requeue.append(entry)
+                    unstable += 1
+                    continue
+                forced += 1
+            ready.append(ScanRequestModel(
+                location=entry.path,
+                metainfo=os.path.basename(entry.path),
+                size_in_bytes=size,
+                object_fingerprint=str(mtime_ns),
+            ))
+        with self._lock:
+            for entry in requeue:
+                newer = self._pending.get(entry.path)
+                if newer is not None:
+                    # Re-queued by an event meanwhile; keep that entry but not its later start
+                    newer.first_seen = min(newer.first_seen, entry.first_seen)
+                    newer.events += entry.events
+                    continue
+                self._pending[entry.path] = entry
+                heapq.heappush(self._deadlines, (entry.deadline, entry.path))
+            self._stats["vanished"] += vanished
+            self._stats["unstable"] += unstable
+            self._stats["forced"] += forced
+        return ready
+
+    async def _send(self, batch: list[ScanRequestModel]) -> None:
+        try:
+            await self._flush(batch)
+        except Exception as e:
+            with self._lock:
+                self._stats["flush_errors"] += 1
+            dsx_logging.error(f"Monitor pipeline: flushing {len(batch)} scan request(s) failed: {e}")
+            return
+        with self._lock:
+            self._stats["flushed"] += len(batch)
+            self._stats["batches"] += 1
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            with self._lock:
+                stopping, drain = self._stopping, self._drain
+            if stopping and not drain:
+                return
+            now = time.monotonic()
+            due, next_deadline = self._take_due(now, everything=stopping)
+            if due:
+                ready = self._settle(due, now, everything=stopping)
+                for i in range(0, len(ready), self._batch_size):
+                    await self._send(ready[i:i + self._batch_size])
+                continue
+            if stopping:
+                return
+            self._wake.clear()
+            timeout = None if next_deadline is None else max(0.0, next_deadline - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
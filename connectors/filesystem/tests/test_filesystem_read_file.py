@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from shared.models.connector_models import ScanRequestModel
+
+
+def _client(location: str) -> TestClient:
+    from connectors.filesystem import filesystem_connector as fsconn
+
+    async def read_file(request):
+        return await fsconn.read_file_handler(ScanRequestModel(location=location, metainfo=Path(location).name))
+
+    return TestClient(Starlette(routes=[Route("/read_file", read_file, methods=["POST"])]))
+
+
+def test_read_file_serves_whole_file_and_byte_ranges(tmp_path):
+    sample = tmp_path / "sample.bin"
+    sample.write_bytes(bytes(range(100)))
+    client = _client(str(sample))
+
+    full = client.post("/read_file")
+    assert full.status_code == 200
+    assert full.content == bytes(range(100))
+    assert full.headers["content-length"] == "100"
+    assert full.headers["accept-ranges"] == "bytes"
+
+    part = client.post("/read_file", headers={"Range": "bytes=10-19"})
+    assert part.status_code == 206
+    assert part.content == bytes(range(10, 20))
+    assert part.headers["content-range"] == "bytes 10-19/100"
+
+    stale = client.post("/read_file", headers={"Range": "bytes=10-19", "If-Range": '"not-the-etag"'})
+    assert stale.status_code == 200
+    assert len(stale.content) == 100
+
+
+def test_read_file_missing_returns_error_status(tmp_path):
+    from connectors.filesystem import filesystem_connector as fsconn
+
+    missing = tmp_path / "missing.bin"
+    resp = asyncio.run(fsconn.read_file_handler(ScanRequestModel(location=str(missing), metainfo=missing.name)))
+    assert resp.status.value == "error"
@@ -18,10 +18,6 @@ async def test_full_scan_handler_uses_bounded_enqueue_concurrency(tmp_path, monk
         path.write_text(f"file {idx}")
         files.append(path)
 
-    async def fake_get_filepaths_async(_root, _filter):
-        for path in files:
-            yield path
-
     in_flight = 0
     max_in_flight = 0
     seen_locations: list[str] = []
@@ -35,7 +31,6 @@ async def test_full_scan_handler_uses_bounded_enqueue_concurrency(tmp_path, monk
         in_flight -= 1
         return StatusResponse(status=StatusResponseEnum.SUCCESS, message="ok")
 
-    monkeypatch.setattr(fsconn, "get_filepaths_async", fake_get_filepaths_async)
     monkeypatch.setattr(fsconn.connector, "scan_file_request", fake_scan_file_request)
     monkeypatch.setattr(fsconn.config, "asset", str(tmp_path))
     monkeypatch.setattr(fsconn.config, "filter", "")
@@ -44,6 +39,42 @@ async def test_full_scan_handler_uses_bounded_enqueue_concurrency(tmp_path, monk
     response = await fsconn.full_scan_handler()
 
     assert response.status == StatusResponseEnum.SUCCESS
-    assert len(seen_locations) == len(files)
+    assert sorted(seen_locations) == sorted(str(p) for p in files)
     assert max_in_flight >= 2
     assert max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_full_scan_requests_carry_walk_stat_and_skip_quarantine(tmp_path, monkeypatch):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from connectors.filesystem import filesystem_connector as fsconn
+
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.txt").write_text("hello")
+    (tmp_path / "quarantine").mkdir()
+    (tmp_path / "quarantine" / "bad.exe").write_text("x")
+
+    requests = []
+
+    async def fake_scan_file_request(scan_request):
+        requests.append(scan_request)
+        return StatusResponse(status=StatusResponseEnum.SUCCESS, message="ok")
+
+    def no_stat(self, *args, **kwargs):
+        raise AssertionError("full scan should not stat files itself")
+
+    monkeypatch.setattr(fsconn.connector, "scan_file_request", fake_scan_file_request)
+    monkeypatch.setattr(fsconn.config, "asset", str(tmp_path))
+    monkeypatch.setattr(fsconn.config, "filter", "")
+    monkeypatch.setattr(fsconn.config, "item_action_move_metainfo", str(tmp_path / "quarantine"))
+    monkeypatch.setattr(fsconn.config, "quarantine_host", None)
+    monkeypatch.setattr(fsconn.config, "full_scan_enqueue_concurrency", 1)
+
+    expected_mtime = str((tmp_path / "docs" / "a.txt").stat().st_mtime_ns)
+    monkeypatch.setattr(Path, "stat", no_stat)
+    response = await fsconn.full_scan_handler()
+
+    assert response.status == StatusResponseEnum.SUCCESS
+    assert [(r.location, r.metainfo, r.size_in_bytes, r.object_fingerprint) for r in requests] == [
+        (str(tmp_path / "docs" / "a.txt"), "a.txt", 5, expected_mtime)
+    ]
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from connectors.filesystem.monitor_pipeline import MonitorPipeline
+
+
+class _Recorder:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.flushed = threading.Event()
+
+    async def __call__(self, requests):
+        self.batches.append([r.location for r in requests])
+        self.flushed.set()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_repeated_events_for_a_path_become_one_scan_request(tmp_path):
+    files = [tmp_path / f"f{i}.bin" for i in range(5)]
+    for f in files:
+        f.write_bytes(b"x" * 10)
+    rec = _Recorder()
+    pipeline = MonitorPipeline(rec, debounce_ms=50, batch_size=10)
+    pipeline.start()
+    try:
+        for _ in range(20):
+            for f in files:
+                pipeline.submit(f)
+        assert _wait_for(lambda: pipeline.stats()["flushed"] == 5)
+    finally:
+        pipeline.stop()
+    assert sorted(loc for batch in rec.batches for loc in batch) == sorted(str(f) for f in files)
+    stats = pipeline.stats()
+    assert stats["events"] == 100
+    assert stats["coalesced"] == 95
+    assert stats["batches"] == len(rec.batches) <= 2
+
+
+def test_file_still_being_written_waits_until_size_is_stable(tmp_path):
+    target = tmp_path / "big.iso"
+    target.write_bytes(b"")
+    rec = _Recorder()
+    pipeline = MonitorPipeline(rec, debounce_ms=40, batch_size=10)
+    pipeline.start()
+    try:
+        pipeline.submit(target)
+        # Writer appends without the monitor reporting every chunk
+        for _ in range(6):
+            with target.open("ab") as f:
+                f.write(b"x" * 1024)
+            time.sleep(0.03)
+        assert _wait_for(rec.flushed.is_set)
+    finally:
+        pipeline.stop()
+    stats = pipeline.stats()
+    assert stats["unstable"] >= 1
+    assert rec.batches == [[str(target)]]
+
+
+def test_full_queue_blocks_then_drops_and_drain_flushes_on_stop(tmp_path):
+    rec = _Recorder()
+    pipeline = MonitorPipeline(rec, debounce_ms=60000, max_pending=2, block_timeout_ms=20, batch_size=10)
+    pipeline.start()
+    try:
+        assert pipeline.submit(tmp_path / "a")
+        assert pipeline.submit(tmp_path / "b")
+        assert not pipeline.submit(tmp_path / "c")
+        stats = pipeline.stats()
+        assert (stats["blocked"], stats["dropped"], stats["pending"]) == (1, 1, 2)
+        assert stats["blocked_seconds"] > 0
+        (tmp_path / "a").write_text("a")
+    finally:
+        pipeline.stop(drain=True)
+    # Drained on stop without waiting out the debounce; 'b' never existed
+    assert rec.batches == [[str(tmp_path / "a")]]
+    assert pipeline.stats()["vanished"] == 1
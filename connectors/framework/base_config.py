@@ -84,6 +84,25 @@ class BaseConnectorConfig(BaseSettings):
     verify_tls: bool = Field(default=True, description="Verify TLS when making outbound HTTP calls")
     ca_bundle: Optional[str] = Field(default=None, description="Optional CA bundle path for outbound verification")
 
+    # Incremental full scans (object state index)
+    full_scan_state_index: bool = Field(
+        default=False,
+        description="Record enqueued objects in a local SQLite index so full scans can run with mode=incremental.",
+    )
+    full_scan_state_index_path: str = Field(
+        default="",
+        description="Optional index file path; defaults to <DSXCONNECTOR_DATA_DIR>/<name>_object_state.sqlite3.",
+    )
+    full_scan_scanner_version: str = Field(
+        default="",
+        description="Scanner version recorded with each object; objects enqueued under another version are rescanned.",
+    )
+    # Full-scan listing (cloud storage connectors)
+    listing_concurrency: int = Field(
+        default=4,
+        description="Prefix hints listed in parallel during a full scan; listing runs on a dedicated thread pool.",
+    )
+
     class Config:
         env_prefix = "DSXCONNECTOR_"
         env_file = ".env"
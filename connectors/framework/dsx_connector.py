@@ -9,7 +9,7 @@ import uuid
 from dataclasses import dataclass
 
 from random import random
-from typing import Any
+from typing import Any, Literal
 from contextlib import asynccontextmanager
 from fastapi.encoders import jsonable_encoder
 from fastapi import FastAPI, APIRouter, Request, BackgroundTasks, Depends, HTTPException, Query
@@ -33,11 +33,14 @@ from connectors.framework.auth_hmac import (
     auth_enabled as connector_auth_enabled,
 )
 from connectors.framework.dsx_connect_sdk_loader import load_sdk
+from connectors.framework.object_state_index import IncrementalScanState, ObjectStateIndex, default_object_state_index_path
 from pydantic import SecretStr
 
 # Context variable to propagate a scan job id during full_scan
 _SCAN_JOB_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar("scan_job_id", default=None)
 _SCAN_ENQ_COUNTER: contextvars.ContextVar[int] = contextvars.ContextVar("scan_enq_counter", default=0)
+# Object state index view for the running full scan (None when the index is disabled)
+_SCAN_STATE: contextvars.ContextVar[IncrementalScanState | None] = contextvars.ContextVar("scan_state", default=None)
 
 # Legacy API key auth removed; HMAC verification now guards private routes when enabled.
 
@@ -321,6 +324,8 @@ class DSXConnector:
         # Optional estimate provider: returns {"count": int|None, "confidence": "exact"|"unknown"}
         self.estimate_provider: Optional[Callable[[], Awaitable[dict]]] = None
         self._reg_retry_task: asyncio.Task | None = None
+        # Lazily opened on the first full scan when full_scan_state_index is enabled.
+        self._object_state_index: ObjectStateIndex | None = None
         # --- heartbeat (refreshes presence/TTL via register endpoint) ---
         self._hb_task: asyncio.Task | None = None
         self.HEARTBEAT_INTERVAL_SECONDS: int = 60  # <= half of server TTL (120s) is safe
@@ -422,6 +427,13 @@ class DSXConnector:
             if self.shutdown_handler:
                 await self.shutdown_handler()
 
+            if self._object_state_index is not None:
+                try:
+                    self._object_state_index.close()
+                except Exception as e:
+                    dsx_logging.warning(f"Object state index close failed: {e}")
+                self._object_state_index = None
+
         docs_enabled = not connector_auth_enabled()
         return FastAPI(
             title=f"{self.connector_running_model.name} [dsx-connector]",
@@ -877,6 +889,23 @@ class DSXConnector:
         except Exception:
             return False
 
+    def object_state_index(self) -> ObjectStateIndex | None:
+        """Return the persistent object state index, or None when full_scan_state_index is disabled."""
+        if not bool(getattr(self.connector_config, "full_scan_state_index", False)):
+            return None
+        if self._object_state_index is None:
+            path = str(getattr(self.connector_config, "full_scan_state_index_path", "") or "").strip()
+            self._object_state_index = ObjectStateIndex(path or default_object_state_index_path(self.connector_id))
+            dsx_logging.info(f"Object state index opened at {self._object_state_index.path}")
+        return self._object_state_index
+
+    def _record_enqueued(self, scan_requests: list[ScanRequestModel]) -> None:
+        state = _SCAN_STATE.get()
+        if state is None:
+            return
+        job_id = _SCAN_JOB_ID.get()
+        state.record_enqueued([req for req in scan_requests if req.scan_job_id == job_id])
+
     def _prepare_scan_request_common(
         self,
         scan_request: ScanRequestModel,
@@ -902,6 +931,18 @@ class DSXConnector:
                 message=f"Skip {scan_request.location}",
             )
 
+        state = _SCAN_STATE.get()
+        if (
+            state is not None
+            and getattr(scan_request, "scan_job_id", None) in (None, _SCAN_JOB_ID.get())
+            and state.should_skip(scan_request)
+        ):
+            return False, StatusResponse(
+                status=StatusResponseEnum.NOTHING,
+                description="Unchanged since last scan",
+                message=f"Skip {scan_request.location}",
+            )
+
         scan_request.connector = self.connector_running_model
         scan_request.connector_url = self.connector_running_model.url
         if not getattr(scan_request, "scan_job_id", None):
@@ -1007,18 +1048,21 @@ class DSXConnector:
             pass
         try:
             if self._should_enqueue_scans_with_ng():
-                return await self._scan_file_request_ng(scan_request)
-
-            payload = jsonable_encoder(scan_request, exclude={"scan_source"})
-            if self._sdk is not None:
-                body = await self._sdk.scan.request(payload)
+                response = await self._scan_file_request_ng(scan_request)
             else:
-                url = service_url(self.dsx_connect_url, API_PREFIX_V1, DSXConnectAPI.SCAN_PREFIX, ScanPath.REQUEST)
-                resp = await self._post_json_with_optional_hmac(url, payload)
-                resp.raise_for_status()
-                body = resp.json()
-            self.scan_request_count += 1
-            return StatusResponse(**body)
+                payload = jsonable_encoder(scan_request, exclude={"scan_source"})
+                if self._sdk is not None:
+                    body = await self._sdk.scan.request(payload)
+                else:
+                    url = service_url(self.dsx_connect_url, API_PREFIX_V1, DSXConnectAPI.SCAN_PREFIX, ScanPath.REQUEST)
+                    resp = await self._post_json_with_optional_hmac(url, payload)
+                    resp.raise_for_status()
+                    body = resp.json()
+                self.scan_request_count += 1
+                response = StatusResponse(**body)
+            if response.status == StatusResponseEnum.SUCCESS:
+                self._record_enqueued([scan_request])
+            return response
         except Exception as e:
             status_code = getattr(e, "status_code", None)
             if status_code:
@@ -1077,7 +1121,9 @@ class DSXConnector:
 
         try:
             if self._should_enqueue_scans_with_ng():
-                return await self._scan_file_request_batch_ng(prepared_requests)
+                response = await self._scan_file_request_batch_ng(prepared_requests)
+                self._record_enqueued(prepared_requests)
+                return response
 
             if self._sdk is not None:
                 body = await self._sdk.scan.request_batch(payload)
@@ -1096,6 +1142,7 @@ class DSXConnector:
                         _SCAN_ENQ_COUNTER.set(c + queued)
             except Exception:
                 pass
+            self._record_enqueued(prepared_requests)
             return StatusResponse(
                 status=StatusResponseEnum.SUCCESS,
                 message=f"Batch scan queued ({queued} items)",
@@ -1476,10 +1523,29 @@ class DSXAConnectorRouter(APIRouter):
         job_id: str,
         batch: bool = False,
         batch_size: int | None = None,
+        mode: str = "full",
+        scanner_version: str | None = None,
     ):
-        """Run connector full_scan handler within a scan-job context."""
+        """Run connector full_scan handler within a scan-job context.
+
+        With the object state index enabled, every run records what it enqueued;
+        mode="incremental" additionally skips objects unchanged since the last run
+        under the same scanner version.
+        """
         token = _SCAN_JOB_ID.set(job_id)
         ctoken = _SCAN_ENQ_COUNTER.set(0)
+        state: IncrementalScanState | None = None
+        try:
+            index = self._connector.object_state_index()
+            if index is not None:
+                state = IncrementalScanState(
+                    index,
+                    incremental=(mode == "incremental"),
+                    scanner_version=scanner_version or getattr(self._connector.connector_config, "full_scan_scanner_version", ""),
+                )
+        except Exception as e:
+            dsx_logging.warning(f"Object state index unavailable; running a full scan: {e}")
+        stoken = _SCAN_STATE.set(state)
         try:
             handler = self._connector.full_scan_handler
             if not handler:
@@ -1536,6 +1602,16 @@ class DSXAConnectorRouter(APIRouter):
                 _SCAN_ENQ_COUNTER.reset(ctoken)
             except Exception:
                 pass
+            _SCAN_STATE.reset(stoken)
+            if state is not None:
+                try:
+                    state.index.flush()
+                except Exception as e:
+                    dsx_logging.warning(f"Object state index flush failed: {e}")
+                dsx_logging.info(
+                    f"full_scan.object_state job={job_id} mode={mode} skipped_unchanged={state.skipped_unchanged} "
+                    f"recorded={state.recorded} scanner_version={state.scanner_version or '-'}"
+                )
 
     async def post_full_scan(
         self,
@@ -1549,13 +1625,36 @@ class DSXAConnectorRouter(APIRouter):
         batch: bool = Query(default=False, description="Request batched enqueue mode when supported by connector/core."),
         batch_size: int | None = Query(default=None, ge=1, description="Requested batch size; clamped by core max."),
         job_id: str | None = Query(default=None, description="Optional existing job ID; if omitted, connector generates one."),
+        mode: Literal["full", "incremental"] = Query(
+            default="full",
+            description="incremental enqueues only objects new or changed since the last scan (requires the object state index).",
+        ),
+        scanner_version: str | None = Query(
+            default=None,
+            description="Scanner version for this run; objects last enqueued under a different version are rescanned.",
+        ),
     ) -> StatusResponse:
 
+        if mode == "incremental" and not bool(getattr(self._connector.connector_config, "full_scan_state_index", False)):
+            return StatusResponse(
+                status=StatusResponseEnum.ERROR,
+                message="Incremental full scan unavailable",
+                description="Set DSXCONNECTOR_FULL_SCAN_STATE_INDEX=true to enable the object state index.",
+            )
         if self._connector.full_scan_handler:
             # Allow caller to provide job_id, else generate a new one
             job_id = job_id or str(uuid.uuid4())
             # Schedule within the running event loop to avoid threadpool/no-loop issues
-            asyncio.create_task(self._run_full_scan(limit, job_id, batch=batch, batch_size=batch_size))
+            asyncio.create_task(
+                self._run_full_scan(
+                    limit,
+                    job_id,
+                    batch=batch,
+                    batch_size=batch_size,
+                    mode=mode,
+                    scanner_version=scanner_version,
+                )
+            )
             return StatusResponse(
                 status=StatusResponseEnum.SUCCESS,
                 message="Full scan initiated",
@@ -1564,6 +1663,7 @@ class DSXAConnectorRouter(APIRouter):
                     f"job_id={job_id}{f' limit={limit}' if limit else ''}"
                     f"{f' batch={batch}' if batch else ''}"
                     f"{f' batch_size={batch_size}' if batch_size else ''}"
+                    f"{f' mode={mode}' if mode != 'full' else ''}"
                 )
             )
         return StatusResponse(status=StatusResponseEnum.ERROR,
@@ -0,0 +1,153 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from shared.dsx_logging import dsx_logging
+from shared.models.connector_models import ScanRequestModel
+
+# Rows are buffered and written in one transaction per this many enqueued objects.
+_DEFAULT_FLUSH_EVERY = 500
+
+
+def default_object_state_index_path(connector_name: str) -> Path:
+    """Place the index next to the persisted connector UUID (see connector_id.py)."""
+    app_root = Path(__file__).resolve().parents[2]
+    data_dir = Path(os.getenv("DSXCONNECTOR_DATA_DIR", str(app_root / "data")))
+    safe_name = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in connector_name) or "connector"
+    return (data_dir / f"{safe_name}_object_state.sqlite3").resolve()
+
+
+class ObjectStateIndex:
+    """
+    Persistent record of the objects a connector has enqueued for scanning.
+
+    Each row is keyed by object identity (the ScanRequestModel location) and stores the
+    size, the connector-supplied change token (mtime, ETag, generation) and the scanner
+    version the object was enqueued under. Incremental full scans consult it to skip
+    objects that have not changed since they were last enqueued with the same scanner
+    version. Connectors never see verdicts, so a successful enqueue is what gets recorded.
+    """
+
+    def __init__(self, path: str | Path, *, flush_every: int = _DEFAULT_FLUSH_EVERY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._flush_every = max(1, int(flush_every))
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[int | None, str | None, str, float]] = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS object_state (
+                identity TEXT PRIMARY KEY,
+                size INTEGER,
+                fingerprint TEXT,
+                scanner_version TEXT NOT NULL DEFAULT '',
+                last_enqueued_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def is_unchanged(self, identity: str, *, size: int | None, fingerprint: str | None, scanner_version: str = "") -> bool:
+        """True when the stored state matches; objects without a size or fingerprint always count as changed."""
+        if size is None and not fingerprint:
+            return False
+        with self._lock:
+            pending = self._pending.get(identity)
+            if pending is not None:
+                row = pending[:3]
+            else:
+                row = self._conn.execute(
+                    "SELECT size, fingerprint, scanner_version FROM object_state WHERE identity = ?",
+                    (identity,),
+                ).fetchone()
+        if row is None:
+            return False
+        return row[0] == size and (row[1] or None) == (fingerprint or None) and (row[2] or "") == (scanner_version or "")
+
+    def record(self, identity: str, *, size: int | None, fingerprint: str | None, scanner_version: str = "") -> None:
+        with self._lock:
+            self._pending[identity] = (size, fingerprint or None, scanner_version or "", time.time())
+            if len(self._pending) < self._flush_every:
+                return
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        rows = [(identity, *state) for identity, state in self._pending.items()]
+        self._pending.clear()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO object_state (identity, size, fingerprint, scanner_version, last_enqueued_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(identity) DO UPDATE SET
+                    size = excluded.size,
+                    fingerprint = excluded.fingerprint,
+                    scanner_version = excluded.scanner_version,
+                    last_enqueued_at = excluded.last_enqueued_at
+                """,
+                rows,
+            )
+
+    def count(self) -> int:
+        with self._lock:
+            self._flush_locked()
+            return int(self._conn.execute("SELECT COUNT(*) FROM object_state").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+
+
+class IncrementalScanState:
+    """Per-full-scan view of the index: filters unchanged requests and records enqueued ones."""
+
+    def __init__(self, index: ObjectStateIndex, *, incremental: bool, scanner_version: str = ""):
+        self.index = index
+        self.incremental = incremental
+        self.scanner_version = scanner_version or ""
+        self.skipped_unchanged = 0
+        self.recorded = 0
+
+    def should_skip(self, scan_request: ScanRequestModel) -> bool:
+        if not self.incremental:
+            return False
+        try:
+            unchanged = self.index.is_unchanged(
+                scan_request.location,
+                size=scan_request.size_in_bytes,
+                fingerprint=scan_request.object_fingerprint,
+                scanner_version=self.scanner_version,
+            )
+        except sqlite3.Error as e:
+            dsx_logging.warning(f"Object state index lookup failed; scanning {scan_request.location}: {e}")
+            return False
+        if unchanged:
+            self.skipped_unchanged += 1
+        return unchanged
+
+    def record_enqueued(self, scan_requests: list[ScanRequestModel]) -> None:
+        try:
+            for req in scan_requests:
+                self.index.record(
+                    req.location,
+                    size=req.size_in_bytes,
+                    fingerprint=req.object_fingerprint,
+                    scanner_version=self.scanner_version,
+                )
+                self.recorded += 1
+        except sqlite3.Error as e:
+            dsx_logging.warning(f"Object state index update failed: {e}")
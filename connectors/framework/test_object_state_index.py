@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from connectors.framework.base_config import BaseConnectorConfig
+from connectors.framework.dsx_connector import DSXAConnectorRouter, DSXConnector
+from connectors.framework.object_state_index import ObjectStateIndex
+from shared.models.connector_models import ConnectorStatusEnum, ScanRequestModel
+from shared.models.status_responses import StatusResponseEnum
+
+
+@pytest.fixture(autouse=True)
+def connector_data_dir(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("DSXCONNECTOR_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("HOSTNAME", raising=False)
+    monkeypatch.delenv("POD_UID", raising=False)
+
+
+def test_object_state_index_persists_and_detects_changes(tmp_path) -> None:
+    path = tmp_path / "state.sqlite3"
+    index = ObjectStateIndex(path, flush_every=2)
+    index.record("a.pdf", size=10, fingerprint="etag-1", scanner_version="v1")
+    assert index.is_unchanged("a.pdf", size=10, fingerprint="etag-1", scanner_version="v1")
+    index.close()
+
+    reopened = ObjectStateIndex(path)
+
+    assert reopened.count() == 1
+    assert reopened.is_unchanged("a.pdf", size=10, fingerprint="etag-1", scanner_version="v1")
+    assert not reopened.is_unchanged("a.pdf", size=11, fingerprint="etag-1", scanner_version="v1")
+    assert not reopened.is_unchanged("a.pdf", size=10, fingerprint="etag-2", scanner_version="v1")
+    assert not reopened.is_unchanged("a.pdf", size=10, fingerprint="etag-1", scanner_version="v2")
+    assert not reopened.is_unchanged("b.pdf", size=10, fingerprint="etag-1", scanner_version="v1")
+    assert not reopened.is_unchanged("c.pdf", size=None, fingerprint=None)
+    reopened.close()
+
+
+def _ng_connector(monkeypatch: pytest.MonkeyPatch, tmp_path, enqueued: list[str], **config) -> DSXConnector:
+    class _FakeResponse:
+        content = b"{}"
+        status_code = 200
+
+        def json(self):
+            return {"job_id": "job_1"}
+
+        def raise_for_status(self):
+            return None
+
+    class _FakeAsyncClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def post(self, url, json=None, headers=None):
+            if url.endswith("/execution/jobs/batch"):
+                enqueued.extend(item["payload"]["location"] for item in json["items"])
+            return _FakeResponse()
+
+    from connectors.framework import dsx_connector as connector_module
+
+    monkeypatch.setattr(connector_module.httpx, "AsyncClient", _FakeAsyncClient)
+    connector = DSXConnector(
+        BaseConnectorConfig(
+            name="fs-connector",
+            connector_url="http://fs:80",
+            dsx_connect_url="http://dsx-connect-ng:8091",
+            register_with_core=False,
+            register_with_ng_control_plane=True,
+            ng_integration_id="int_fs",
+            full_scan_state_index_path=str(tmp_path / "index.sqlite3"),
+            **config,
+        )
+    )
+    connector.connector_running_model.status = ConnectorStatusEnum.READY
+    return connector
+
+
+def test_incremental_full_scan_enqueues_only_new_or_changed_objects(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    enqueued: list[str] = []
+    connector = _ng_connector(monkeypatch, tmp_path, enqueued, full_scan_state_index=True)
+    objects = {"a.pdf": (10, "m1"), "b.pdf": (20, "m1"), "c.pdf": (30, "m1")}
+
+    async def full_scan_handler():
+        await connector.scan_file_request_batch(
+            [
+                ScanRequestModel(location=key, metainfo=key, size_in_bytes=size, object_fingerprint=token)
+                for key, (size, token) in objects.items()
+            ]
+        )
+
+    connector.full_scan_handler = full_scan_handler
+    router = DSXAConnectorRouter(connector)
+
+    asyncio.run(router._run_full_scan(None, "job-1"))
+    objects["b.pdf"] = (20, "m2")
+    objects["d.pdf"] = (40, "m1")
+    asyncio.run(router._run_full_scan(None, "job-2", mode="incremental"))
+    asyncio.run(router._run_full_scan(None, "job-3", mode="incremental"))
+    asyncio.run(router._run_full_scan(None, "job-4", mode="incremental", scanner_version="dsxa-2"))
+
+    assert enqueued == [
+        "a.pdf", "b.pdf", "c.pdf",
+        "b.pdf", "d.pdf",
+        "a.pdf", "b.pdf", "c.pdf", "d.pdf",
+    ]
+
+
+def test_incremental_full_scan_requires_state_index(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    connector = _ng_connector(monkeypatch, tmp_path, [])
+
+    async def full_scan_handler():
+        return None
+
+    connector.full_scan_handler = full_scan_handler
+    router = DSXAConnectorRouter(connector)
+
+    result = asyncio.run(
+        router.post_full_scan(
+            None, None, limit=None, batch=False, batch_size=None, job_id=None, mode="incremental", scanner_version=None
+        )
+    )
+
+    assert result.status == StatusResponseEnum.ERROR
+    assert connector.object_state_index() is None
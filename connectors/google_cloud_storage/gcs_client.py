@@ -2,7 +2,8 @@ from google.api_core.exceptions import NotFound, GoogleAPIError
 import io, hashlib, pathlib, os
 from typing import BinaryIO
 from shared import file_ops
-from shared.file_ops import relpath_matches_filter, compute_prefix_hints
+from shared.file_ops import compile_filter, compute_prefix_hints, disjoint_prefixes
+from shared.listing import DEFAULT_CONCURRENCY, ListingPlan, aiter_plan, iter_plan
 from shared.dsx_logging import dsx_logging
 from connectors.google_cloud_storage.config import config
 
@@ -41,14 +42,14 @@ class GCSClient:
             dsx_logging.error(f"GCS key_exists error: {e}")
             raise
 
-    def keys(self, bucket: str, base_prefix: str = "", filter_str: str = ""):
+    def listing_plan(self, bucket: str, base_prefix: str = "", filter_str: str = "") -> ListingPlan:
         """
-        Yield blobs in a GCS bucket applying DSXCONNECTOR_FILTER.
-        Uses prefix hints when safe and always verifies with relpath_matches_filter.
+        Describe the blob listing for DSXCONNECTOR_FILTER: one list_blobs call per safe
+        prefix hint (or one for the whole base prefix), plus the client-side filter.
         """
         client = self._get_client()
         hints = compute_prefix_hints(filter_str or "")
-        seen: set[str] = set()
+        matcher = compile_filter(filter_str) if filter_str else None
 
         # Normalize base_prefix to either '' or 'path/'
         bp = (base_prefix or "").strip("/")
@@ -62,28 +63,41 @@ class GCSClient:
 
         def _emit(blob):
             key = blob.name
-            if not key or key in seen or key.endswith('/'):
-                return
+            if not key or key.endswith('/'):
+                return None
             rel = _rel(key)
-            if filter_str and not relpath_matches_filter(rel, filter_str):
-                return
-            seen.add(key)
-            yield {'Key': key, 'Size': getattr(blob, 'size', None)}
+            if matcher is not None and not matcher.match(rel):
+                return None
+            return {
+                'Key': key,
+                'Size': getattr(blob, 'size', None),
+                'Generation': getattr(blob, 'generation', None),
+                'ETag': getattr(blob, 'etag', None),
+            }
+
+        def _source(prefix: str | None):
+            if prefix:
+                return lambda: client.list_blobs(bucket, prefix=prefix)
+            return lambda: client.list_blobs(bucket)
 
         if hints:
-            for prefix in sorted(set(hints)):
-                eff = f"{bp}{prefix}" if bp else prefix
-                for blob in client.list_blobs(bucket, prefix=eff):
-                    for item in _emit(blob):
-                        yield item
-        else:
-            if bp:
-                it = client.list_blobs(bucket, prefix=bp)
-            else:
-                it = client.list_blobs(bucket)
-            for blob in it:
-                for item in _emit(blob):
-                    yield item
+            sources = [_source(f"{bp}{prefix}" if bp else prefix) for prefix in disjoint_prefixes(hints)]
+            return ListingPlan(sources=sources, emit=_emit)
+        return ListingPlan(sources=[_source(bp or None)], emit=_emit)
+
+    def keys(self, bucket: str, base_prefix: str = "", filter_str: str = ""):
+        """
+        Yield blobs in a GCS bucket applying DSXCONNECTOR_FILTER.
+        Uses prefix hints when safe and always verifies each key with the compiled filter.
+        """
+        yield from iter_plan(self.listing_plan(bucket, base_prefix, filter_str))
+
+    async def keys_async(self, bucket: str, base_prefix: str = "", filter_str: str = "", *,
+                         concurrency: int = DEFAULT_CONCURRENCY):
+        """Async `keys()`: pages are fetched on the listing pool, prefix hints are listed in parallel."""
+        plan = self.listing_plan(bucket, base_prefix, filter_str)
+        async for item in aiter_plan(plan, concurrency=concurrency):
+            yield item
 
     def list_object_page(
         self,
@@ -119,13 +133,14 @@ class GCSClient:
                 return key
             return key[len(prefix):] if key.startswith(prefix) else key
 
+        matcher = compile_filter(filter_str) if filter_str else None
         objects: list[dict] = []
         for blob in page:
             key = getattr(blob, "name", "") or ""
             if not key or key.endswith("/"):
                 continue
             rel = _rel(key)
-            if filter_str and not relpath_matches_filter(rel, filter_str):
+            if matcher is not None and not matcher.match(rel):
                 continue
             objects.append({"Key": key, "Size": getattr(blob, "size", None)})
         next_cursor = getattr(page, "next_page_token", None) or getattr(iterator, "next_page_token", None)
@@ -3,18 +3,28 @@ from __future__ import annotations
 from typing import AsyncIterator
 
 from connectors.google_cloud_storage.gcs_client import GCSClient
+from shared.listing import DEFAULT_CONCURRENCY, aiter_blocking
 from shared.object_storage import ObjectInfo, ObjectRef, ObjectScope
 
 
 class GCSDiscoverer:
-    def __init__(self, client: GCSClient | None = None) -> None:
+    def __init__(self, client: GCSClient | None = None, *, listing_concurrency: int = DEFAULT_CONCURRENCY) -> None:
         self.client = client or GCSClient()
+        self.listing_concurrency = listing_concurrency
 
     def validate(self, *, bucket: str | None = None) -> None:
         self.client.ensure_ready(bucket=bucket)
 
+    def _keys(self, scope: ObjectScope) -> AsyncIterator[dict]:
+        keys_async = getattr(self.client, "keys_async", None)
+        if keys_async is not None:
+            return keys_async(scope.bucket, base_prefix=scope.prefix, filter_str=scope.filter,
+                              concurrency=self.listing_concurrency)
+        # Clients with only a blocking keys(): still keep the listing off the event loop.
+        return aiter_blocking(self.client.keys(scope.bucket, base_prefix=scope.prefix, filter_str=scope.filter))
+
     async def list_objects(self, scope: ObjectScope) -> AsyncIterator[ObjectInfo]:
-        for item in self.client.keys(scope.bucket, base_prefix=scope.prefix, filter_str=scope.filter):
+        async for item in self._keys(scope):
             key = item["Key"]
             yield ObjectInfo(
                 ref=ObjectRef(
@@ -23,4 +33,9 @@ class GCSDiscoverer:
                     uri=f"gs://{scope.bucket}/{key}",
                 ),
                 size_bytes=item.get("Size"),
+                metadata={
+                    name: item[field]
+                    for field, name in (("Generation", "generation"), ("ETag", "etag"))
+                    if item.get(field) is not None
+                },
             )
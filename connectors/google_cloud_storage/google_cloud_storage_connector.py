@@ -72,7 +72,7 @@ connector = DSXConnector(config)
 
 gcs_client = GCSClient()
 gcs_reader = GCSReader(client=gcs_client)
-gcs_discoverer = GCSDiscoverer(client=gcs_client)
+gcs_discoverer = GCSDiscoverer(client=gcs_client, listing_concurrency=config.listing_concurrency)
 
 _monitor_thread: threading.Thread | None = None
 _monitor_stop = threading.Event()
@@ -568,7 +568,16 @@ async def full_scan_handler(
         if config.filter and not relpath_matches_filter(_relative_to_configured_prefix(key), config.filter):
             continue
         full_path = f"{config.asset_bucket}/{key}"
-        requests.append(ScanRequestModel(location=key, metainfo=full_path))
+        # The object generation changes on every overwrite; the ETag is the fallback.
+        fingerprint = obj.metadata.get("generation") or obj.metadata.get("etag")
+        requests.append(
+            ScanRequestModel(
+                location=key,
+                metainfo=full_path,
+                size_in_bytes=obj.size_bytes,
+                object_fingerprint=str(fingerprint) if fingerprint is not None else None,
+            )
+        )
         if limit and len(requests) >= limit:
             break
 
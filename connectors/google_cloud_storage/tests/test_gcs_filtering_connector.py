@@ -159,12 +159,12 @@ async def test_full_scan_filters(monkeypatch):
 
     monkeypatch.setattr(gc.connector, "scan_file_request", fake_scan)
 
-    def fake_keys(bucket, base_prefix: str = "", filter_str=""):
+    async def fake_keys(bucket, base_prefix: str = "", filter_str="", **kwargs):
         yield {"Key": "sub1/a.txt"}
         yield {"Key": "sub1/deep/b.txt"}
         yield {"Key": "sub2/c.txt"}
 
-    monkeypatch.setattr(gc.gcs_client, "keys", fake_keys)
+    monkeypatch.setattr(gc.gcs_client, "keys_async", fake_keys)
 
     resp = await gc.full_scan_handler()
     assert resp.status.value == "success"
@@ -187,12 +187,12 @@ async def test_full_scan_batch_filters(monkeypatch):
 
     monkeypatch.setattr(gc.connector, "scan_file_request_batch", fake_scan_batch)
 
-    def fake_keys(bucket, base_prefix: str = "", filter_str=""):
+    async def fake_keys(bucket, base_prefix: str = "", filter_str="", **kwargs):
         yield {"Key": "sub1/a.txt"}
         yield {"Key": "sub1/deep/b.txt"}
         yield {"Key": "sub2/c.txt"}
 
-    monkeypatch.setattr(gc.gcs_client, "keys", fake_keys)
+    monkeypatch.setattr(gc.gcs_client, "keys_async", fake_keys)
 
     resp = await gc.full_scan_handler(batch=True, batch_size=100)
     assert resp.status.value == "success"
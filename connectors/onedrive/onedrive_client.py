@@ -6,7 +6,7 @@ import httpx
 
 from shared.dsx_logging import dsx_logging
 from shared.graph.base import MSGraphClientBase
-from shared.graph.drive import delta_changes, build_drive_item_path
+from shared.graph.drive import DeltaPage, delta_changes, build_drive_item_path, iter_delta_pages
 from connectors.onedrive.config import OneDriveConnectorConfig
 
 
@@ -100,14 +100,16 @@ class OneDriveClient(MSGraphClientBase):
         page_size = max(1, int(getattr(self._cfg, "sp_graph_page_size", 200) or 200))
         return await delta_changes(self, self.drive_resource, cursor, page_size=page_size)
 
+    async def iter_delta_pages(self, cursor: Optional[str]) -> AsyncIterator[DeltaPage]:
+        await self._ensure_drive()
+        page_size = max(1, int(getattr(self._cfg, "sp_graph_page_size", 200) or 200))
+        async for page in iter_delta_pages(self, self.drive_resource, cursor, page_size=page_size):
+            yield page
+
     async def iter_files_delta(self) -> AsyncIterator[Dict[str, Any]]:
-        cursor: Optional[str] = None
-        while True:
-            items, cursor = await self.delta_changes(cursor)
-            for item in items:
+        async for page in self.iter_delta_pages(None):
+            for item in page.items:
                 yield item
-            if not cursor:
-                break
 
     async def download_file(self, identifier: str) -> httpx.Response:
         await self._ensure_drive()
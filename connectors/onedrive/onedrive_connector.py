@@ -14,7 +14,7 @@ from shared.routes import service_url, API_PREFIX_V1, DSXConnectAPI
 from shared.dsx_logging import dsx_logging
 from shared.file_ops import relpath_matches_filter
 from shared.graph.subscriptions import GraphDriveSubscriptionManager
-from shared.graph.drive import build_drive_item_path, process_drive_delta_items
+from shared.graph.drive import build_drive_item_path, process_drive_delta_items, run_drive_delta
 from shared.models.connector_models import ConnectorInstanceModel, ItemActionEnum, ScanRequestModel
 from shared.models.status_responses import ItemActionStatusResponse, StatusResponse, StatusResponseEnum
 from shared.log_sanitizer import config_for_log, maybe_mask_identifier
@@ -171,7 +171,10 @@ async def _initialize_delta_cursor() -> None:
         if await _kv_get(_DELTA_STATE_KEY):
             return
         try:
-            _, cursor = await client.delta_changes(None)
+            # Only the final delta link matters here; pages are discarded as they stream past.
+            cursor = None
+            async for page in client.iter_delta_pages(None):
+                cursor = page.delta_link or cursor
             if cursor:
                 await _kv_put(_DELTA_STATE_KEY, cursor)
                 dsx_logging.debug("Initialized OneDrive delta cursor from baseline delta query.")
@@ -183,29 +186,41 @@ async def _run_delta_sync(reason: str = "webhook", exclude_ids: Optional[Set[str
     lock = _ensure_delta_lock()
     async with lock:
         cursor = await _kv_get(_DELTA_STATE_KEY)
-        try:
-            items, new_cursor = await client.delta_changes(cursor)
-        except Exception as exc:
-            dsx_logging.warning(f"OneDrive delta sync failed ({reason}): {exc}")
-            return 0
-        if new_cursor:
-            await _kv_put(_DELTA_STATE_KEY, new_cursor)
         base_path, eff_filter = _asset_scope()
+        seen = 0
+        enqueued = 0
 
         async def _enqueue(item_id: str, metainfo: str, item: dict[str, Any]) -> None:
             await connector.scan_file_request(ScanRequestModel(location=item_id, metainfo=str(metainfo)))
 
-        enqueued, _ = await process_drive_delta_items(
-            items,
-            exclude_ids=set(exclude_ids or ()),
-            path_in_scope=_path_in_scope,
-            enqueue_file=_enqueue,
-            log_prefix="OneDrive",
-            base_path=base_path,
-            filter_text=eff_filter,
-        )
-        if items:
-            dsx_logging.info(f"OneDrive delta sync ({reason}) items={len(items)} enqueued={enqueued}")
+        async def _process(items: list[dict]) -> None:
+            nonlocal seen, enqueued
+            page_enqueued, _ = await process_drive_delta_items(
+                items,
+                exclude_ids=set(exclude_ids or ()),
+                path_in_scope=_path_in_scope,
+                enqueue_file=_enqueue,
+                log_prefix="OneDrive",
+                base_path=base_path,
+                filter_text=eff_filter,
+                concurrency=max(1, int(getattr(config, "scan_concurrency", 1) or 1)),
+            )
+            seen += len(items)
+            enqueued += page_enqueued
+
+        async def _checkpoint(page_cursor: str) -> None:
+            await _kv_put(_DELTA_STATE_KEY, page_cursor)
+
+        try:
+            await run_drive_delta(client.iter_delta_pages(cursor), process_items=_process, checkpoint=_checkpoint)
+        except Exception as exc:
+            dsx_logging.warning(
+                f"OneDrive delta sync failed ({reason}) after items={seen} enqueued={enqueued}; "
+                f"will resume from the last checkpoint: {exc}"
+            )
+            return enqueued
+        if seen:
+            dsx_logging.info(f"OneDrive delta sync ({reason}) items={seen} enqueued={enqueued}")
         return enqueued
 
 
@@ -7,7 +7,7 @@ import httpx
 
 from shared.dsx_logging import dsx_logging
 from shared.graph.base import MSGraphClientBase
-from shared.graph.drive import build_drive_item_path, delta_changes
+from shared.graph.drive import DeltaPage, build_drive_item_path, delta_changes, iter_delta_pages
 from connectors.sharepoint.config import SharepointConnectorConfig
 
 GRAPH_BASE = MSGraphClientBase.GRAPH_BASE
@@ -175,26 +175,21 @@ class SharePointClient(MSGraphClientBase):
                     stack.append(rel_path)
 
     async def iter_files_delta(self) -> AsyncIterator[Dict[str, Any]]:
-        await self._ensure_site_and_drive()
-        cursor: Optional[str] = None
-        page_size = max(1, int(getattr(self._cfg, "sp_graph_page_size", 200) or 200))
-        while True:
-            items, cursor = await delta_changes(
-                self,
-                self._drive_resource,
-                cursor,
-                page_size=page_size,
-            )
-            for item in items:
+        async for page in self.iter_delta_pages(None):
+            for item in page.items:
                 yield item
-            if not cursor:
-                break
 
     async def delta_changes(self, cursor: Optional[str]) -> tuple[List[dict], Optional[str]]:
         await self._ensure_site_and_drive()
         page_size = max(1, int(getattr(self._cfg, "sp_graph_page_size", 200) or 200))
         return await delta_changes(self, self._drive_resource, cursor, page_size=page_size)
 
+    async def iter_delta_pages(self, cursor: Optional[str]) -> AsyncIterator[DeltaPage]:
+        await self._ensure_site_and_drive()
+        page_size = max(1, int(getattr(self._cfg, "sp_graph_page_size", 200) or 200))
+        async for page in iter_delta_pages(self, self._drive_resource, cursor, page_size=page_size):
+            yield page
+
     async def download_file(self, identifier: str) -> httpx.Response:
         await self._ensure_site_and_drive()
         client = await self.get_client()
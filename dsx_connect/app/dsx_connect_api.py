@@ -19,6 +19,7 @@ from dsx_connect.config import get_config, get_auth_config, persist_core_overrid
 from dsx_connect.connectors.registry import ConnectorsRegistry
 from dsx_connect.messaging.bus import Bus
 from dsx_connect.messaging.channels import Channel
+from dsx_connect.messaging.fanout import FanoutHub, job_status_coalesce_key
 from dsx_connect.messaging.notifiers import Notifiers
 from dsx_connect.messaging.state_keys import job_key
 from dsx_connect.database.control_plane_postgres import ControlPlanePostgresRepo
@@ -210,7 +211,31 @@ async def _start_services(app: FastAPI, cfg):
         app.state.control_plane_repo = None
         dsx_logging.warning(f"Control-plane PostgreSQL preview mirror disabled: {e.__class__.__name__}: {e}")
 
+def _scan_result_hub(app: FastAPI) -> FanoutHub:
+    """Per-process fan-out of the scan result channel; survives Redis reconnects (reads notifiers on each resubscribe)."""
+    hub = getattr(app.state, "scan_result_hub", None)
+    if hub is None:
+        ncfg = get_config().notifications
+
+        def _source():
+            notifiers = getattr(app.state, "notifiers", None)
+            return notifiers.listen_scan_results_raw() if notifiers is not None else None
+
+        hub = FanoutHub(
+            _source,
+            name="scan_result",
+            history_size=ncfg.sse_history_size,
+            client_queue_size=ncfg.sse_client_queue_size,
+            coalesce_key=job_status_coalesce_key,
+        )
+        app.state.scan_result_hub = hub
+    return hub
+
+
 async def _stop_services(app):
+    hub = getattr(app.state, "scan_result_hub", None)
+    if hub is not None:
+        await hub.stop()
     if getattr(app.state, "registry", None):
         await app.state.registry.stop()
     if getattr(app.state, "redis", None):
@@ -518,60 +543,40 @@ sse_notifications = APIRouter(prefix=route_path(API_PREFIX_V1), tags=["server si
     name=route_name(DSXConnectAPI.NOTIFICATIONS_PREFIX, NotificationPath.SCAN_RESULT, Action.LIST),
     description="SSE stream of scan result notifications",
 )
-async def notifications_scan_result(request: Request):
+async def notifications_scan_result(
+        request: Request,
+        last_event_id: str | None = Query(None, description="Resume after this event id (same as the Last-Event-ID header)"),
+):
     LOG_SSE = os.getenv('DSX_LOG_SSE_EVENTS', '0') == '1'
-    async def stream():
-        # Initial connected and retry hints
-        yield 'data: {"type":"connected"}\n\n'
-        yield 'retry: 5000\n'
-        hb = 0
-
-        while True:
-            # Wait for notifier availability
-            if not hasattr(request.app.state, 'notifiers') or request.app.state.notifiers is None:
-                yield 'data: {"type":"waiting","message":"Notifier unavailable"}\n\n'
-                for _ in range(5):
-                    if await request.is_disconnected():
-                        return
-                    yield 'data: {"type":"heartbeat"}\n\n'
-                    await asyncio.sleep(1.0)
-                continue
+    hub = _scan_result_hub(request.app)
+    heartbeat_seconds = max(1.0, float(get_config().notifications.sse_heartbeat_seconds))
+    resume_from = request.headers.get("last-event-id") or last_event_id
 
-            try:
-                async for raw in request.app.state.notifiers.subscribe_scan_results():
-                    if await request.is_disconnected():
-                        return
-                    # Normalize to JSON string for SSE data
-                    try:
-                        from json import dumps
-                        if isinstance(raw, (bytes, bytearray)):
-                            data = raw.decode()
-                        elif isinstance(raw, str):
-                            data = raw
-                        else:
-                            data = dumps(raw, separators=(",", ":"))
-                    except Exception:
-                        data = str(raw)
-                    if LOG_SSE:
-                        try:
-                            dsx_logging.info(f"sse.scan_result len={len(data)} data={data[:256]}")
-                        except Exception:
-                            pass
-                    yield f"data: {data}\n\n"
-                    hb += 1
-                    if hb >= 10:
-                        yield 'data: {"type":"heartbeat"}\n\n'
-                        hb = 0
-                    await asyncio.sleep(0)
-            except Exception as e:
-                dsx_logging.warning(f"SSE scan result stream disconnected: {e.__class__.__name__}: {e}")
-                # Fall back to heartbeat loop, then retry
-                for _ in range(5):
+    async def stream():
+        client = hub.subscribe(resume_from)
+        try:
+            # Initial connected and retry hints
+            yield 'data: {"type":"connected"}\n\n'
+            yield 'retry: 5000\n'
+            reported_drops = 0
+            while True:
+                event = await client.get(heartbeat_seconds)
+                if event is None:
                     if await request.is_disconnected():
                         return
+                    if getattr(request.app.state, 'notifiers', None) is None:
+                        yield 'data: {"type":"waiting","message":"Notifier unavailable"}\n\n'
                     yield 'data: {"type":"heartbeat"}\n\n'
-                    await asyncio.sleep(1.0)
-                continue
+                    continue
+                if client.dropped != reported_drops:
+                    # SSE comment: ignored by EventSource, visible when debugging slow viewers.
+                    yield f": dropped {client.dropped - reported_drops} events (slow consumer)\n\n"
+                    reported_drops = client.dropped
+                if LOG_SSE:
+                    dsx_logging.info(f"sse.scan_result id={event.id} len={len(event.data)} data={event.data[:256]}")
+                yield event.sse()
+        finally:
+            hub.unsubscribe(client)
 
     return StreamingResponse(stream(), media_type="text/event-stream",
                              headers={"Cache-Control":"no-cache","X-Accel-Buffering":"no"})
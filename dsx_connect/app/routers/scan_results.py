@@ -1,11 +1,12 @@
 from typing import List
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Query, Response
 
 from dsx_connect.models.scan_result import ScanResultModel, ScanStatsModel
 from dsx_connect.config import get_config
 from shared.routes import DSXConnectAPI, API_PREFIX_V1, route_name, Action, ScanPath, route_path
 from dsx_connect.database.database_factory import database_scan_stats_factory, database_scan_results_factory
+from dsx_connect.database.scan_stats_redis import ScanStatsRedisDB
 from redis.asyncio import Redis
 from fastapi import Depends
 from shared.dsx_logging import dsx_logging
@@ -79,10 +80,23 @@ async def _publish_job_status_event(request: Request, job_id: str, forced_status
     route_path(DSXConnectAPI.SCAN_PREFIX.value, ScanPath.RESULTS.value),
     name=route_name(DSXConnectAPI.SCAN_PREFIX, ScanPath.RESULTS, Action.LIST),
     response_model=List[ScanResultModel],
-    description="List recent scan results (optionally filtered by job_id)."
+    description="List recent scan results, newest first (optionally filtered by job_id, verdict or connector). "
+                "Pass the X-Next-Cursor response header back as `cursor` to fetch the next page."
 )
-async def list_scan_results(limit: int = 200, job_id: str | None = None) -> List[ScanResultModel]:
-    return _results_database.recent(limit=limit, job_id=job_id)
+async def list_scan_results(
+        response: Response,
+        limit: int = 200,
+        job_id: str | None = None,
+        cursor: int | None = None,
+        verdict: str | None = None,
+        connector: str | None = None,
+) -> List[ScanResultModel]:
+    items, next_cursor = _results_database.page(
+        limit=limit, cursor=cursor, job_id=job_id, verdict=verdict, connector=connector
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
 
 
 @router.delete(
@@ -122,8 +136,11 @@ async def get_scan_result(task_id: str) -> List[ScanResultModel]:
     route_path(DSXConnectAPI.SCAN_PREFIX.value, ScanPath.STATS.value),
     name=route_name(DSXConnectAPI.SCAN_PREFIX, ScanPath.STATS, Action.GET),
     response_model=ScanStatsModel,
-    description="Retrieve scan statistics.")
-async def get_scan_stats() -> ScanStatsModel:
+    description="Retrieve scan statistics. Counters are all-time; p50/p95/p99 quantiles are all-time, "
+                "or over the last `window_hours` hours when given (Redis backend).")
+async def get_scan_stats(window_hours: int | None = Query(None, ge=1, le=168)) -> ScanStatsModel:
+    if window_hours and isinstance(_stats_database, ScanStatsRedisDB):
+        return _stats_database.get(window_hours=window_hours)
     return _stats_database.get()
 
 
@@ -433,7 +450,10 @@ async def clear_jobs(request: Request) -> dict:
                     pass
                 # Best-effort: clear per-job scan results index
                 try:
-                    await r.delete(f"dsxconnect:scan_results_by_job:{job_id}")
+                    await r.delete(
+                        f"dsxconnect:scan_results:by_job:{job_id}",
+                        f"dsxconnect:scan_results_by_job:{job_id}",
+                    )
                 except Exception:
                     pass
     except Exception as e:
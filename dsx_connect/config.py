@@ -65,6 +65,18 @@ class ScannerConfig(BaseSettings):
     max_inflight: int = 2048
     # Maximum file size accepted by DSXA (/scan/binary/v2). Files larger than this are skipped.
     max_file_size_bytes: int = 2 * 1024 * 1024 * 1024
+    # Admission control: when max_inflight is reached, scan workers block for up to
+    # admission_max_wait_seconds waiting for a lease before re-enqueueing the task.
+    admission_max_wait_seconds: float = 30.0
+    admission_poll_seconds: float = 1.0
+    admission_lease_ttl_seconds: int = 600
+    # Cap each connector at ceil(max_inflight / contending connectors) concurrent scans.
+    admission_fair_share: bool = False
+    # Per-worker-process keep-alive pool for DSXA. HTTP/2 is used only when `h2` is installed.
+    http2: bool = False
+    pool_max_connections: int = 32
+    pool_max_keepalive_connections: int = 16
+    pool_keepalive_expiry_seconds: float = 60.0
 
     @model_validator(mode="after")
     def _derive_base_url(self):
@@ -131,6 +143,10 @@ class DiannaConfig(BaseSettings):
     ca_bundle: str | None = None
     # Chunk size for uploads (bytes)
     chunk_size: int = 4 * 1024 * 1024
+    # Files read from connectors are spooled before upload: in memory up to this size,
+    # then to a temporary file (in spool_dir, or the system temp dir).
+    spool_max_memory_bytes: int = 8 * 1024 * 1024
+    spool_dir: str | None = None
     # Request timeout (seconds)
     timeout: int = 60
     # Auto-enqueue analysis when verdict is malicious
@@ -207,6 +223,33 @@ class CeleryTaskConfig(BaseSettings):
     scan_request_batch_enabled: bool = False
     scan_request_batch_default_size: int = 10
     scan_request_batch_max_size: int = 100
+    # Scan result persistence is micro-batched per result worker process: results are written
+    # with one pipeline per batch once this many are waiting or flush_ms after the first arrived.
+    # A batch size of 1 writes each result immediately.
+    scan_results_batch_size: int = 50
+    scan_results_batch_flush_ms: int = 200
+
+
+class ConnectorClientConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_nested_delimiter="__")
+    # Outbound calls from dsx-connect to connectors (read_file, item actions, repo checks).
+    client_timeout_seconds: float = 30.0
+    # Keep-alive pool per connector URL and process. HTTP/2 is used only when `h2` is installed.
+    http2: bool = False
+    pool_max_connections: int = 32
+    pool_max_keepalive_connections: int = 16
+    pool_keepalive_expiry_seconds: float = 60.0
+
+
+class NotificationsConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_nested_delimiter="__")
+    # SSE fan-out: one Redis subscription per API process, shared by all connected viewers.
+    # Events kept for Last-Event-ID replay after a reconnect.
+    sse_history_size: int = 500
+    # Per-viewer queue; a viewer that falls further behind loses its oldest events.
+    sse_client_queue_size: int = 256
+    # Heartbeat sent to idle viewers (also how disconnects are noticed between events).
+    sse_heartbeat_seconds: float = 15.0
 
 
 # class SecurityConfig(BaseSettings):
@@ -222,6 +265,8 @@ class DSXConnectConfig(BaseSettings):
     scanner: ScannerConfig = ScannerConfig()
     workers: CeleryTaskConfig = CeleryTaskConfig()
     control_plane_database: ControlPlaneDatabaseConfig = ControlPlaneDatabaseConfig()
+    connectors: ConnectorClientConfig = ConnectorClientConfig()
+    notifications: NotificationsConfig = NotificationsConfig()
 
     # Feature flags
     class FeatureFlags(BaseSettings):
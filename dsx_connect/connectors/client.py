@@ -25,7 +25,7 @@ _async_lock = asyncio.Lock()
 _CFG = get_config()
 
 
-def _connector_timeout() -> "httpx.Timeout":
+def _connector_timeout() -> float:
     # Keep a conservative default, but allow local benchmarking/tuning of slow
     # connector read_file paths without code changes in each worker callsite.
     try:
@@ -35,8 +35,50 @@ def _connector_timeout() -> "httpx.Timeout":
             timeout_s = float(__import__("os").getenv("DSXCONNECT_CONNECTORS__CLIENT_TIMEOUT_SECONDS", "30"))
         except Exception:
             timeout_s = 30.0
-    timeout_s = max(1.0, timeout_s)
-    return httpx.Timeout(timeout_s)
+    return max(1.0, timeout_s)
+
+
+def _pool_kwargs(asynchronous: bool) -> dict[str, Any]:
+    from dsx_connect.taskworkers.http_pool import pooled_client_kwargs
+    cfg = getattr(_CFG, "connectors", None)
+    return pooled_client_kwargs(
+        "connector_async" if asynchronous else "connector",
+        http2=bool(getattr(cfg, "http2", False)),
+        max_connections=getattr(cfg, "pool_max_connections", 32),
+        max_keepalive_connections=getattr(cfg, "pool_max_keepalive_connections", 16),
+        keepalive_expiry=getattr(cfg, "pool_keepalive_expiry_seconds", 60.0),
+        asynchronous=asynchronous,
+    )
+
+
+def _sync_http(url: str) -> Any:
+    # One keep-alive pool per connector URL; built only on first use so that
+    # repeat calls do not construct (and leak) a throwaway client.
+    http = _sync_pool.get(url)
+    if http is None or getattr(http, "is_closed", False):
+        http = httpx.Client(verify=False, timeout=_connector_timeout(), **_pool_kwargs(False))
+        _sync_pool[url] = http
+    return http
+
+
+def _async_http(url: str) -> Any:
+    http = _async_pool.get(url)
+    if http is None or getattr(http, "is_closed", False):
+        http = httpx.AsyncClient(verify=False, timeout=_connector_timeout(), **_pool_kwargs(True))
+        _async_pool[url] = http
+    return http
+
+
+def close_connector_clients() -> None:
+    """Close this process's pooled sync connector clients (async pools close with their loop)."""
+    with _sync_lock:
+        clients = list(_sync_pool.values())
+        _sync_pool.clear()
+    for http in clients:
+        try:
+            http.close()
+        except Exception:
+            pass
 
 def _signed_headers(
         url: str,
@@ -85,7 +127,7 @@ def _conn_parts(conn: Union[str, Any]) -> Tuple[str, Optional[str], Optional[str
 async def get_async_connector_client(conn):
     async with _async_lock:
         url, key_id, secret = _conn_parts(conn)
-        http = _async_pool.setdefault(url, httpx.AsyncClient(verify=False, timeout=_connector_timeout()))
+        http = _async_http(url)
 
     class AClient:
         async def request(self, method: HttpMethod, path: str,
@@ -141,13 +183,13 @@ async def get_async_connector_client(conn):
 def get_connector_client(conn):
     with _sync_lock:
         url, key_id, secret = _conn_parts(conn)
-        http = _sync_pool.setdefault(url, httpx.Client(verify=False, timeout=_connector_timeout()))
+        http = _sync_http(url)
 
     class SClient:
-        def request(self, method: HttpMethod, path: str,
-                    json_body: Optional[Mapping[str, Any]] = None,
-                    headers: Optional[dict[str, str]] = None,
-                    params: Optional[Mapping[str, Any]] = None) -> Any:
+        def _prepare(self, method: HttpMethod, path: str,
+                     json_body: Optional[Mapping[str, Any]] = None,
+                     headers: Optional[dict[str, str]] = None,
+                     params: Optional[Mapping[str, Any]] = None) -> Tuple[str, bytes, dict[str, str]]:
             base_url = service_url(url, path)
             if params:
                 from urllib.parse import urlencode
@@ -159,8 +201,25 @@ def get_connector_client(conn):
             hdrs = _signed_headers(full_url, method, body, key_id, secret)
             if headers:
                 hdrs.update(headers)
+            return full_url, body, hdrs
+
+        def request(self, method: HttpMethod, path: str,
+                    json_body: Optional[Mapping[str, Any]] = None,
+                    headers: Optional[dict[str, str]] = None,
+                    params: Optional[Mapping[str, Any]] = None) -> Any:
+            full_url, body, hdrs = self._prepare(method, path, json_body, headers, params)
             return http.request(method, full_url, content=(body or None), headers=hdrs)
 
+        @contextmanager
+        def stream(self, method: HttpMethod, path: str,
+                   json_body: Optional[Mapping[str, Any]] = None,
+                   headers: Optional[dict[str, str]] = None,
+                   params: Optional[Mapping[str, Any]] = None):
+            """Like request(), but the body is not read up front; iterate response.iter_bytes()."""
+            full_url, body, hdrs = self._prepare(method, path, json_body, headers, params)
+            with http.stream(method, full_url, content=(body or None), headers=hdrs) as response:
+                yield response
+
         def get(self, path, headers=None, params: Optional[Mapping[str, Any]] = None):
             return self.request("GET", path, None, headers, params)
         def post(self, path, json_body=None, headers=None, params: Optional[Mapping[str, Any]] = None):
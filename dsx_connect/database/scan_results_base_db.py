@@ -18,6 +18,11 @@ class ScanResultsBaseDB(ABC):
         """Insert a new record into the JSON file."""
         pass
 
+    def insert_many(self, scan_results: list[ScanResultModel]) -> None:
+        """Insert several records; backends with a network round trip per insert should override."""
+        for scan_result in scan_results:
+            self.insert(scan_result)
+
     @abstractmethod
     def delete(self, key, value) -> ScanResultModel:
         """Delete a record from the JSON file based on a key-value pair."""
@@ -68,3 +73,37 @@ class ScanResultsBaseDB(ABC):
         # Assume monotonically increasing ID reflects insertion order
         items.sort(key=lambda r: getattr(r, "id", -1), reverse=True)
         return items[: max(1, int(limit))]
+
+    def page(
+            self,
+            limit: int = 200,
+            *,
+            cursor: int | None = None,
+            job_id: Optional[str] = None,
+            verdict: Optional[str] = None,
+            connector: Optional[str] = None,
+    ) -> tuple[list[ScanResultModel], int | None]:
+        """Newest-first page of results with ids below `cursor`; returns (items, next_cursor).
+
+        Default fallback filters read_all(); concrete DBs should override with index reads.
+        """
+        def _matches(r: ScanResultModel) -> bool:
+            req = getattr(r, "scan_request", None)
+            if job_id and (getattr(r, "scan_job_id", None) or getattr(req, "scan_job_id", None)) != job_id:
+                return False
+            if verdict:
+                v = getattr(getattr(r, "verdict", None), "verdict", None)
+                if str(getattr(v, "value", v)) != verdict:
+                    return False
+            if connector:
+                conn = getattr(req, "connector", None)
+                ids = {str(getattr(conn, "uuid", "") or ""), str(getattr(req, "connector_url", "") or "")}
+                if connector not in ids:
+                    return False
+            return cursor is None or getattr(r, "id", -1) < cursor
+
+        items = sorted((r for r in self.read_all() if _matches(r)), key=lambda r: getattr(r, "id", -1), reverse=True)
+        limit = max(1, int(limit))
+        page = items[:limit]
+        next_cursor = page[-1].id if len(items) > limit else None
+        return page, next_cursor
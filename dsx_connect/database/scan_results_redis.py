@@ -1,4 +1,3 @@
-import json
 from typing import Optional, List
 
 import redis
@@ -8,14 +7,51 @@ from dsx_connect.models.scan_result import ScanResultModel
 from dsx_connect.config import get_config
 from shared.dsx_logging import dsx_logging
 
+# Retention is enforced in batches: once every this many inserts, ids older than
+# (newest id - retain) are dropped from the record hash and every index.
+_TRIM_EVERY = 50
+
+# Page size used when walking an index for a filtered query.
+_INDEX_SLICE = 200
+
+# Records moved per step when migrating the legacy newest-first list.
+_MIGRATE_BATCH = 500
+
+_TRIM_LUA = """
+local old = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", ARGV[1], "LIMIT", 0, 5000)
+if #old == 0 then
+    return 0
+end
+for i = 1, #old, 500 do
+    redis.call("HDEL", KEYS[1], unpack(old, i, math.min(i + 499, #old)))
+end
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", old[#old])
+for _, index_key in ipairs(redis.call("SMEMBERS", KEYS[3])) do
+    redis.call("ZREMRANGEBYSCORE", index_key, "-inf", ARGV[1])
+end
+return #old
+"""
+
 
 class ScanResultsRedisDB(ScanResultsBaseDB):
     """Redis-backed scan results store.
 
-    Data model:
-    - List newest-first at key 'dsxconnect:scan_results' (LPUSH + LTRIM retain)
-    - Per-job lists at 'dsxconnect:scan_results_by_job:<job_id>' (optional, for fast queries)
-    - Per-task lookup at 'dsxconnect:scan_result_by_task:<task_id>' (string JSON)
+    Data model (prefix 'dsxconnect:scan_results'):
+    - ':records'                 hash id -> JSON payload
+    - ':by_time'                 sorted set of ids scored by id (ids are assigned in insertion order)
+    - ':by_verdict:<verdict>'    sorted set of ids per verdict
+    - ':by_connector:<uuid|url>' sorted set of ids per connector
+    - ':by_job:<job_id>'         sorted set of ids per job (expires after 14 days)
+    - ':indexes'                 set of verdict/connector index keys, trimmed together with ':by_time'
+    - 'dsxconnect:scan_result_by_task:<task_id>' record id for direct task lookups (older
+      versions stored the full JSON; both are read)
+
+    Records are written in batches by `insert_many` (see taskworkers/result_writer.py).
+    Queries walk an index newest-first and fetch only the matching ids with HMGET.
+
+    Earlier versions kept full payloads in a newest-first list at 'dsxconnect:scan_results'
+    (and per-job lists at 'dsxconnect:scan_results_by_job:<job_id>'). The first instance
+    to start moves that list into the layout above; see `_migrate_legacy_list`.
     """
 
     def __init__(self, retain: int = -1, collection_name: str = "scan_results"):
@@ -24,8 +60,17 @@ class ScanResultsRedisDB(ScanResultsBaseDB):
         self._r = redis.from_url(str(cfg.results_database.loc))
         # keys
         self._main_key = f"dsxconnect:{collection_name}"
+        self._records_key = f"{self._main_key}:records"
+        self._time_key = f"{self._main_key}:by_time"
+        self._indexes_key = f"{self._main_key}:indexes"
         self._task_key_prefix = f"dsxconnect:scan_result_by_task:"
-        self._job_key_prefix = f"dsxconnect:{collection_name}_by_job:"
+        self._job_key_prefix = f"{self._main_key}:by_job:"
+        self._legacy_job_key_prefix = f"{self._main_key}_by_job:"
+        self._trim_script = self._r.register_script(_TRIM_LUA)
+        try:
+            self._migrate_legacy_list()
+        except Exception as e:
+            dsx_logging.warning(f"Scan results: migrating legacy list {self._main_key} failed: {e}")
 
     # ---------- helpers ----------
     @staticmethod
@@ -36,107 +81,287 @@ class ScanResultsRedisDB(ScanResultsBaseDB):
             return sr.json()
 
     @staticmethod
-    def _from_json(s: str) -> ScanResultModel:
-        data = json.loads(s)
-        return ScanResultModel.model_validate(data)
+    def _from_json(s: str | bytes) -> ScanResultModel:
+        return ScanResultModel.model_validate_json(s)
 
-    # ---------- base impl ----------
-    def read_all(self) -> List[ScanResultModel]:
-        vals = self._r.lrange(self._main_key, 0, -1) or []
+    def _verdict_key(self, verdict: str) -> str:
+        return f"{self._main_key}:by_verdict:{verdict}"
+
+    def _connector_key(self, connector: str) -> str:
+        return f"{self._main_key}:by_connector:{connector}"
+
+    @staticmethod
+    def _verdict_of(sr: ScanResultModel) -> str | None:
+        verdict = getattr(getattr(sr, "verdict", None), "verdict", None)
+        if verdict is None:
+            return None
+        return str(getattr(verdict, "value", verdict))
+
+    @staticmethod
+    def _connector_of(sr: ScanResultModel) -> str | None:
+        req = getattr(sr, "scan_request", None)
+        if req is None:
+            return None
+        connector = getattr(req, "connector", None)
+        if connector is not None and getattr(connector, "uuid", None):
+            return str(connector.uuid)
+        return getattr(req, "connector_url", None) or None
+
+    @staticmethod
+    def _job_of(sr: ScanResultModel) -> str | None:
+        return getattr(sr, "scan_job_id", None) or getattr(getattr(sr, "scan_request", None), "scan_job_id", None)
+
+    def _load(self, ids: list) -> list[ScanResultModel]:
+        if not ids:
+            return []
         out = []
-        for b in vals:
+        for raw in self._r.hmget(self._records_key, ids):
+            if not raw:
+                # Evicted by retention; indexes are trimmed lazily.
+                continue
             try:
-                out.append(self._from_json(b.decode("utf-8") if isinstance(b, (bytes, bytearray)) else b))
+                out.append(self._from_json(raw))
             except Exception:
                 continue
         return out
 
-    def insert(self, scan_result: ScanResultModel):
-        # Assign a monotonically increasing id if not present
+    def _migrate_legacy_list(self) -> None:
+        """
+        Move records from the legacy list into the records hash and indexes, oldest first.
+
+        One instance migrates at a time (SET NX lock). Each batch is removed from the tail
+        of the list only after insert_many stored it, and re-inserting a record keeps its
+        id, so an interrupted migration resumes on the next start without losing or
+        duplicating records. The legacy per-job lists are dropped once the list is empty.
+        """
+        key_type = self._r.type(self._main_key)
+        if (key_type.decode() if isinstance(key_type, bytes) else key_type) != "list":
+            return
+        lock_key = f"{self._main_key}:migrate_lock"
+        if not self._r.set(lock_key, 1, nx=True, ex=600):
+            return
+        moved = 0
         try:
-            if getattr(scan_result, "id", -1) is None or int(getattr(scan_result, "id", -1)) < 0:
-                seq_key = f"{self._main_key}:seq"
-                new_id = int(self._r.incr(seq_key))
-                scan_result.id = new_id
-        except Exception:
-            pass
-        payload = self._to_json(scan_result)
-        pipe = self._r.pipeline()
-        pipe.lpush(self._main_key, payload)
-        if self._retain > 0:
-            pipe.ltrim(self._main_key, 0, max(0, self._retain - 1))
-        # Index by task id
-        task_id = getattr(scan_result, "scan_request_task_id", None)
-        if task_id:
-            pipe.set(f"{self._task_key_prefix}{task_id}", payload, ex=7 * 24 * 3600)
-        # Index by job id
-        job_id = getattr(scan_result, "scan_job_id", None) or getattr(getattr(scan_result, "scan_request", None), "scan_job_id", None)
-        if job_id:
-            jkey = f"{self._job_key_prefix}{job_id}"
-            pipe.lpush(jkey, payload)
-            if self._retain > 0:
-                pipe.ltrim(jkey, 0, max(0, self._retain - 1))
+            while True:
+                raw = self._r.lrange(self._main_key, -_MIGRATE_BATCH, -1)
+                if not raw:
+                    break
+                batch = []
+                for payload in reversed(raw):
+                    try:
+                        batch.append(self._from_json(payload))
+                    except Exception:
+                        continue
+                self.insert_many(batch)
+                self._r.ltrim(self._main_key, 0, -(len(raw) + 1))
+                self._r.expire(lock_key, 600)
+                moved += len(batch)
+            pipe = self._r.pipeline(transaction=False)
+            for key in self._r.scan_iter(f"{self._legacy_job_key_prefix}*"):
+                pipe.delete(key)
+            pipe.execute()
+        finally:
+            self._r.delete(lock_key)
+        dsx_logging.info(f"Scan results: migrated {moved} record(s) from legacy list {self._main_key}")
+
+    # ---------- base impl ----------
+    def read_all(self) -> List[ScanResultModel]:
+        return self._load(self._r.zrevrange(self._time_key, 0, -1))
+
+    def insert(self, scan_result: ScanResultModel):
+        self.insert_many([scan_result])
+
+    def insert_many(self, scan_results: list[ScanResultModel]) -> None:
+        """
+        Store a batch in one pipeline: ids come from a single INCRBY, the JSON payload is
+        written once to the records hash, and every index (time, verdict, connector, job,
+        task) holds only the id.
+        """
+        if not scan_results:
+            return
+        # Assign monotonically increasing ids to records that do not have one yet
+        missing = [sr for sr in scan_results if getattr(sr, "id", -1) is None or int(getattr(sr, "id", -1)) < 0]
+        if missing:
+            last_id = int(self._r.incrby(f"{self._main_key}:seq", len(missing)))
+            for offset, sr in enumerate(missing):
+                sr.id = last_id - len(missing) + 1 + offset
+
+        records: dict[int, str] = {}
+        by_time: dict[int, int] = {}
+        by_index: dict[str, dict[int, int]] = {}
+        by_job: dict[str, dict[int, int]] = {}
+        task_ids: dict[str, int] = {}
+        for sr in scan_results:
+            rid = int(sr.id)
+            records[rid] = self._to_json(sr)
+            by_time[rid] = rid
+            verdict = self._verdict_of(sr)
+            if verdict:
+                by_index.setdefault(self._verdict_key(verdict), {})[rid] = rid
+            connector = self._connector_of(sr)
+            if connector:
+                by_index.setdefault(self._connector_key(connector), {})[rid] = rid
+            job_id = self._job_of(sr)
+            if job_id:
+                by_job.setdefault(f"{self._job_key_prefix}{job_id}", {})[rid] = rid
+            task_id = getattr(sr, "scan_request_task_id", None)
+            if task_id:
+                task_ids[f"{self._task_key_prefix}{task_id}"] = rid
+
+        pipe = self._r.pipeline(transaction=False)
+        pipe.hset(self._records_key, mapping=records)
+        pipe.zadd(self._time_key, by_time)
+        for index_key, members in by_index.items():
+            pipe.zadd(index_key, members)
+        if by_index:
+            pipe.sadd(self._indexes_key, *by_index.keys())
+        for jkey, members in by_job.items():
+            pipe.zadd(jkey, members)
             # Optional expiry to avoid unbounded growth
             pipe.expire(jkey, 14 * 24 * 3600)
+        for tkey, rid in task_ids.items():
+            pipe.set(tkey, rid, ex=7 * 24 * 3600)
         pipe.execute()
-        self._check_retain_limit()  # no-op for Redis (we already trim)
+        self._trim(min(records), max(records))
+
+    def _trim(self, first_id: int, newest_id: int) -> None:
+        # Trim when the batch [first_id, newest_id] crossed a multiple of _TRIM_EVERY.
+        if self._retain > 0 and newest_id // _TRIM_EVERY > (first_id - 1) // _TRIM_EVERY:
+            self._trim_script(
+                keys=[self._records_key, self._time_key, self._indexes_key],
+                args=[newest_id - self._retain],
+            )
+
+    def _by_task(self, task_id: str) -> Optional[ScanResultModel]:
+        raw = self._r.get(f"{self._task_key_prefix}{task_id}")
+        if not raw:
+            return None
+        text = raw.decode() if isinstance(raw, (bytes, bytearray)) else str(raw)
+        if text.lstrip().startswith("{"):
+            # Full payload written by earlier versions
+            return self._from_json(text)
+        found = self._load([text])
+        return found[0] if found else None
 
     def delete(self, key, value) -> ScanResultModel:
-        # Not used by current code; implement best-effort remove from lists
         # Return the first matching record if found, else raise KeyError
         if key == "scan_request_task_id":
-            raw = self._r.get(f"{self._task_key_prefix}{value}")
-            if raw:
-                rec = self._from_json(raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else raw)
+            try:
+                rec = self._by_task(value)
+            except Exception:
+                rec = None
+            if rec is not None:
                 try:
                     self._r.delete(f"{self._task_key_prefix}{value}")
+                    self._remove_ids([rec.id])
                 finally:
                     return rec
-        # Generic: scan main list and remove first match
-        all_vals = self._r.lrange(self._main_key, 0, -1) or []
-        for b in all_vals:
-            try:
-                rec = self._from_json(b.decode("utf-8") if isinstance(b, (bytes, bytearray)) else b)
-            except Exception:
-                continue
-            if getattr(rec, key, None) == value or (
-                getattr(rec, "scan_request", None) and getattr(getattr(rec, "scan_request"), key, None) == value
-            ):
-                # remove one occurrence
-                self._r.lrem(self._main_key, 1, b)
-                return rec
+        if key == "id":
+            found = self._load([value])
+            if found:
+                self._remove_ids([value])
+                return found[0]
+            raise KeyError("record_not_found")
+        for rec in self.find(key, value) or []:
+            self._remove_ids([rec.id])
+            return rec
         raise KeyError("record_not_found")
 
+    def _index_keys_of(self, sr: ScanResultModel) -> list[str]:
+        keys = []
+        verdict = self._verdict_of(sr)
+        if verdict:
+            keys.append(self._verdict_key(verdict))
+        connector = self._connector_of(sr)
+        if connector:
+            keys.append(self._connector_key(connector))
+        job_id = self._job_of(sr)
+        if job_id:
+            keys.append(f"{self._job_key_prefix}{job_id}")
+        return keys
+
+    def _remove_ids(self, ids: list) -> None:
+        if not ids:
+            return
+        pipe = self._r.pipeline()
+        # Drop the ids from the verdict/connector/job indexes they were filed under
+        for rec in self._load(ids):
+            for index_key in self._index_keys_of(rec):
+                pipe.zrem(index_key, rec.id)
+        pipe.hdel(self._records_key, *ids)
+        pipe.zrem(self._time_key, *ids)
+        pipe.execute()
+
     def delete_oldest(self):
-        # Drop from tail
-        self._r.rpop(self._main_key)
+        oldest = self._r.zrange(self._time_key, 0, 0)
+        if oldest:
+            self._remove_ids(oldest)
+
+    def page(
+            self,
+            limit: int = 200,
+            *,
+            cursor: int | None = None,
+            job_id: str | None = None,
+            verdict: str | None = None,
+            connector: str | None = None,
+    ) -> tuple[list[ScanResultModel], int | None]:
+        """
+        Newest-first page of results with ids below `cursor`.
+
+        Walks the most selective index (job, then connector, then verdict) in slices and
+        returns (items, next_cursor); next_cursor is None when no older results remain. One
+        match past `limit` is read to tell the two apart, as the base implementation does.
+        """
+        limit = max(1, int(limit))
+        if job_id:
+            index = f"{self._job_key_prefix}{job_id}"
+        elif connector:
+            index = self._connector_key(connector)
+        elif verdict:
+            index = self._verdict_key(verdict)
+        else:
+            index = self._time_key
+        upper = f"({int(cursor)}" if cursor is not None else "+inf"
+        out: list[ScanResultModel] = []
+        while len(out) <= limit:
+            ids = self._r.zrevrangebyscore(index, upper, "-inf", start=0, num=_INDEX_SLICE)
+            if not ids:
+                break
+            for rec in self._load(ids):
+                if verdict and self._verdict_of(rec) != verdict:
+                    continue
+                if connector and self._connector_of(rec) != connector:
+                    continue
+                out.append(rec)
+                if len(out) > limit:
+                    break
+            upper = f"({int(ids[-1])}"
+        if len(out) > limit:
+            return out[:limit], int(out[limit - 1].id)
+        return out, None
+
+    def recent(self, limit: int = 200, job_id: Optional[str] = None) -> list[ScanResultModel]:
+        items, _ = self.page(limit, job_id=job_id)
+        return items
 
     def find(self, key: str, value: str) -> Optional[List[ScanResultModel]]:
         if key == "scan_request_task_id":
-            raw = self._r.get(f"{self._task_key_prefix}{value}")
-            if not raw:
-                return []
             try:
-                return [self._from_json(raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else raw)]
+                rec = self._by_task(value)
             except Exception:
                 return []
+            return [rec] if rec is not None else []
         if key == "scan_job_id":
-            vals = self._r.lrange(f"{self._job_key_prefix}{value}", 0, -1) or []
-            out = []
-            for b in vals:
-                try:
-                    out.append(self._from_json(b.decode("utf-8") if isinstance(b, (bytes, bytearray)) else b))
-                except Exception:
-                    continue
-            return out
+            return self._load(self._r.zrevrange(f"{self._job_key_prefix}{value}", 0, -1))
+        if key == "verdict":
+            return self._load(self._r.zrevrange(self._verdict_key(value), 0, -1))
+        if key == "connector":
+            return self._load(self._r.zrevrange(self._connector_key(value), 0, -1))
         # Fallback: linear scan of recent items
-        vals = self._r.lrange(self._main_key, 0, max(0, (self._retain - 1) if self._retain > 0 else 9999)) or []
+        count = self._retain if self._retain > 0 else 10000
         out: list[ScanResultModel] = []
-        for b in vals:
-            try:
-                rec = self._from_json(b.decode("utf-8") if isinstance(b, (bytes, bytearray)) else b)
-            except Exception:
-                continue
+        for rec in self._load(self._r.zrevrange(self._time_key, 0, count - 1)):
             if getattr(rec, key, None) == value or (
                 getattr(rec, "scan_request", None) and getattr(getattr(rec, "scan_request"), key, None) == value
             ):
@@ -145,22 +370,19 @@ class ScanResultsRedisDB(ScanResultsBaseDB):
 
     def __len__(self) -> int:
         try:
-            return int(self._r.llen(self._main_key) or 0)
+            return int(self._r.zcard(self._time_key) or 0)
         except Exception as e:
-            dsx_logging.debug(f"redis llen failed: {e}")
+            dsx_logging.debug(f"redis zcard failed: {e}")
             return 0
 
     def clear(self, job_id: str | None = None) -> None:
+        # A specific job id still clears everything, for consistency with UI expectations.
         pipe = self._r.pipeline()
-        if job_id:
-            # Best-effort: drop job-specific list; main list may still contain entries, so fall back to full clear
-            pipe.delete(f"{self._job_key_prefix}{job_id}")
-            # For simplicity and consistency with UI expectations, clear all when requested with a specific job id.
-        # Clear main list, sequence, and all per-job lists
-        pipe.delete(self._main_key, f"{self._main_key}:seq")
+        pipe.delete(self._main_key, f"{self._main_key}:seq", self._records_key, self._time_key, self._indexes_key)
         try:
-            for key in self._r.scan_iter(f"{self._job_key_prefix}*"):
-                pipe.delete(key)
+            for pattern in (f"{self._main_key}:by_*", f"{self._legacy_job_key_prefix}*"):
+                for key in self._r.scan_iter(pattern):
+                    pipe.delete(key)
         except Exception:
             pass
         pipe.execute()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dsx_connect.models.scan_result import ScanStatsModel
+from dsx_connect.models.scan_result import ScanResultModel, ScanStatsModel
 
 
 class ScanStatsBaseDB(ABC):
@@ -14,3 +14,8 @@ class ScanStatsBaseDB(ABC):
     @abstractmethod
     def get(self) -> ScanStatsModel:
         pass
+
+    @abstractmethod
+    def record(self, scan_result: ScanResultModel):
+        """Fold one scan result into the stats atomically (no read-modify-write across workers)."""
+        pass
@@ -1,22 +1,53 @@
-import json
-from dsx_connect.models.scan_result import ScanStatsModel
+import threading
+
+from dsx_connect.models.scan_result import ScanResultModel, ScanStatsModel
 from dsx_connect.database.scan_stats_base_db import ScanStatsBaseDB
+from dsx_connect.database.scan_stats_sketch import (
+    COUNTER_FIELDS, QuantileSketch, build_scan_stats, scan_result_counters, scan_result_label,
+)
 
 
 class ScanStatsCollection(ScanStatsBaseDB):
     def __init__(self):
         super().__init__()
-        self._record = None  # Only one stats record now
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._longest: tuple[int, str, int] = (-1, "", -1)
+        self._scan_time_sketch = QuantileSketch()
+        self._file_size_sketch = QuantileSketch()
+
+    def record(self, scan_result: ScanResultModel):
+        incr = scan_result_counters(scan_result)
+        scan_us = incr["total_scan_time_in_microseconds"]
+        size = incr["total_file_size"]
+        with self._lock:
+            for field, value in incr.items():
+                self._counters[field] = self._counters.get(field, 0) + value
+            if scan_us > self._longest[0]:
+                self._longest = (scan_us, scan_result_label(scan_result), size)
+            self._scan_time_sketch.add(scan_us)
+            self._file_size_sketch.add(size)
 
     def upsert(self, stats: ScanStatsModel):
-        stats_dict = json.loads(stats.json())
-        if self._record:
-            self._record.update(stats_dict)
-        else:
-            self._record = stats_dict
+        with self._lock:
+            self._counters = {field: max(0, int(getattr(stats, field))) for field in COUNTER_FIELDS}
+            self._longest = (
+                stats.longest_scan_time_in_microseconds,
+                stats.longest_scan_time_file,
+                stats.longest_scan_time_file_size_in_bytes,
+            )
 
     def get(self) -> ScanStatsModel:
-        return ScanStatsModel(**self._record) if self._record else ScanStatsModel()
+        with self._lock:
+            longest_us, longest_file, longest_size = self._longest
+            return build_scan_stats(
+                self._counters,
+                longest_us=longest_us,
+                longest_file=longest_file,
+                longest_file_size=longest_size,
+                scan_time_sketch=self._scan_time_sketch,
+                file_size_sketch=self._file_size_sketch,
+            )
 
     def __len__(self):
-        return 1 if self._record else 0
+        return 1 if self._counters.get("files_scanned") else 0
@@ -1,38 +1,150 @@
-import json
+import os
+import time
+
 import redis
 
 from dsx_connect.database.scan_stats_base_db import ScanStatsBaseDB
-from dsx_connect.models.scan_result import ScanStatsModel
+from dsx_connect.database.scan_stats_sketch import (
+    COUNTER_FIELDS, QuantileSketch, build_scan_stats, merged_sketch, scan_result_counters, scan_result_label,
+)
+from dsx_connect.models.scan_result import ScanResultModel, ScanStatsModel
 from dsx_connect.config import get_config
 
 
+# One round trip per scan result: counters, longest-scan max and sketch buckets.
+# KEYS[1] = counter shard hash, KEYS[2] = longest hash, KEYS[3]/KEYS[4] = all-time scan time / file size
+# sketches, KEYS[5]/KEYS[6] = current-window sketches.
+# ARGV = window_ttl, scan_us, file_size, scan_bucket, size_bucket, label, then (counter, incr) pairs.
+_RECORD_LUA = """
+for i = 7, #ARGV, 2 do
+    redis.call("HINCRBY", KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call("HINCRBY", KEYS[3], ARGV[4], 1)
+redis.call("HINCRBY", KEYS[4], ARGV[5], 1)
+redis.call("HINCRBY", KEYS[5], ARGV[4], 1)
+redis.call("HINCRBY", KEYS[6], ARGV[5], 1)
+redis.call("EXPIRE", KEYS[5], ARGV[1])
+redis.call("EXPIRE", KEYS[6], ARGV[1])
+
+local scan_us = tonumber(ARGV[2])
+local longest = tonumber(redis.call("HGET", KEYS[2], "us") or "-1")
+if scan_us > longest then
+    redis.call("HSET", KEYS[2], "us", scan_us, "file", ARGV[6], "size", ARGV[3])
+end
+return 1
+"""
+
+
 class ScanStatsRedisDB(ScanStatsBaseDB):
-    """Redis-backed scan stats store using a single JSON blob.
+    """Redis-backed scan stats built from sharded HINCRBY counters and quantile sketches.
 
-    Key: 'dsxconnect:scan_stats'
+    Keys (prefix 'dsxconnect:scan_stats'):
+      :counters:<shard>            hash of COUNTER_FIELDS; a worker process always writes the same shard
+      :longest                     hash with the longest scan (us, file, size)
+      :sketch:<metric>             all-time sketch buckets (metric = scan_time | file_size)
+      :sketch:<metric>:<window>    per-window sketch buckets, expiring after `window_retention_seconds`
     """
 
-    def __init__(self, collection_name: str = 'scan_stats'):
+    def __init__(
+            self,
+            collection_name: str = 'scan_stats',
+            *,
+            shards: int = 8,
+            window_seconds: int = 3600,
+            window_retention_seconds: int = 7 * 24 * 3600,
+    ):
         self._key = f"dsxconnect:{collection_name}"
+        self._shards = max(1, int(shards))
+        self._window_seconds = max(60, int(window_seconds))
+        self._window_retention = max(self._window_seconds, int(window_retention_seconds))
         cfg = get_config()
-        self._r = redis.from_url(str(cfg.results_database.loc))
+        self._r = redis.from_url(str(cfg.results_database.loc), decode_responses=True)
+        self._record_script = self._r.register_script(_RECORD_LUA)
+        self._sketch = QuantileSketch()
+
+    def _counter_key(self, shard: int) -> str:
+        return f"{self._key}:counters:{shard}"
+
+    def _sketch_key(self, metric: str, window: int | None = None) -> str:
+        base = f"{self._key}:sketch:{metric}"
+        return base if window is None else f"{base}:{window}"
+
+    def _window(self, ts: float) -> int:
+        return int(ts) - int(ts) % self._window_seconds
+
+    def record(self, scan_result: ScanResultModel):
+        incr = scan_result_counters(scan_result)
+        scan_us = incr["total_scan_time_in_microseconds"]
+        size = incr["total_file_size"]
+        window = self._window(time.time())
+        args = [
+            self._window_retention,
+            scan_us,
+            size,
+            self._sketch.bucket(scan_us),
+            self._sketch.bucket(size),
+            scan_result_label(scan_result),
+        ]
+        for field, value in incr.items():
+            args.extend([field, value])
+        self._record_script(
+            keys=[
+                self._counter_key(os.getpid() % self._shards),
+                f"{self._key}:longest",
+                self._sketch_key("scan_time"),
+                self._sketch_key("file_size"),
+                self._sketch_key("scan_time", window),
+                self._sketch_key("file_size", window),
+            ],
+            args=args,
+        )
 
     def upsert(self, stats: ScanStatsModel):
-        try:
-            payload = stats.model_dump_json()
-        except Exception:
-            payload = stats.json()
-        self._r.set(self._key, payload)
-
-    def get(self) -> ScanStatsModel:
-        raw = self._r.get(self._key)
-        if not raw:
-            return ScanStatsModel()
-        try:
-            data = raw.decode('utf-8') if isinstance(raw, (bytes, bytearray)) else raw
-            return ScanStatsModel.model_validate(json.loads(data))
-        except Exception:
-            return ScanStatsModel()
+        pipe = self._r.pipeline()
+        pipe.delete(*[self._counter_key(shard) for shard in range(self._shards)])
+        pipe.hset(self._counter_key(0), mapping={f: max(0, int(getattr(stats, f))) for f in COUNTER_FIELDS})
+        pipe.hset(f"{self._key}:longest", mapping={
+            "us": stats.longest_scan_time_in_microseconds,
+            "file": stats.longest_scan_time_file,
+            "size": stats.longest_scan_time_file_size_in_bytes,
+        })
+        pipe.execute()
+
+    def get(self, window_hours: int | None = None) -> ScanStatsModel:
+        """
+        All-time counters; quantiles are all-time, or over the last `window_hours` when given.
+
+        `window_hours` is clamped to the window retention: older windows have expired anyway.
+        """
+        pipe = self._r.pipeline(transaction=False)
+        for shard in range(self._shards):
+            pipe.hgetall(self._counter_key(shard))
+        pipe.hgetall(f"{self._key}:longest")
+        if window_hours:
+            now = self._window(time.time())
+            span = min(int(window_hours) * 3600, self._window_retention)
+            windows = [now - i * self._window_seconds for i in range(max(1, span // self._window_seconds))]
+        else:
+            windows = [None]
+        for metric in ("scan_time", "file_size"):
+            for window in windows:
+                pipe.hgetall(self._sketch_key(metric, window))
+        results = pipe.execute()
+
+        counters: dict[str, int] = {}
+        for shard_counts in results[:self._shards]:
+            for field, value in (shard_counts or {}).items():
+                counters[field] = counters.get(field, 0) + int(value)
+        longest = results[self._shards] or {}
+        sketches = results[self._shards + 1:]
+        return build_scan_stats(
+            counters,
+            longest_us=int(longest.get("us", -1)),
+            longest_file=longest.get("file", ""),
+            longest_file_size=int(longest.get("size", -1)),
+            scan_time_sketch=merged_sketch(sketches[:len(windows)]),
+            file_size_sketch=merged_sketch(sketches[len(windows):]),
+        )
 
     def __len__(self):
-        return 1 if self._r.exists(self._key) else 0
+        return 1 if any(self._r.exists(self._counter_key(shard)) for shard in range(self._shards)) else 0
@@ -0,0 +1,168 @@
+"""
+Shared building blocks for scan statistics backends.
+
+`QuantileSketch` is a DDSketch-style log-bucketed histogram: every value maps to
+bucket ceil(log_gamma(value)), so any quantile is reported within
+`relative_accuracy` of the true value. Buckets are plain counters, so sketches
+merge by adding counts. The Redis backend keeps them in hashes updated with
+HINCRBY. Memory is bounded by the value range (about 1.4k buckets for 1..1e12
+at 1% accuracy), not by the number of scans.
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable, Mapping
+
+from dsx_connect.models.scan_result import ScanResultModel, ScanStatsModel
+from dsxa_sdk_py.models import VerdictEnum
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Bucket key for values <= 0 (log is undefined there).
+ZERO_BUCKET = "z"
+
+# Counter fields folded per scan result; everything else in ScanStatsModel is derived from these.
+COUNTER_FIELDS = (
+    "files_scanned",
+    "benign_count",
+    "malicious_count",
+    "unknown_count",
+    "unsupported_count",
+    "not_scanned_count",
+    "encrypted_count",
+    "total_scan_time_in_microseconds",
+    "total_file_size",
+)
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, counts: Mapping[str, int] | None = None):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.counts: dict[str, int] = {}
+        if counts:
+            self.merge_counts(counts)
+
+    def bucket(self, value: float) -> str:
+        if value <= 0:
+            return ZERO_BUCKET
+        return str(math.ceil(math.log(value) / self._log_gamma))
+
+    def add(self, value: float, count: int = 1) -> None:
+        key = self.bucket(value)
+        self.counts[key] = self.counts.get(key, 0) + count
+
+    def merge_counts(self, counts: Mapping[str, int | str]) -> None:
+        for key, count in counts.items():
+            key = key.decode() if isinstance(key, (bytes, bytearray)) else str(key)
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self.merge_counts(other.counts)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def _value(self, key: str) -> float:
+        if key == ZERO_BUCKET:
+            return 0.0
+        return 2 * self._gamma ** int(key) / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if total <= 0:
+            return None
+        rank = max(0.0, min(1.0, q)) * (total - 1)
+        ordered = sorted(self.counts, key=lambda k: -math.inf if k == ZERO_BUCKET else int(k))
+        seen = 0
+        for key in ordered:
+            seen += self.counts[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(ordered[-1])
+
+
+def scan_result_counters(scan_result: ScanResultModel) -> dict[str, int]:
+    """Counter increments contributed by one scan result."""
+    verdict = scan_result.verdict
+    incr = {
+        "files_scanned": 1,
+        "total_scan_time_in_microseconds": int(verdict.scan_duration_in_microseconds or 0),
+        "total_file_size": int(verdict.file_info.file_size_in_bytes or 0),
+    }
+    try:
+        v = verdict.verdict
+        if v == VerdictEnum.BENIGN:
+            incr["benign_count"] = 1
+        elif v == VerdictEnum.MALICIOUS:
+            incr["malicious_count"] = 1
+        elif v == VerdictEnum.UNKNOWN:
+            incr["unknown_count"] = 1
+        elif v == VerdictEnum.UNSUPPORTED:
+            incr["unsupported_count"] = 1
+        elif v in {VerdictEnum.NOT_SCANNED, VerdictEnum.NON_COMPLIANT}:
+            incr["not_scanned_count"] = 1
+            reason = verdict.verdict_details.reason if verdict.verdict_details else None
+            if reason and reason.strip().lower() == "encrypted file":
+                incr["encrypted_count"] = 1
+    except Exception:
+        # best-effort; ignore if structure not present
+        pass
+    return incr
+
+
+def scan_result_label(scan_result: ScanResultModel) -> str:
+    # Ensure a string is stored; fallback when metadata_tag is None
+    return scan_result.metadata_tag or (scan_result.scan_request.location if scan_result.scan_request else "")
+
+
+def build_scan_stats(
+        counters: Mapping[str, int],
+        *,
+        longest_us: int = -1,
+        longest_file: str = "",
+        longest_file_size: int = -1,
+        scan_time_sketch: QuantileSketch | None = None,
+        file_size_sketch: QuantileSketch | None = None,
+) -> ScanStatsModel:
+    """Derive the full ScanStatsModel (averages, quantiles, longest scan) from raw counters and sketches."""
+    stats = ScanStatsModel()
+    files = int(counters.get("files_scanned", 0))
+    if files <= 0:
+        return stats
+    for field in COUNTER_FIELDS:
+        setattr(stats, field, int(counters.get(field, 0)))
+    stats.total_scan_time_in_seconds = stats.total_scan_time_in_microseconds / 1000000
+    stats.avg_file_size = int(stats.total_file_size / files)
+    stats.avg_scan_time_in_microseconds = int(stats.total_scan_time_in_microseconds / files)
+    stats.avg_scan_time_in_milliseconds = stats.avg_scan_time_in_microseconds / 1000
+    stats.avg_scan_time_in_seconds = stats.avg_scan_time_in_milliseconds / 1000
+
+    if longest_us >= 0:
+        stats.longest_scan_time_in_microseconds = int(longest_us)
+        stats.longest_scan_time_in_milliseconds = stats.longest_scan_time_in_microseconds / 1000
+        stats.longest_scan_time_in_seconds = stats.longest_scan_time_in_milliseconds / 1000
+        stats.longest_scan_time_file = longest_file
+        stats.longest_scan_time_file_size_in_bytes = int(longest_file_size)
+
+    for prefix, sketch, suffix in (
+        ("scan_time", scan_time_sketch, "in_microseconds"),
+        ("file_size", file_size_sketch, "in_bytes"),
+    ):
+        if sketch is None or sketch.count <= 0:
+            continue
+        for label, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            setattr(stats, f"{label}_{prefix}_{suffix}", int(round(sketch.quantile(q))))
+    stats.median_scan_time_in_microseconds = stats.p50_scan_time_in_microseconds
+    stats.median_file_size_in_bytes = stats.p50_file_size_in_bytes
+    return stats
+
+
+def merged_sketch(count_maps: Iterable[Mapping[str, int | str]], relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> QuantileSketch:
+    sketch = QuantileSketch(relative_accuracy)
+    for counts in count_maps:
+        if counts:
+            sketch.merge_counts(counts)
+    return sketch
@@ -0,0 +1,211 @@
+"""
+In-process fan-out of a Redis pub/sub channel to many SSE clients.
+
+`FanoutHub` keeps ONE subscription per API process and hands each message to
+every connected client. Redis load therefore stays the same no matter how many
+dashboards are open. Each message is parsed and serialized once in the hub,
+never per client.
+
+Every client has a bounded queue. A slow client loses its oldest events instead
+of stalling the hub or growing without limit. Status events that only carry the
+latest state (job progress) are coalesced: the queued older one is removed and
+the newer one joins the tail, so a client always sees ids in increasing order
+(a Last-Event-ID it sends never skips events still queued). The hub keeps a short history of events with ids of the form
+"<epoch>-<seq>". A reconnecting client that sends `Last-Event-ID` gets the
+events it missed, provided they are still in history and it reconnected to the
+same process (same epoch).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Hashable, Optional
+
+from shared.dsx_logging import dsx_logging
+
+# Returns a fresh async iterator of raw channel payloads, or None while the bus is unavailable.
+SourceFactory = Callable[[], Optional[AsyncIterator[bytes | str]]]
+# Returns a coalescing key for a parsed event, or None if the event must always be delivered.
+CoalesceKey = Callable[[dict], Optional[Hashable]]
+
+
+@dataclass(slots=True)
+class FanoutEvent:
+    id: str
+    seq: int
+    data: str
+    coalesce_key: Optional[Hashable] = None
+
+    def sse(self) -> str:
+        return f"id: {self.id}\ndata: {self.data}\n\n"
+
+
+class FanoutClient:
+    """One subscriber's bounded queue; drop-oldest when full, coalesced events move to the tail."""
+
+    def __init__(self, max_queue: int):
+        self.max_queue = max(1, int(max_queue))
+        self.dropped = 0
+        self._queue: deque[FanoutEvent] = deque()
+        self._wakeup = asyncio.Event()
+
+    def push(self, event: FanoutEvent) -> None:
+        if event.coalesce_key is not None:
+            for i, queued in enumerate(self._queue):
+                if queued.coalesce_key == event.coalesce_key:
+                    # Replacing in place would deliver this id ahead of lower ids queued behind it
+                    del self._queue[i]
+                    self._queue.append(event)
+                    self._wakeup.set()
+                    return
+        if len(self._queue) >= self.max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(event)
+        self._wakeup.set()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def get(self, timeout: float) -> Optional[FanoutEvent]:
+        """Next queued event, or None when nothing arrives within `timeout` seconds."""
+        if not self._queue:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._queue.popleft() if self._queue else None
+
+
+class FanoutHub:
+    def __init__(
+            self,
+            source: SourceFactory,
+            *,
+            name: str = "fanout",
+            history_size: int = 500,
+            client_queue_size: int = 256,
+            coalesce_key: CoalesceKey | None = None,
+            retry_seconds: float = 1.0,
+    ):
+        self.name = name
+        self._source = source
+        self._coalesce_key = coalesce_key
+        self._client_queue_size = client_queue_size
+        self._retry_seconds = retry_seconds
+        self._history: deque[FanoutEvent] = deque(maxlen=max(0, int(history_size)))
+        self._clients: set[FanoutClient] = set()
+        self._epoch = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._task: Optional[asyncio.Task] = None
+        self.received = 0
+        self.started_at: float | None = None
+
+    # ---- lifecycle -------------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"{self.name}-fanout")
+            self.started_at = time.time()
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            source = None
+            try:
+                source = self._source()
+                if source is None:
+                    await asyncio.sleep(self._retry_seconds)
+                    continue
+                async for raw in source:
+                    self.publish_raw(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                dsx_logging.warning(f"{self.name} fan-out subscription lost: {e.__class__.__name__}: {e}")
+            finally:
+                aclose = getattr(source, "aclose", None)
+                if aclose is not None:
+                    try:
+                        await aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(self._retry_seconds)
+
+    # ---- publishing --------------------------------------------------------------
+    def publish_raw(self, raw: bytes | str) -> Optional[FanoutEvent]:
+        """Parse one channel payload and deliver it to history and every client; bad frames are dropped."""
+        try:
+            text = raw.decode() if isinstance(raw, (bytes, bytearray)) else str(raw)
+            parsed = json.loads(text)
+        except Exception:
+            return None
+        key = None
+        if self._coalesce_key is not None and isinstance(parsed, dict):
+            try:
+                key = self._coalesce_key(parsed)
+            except Exception:
+                key = None
+        self._seq += 1
+        self.received += 1
+        event = FanoutEvent(id=f"{self._epoch}-{self._seq}", seq=self._seq, data=text, coalesce_key=key)
+        self._history.append(event)
+        for client in self._clients:
+            client.push(event)
+        return event
+
+    # ---- subscribing ----------------------------------------------------------------
+    def replay_since(self, last_event_id: str | None) -> list[FanoutEvent]:
+        """History after `last_event_id`; empty when the id is missing or from another process."""
+        if not last_event_id:
+            return []
+        epoch, _, seq = str(last_event_id).partition("-")
+        if epoch != self._epoch:
+            return []
+        try:
+            after = int(seq)
+        except ValueError:
+            return []
+        return [e for e in self._history if e.seq > after]
+
+    def subscribe(self, last_event_id: str | None = None) -> FanoutClient:
+        self._ensure_started()
+        client = FanoutClient(self._client_queue_size)
+        for event in self.replay_since(last_event_id):
+            client.push(event)
+        self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: FanoutClient) -> None:
+        self._clients.discard(client)
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self._clients),
+            "received": self.received,
+            "history": len(self._history),
+            "dropped": sum(c.dropped for c in self._clients),
+            "running": bool(self._task is not None and not self._task.done()),
+        }
+
+
+def job_status_coalesce_key(event: dict) -> Optional[Hashable]:
+    """Job status pushes only carry the latest counters, so queued ones for the same job can be replaced."""
+    inner = event.get("scan_result")
+    if isinstance(inner, dict) and inner.get("type") == "job_status":
+        job_id = (event.get("job") or {}).get("job_id")
+        if job_id:
+            return ("job_status", job_id)
+    return None
@@ -77,6 +77,12 @@ class Notifiers:
             except Exception:
                 continue  # drop bad frames
 
+    def listen_scan_results_raw(self) -> AsyncIterator[bytes]:
+        """Raw scan result payloads (unparsed); the SSE fan-out hub parses each one once for all viewers."""
+        if not self._abus:
+            raise RuntimeError("Async bus not configured")
+        return self._abus.listen(Channel.NOTIFY_SCAN_RESULT)
+
     async def subscribe_connector_notify(self) -> AsyncIterator[dict]:
         if not self._abus:
             raise RuntimeError("Async bus not configured")
@@ -15,5 +15,25 @@ def job_keys(job_id: str) -> str:
     return f"{job_key(job_id)}:tasks"
 
 
-def scanner_inflight_key() -> str:
-    return f"{PREFIX}:scanner:inflight"
+def scanner_leases_key() -> str:
+    return f"{PREFIX}:scanner:leases"
+
+
+def scanner_connector_leases_key(connector: str) -> str:
+    return f"{PREFIX}:scanner:leases:{connector}"
+
+
+def scanner_waiting_key() -> str:
+    return f"{PREFIX}:scanner:waiting"
+
+
+def scanner_wakeup_key() -> str:
+    return f"{PREFIX}:scanner:wakeup"
+
+
+def scanner_blocked_key() -> str:
+    return f"{PREFIX}:scanner:blocked"
+
+
+def scanner_wait_histogram_key() -> str:
+    return f"{PREFIX}:scanner:wait_hist"
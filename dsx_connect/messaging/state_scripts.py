@@ -1,30 +1,180 @@
 from __future__ import annotations
 
-# Acquire a scanner slot via an atomic INCR/check/rollback to enforce max inflight.
-# This avoids interleaving when multiple scan request workers contend for slots.
-
-ACQUIRE_SCANNER_SLOT_LUA = """
+# Record terminal outcomes for a job in one round trip and decide completion atomically,
+# so exactly one caller observes the transition to completed/cancelled.
+# KEYS[1] = job hash; ARGV = job_id, now, ttl, then (outcome_field, count) pairs.
+# Returns {completed_now, terminal_count, total, HGETALL...}.
+RECORD_JOB_TERMINAL_LUA = """
 local key = KEYS[1]
-local max_inflight = tonumber(ARGV[1])
-local ttl = tonumber(ARGV[2])
+local job_id = ARGV[1]
+local now = ARGV[2]
+local ttl = tonumber(ARGV[3])
+
+local n = 0
+for i = 4, #ARGV, 2 do
+    local c = tonumber(ARGV[i + 1])
+    redis.call("HINCRBY", key, ARGV[i], c)
+    n = n + c
+end
+
+redis.call("HSETNX", key, "job_id", job_id)
+redis.call("HSETNX", key, "status", "running")
+redis.call("HINCRBY", key, "processed_count", n)
+local terminal = redis.call("HINCRBY", key, "terminal_count", n)
+redis.call("HSETNX", key, "first_terminal_at", now)
+redis.call("HSET", key, "last_terminal_at", now, "last_update", now)
+redis.call("EXPIRE", key, ttl)
 
-local inflight = redis.call("INCR", key)
-if inflight == 1 then
-    redis.call("EXPIRE", key, ttl)
+local completed = 0
+local total = -1
+local f = redis.call("HMGET", key, "enqueue_done", "finished_at", "enqueued_total", "expected_total", "enqueued_count", "status")
+if f[1] == "1" and not f[2] then
+    for i = 3, 5 do
+        local v = f[i] and tonumber(f[i])
+        if v and v >= 0 then
+            total = v
+            break
+        end
+    end
+    if total >= 0 and terminal >= total then
+        local final_status = "completed"
+        if f[6] == "cancelled" then
+            final_status = "cancelled"
+        end
+        redis.call("HSET", key, "status", final_status, "finished_at", now, "last_update", now)
+        completed = 1
+    end
 end
 
-if inflight > max_inflight then
-    redis.call("DECR", key)
-    return {0, inflight - 1}
+local out = {completed, terminal, total}
+local all = redis.call("HGETALL", key)
+for i = 1, #all do
+    out[#out + 1] = all[i]
+end
+return out
+"""
+
+
+# Record enqueued scan requests for a job in one round trip.
+# KEYS[1] = job hash, KEYS[2] = job task-id list; ARGV = job_id, now, ttl, count, task_ids...
+# Returns HGETALL of the job hash.
+RECORD_JOB_ENQUEUED_LUA = """
+local key = KEYS[1]
+local job_id = ARGV[1]
+local now = ARGV[2]
+local ttl = tonumber(ARGV[3])
+local count = tonumber(ARGV[4])
+
+redis.call("HSETNX", key, "job_id", job_id)
+redis.call("HSETNX", key, "status", "running")
+redis.call("HSETNX", key, "started_at", now)
+local total = redis.call("HINCRBY", key, "enqueued_count", count)
+redis.call("HSETNX", key, "first_enqueued_at", now)
+redis.call("HSET", key, "enqueued_total", total, "expected_total", total, "last_enqueued_at", now, "last_update", now)
+
+-- RPUSH in slices to stay well below Lua's unpack() stack limit.
+local i = 5
+while i <= #ARGV do
+    local j = math.min(i + 499, #ARGV)
+    redis.call("RPUSH", KEYS[2], unpack(ARGV, i, j))
+    i = j + 1
 end
 
-return {1, inflight}
+redis.call("EXPIRE", key, ttl)
+return redis.call("HGETALL", key)
 """
 
 
-def get_acquire_scanner_script(redis_client):
-    script = getattr(redis_client, "_acquire_scanner_script", None)
+def _get_script(redis_client, attr: str, lua: str):
+    script = getattr(redis_client, attr, None)
     if script is None:
-        script = redis_client.register_script(ACQUIRE_SCANNER_SLOT_LUA)
-        setattr(redis_client, "_acquire_scanner_script", script)
+        script = redis_client.register_script(lua)
+        setattr(redis_client, attr, script)
     return script
+
+
+def get_record_job_terminal_script(redis_client):
+    return _get_script(redis_client, "_record_job_terminal_script", RECORD_JOB_TERMINAL_LUA)
+
+
+def get_record_job_enqueued_script(redis_client):
+    return _get_script(redis_client, "_record_job_enqueued_script", RECORD_JOB_ENQUEUED_LUA)
+
+
+# Scanner admission: a sorted-set semaphore where each member is a lease that expires on
+# its own, so a killed worker cannot leak capacity. With fair sharing enabled a connector
+# may hold at most ceil(max_inflight / contending connectors) leases.
+# KEYS[1] = leases zset, KEYS[2] = per-connector leases zset, KEYS[3] = waiting connectors zset,
+# KEYS[4] = wait histogram hash.
+# ARGV = lease_id, now, lease_ttl, max_inflight, fair (0/1), connector, waiting_ttl,
+#        wait_bucket, wait_ms.
+# Returns {acquired, inflight}.
+ADMIT_SCANNER_LEASE_LUA = """
+local now = tonumber(ARGV[2])
+local lease_ttl = tonumber(ARGV[3])
+local max_inflight = tonumber(ARGV[4])
+local fair = ARGV[5] == "1"
+local connector = ARGV[6]
+local waiting_ttl = tonumber(ARGV[7])
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+local inflight = redis.call("ZCARD", KEYS[1])
+if inflight >= max_inflight then
+    if fair then
+        redis.call("ZADD", KEYS[3], now + waiting_ttl, connector)
+    end
+    return {0, inflight}
+end
+
+if fair then
+    redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+    redis.call("ZREMRANGEBYSCORE", KEYS[3], "-inf", now)
+    local contenders = redis.call("ZCARD", KEYS[3])
+    if not redis.call("ZSCORE", KEYS[3], connector) then
+        contenders = contenders + 1
+    end
+    local share = math.max(1, math.ceil(max_inflight / contenders))
+    if redis.call("ZCARD", KEYS[2]) >= share then
+        redis.call("ZADD", KEYS[3], now + waiting_ttl, connector)
+        return {0, inflight}
+    end
+    redis.call("ZADD", KEYS[2], now + lease_ttl, ARGV[1])
+    redis.call("EXPIRE", KEYS[2], lease_ttl)
+end
+
+redis.call("ZADD", KEYS[1], now + lease_ttl, ARGV[1])
+redis.call("EXPIRE", KEYS[1], lease_ttl)
+redis.call("HINCRBY", KEYS[4], ARGV[8], 1)
+redis.call("HINCRBY", KEYS[4], "count", 1)
+redis.call("HINCRBY", KEYS[4], "sum_ms", tonumber(ARGV[9]))
+return {1, inflight + 1}
+"""
+
+
+# Release a scanner lease and wake one blocked waiter. A wake-up token is pushed only
+# while fewer tokens are queued than there are registered waiters, so tokens do not pile
+# up when nobody is blocked. Waiters past their deadline are dropped first.
+# KEYS[1] = leases zset, KEYS[2] = per-connector leases zset, KEYS[3] = wakeup list,
+# KEYS[4] = blocked waiters zset (scored by deadline).
+# ARGV = lease_id, now.
+RELEASE_SCANNER_LEASE_LUA = """
+local removed = redis.call("ZREM", KEYS[1], ARGV[1])
+redis.call("ZREM", KEYS[2], ARGV[1])
+if removed == 1 then
+    redis.call("ZREMRANGEBYSCORE", KEYS[4], "-inf", tonumber(ARGV[2]))
+    local waiters = redis.call("ZCARD", KEYS[4])
+    if redis.call("LLEN", KEYS[3]) < waiters then
+        redis.call("LPUSH", KEYS[3], "1")
+        redis.call("EXPIRE", KEYS[3], 60)
+    end
+end
+return removed
+"""
+
+
+def get_admit_scanner_lease_script(redis_client):
+    return _get_script(redis_client, "_admit_scanner_lease_script", ADMIT_SCANNER_LEASE_LUA)
+
+
+def get_release_scanner_lease_script(redis_client):
+    return _get_script(redis_client, "_release_scanner_lease_script", RELEASE_SCANNER_LEASE_LUA)
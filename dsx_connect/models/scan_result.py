@@ -41,6 +41,13 @@ class ScanStatsModel(BaseModel):
     avg_scan_time_in_seconds: float = -1
     median_file_size_in_bytes: int = -1
     median_scan_time_in_microseconds: int = -1
+    # Global quantiles (within ~1% relative error) from a mergeable log-bucket sketch.
+    p50_file_size_in_bytes: int = -1
+    p95_file_size_in_bytes: int = -1
+    p99_file_size_in_bytes: int = -1
+    p50_scan_time_in_microseconds: int = -1
+    p95_scan_time_in_microseconds: int = -1
+    p99_scan_time_in_microseconds: int = -1
     longest_scan_time_file: str = ''
     longest_scan_time_file_size_in_bytes: int = -1
     longest_scan_time_in_microseconds: int = -1
@@ -0,0 +1,71 @@
+"""
+Bounded spooling of connector file streams.
+
+Workers that hand a file to another service in chunks (DIANNA) need the exact size
+and digest before the first chunk goes out, but must not hold the file in memory.
+`spool_stream` copies a byte stream into a SpooledTemporaryFile that stays in
+memory up to `max_memory_bytes` and rolls over to disk beyond that, hashing on the
+way. `iter_spool` then reads it back one chunk at a time. Peak memory is about
+max_memory_bytes + one chunk, whatever the file size.
+"""
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Iterable, Iterator, Optional
+
+
+@dataclass
+class SpooledFile:
+    file: IO[bytes]
+    size: int
+    sha256: str
+
+    @property
+    def on_disk(self) -> bool:
+        return bool(getattr(self.file, "_rolled", True))
+
+    def close(self) -> None:
+        try:
+            self.file.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "SpooledFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def spool_stream(
+        chunks: Iterable[bytes],
+        *,
+        max_memory_bytes: int,
+        spool_dir: Optional[str] = None,
+) -> SpooledFile:
+    spool = tempfile.SpooledTemporaryFile(max_size=max(0, int(max_memory_bytes)), dir=spool_dir or None)
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            spool.write(chunk)
+            hasher.update(chunk)
+            size += len(chunk)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return SpooledFile(file=spool, size=size, sha256=hasher.hexdigest())
+
+
+def iter_spool(spooled: SpooledFile, chunk_size: int) -> Iterator[bytes]:
+    spooled.file.seek(0)
+    while True:
+        chunk = spooled.file.read(max(1, int(chunk_size)))
+        if not chunk:
+            return
+        yield chunk
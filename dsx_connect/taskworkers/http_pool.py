@@ -0,0 +1,207 @@
+"""
+Per-process pooled HTTP clients for Celery workers.
+
+Scan workers talk to the same DSXA scanner and the same handful of connectors
+for every task. Building a fresh httpx client per task throws away the TCP/TLS
+connection each time; these helpers keep one keep-alive pool per upstream per
+worker process and count how often requests reuse a pooled connection versus
+paying for a new handshake.
+
+The module deliberately does not import Celery; the worker modules wire
+`init_worker_http_clients` / `close_worker_http_clients` to the
+`worker_process_init` / `worker_process_shutdown` signals.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Optional, Union
+
+import httpx
+
+from shared.dsx_logging import dsx_logging
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class PoolStats:
+    requests: int = 0
+    tcp_connects: int = 0
+    tls_handshakes: int = 0
+    http2_connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.tcp_connects)
+
+    def as_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["reused"] = self.reused
+        out["reuse_ratio"] = round(self.reused / self.requests, 4) if self.requests else 0.0
+        return out
+
+
+# Pool counters are logged every this many requests per pool, and again at shutdown.
+_LOG_EVERY_REQUESTS = 1000
+
+_stats: dict[str, PoolStats] = {}
+_stats_lock = threading.Lock()
+
+_dsxa_http: Optional[httpx.Client] = None
+_dsxa_lock = threading.Lock()
+
+
+def _pool_stats(name: str) -> PoolStats:
+    with _stats_lock:
+        return _stats.setdefault(name, PoolStats())
+
+
+def _count_request(name: str, stats: PoolStats) -> None:
+    stats.requests += 1
+    if stats.requests % _LOG_EVERY_REQUESTS == 0:
+        log_http_pool_stats(only=name)
+
+
+def _make_trace(stats: PoolStats):
+    def trace(event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            stats.tcp_connects += 1
+        elif event_name == "connection.start_tls.complete":
+            stats.tls_handshakes += 1
+        elif event_name == "http2.send_connection_init.complete":
+            stats.http2_connections += 1
+
+    return trace
+
+
+def _make_async_trace(stats: PoolStats):
+    sync_trace = _make_trace(stats)
+
+    async def trace(event_name: str, info: dict) -> None:
+        sync_trace(event_name, info)
+
+    return trace
+
+
+def pooled_client_kwargs(
+        name: str,
+        *,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        asynchronous: bool = False,
+) -> dict[str, Any]:
+    """
+    httpx client kwargs for a keep-alive pool whose handshakes are counted under `name`.
+
+    HTTP/2 is only enabled when requested and `h2` is installed; otherwise the
+    pool stays on HTTP/1.1 keep-alive.
+    """
+    stats = _pool_stats(name)
+    use_http2 = bool(http2) and http2_available()
+    if http2 and not use_http2:
+        dsx_logging.warning(f"HTTP/2 requested for {name} pool but 'h2' is not installed; using HTTP/1.1")
+    limits = httpx.Limits(
+        max_connections=max(1, int(max_connections)),
+        max_keepalive_connections=max(0, int(max_keepalive_connections)),
+        keepalive_expiry=float(keepalive_expiry),
+    )
+    if asynchronous:
+        async_trace = _make_async_trace(stats)
+
+        async def on_request_async(request: httpx.Request) -> None:
+            _count_request(name, stats)
+            request.extensions["trace"] = async_trace
+
+        hook = on_request_async
+    else:
+        trace = _make_trace(stats)
+
+        def on_request(request: httpx.Request) -> None:
+            _count_request(name, stats)
+            request.extensions["trace"] = trace
+
+        hook = on_request
+    return {"http2": use_http2, "limits": limits, "event_hooks": {"request": [hook]}}
+
+
+def build_pooled_client(
+        name: str,
+        *,
+        timeout: Union[float, httpx.Timeout],
+        verify: Union[bool, str] = True,
+        **pool_kwargs: Any,
+) -> httpx.Client:
+    """Build a sync keep-alive httpx client; see `pooled_client_kwargs`."""
+    return httpx.Client(timeout=timeout, verify=verify, **pooled_client_kwargs(name, **pool_kwargs))
+
+
+def get_dsxa_http_client() -> httpx.Client:
+    """The worker process's shared DSXA connection pool (created on first use)."""
+    global _dsxa_http
+    with _dsxa_lock:
+        if _dsxa_http is None or _dsxa_http.is_closed:
+            from dsx_connect.config import get_config
+            scanner = get_config().scanner
+            _dsxa_http = build_pooled_client(
+                "dsxa",
+                timeout=scanner.timeout_seconds,
+                verify=scanner.verify_tls,
+                http2=scanner.http2,
+                max_connections=scanner.pool_max_connections,
+                max_keepalive_connections=scanner.pool_max_keepalive_connections,
+                keepalive_expiry=scanner.pool_keepalive_expiry_seconds,
+            )
+        return _dsxa_http
+
+
+def http_pool_stats() -> dict[str, dict[str, Any]]:
+    """Request, handshake and connection-reuse counters per pool for this process."""
+    with _stats_lock:
+        return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+def log_http_pool_stats(prefix: str = "HTTP pool stats", *, only: Optional[str] = None) -> None:
+    for name, stats in http_pool_stats().items():
+        if only is not None and name != only:
+            continue
+        dsx_logging.info(
+            f"{prefix} [{name}]: requests={stats['requests']} reused={stats['reused']} "
+            f"tcp_connects={stats['tcp_connects']} tls_handshakes={stats['tls_handshakes']} "
+            f"reuse_ratio={stats['reuse_ratio']}"
+        )
+
+
+def init_worker_http_clients(**_kwargs) -> None:
+    """worker_process_init hook: open the DSXA pool before the first task arrives."""
+    try:
+        get_dsxa_http_client()
+    except Exception as e:
+        dsx_logging.warning(f"Failed to initialize pooled DSXA HTTP client: {e}")
+
+
+def close_worker_http_clients(**_kwargs) -> None:
+    """worker_process_shutdown hook: report pool metrics and close every pooled client."""
+    global _dsxa_http
+    log_http_pool_stats()
+    with _dsxa_lock:
+        if _dsxa_http is not None:
+            try:
+                _dsxa_http.close()
+            except Exception:
+                pass
+            _dsxa_http = None
+    try:
+        from dsx_connect.connectors.client import close_connector_clients
+        close_connector_clients()
+    except Exception as e:
+        dsx_logging.debug(f"Closing pooled connector clients failed: {e}")
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
 import time
+from collections import Counter, defaultdict
+from typing import Iterable
 
 import redis
 
 from dsx_connect.config import get_config
 from dsx_connect.messaging.state_keys import job_key, job_keys
+from dsx_connect.messaging.state_scripts import get_record_job_enqueued_script, get_record_job_terminal_script
 from shared.dsx_logging import dsx_logging
 
 
 _REDIS = None
 
+_JOB_TTL_SECONDS = 7 * 24 * 3600
+
+_OUTCOME_FIELDS = {
+    "SUCCESS": "succeeded_count",
+    "FAILED": "failed_count",
+    "CANCELLED": "cancelled_count",
+    "SKIPPED": "skipped_count",
+}
+
 
 def _job_redis():
     global _REDIS
@@ -20,91 +32,82 @@ def _job_redis():
     return _REDIS
 
 
-def record_scan_request_terminal(job_id: str | None, outcome: str) -> dict | None:
-    if not job_id:
-        return None
+def _pairs_to_dict(flat: list) -> dict:
+    return {flat[i]: flat[i + 1] for i in range(0, len(flat) - 1, 2)}
 
-    outcome_key = {
-        "SUCCESS": "succeeded_count",
-        "FAILED": "failed_count",
-        "CANCELLED": "cancelled_count",
-        "SKIPPED": "skipped_count",
-    }.get(str(outcome).upper())
-    if outcome_key is None:
-        return None
 
-    r = _job_redis()
-    key = job_key(job_id)
-    now = str(int(time.time()))
+def _to_int(value: str | None, default: int = 0) -> int:
+    try:
+        return int(value) if value is not None else default
+    except Exception:
+        return default
+
+
+def _terminal_args(job_id: str, now: str, outcome_counts: Counter) -> list:
+    args: list = [job_id, now, _JOB_TTL_SECONDS]
+    for field, count in outcome_counts.items():
+        args.extend([field, count])
+    return args
 
-    r.hsetnx(key, "job_id", job_id)
-    r.hsetnx(key, "status", "running")
-    r.hincrby(key, "processed_count", 1)
-    r.hincrby(key, "terminal_count", 1)
-    r.hincrby(key, outcome_key, 1)
-    r.hsetnx(key, "first_terminal_at", now)
-    r.hset(key, mapping={"last_terminal_at": now, "last_update": now})
-    r.expire(key, 7 * 24 * 3600)
-
-    data = r.hgetall(key) or {}
-    if data.get("enqueue_done") != "1" or data.get("finished_at"):
-        return data
-
-    def _to_int(value: str | None, default: int = -1) -> int:
-        try:
-            return int(value) if value is not None else default
-        except Exception:
-            return default
-
-    enq_total = _to_int(data.get("enqueued_total"))
-    expected = _to_int(data.get("expected_total"))
-    enq_count = _to_int(data.get("enqueued_count"))
-    total = enq_total if enq_total >= 0 else (expected if expected >= 0 else enq_count)
-    terminal_count = _to_int(data.get("terminal_count"), 0)
-
-    if total >= 0 and terminal_count >= total:
-        status = data.get("status", "running")
-        final_status = "cancelled" if status == "cancelled" else "completed"
-        r.hset(key, mapping={"status": final_status, "finished_at": now, "last_update": now})
+
+def _finish_terminal(job_id: str, now: str, raw: list) -> dict:
+    completed, terminal_count, total = int(raw[0]), int(raw[1]), int(raw[2])
+    data = _pairs_to_dict(raw[3:])
+    if completed:
         dsx_logging.info(
             f"job.terminal_complete job={job_id} terminal={terminal_count} total={total} "
-            f"succeeded={_to_int(data.get('succeeded_count'), 0)} failed={_to_int(data.get('failed_count'), 0)} "
-            f"skipped={_to_int(data.get('skipped_count'), 0)} cancelled={_to_int(data.get('cancelled_count'), 0)} "
+            f"succeeded={_to_int(data.get('succeeded_count'))} failed={_to_int(data.get('failed_count'))} "
+            f"skipped={_to_int(data.get('skipped_count'))} cancelled={_to_int(data.get('cancelled_count'))} "
             f"finished_at={now}"
         )
-        data["status"] = final_status
-        data["finished_at"] = now
-        data["last_update"] = now
-
     return data
 
 
+def record_scan_request_terminal(job_id: str | None, outcome: str) -> dict | None:
+    """Count one terminal outcome; the Lua script also flips the job to completed when it is the last item."""
+    if not job_id:
+        return None
+    outcome_key = _OUTCOME_FIELDS.get(str(outcome).upper())
+    if outcome_key is None:
+        return None
+
+    now = str(int(time.time()))
+    script = get_record_job_terminal_script(_job_redis())
+    raw = script(keys=[job_key(job_id)], args=_terminal_args(job_id, now, Counter({outcome_key: 1})))
+    return _finish_terminal(job_id, now, raw)
+
+
 def record_scan_request_enqueued(job_id: str | None, *, task_id: str | None = None, count: int = 1) -> dict | None:
     if not job_id or count <= 0:
         return None
 
-    r = _job_redis()
-    key = job_key(job_id)
     now = str(int(time.time()))
-
-    r.hsetnx(key, "job_id", job_id)
-    r.hsetnx(key, "status", "running")
-    r.hsetnx(key, "started_at", now)
-    total = r.hincrby(key, "enqueued_count", count)
-    r.hsetnx(key, "first_enqueued_at", now)
-    r.hset(
-        key,
-        mapping={
-            "enqueued_total": str(total),
-            "expected_total": str(total),
-            "last_enqueued_at": now,
-            "last_update": now,
-        },
-    )
+    script = get_record_job_enqueued_script(_job_redis())
+    args: list = [job_id, now, _JOB_TTL_SECONDS, count]
     if task_id:
-        try:
-            r.rpush(job_keys(job_id), task_id)
-        except Exception:
-            pass
-    r.expire(key, 7 * 24 * 3600)
-    return r.hgetall(key) or {}
+        args.append(task_id)
+    return _pairs_to_dict(script(keys=[job_key(job_id), job_keys(job_id)], args=args))
+
+
+def record_scan_request_enqueued_many(entries: Iterable[tuple[str | None, str | None]]) -> dict[str, dict]:
+    """
+    Batched `record_scan_request_enqueued` for (job_id, task_id) pairs, e.g. one scan_request_batch chunk.
+    Each job is updated by a single script call and all calls share one pipeline round trip.
+    """
+    per_job: dict[str, list[str | None]] = defaultdict(list)
+    for job_id, task_id in entries:
+        if job_id:
+            per_job[job_id].append(task_id)
+    if not per_job:
+        return {}
+
+    r = _job_redis()
+    now = str(int(time.time()))
+    script = get_record_job_enqueued_script(r)
+    pipe = r.pipeline(transaction=False)
+    for job_id, task_ids in per_job.items():
+        args: list = [job_id, now, _JOB_TTL_SECONDS, len(task_ids)]
+        args.extend(task_id for task_id in task_ids if task_id)
+        script(keys=[job_key(job_id), job_keys(job_id)], args=args, client=pipe)
+    results = pipe.execute()
+    return {job_id: _pairs_to_dict(raw) for job_id, raw in zip(per_job, results)}
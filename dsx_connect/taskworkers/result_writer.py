@@ -0,0 +1,101 @@
+"""
+Micro-batching writer for scan result persistence.
+
+The result worker finishes one task at a time, so writing each result as it
+arrives costs one or more Redis round trips per result. `ScanResultWriter`
+buffers results in the worker process and hands them to the store's
+`insert_many`. It flushes when `max_batch` results are waiting, or `flush_ms`
+after the first one arrived, whichever comes first. A background thread handles
+the time-based flush, so a quiet worker still persists its last results
+promptly. Call `close()` on process shutdown to write what is left.
+
+Persistence stays best-effort, as before. A failed flush is logged and its batch
+dropped; it never fails the task that produced the result.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from dsx_connect.database.scan_results_base_db import ScanResultsBaseDB
+from dsx_connect.models.scan_result import ScanResultModel
+from shared.dsx_logging import dsx_logging
+
+
+class ScanResultWriter:
+    def __init__(self, db: ScanResultsBaseDB, *, max_batch: int = 50, flush_ms: int = 200):
+        self._db = db
+        self.max_batch = max(1, int(max_batch))
+        self.flush_seconds = max(0, int(flush_ms)) / 1000.0
+        self._buffer: list[ScanResultModel] = []
+        self._first_at: float | None = None
+        self._lock = threading.Lock()
+        # Serializes flushes so batches reach the store in id order.
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.flushed_batches = 0
+        self.flushed_results = 0
+
+    def add(self, scan_result: ScanResultModel) -> None:
+        if self.max_batch <= 1 or self._closed:
+            self._write([scan_result])
+            return
+        with self._lock:
+            self._buffer.append(scan_result)
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            full = len(self._buffer) >= self.max_batch
+        if full:
+            self.flush()
+        else:
+            self._ensure_thread()
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                self._first_at = None
+            if batch:
+                self._write(batch)
+            return len(batch)
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+
+    def _write(self, batch: list[ScanResultModel]) -> None:
+        try:
+            self._db.insert_many(batch)
+            self.flushed_batches += 1
+            self.flushed_results += len(batch)
+            dsx_logging.debug(f"[scan_result] stored {len(batch)} result(s) in scan_results DB")
+        except Exception as e:
+            dsx_logging.warning(f"[scan_result] store DB failed for batch of {len(batch)}: {e}")
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="scan-result-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            with self._lock:
+                first_at = self._first_at
+            if first_at is None:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            remaining = first_at + self.flush_seconds - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+                continue
+            self.flush()
@@ -0,0 +1,172 @@
+"""
+Redis-backed admission control for DSXA scans.
+
+Scan request workers hold a lease in a shared sorted set while they read and scan
+a file. When DSXA is at `max_inflight` a worker registers as blocked and waits on a
+wake-up list (BLPOP) that releases push to while someone is blocked, instead of
+re-sending the whole task to the broker with a countdown. Leases carry their own expiry so a killed worker cannot leak
+capacity.
+
+Optional fair sharing caps each connector at ceil(max_inflight / contending
+connectors) leases, so one large full scan cannot starve other connectors.
+Admission wait times are recorded in a Redis hash histogram (see
+`admission_stats`).
+"""
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import redis
+
+from dsx_connect.messaging.state_keys import (
+    scanner_blocked_key,
+    scanner_connector_leases_key,
+    scanner_leases_key,
+    scanner_wait_histogram_key,
+    scanner_waiting_key,
+    scanner_wakeup_key,
+)
+from dsx_connect.messaging.state_scripts import get_admit_scanner_lease_script, get_release_scanner_lease_script
+
+# Upper bounds (ms) of the admission wait histogram buckets; the last bucket is +Inf.
+WAIT_BUCKETS_MS = (0, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Connectors stay "contending" for fair-share purposes this long after their last denied attempt.
+_WAITING_TTL_SECONDS = 10
+
+_REDIS: Optional[redis.Redis] = None
+
+
+def admission_redis(redis_url: str) -> redis.Redis:
+    """Process-wide Redis client (one connection pool) for admission calls."""
+    global _REDIS
+    if _REDIS is None:
+        _REDIS = redis.Redis.from_url(redis_url, decode_responses=True)
+    return _REDIS
+
+
+def wait_bucket(wait_ms: float) -> str:
+    for bound in WAIT_BUCKETS_MS:
+        if wait_ms <= bound:
+            return f"le_{bound}"
+    return "le_inf"
+
+
+@dataclass
+class ScannerLease:
+    lease_id: str
+    connector: str
+    waited_ms: float
+    inflight: int
+
+
+class ScannerAdmission:
+    def __init__(
+            self,
+            r: redis.Redis,
+            *,
+            max_inflight: int,
+            lease_ttl_seconds: int = 600,
+            max_wait_seconds: float = 30.0,
+            poll_seconds: float = 1.0,
+            fair_share: bool = False,
+    ):
+        self.r = r
+        self.max_inflight = int(max_inflight)
+        self.lease_ttl_seconds = max(1, int(lease_ttl_seconds))
+        self.max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self.poll_seconds = max(0.05, float(poll_seconds))
+        self.fair_share = bool(fair_share)
+
+    def try_acquire(self, connector: str, *, lease_id: str | None = None, waited_ms: float = 0.0) -> tuple[Optional[ScannerLease], int]:
+        """One non-blocking admission attempt. Returns (lease or None, current inflight)."""
+        lease_id = lease_id or uuid.uuid4().hex
+        connector = connector or "-"
+        script = get_admit_scanner_lease_script(self.r)
+        acquired, inflight = script(
+            keys=[
+                scanner_leases_key(),
+                scanner_connector_leases_key(connector),
+                scanner_waiting_key(),
+                scanner_wait_histogram_key(),
+            ],
+            args=[
+                lease_id,
+                time.time(),
+                self.lease_ttl_seconds,
+                self.max_inflight,
+                "1" if self.fair_share else "0",
+                connector,
+                _WAITING_TTL_SECONDS,
+                wait_bucket(waited_ms),
+                int(waited_ms),
+            ],
+        )
+        if int(acquired):
+            return ScannerLease(lease_id, connector, waited_ms, int(inflight)), int(inflight)
+        return None, int(inflight)
+
+    def acquire(self, connector: str) -> tuple[Optional[ScannerLease], int]:
+        """
+        Block until a lease is granted or `max_wait_seconds` elapses.
+
+        Waiters register in the blocked set, sleep on the wake-up list and re-try when
+        a lease is released; the poll interval bounds the delay when a wake-up goes to
+        another waiter.
+        """
+        lease_id = uuid.uuid4().hex
+        started = time.monotonic()
+        deadline = started + self.max_wait_seconds
+        registered = False
+        try:
+            while True:
+                waited_ms = (time.monotonic() - started) * 1000.0
+                lease, inflight = self.try_acquire(connector, lease_id=lease_id, waited_ms=waited_ms)
+                if lease is not None:
+                    return lease, inflight
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, inflight
+                if not registered:
+                    # Releases only push wake-ups while waiters are registered; re-try once
+                    # after registering so a release in between is not missed.
+                    self.r.zadd(scanner_blocked_key(), {lease_id: time.time() + remaining + self.poll_seconds})
+                    registered = True
+                    continue
+                self.r.blpop([scanner_wakeup_key()], timeout=min(remaining, self.poll_seconds))
+        finally:
+            if registered:
+                self.r.zrem(scanner_blocked_key(), lease_id)
+
+    def release(self, lease: ScannerLease) -> None:
+        script = get_release_scanner_lease_script(self.r)
+        script(
+            keys=[
+                scanner_leases_key(),
+                scanner_connector_leases_key(lease.connector),
+                scanner_wakeup_key(),
+                scanner_blocked_key(),
+            ],
+            args=[lease.lease_id, time.time()],
+        )
+
+
+def admission_stats(r: redis.Redis) -> dict:
+    """Current inflight leases plus the cumulative admission wait histogram."""
+    now = time.time()
+    inflight = r.zcount(scanner_leases_key(), now, "+inf")
+    raw = r.hgetall(scanner_wait_histogram_key()) or {}
+    buckets = {f"le_{bound}": int(raw.get(f"le_{bound}", 0)) for bound in WAIT_BUCKETS_MS}
+    buckets["le_inf"] = int(raw.get("le_inf", 0))
+    count = int(raw.get("count", 0))
+    sum_ms = int(raw.get("sum_ms", 0))
+    return {
+        "inflight": int(inflight),
+        "wait_ms_buckets": buckets,
+        "wait_count": count,
+        "wait_ms_sum": sum_ms,
+        "wait_ms_avg": round(sum_ms / count, 2) if count else 0.0,
+    }
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import httpx
 from celery import states
+from celery.signals import worker_process_init, worker_process_shutdown
 from fastapi.encoders import jsonable_encoder
 from pydantic import ValidationError
 
@@ -22,6 +23,8 @@ from dsx_connect.taskworkers.workers.base_worker import BaseWorker, RetryDecisio
 from dsx_connect.config import get_config
 from dsx_connect.taskworkers.dlq_store import enqueue_scan_request_dlq_sync, make_scan_request_dlq_item
 from dsx_connect.taskworkers.job_state import record_scan_request_terminal
+from dsx_connect.taskworkers.http_pool import close_worker_http_clients, get_dsxa_http_client, \
+    init_worker_http_clients
 
 from dsx_connect.connectors.client import get_connector_client
 from shared.models.connector_models import ScanRequestModel
@@ -32,8 +35,8 @@ from dsx_connect.taskworkers.names import Tasks, Queues
 import redis  # lightweight sync client for quick job-state checks
 from shared.dsx_logging import dsx_logging
 from shared.routes import ConnectorAPI
-from dsx_connect.messaging.state_keys import job_key, scanner_inflight_key
-from dsx_connect.messaging.state_scripts import get_acquire_scanner_script
+from dsx_connect.messaging.state_keys import job_key
+from dsx_connect.taskworkers.scanner_admission import ScannerAdmission, ScannerLease, admission_redis
 
 class ScanRequestWorker(BaseWorker):
     """
@@ -148,11 +151,11 @@ class ScanRequestWorker(BaseWorker):
             self._record_terminal(job_id, "SKIPPED")
             return "SKIPPED_FILE_TOO_LARGE"
 
-        slot_acquired = False
+        lease = None
         # 2. Read file from connector
         try:
-            slot_acquired = self._acquire_scanner_slot(cfg, scan_request_dict, scan_request_task_id)
-            if not slot_acquired:
+            admitted, lease = self._acquire_scanner_slot(cfg, scan_request_dict, scan_request_task_id)
+            if not admitted:
                 return "BACKPRESSURE"
 
             read_started = time.perf_counter()
@@ -217,8 +220,7 @@ class ScanRequestWorker(BaseWorker):
             self._record_terminal(job_id, "SUCCESS")
             return "SUCCESS"
         finally:
-            if slot_acquired:
-                self._release_scanner_slot(cfg)
+            self._release_scanner_slot(cfg, lease)
 
 
     def read_file_stream_from_connector(self, scan_request: ScanRequestModel):
@@ -267,11 +269,14 @@ class ScanRequestWorker(BaseWorker):
         config = get_config()
         metadata_info = self._build_metadata(scan_request, task_id)
 
+        # The SDK client is a thin per-task wrapper; the connection pool underneath is
+        # shared by every task in this worker process and is not closed here.
         client = DSXAClient(
             base_url=config.scanner.base_url,
             auth_token=getattr(config.scanner, "auth_token", None),
             timeout=getattr(config.scanner, "timeout_seconds", 30.0),
             verify_tls=getattr(config.scanner, "verify_tls", True),
+            http_client=get_dsxa_http_client(),
         )
 
         try:
@@ -313,11 +318,6 @@ class ScanRequestWorker(BaseWorker):
             raise DsxaTimeoutError(f"DSXA timeout: {e}") from e
         except httpx.HTTPError as e:
             raise DsxaServerError(f"DSXA connection error: {e}") from e
-        finally:
-            try:
-                client.close()
-            except Exception:
-                pass
 
     def _build_metadata(self, scan_request: ScanRequestModel, task_id: str | None) -> str:
         def _encode_value(value: str) -> str:
@@ -412,58 +412,70 @@ class ScanRequestWorker(BaseWorker):
         except Exception:
             pass
 
-    def _acquire_scanner_slot(self, cfg, scan_request_dict: dict, scan_request_task_id: str | None) -> bool:
-        """Simple backpressure: cap concurrent/pending scans to protect DSXA."""
+    def _acquire_scanner_slot(
+        self, cfg, scan_request_dict: dict, scan_request_task_id: str | None
+    ) -> tuple[bool, ScannerLease | None]:
+        """Backpressure: wait for a DSXA admission lease; re-enqueue only if the wait times out."""
         max_inflight = getattr(cfg.scanner, "max_inflight", 0) or 0
         if max_inflight <= 0:
-            return True
+            return True, None
 
         try:
-            r = redis.Redis.from_url(str(cfg.redis_url), decode_responses=True)
-            key = scanner_inflight_key()
-            ttl_seconds = 600
-            script = get_acquire_scanner_script(r)
-            result = script(keys=[key], args=[max_inflight, ttl_seconds])
-            acquired = False
-            inflight = None
-            if isinstance(result, (list, tuple)) and len(result) >= 2:
-                acquired = bool(result[0])
-                inflight = int(result[1])
-            else:
-                acquired = bool(result)
-            if not acquired:
-                delay = 3 + random.randint(0, 3)
-                async_result = celery_app.send_task(
-                    Tasks.REQUEST,
-                    args=[scan_request_dict],
-                    kwargs={"scan_request_task_id": scan_request_task_id or getattr(self.request, "id", None)},
-                    queue=Queues.REQUEST,
-                    countdown=delay,
-                )
-                inflight_desc = f"{inflight}" if inflight is not None else "unknown"
-                dsx_logging.warning(
-                    f"[scan_request:{getattr(self.context, 'task_id', 'unknown')}] "
-                    f"Scanner at capacity ({inflight_desc}/{max_inflight}); "
-                    f"rescheduled as {async_result.id} in {delay}s"
-                )
-                return False
-            return True
+            admission = ScannerAdmission(
+                admission_redis(str(cfg.redis_url)),
+                max_inflight=max_inflight,
+                lease_ttl_seconds=cfg.scanner.admission_lease_ttl_seconds,
+                max_wait_seconds=cfg.scanner.admission_max_wait_seconds,
+                poll_seconds=cfg.scanner.admission_poll_seconds,
+                fair_share=cfg.scanner.admission_fair_share,
+            )
+            lease, inflight = admission.acquire(self._admission_connector(scan_request_dict))
+            if lease is not None:
+                if lease.waited_ms >= 1000:
+                    dsx_logging.debug(
+                        f"[scan_request:{getattr(self.context, 'task_id', 'unknown')}] "
+                        f"Admitted after {lease.waited_ms:.0f}ms ({inflight}/{max_inflight})"
+                    )
+                return True, lease
+
+            delay = 3 + random.randint(0, 3)
+            async_result = celery_app.send_task(
+                Tasks.REQUEST,
+                args=[scan_request_dict],
+                kwargs={"scan_request_task_id": scan_request_task_id or getattr(self.request, "id", None)},
+                queue=Queues.REQUEST,
+                countdown=delay,
+            )
+            dsx_logging.warning(
+                f"[scan_request:{getattr(self.context, 'task_id', 'unknown')}] "
+                f"Scanner at capacity ({inflight}/{max_inflight}) for "
+                f"{cfg.scanner.admission_max_wait_seconds:.0f}s; rescheduled as {async_result.id} in {delay}s"
+            )
+            return False, None
         except redis.RedisError as e:
             dsx_logging.warning(
                 f"[scan_request:{getattr(self.context, 'task_id', 'unknown')}] "
                 f"Backpressure check skipped (Redis error): {e}"
             )
-            return True
+            return True, None
 
-    def _release_scanner_slot(self, cfg) -> None:
-        max_inflight = getattr(cfg.scanner, "max_inflight", 0) or 0
-        if max_inflight <= 0:
+    @staticmethod
+    def _admission_connector(scan_request_dict: dict) -> str:
+        connector = scan_request_dict.get("connector") or {}
+        if isinstance(connector, dict) and connector.get("uuid"):
+            return str(connector["uuid"])
+        return str(scan_request_dict.get("connector_url") or "-")
+
+    def _release_scanner_slot(self, cfg, lease: ScannerLease | None) -> None:
+        if lease is None:
             return
         try:
-            r = redis.Redis.from_url(str(cfg.redis_url), decode_responses=True)
-            r.decr(scanner_inflight_key())
+            ScannerAdmission(
+                admission_redis(str(cfg.redis_url)),
+                max_inflight=getattr(cfg.scanner, "max_inflight", 0) or 0,
+            ).release(lease)
         except redis.RedisError:
-            # Best-effort; if Redis is unavailable, counters may drift until service restarts
+            # Best-effort; an unreleased lease expires after admission_lease_ttl_seconds
             pass
 
     def _emit_not_scanned_verdict(
@@ -511,3 +523,7 @@ class ScanRequestWorker(BaseWorker):
 
 # Register the class-based task with Celery
 celery_app.register_task(ScanRequestWorker())
+
+# Keep-alive pools for DSXA and connectors live for the whole worker process.
+worker_process_init.connect(init_worker_http_clients, weak=False)
+worker_process_shutdown.connect(close_worker_http_clients, weak=False)
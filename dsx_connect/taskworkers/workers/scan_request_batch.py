@@ -11,7 +11,7 @@ from dsx_connect.taskworkers.celery_app import celery_app
 from dsx_connect.taskworkers.dlq_store import enqueue_scan_request_dlq_sync, make_scan_request_dlq_item
 from dsx_connect.taskworkers.errors import MalformedScanRequest
 from dsx_connect.taskworkers.names import Queues, Tasks
-from dsx_connect.taskworkers.job_state import record_scan_request_enqueued
+from dsx_connect.taskworkers.job_state import record_scan_request_enqueued_many
 from dsx_connect.taskworkers.workers.base_worker import BaseWorker, RetryGroups
 
 
@@ -50,6 +50,7 @@ class ScanRequestBatchWorker(BaseWorker):
 
         for start in range(0, total, configured_batch_size):
             chunk = validated[start:start + configured_batch_size]
+            sent: list[tuple[str | None, str]] = []
             for req in chunk:
                 async_result = celery_app.send_task(
                     Tasks.REQUEST,
@@ -57,8 +58,10 @@ class ScanRequestBatchWorker(BaseWorker):
                     kwargs={"scan_request_task_id": root_id},
                     queue=Queues.REQUEST,
                 )
-                record_scan_request_enqueued(req.get("scan_job_id"), task_id=async_result.id)
+                sent.append((req.get("scan_job_id"), async_result.id))
                 enqueued += 1
+            # One Redis round trip per chunk for the job counters.
+            record_scan_request_enqueued_many(sent)
 
             dsx_logging.info(
                 f"[scan_request_batch:{getattr(self.context, 'task_id', 'unknown')}] "
@@ -1,11 +1,12 @@
 # dsx_connect/taskworkers/workers/scan_result.py
 from __future__ import annotations
+import atexit
 import re
 from typing import Any, Dict
 import time
 import redis as _redis
 from celery import signals
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 from functools import cached_property
 
 from pydantic import ValidationError
@@ -16,6 +17,7 @@ from dsx_connect.taskworkers.workers.base_worker import BaseWorker, RetryGroup,
 from dsx_connect.taskworkers.dlq_store import enqueue_scan_result_dlq_sync, \
     make_scan_result_dlq_item
 from dsx_connect.taskworkers.errors import TaskError, MalformedScanRequest, MalformedResponse
+from dsx_connect.taskworkers.result_writer import ScanResultWriter
 
 from dsxa_sdk_py.models import ScanResponse
 from shared.models.connector_models import ScanRequestModel, ItemActionModel
@@ -54,6 +56,25 @@ def _send_syslog(scan_result: ScanResultModel, original_task_id: str, current_ta
         raise TaskError(retriable=True, reason="syslog_failure") from e
 
 
+_RESULT_WRITER: ScanResultWriter | None = None
+
+
+def _result_writer(db) -> ScanResultWriter:
+    """Per-process micro-batching writer (created after fork so its flush thread lives in the worker)."""
+    global _RESULT_WRITER
+    if _RESULT_WRITER is None:
+        from dsx_connect.config import get_config
+        cfg = get_config().workers
+        _RESULT_WRITER = ScanResultWriter(
+            db,
+            max_batch=cfg.scan_results_batch_size,
+            flush_ms=cfg.scan_results_batch_flush_ms,
+        )
+        # Pools without worker_process_shutdown (solo/threads) still flush on exit.
+        atexit.register(_RESULT_WRITER.close)
+    return _RESULT_WRITER
+
+
 class ScanResultWorker(BaseWorker):
     name = Tasks.RESULT
     RETRY_GROUPS = RetryGroups.none()  # no connector/dsxa mapping; retries driven by TaskError.retriable
@@ -215,8 +236,7 @@ class ScanResultWorker(BaseWorker):
 
             if getattr(cfg.workers, "enable_scan_results_db", True):
                 try:
-                    self.__class__._scan_results_db.insert(scan_result)
-                    dsx_logging.debug("[scan_result] stored in scan_results DB")
+                    _result_writer(self.__class__._scan_results_db).add(scan_result)
                 except Exception as e:
                     try:
                         loc = getattr(get_config().results_database, "loc", "?")
@@ -388,3 +408,16 @@ def _init_syslog_for_worker(**kwargs):
             dsx_logging.warning(f"[scan_result] syslog init failed: {e}")
         except Exception:
             pass
+
+
+@worker_process_shutdown.connect
+def _flush_result_writer(**kwargs):
+    # Write results still buffered by the micro-batching writer before the process exits
+    try:
+        if _RESULT_WRITER is not None:
+            _RESULT_WRITER.close()
+    except Exception as e:
+        try:
+            dsx_logging.warning(f"[scan_result] final result flush failed: {e}")
+        except Exception:
+            pass
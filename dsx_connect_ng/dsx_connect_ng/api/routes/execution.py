@@ -136,6 +136,8 @@ async def execution_status(
 ) -> dict:
     bootstrap = getattr(request.app.state, "job_bus_bootstrap", None)
     service_bootstrap = getattr(request.app.state, "job_service_bootstrap", None)
+    control_plane = getattr(request.app.state, "control_plane_service", None)
+    job_service = getattr(service_bootstrap, "service", None)
     return {
         "surface": "execution",
         "service": settings.service_name,
@@ -147,6 +149,8 @@ async def execution_status(
         "job_bus_detail": getattr(bootstrap, "detail", None),
         "job_bus_status": await bus.status(),
         "configured_topology": rabbitmq_topology_summary(settings),
+        "control_plane_read_cache": control_plane.read_cache_stats() if control_plane is not None else None,
+        "job_repository_pool": job_service.repository_pool_status() if job_service is not None else None,
         "intended_callers": [
             "connectors",
             "workers",
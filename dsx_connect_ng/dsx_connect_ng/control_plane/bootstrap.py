@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 
 from dsx_connect_ng.config import settings
-from dsx_connect_ng.control_plane.repository import InMemoryControlPlaneRepository
+from dsx_connect_ng.control_plane.read_cache import ControlPlaneReadCache
+from dsx_connect_ng.control_plane.repository import ControlPlaneRepository, InMemoryControlPlaneRepository
 from dsx_connect_ng.control_plane.service import ControlPlaneService
 
 
@@ -22,29 +23,50 @@ def _build_postgres_repo():
     return PostgresControlPlaneRepository(settings.postgres.url)
 
 
+def _build_read_cache() -> ControlPlaneReadCache | None:
+    if not settings.control_plane_cache.enabled:
+        return None
+    return ControlPlaneReadCache(
+        ttl_seconds=settings.control_plane_cache.ttl_seconds,
+        max_memoized_configs=settings.control_plane_cache.max_memoized_configs,
+    )
+
+
+def _build_service(repo: ControlPlaneRepository) -> ControlPlaneService:
+    read_cache = _build_read_cache()
+    db_url = getattr(repo, "db_url", None)
+    if read_cache is not None and db_url and settings.control_plane_cache.listen_notify:
+        from dsx_connect_ng.control_plane.postgres_notify import PostgresControlPlaneChangeListener
+
+        listener = PostgresControlPlaneChangeListener(db_url, read_cache)
+        listener.start()
+        read_cache.change_listener = listener
+    return ControlPlaneService(repo=repo, read_cache=read_cache)
+
+
 def bootstrap_control_plane() -> ControlPlaneBootstrapResult:
     mode = settings.control_plane_backend
     if mode == "memory":
         return ControlPlaneBootstrapResult(
-            service=ControlPlaneService(repo=InMemoryControlPlaneRepository()),
+            service=_build_service(InMemoryControlPlaneRepository()),
             backend="memory",
             detail="configured_memory_mode",
         )
     if mode == "postgres":
         return ControlPlaneBootstrapResult(
-            service=ControlPlaneService(repo=_build_postgres_repo()),
+            service=_build_service(_build_postgres_repo()),
             backend="postgres",
             detail="configured_postgres_mode",
         )
     try:
         return ControlPlaneBootstrapResult(
-            service=ControlPlaneService(repo=_build_postgres_repo()),
+            service=_build_service(_build_postgres_repo()),
             backend="postgres",
             detail="auto_selected_postgres",
         )
     except Exception as exc:
         return ControlPlaneBootstrapResult(
-            service=ControlPlaneService(repo=InMemoryControlPlaneRepository()),
+            service=_build_service(InMemoryControlPlaneRepository()),
             backend="memory_fallback",
             detail=f"auto_fallback:{type(exc).__name__}:{exc}",
         )
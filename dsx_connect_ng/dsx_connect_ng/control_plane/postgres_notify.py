@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+
+import psycopg
+
+from dsx_connect_ng.control_plane.read_cache import CONTROL_PLANE_NOTIFY_CHANNEL, READ_CACHE_KINDS, ControlPlaneReadCache
+from dsx_connect_ng.ops_logging import log_event, ops_logging
+
+
+def apply_change_notification(cache: ControlPlaneReadCache, payload: str) -> None:
+    """Invalidate the cache entry named by a `cp_notify_control_plane_change()` payload."""
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        cache.invalidate()
+        return
+    kind = data.get("kind") if isinstance(data, dict) else None
+    key = data.get("key") if isinstance(data, dict) else None
+    if kind not in READ_CACHE_KINDS:
+        cache.invalidate()
+        return
+    cache.invalidate(kind, str(key) if key else None)
+
+
+class PostgresControlPlaneChangeListener:
+    """Background `LISTEN` loop that keeps a `ControlPlaneReadCache` coherent across processes.
+
+    While the listener is disconnected it cannot see changes, so the cache is
+    cleared on every (re)connect; the TTL bounds staleness in the meantime.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        cache: ControlPlaneReadCache,
+        *,
+        channel: str = CONTROL_PLANE_NOTIFY_CHANNEL,
+        poll_timeout_seconds: float = 1.0,
+        reconnect_delay_seconds: float = 5.0,
+    ) -> None:
+        self.db_url = db_url
+        self.cache = cache
+        self.channel = channel
+        self.poll_timeout_seconds = poll_timeout_seconds
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.connected = False
+        self.notifications = 0
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="dsx-connect-ng-control-plane-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def status(self) -> dict:
+        return {
+            "channel": self.channel,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "connected": self.connected,
+            "notifications": self.notifications,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.db_url, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self.channel}")
+                    self.connected = True
+                    self.cache.invalidate()
+                    log_event(ops_logging, logging.INFO, "control_plane_cache_listener_connected", channel=self.channel)
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=self.poll_timeout_seconds):
+                            self.notifications += 1
+                            apply_change_notification(self.cache, notify.payload)
+            except Exception as exc:
+                log_event(
+                    ops_logging,
+                    logging.WARNING,
+                    "control_plane_cache_listener_disconnected",
+                    channel=self.channel,
+                    error_type=type(exc).__name__,
+                    error=str(exc),
+                )
+            finally:
+                self.connected = False
+            self.cache.invalidate()
+            self._stop.wait(self.reconnect_delay_seconds)
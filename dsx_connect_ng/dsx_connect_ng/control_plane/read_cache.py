@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+CONTROL_PLANE_NOTIFY_CHANNEL = "dsx_connect_ng_control_plane"
+
+READ_CACHE_KIND_INTEGRATION = "integration"
+READ_CACHE_KIND_SCOPE = "scope"
+READ_CACHE_KIND_CONNECTOR_INSTANCES = "connector_instances"
+READ_CACHE_KINDS = (
+    READ_CACHE_KIND_INTEGRATION,
+    READ_CACHE_KIND_SCOPE,
+    READ_CACHE_KIND_CONNECTOR_INSTANCES,
+)
+
+
+@dataclass
+class ControlPlaneReadCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    memo_hits: int = 0
+    memo_misses: int = 0
+    hits_by_kind: dict[str, int] = field(default_factory=dict)
+    misses_by_kind: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "hits_by_kind": dict(self.hits_by_kind),
+            "misses_by_kind": dict(self.misses_by_kind),
+        }
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+
+
+class ControlPlaneReadCache:
+    """Process-local TTL cache for control-plane reads on the scan hot path.
+
+    Records are cached per `(kind, key)` where `key` is the record id, and
+    dropped on expiry or when `invalidate()` is called, either by local writes
+    through `ControlPlaneService` or by the Postgres change listener. Parsed
+    runtime configs are memoized separately under keys that include the record
+    `updated_at`, so a changed integration or scope never reuses a stale parse.
+
+    A load that races with an invalidation is returned to its caller but not
+    stored, so invalidations cannot be undone by in-flight reads.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 30.0,
+        max_memoized_configs: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_memoized_configs = max(1, int(max_memoized_configs))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], _CacheEntry] = {}
+        self._memo: OrderedDict[Hashable, Any] = OrderedDict()
+        self._generation = 0
+        self._stats = ControlPlaneReadCacheStats()
+        # Set by bootstrap when a Postgres change listener keeps this cache coherent.
+        self.change_listener: Any | None = None
+
+    def get_or_load(self, kind: str, key: str, loader: Callable[[], T]) -> T:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._record_lookup(kind, hit=True)
+                    return entry.value
+                del self._entries[(kind, key)]
+                self._stats.expirations += 1
+            self._record_lookup(kind, hit=False)
+            generation = self._generation
+        value = loader()
+        if self.ttl_seconds <= 0:
+            return value
+        with self._lock:
+            if generation == self._generation:
+                self._entries[(kind, key)] = _CacheEntry(value=value, expires_at=self._clock() + self.ttl_seconds)
+        return value
+
+    def memoize(self, key: Hashable, builder: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self._stats.memo_hits += 1
+                return self._memo[key]
+            self._stats.memo_misses += 1
+        value = builder()
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.max_memoized_configs:
+                self._memo.popitem(last=False)
+        return value
+
+    def invalidate(self, kind: str | None = None, key: str | None = None) -> None:
+        """Drop cached records; `kind=None` clears everything, `key=None` clears one kind."""
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += 1
+            if kind is None:
+                self._entries.clear()
+                return
+            if key is None:
+                for cache_key in [cache_key for cache_key in self._entries if cache_key[0] == kind]:
+                    del self._entries[cache_key]
+                return
+            self._entries.pop((kind, key), None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            payload = self._stats.as_dict()
+            payload["entries"] = len(self._entries)
+            payload["memoized_configs"] = len(self._memo)
+            payload["ttl_seconds"] = self.ttl_seconds
+        payload["change_listener"] = self.change_listener.status() if self.change_listener is not None else None
+        return payload
+
+    def _record_lookup(self, kind: str, *, hit: bool) -> None:
+        if hit:
+            self._stats.hits += 1
+            self._stats.hits_by_kind[kind] = self._stats.hits_by_kind.get(kind, 0) + 1
+        else:
+            self._stats.misses += 1
+            self._stats.misses_by_kind[kind] = self._stats.misses_by_kind.get(kind, 0) + 1
@@ -6,7 +6,13 @@ from urllib.parse import urlparse, urlunparse
 from fastapi import HTTPException, status
 from pydantic import ValidationError
 
-from dsx_connect_ng.control_plane.config_models import parse_integration_runtime_config, parse_policy_runtime_config
+from dsx_connect_ng.control_plane.config_models import (
+    IntegrationRuntimeConfig,
+    PolicyRuntimeConfig,
+    parse_integration_runtime_config,
+    parse_policy_runtime_config,
+    resolve_policy_runtime_config,
+)
 from dsx_connect_ng.control_plane.models import (
     ConnectorInstanceHeartbeat,
     ConnectorInstanceRecord,
@@ -21,6 +27,12 @@ from dsx_connect_ng.control_plane.models import (
     ProtectedScopeRecord,
     ProtectedScopeUpdate,
 )
+from dsx_connect_ng.control_plane.read_cache import (
+    READ_CACHE_KIND_CONNECTOR_INSTANCES,
+    READ_CACHE_KIND_INTEGRATION,
+    READ_CACHE_KIND_SCOPE,
+    ControlPlaneReadCache,
+)
 from dsx_connect_ng.control_plane.repository import ControlPlaneRepository
 
 
@@ -53,8 +65,74 @@ def normalize_registered_connector_base_url(base_url: str) -> str:
 
 
 class ControlPlaneService:
-    def __init__(self, repo: ControlPlaneRepository) -> None:
+    def __init__(self, repo: ControlPlaneRepository, read_cache: ControlPlaneReadCache | None = None) -> None:
         self.repo = repo
+        self.read_cache = read_cache
+
+    def _invalidate_read_cache(self, kind: str, key: str) -> None:
+        if self.read_cache is not None:
+            self.read_cache.invalidate(kind, key)
+
+    def read_cache_stats(self) -> dict:
+        if self.read_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.read_cache.stats()}
+
+    # Hot-path reads. These serve scan, policy and delivery workers from the read
+    # cache when one is configured and fall back to the repository otherwise.
+    # Returned records and parsed configs are shared and must not be mutated.
+
+    def get_integration_for_read(self, integration_id: str) -> IntegrationRecord:
+        if self.read_cache is None:
+            return self.get_integration_or_404(integration_id)
+        return self.read_cache.get_or_load(
+            READ_CACHE_KIND_INTEGRATION,
+            integration_id,
+            lambda: self.get_integration_or_404(integration_id),
+        )
+
+    def get_scope_for_read(self, scope_id: str) -> ProtectedScopeRecord:
+        if self.read_cache is None:
+            return self.get_scope_or_404(scope_id)
+        return self.read_cache.get_or_load(READ_CACHE_KIND_SCOPE, scope_id, lambda: self.get_scope_or_404(scope_id))
+
+    def list_connector_instances_for_read(self, integration_id: str) -> list[ConnectorInstanceRecord]:
+        if self.read_cache is None:
+            return self.list_connector_instances(integration_id=integration_id)
+
+        def load() -> list[ConnectorInstanceRecord]:
+            self.get_integration_for_read(integration_id)
+            return self.repo.list_connector_instances(integration_id=integration_id)
+
+        return self.read_cache.get_or_load(READ_CACHE_KIND_CONNECTOR_INSTANCES, integration_id, load)
+
+    def integration_runtime_config(self, integration: IntegrationRecord) -> IntegrationRuntimeConfig:
+        if self.read_cache is None:
+            return parse_integration_runtime_config(integration.config)
+        return self.read_cache.memoize(
+            ("integration_runtime", integration.integration_id, integration.updated_at),
+            lambda: parse_integration_runtime_config(integration.config),
+        )
+
+    def policy_runtime_config(
+        self,
+        integration: IntegrationRecord | None,
+        scope: ProtectedScopeRecord | None = None,
+    ) -> PolicyRuntimeConfig:
+        integration_config = integration.config if integration is not None else {}
+        scope_policy = scope.post_scan_policy if scope is not None else {}
+        if self.read_cache is None:
+            return resolve_policy_runtime_config(integration_config, scope_policy)
+        return self.read_cache.memoize(
+            (
+                "policy_runtime",
+                integration.integration_id if integration is not None else None,
+                integration.updated_at if integration is not None else None,
+                scope.scope_id if scope is not None else None,
+                scope.updated_at if scope is not None else None,
+            ),
+            lambda: resolve_policy_runtime_config(integration_config, scope_policy),
+        )
 
     def _validate_integration_config(self, config: dict) -> None:
         try:
@@ -104,6 +182,7 @@ class ControlPlaneService:
         if payload.config is not None:
             self._validate_integration_config(payload.config)
         row = self.repo.update_integration(integration_id, payload)
+        self._invalidate_read_cache(READ_CACHE_KIND_INTEGRATION, integration_id)
         if row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="integration_not_found")
         return row
@@ -199,7 +278,9 @@ class ControlPlaneService:
 
     def register_connector_instance(self, payload: ConnectorInstanceRegister) -> ConnectorInstanceRecord:
         integration = self._integration_for_connector_registration(payload)
-        return self.repo.upsert_connector_instance(payload, integration_id=integration.integration_id)
+        row = self.repo.upsert_connector_instance(payload, integration_id=integration.integration_id)
+        self._invalidate_read_cache(READ_CACHE_KIND_CONNECTOR_INSTANCES, integration.integration_id)
+        return row
 
     def list_connector_instances(self, integration_id: str | None = None) -> list[ConnectorInstanceRecord]:
         if integration_id:
@@ -220,6 +301,7 @@ class ControlPlaneService:
         row = self.repo.update_connector_instance_heartbeat(connector_instance_id, payload)
         if row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="connector_instance_not_found")
+        self._invalidate_read_cache(READ_CACHE_KIND_CONNECTOR_INSTANCES, row.integration_id)
         integration = self.get_integration_or_404(row.integration_id)
         self._ensure_reader_config_for_connector_registration(
             integration,
@@ -366,6 +448,7 @@ class ControlPlaneService:
             exclude_scope_id=scope_id,
         )
         row = self.repo.update_scope(scope_id, payload, normalized_selector=current.normalized_selector)
+        self._invalidate_read_cache(READ_CACHE_KIND_SCOPE, scope_id)
         if row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="scope_not_found")
         return row
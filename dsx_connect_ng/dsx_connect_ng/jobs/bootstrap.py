@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from dsx_connect_ng.config import settings
 from dsx_connect_ng.control_plane.bootstrap import ControlPlaneBootstrapResult
@@ -10,6 +11,9 @@ from dsx_connect_ng.jobs.repository import InMemoryJobRepository, JobRepository
 from dsx_connect_ng.jobs.rabbitmq_bus import RabbitMQJobBus
 from dsx_connect_ng.jobs.service import JobService
 
+if TYPE_CHECKING:
+    from dsx_connect_ng.jobs.postgres_pool import AsyncPostgresJobRepository
+
 
 @dataclass(frozen=True)
 class JobBusBootstrapResult:
@@ -59,12 +63,36 @@ def bootstrap_job_bus() -> JobBusBootstrapResult:
 
 def _build_job_repo(control_plane_bootstrap: ControlPlaneBootstrapResult) -> JobRepository:
     if control_plane_bootstrap.backend == "postgres":
+        if settings.postgres.pool_enabled:
+            from dsx_connect_ng.jobs.postgres_pool import PooledPostgresJobRepository
+
+            return PooledPostgresJobRepository(
+                settings.postgres.url,
+                min_size=settings.postgres.pool_min_size,
+                max_size=settings.postgres.pool_max_size,
+                timeout_seconds=settings.postgres.pool_timeout_seconds,
+                prepare_hot_queries=settings.postgres.prepare_hot_queries,
+            )
         from dsx_connect_ng.jobs.postgres_repo import PostgresJobRepository
 
         return PostgresJobRepository(settings.postgres.url)
     return InMemoryJobRepository()
 
 
+def _build_async_job_repo(control_plane_bootstrap: ControlPlaneBootstrapResult) -> AsyncPostgresJobRepository | None:
+    if control_plane_bootstrap.backend != "postgres" or not settings.postgres.async_pool_enabled:
+        return None
+    from dsx_connect_ng.jobs.postgres_pool import AsyncPostgresJobRepository
+
+    return AsyncPostgresJobRepository(
+        settings.postgres.url,
+        min_size=settings.postgres.pool_min_size,
+        max_size=settings.postgres.pool_max_size,
+        timeout_seconds=settings.postgres.pool_timeout_seconds,
+        prepare_hot_queries=settings.postgres.prepare_hot_queries,
+    )
+
+
 def bootstrap_job_service(
     control_plane_bootstrap: ControlPlaneBootstrapResult,
     job_bus_bootstrap: JobBusBootstrapResult,
@@ -79,6 +107,7 @@ def bootstrap_job_service(
                 control_plane=control_plane_service,
                 recovery_settings=settings.recovery,
                 runtime_settings=settings.runtime,
+                async_repo=_build_async_job_repo(control_plane_bootstrap),
             ),
             backend="postgres",
             detail=f"follows_control_plane:{control_plane_bootstrap.backend}",
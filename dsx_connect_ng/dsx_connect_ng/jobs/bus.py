@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable
+import asyncio
+from typing import Protocol, Sequence, runtime_checkable
 
 
 @runtime_checkable
@@ -15,6 +16,25 @@ class JobBus(ABC):
     async def publish(self, job: PublishableMessage) -> None:
         raise NotImplementedError
 
+    async def publish_many(
+        self,
+        jobs: Sequence[PublishableMessage],
+        *,
+        window: int | None = None,
+    ) -> list[BaseException | None]:
+        """Publish `jobs` with at most `window` in flight; returns one error (or None) per job, in order."""
+        semaphore = asyncio.Semaphore(max(1, window or len(jobs) or 1))
+
+        async def publish_one(job: PublishableMessage) -> BaseException | None:
+            async with semaphore:
+                try:
+                    await self.publish(job)
+                except Exception as exc:
+                    return exc
+            return None
+
+        return list(await asyncio.gather(*(publish_one(job) for job in jobs)))
+
     @abstractmethod
     async def status(self) -> dict:
         raise NotImplementedError
@@ -601,6 +601,14 @@ class JobLatencySnapshot(BaseModel):
     queue_wait_ms: LatencySummary = Field(default_factory=LatencySummary)
 
 
+class JobVerdictCacheSnapshot(BaseModel):
+    lookups: int = 0
+    hits: int = 0
+    scanner_hash_hits: int = 0
+    misses: int = 0
+    hit_rate: float | None = None
+
+
 class JobBacklogSnapshot(BaseModel):
     accepted: int = 0
     publish_pending: int = 0
@@ -636,6 +644,7 @@ class JobProgressSnapshot(BaseModel):
     last_activity_at: datetime | None = None
     throughput: JobThroughputSnapshot = Field(default_factory=JobThroughputSnapshot)
     latency: JobLatencySnapshot = Field(default_factory=JobLatencySnapshot)
+    verdict_cache: JobVerdictCacheSnapshot = Field(default_factory=JobVerdictCacheSnapshot)
     backlog: JobBacklogSnapshot = Field(default_factory=JobBacklogSnapshot)
     runtime: JobRuntimeSnapshot = Field(default_factory=JobRuntimeSnapshot)
     bottleneck_hints: list[BottleneckHint] = Field(default_factory=list)
@@ -668,6 +677,7 @@ class OutboxFlushResult(BaseModel):
     active_scan_items: int | None = None
     max_active_scan_items: int | None = None
     publish_capacity: int | None = None
+    publish_mode: str = "serial"
     list_elapsed_ms: float | None = None
     publish_elapsed_ms: float | None = None
     total_elapsed_ms: float | None = None
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+from psycopg.rows import dict_row
+
+from dsx_connect_ng.jobs.models import JobItemRecord, JobRecord
+from dsx_connect_ng.jobs.postgres_repo import GET_JOB_ITEM_SQL, GET_JOB_SQL, PostgresJobRepository
+
+
+def _import_psycopg_pool():
+    try:
+        import psycopg_pool
+    except ImportError as exc:
+        raise RuntimeError("psycopg_pool_not_installed") from exc
+    return psycopg_pool
+
+
+@dataclass
+class PoolWaitMetrics:
+    """Connection checkout counters; wait time is how long callers blocked on the pool."""
+
+    acquisitions: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def record_acquired(self, wait_seconds: float) -> None:
+        wait_ms = wait_seconds * 1000.0
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_ms, 3),
+                "avg_wait_ms": round(self.total_wait_ms / self.acquisitions, 3) if self.acquisitions else None,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+def _pool_status(pool: Any, metrics: PoolWaitMetrics, *, min_size: int, max_size: int, prepare: bool | None) -> dict[str, Any]:
+    get_stats = getattr(pool, "get_stats", None)
+    return {
+        "min_size": min_size,
+        "max_size": max_size,
+        "prepare_hot_queries": bool(prepare),
+        **metrics.as_dict(),
+        "pool": dict(get_stats()) if callable(get_stats) else None,
+    }
+
+
+class PooledPostgresJobRepository(PostgresJobRepository):
+    """`PostgresJobRepository` that borrows connections from a shared `psycopg_pool.ConnectionPool`.
+
+    The thread-local repository opens one connection per thread, so the
+    connection count follows whatever thread pool the caller happens to use.
+    Here the pool bounds it to `max_size`, and because pooled connections are
+    long-lived the hot-path statements are prepared once per connection.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout_seconds: float = 30.0,
+        prepare_hot_queries: bool = True,
+        pool: Any | None = None,
+    ) -> None:
+        super().__init__(db_url)
+        self.min_size = max(0, int(min_size))
+        self.max_size = max(1, self.min_size, int(max_size))
+        self.timeout_seconds = timeout_seconds
+        self._hot_query_prepare = True if prepare_hot_queries else None
+        self.metrics = PoolWaitMetrics()
+        if pool is None:
+            psycopg_pool = _import_psycopg_pool()
+            pool = psycopg_pool.ConnectionPool(
+                db_url,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                timeout=timeout_seconds,
+                kwargs={"row_factory": dict_row},
+                name="dsx-connect-ng-jobs",
+                open=True,
+            )
+        self.pool = pool
+
+    @contextmanager
+    def _connect(self):
+        started = time.perf_counter()
+        try:
+            conn = self.pool.getconn()
+        except Exception as exc:
+            if type(exc).__name__ == "PoolTimeout":
+                self.metrics.record_timeout()
+            raise
+        self.metrics.record_acquired(time.perf_counter() - started)
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        else:
+            if not conn.closed:
+                conn.commit()
+        finally:
+            self.pool.putconn(conn)
+
+    def pool_status(self) -> dict[str, Any]:
+        return _pool_status(
+            self.pool,
+            self.metrics,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            prepare=self._hot_query_prepare,
+        )
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class AsyncPostgresJobRepository:
+    """Async hot-path reads over `psycopg_pool.AsyncConnectionPool`.
+
+    This is not a full `JobRepository`: it covers only the per-message calls
+    the workers make, so they can run on the event loop instead of being
+    offloaded to a thread. Everything else stays on the sync repository.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout_seconds: float = 30.0,
+        prepare_hot_queries: bool = True,
+        pool: Any | None = None,
+    ) -> None:
+        self.db_url = db_url
+        self.min_size = max(0, int(min_size))
+        self.max_size = max(1, self.min_size, int(max_size))
+        self.timeout_seconds = timeout_seconds
+        self._hot_query_prepare = True if prepare_hot_queries else None
+        self.metrics = PoolWaitMetrics()
+        if pool is None:
+            psycopg_pool = _import_psycopg_pool()
+            pool = psycopg_pool.AsyncConnectionPool(
+                db_url,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                timeout=timeout_seconds,
+                kwargs={"row_factory": dict_row},
+                name="dsx-connect-ng-jobs-async",
+                open=False,
+            )
+        self.pool = pool
+
+    async def open(self) -> None:
+        await self.pool.open()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    @asynccontextmanager
+    async def _connect(self):
+        started = time.perf_counter()
+        try:
+            conn = await self.pool.getconn()
+        except Exception as exc:
+            if type(exc).__name__ == "PoolTimeout":
+                self.metrics.record_timeout()
+            raise
+        self.metrics.record_acquired(time.perf_counter() - started)
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                await conn.rollback()
+            raise
+        else:
+            if not conn.closed:
+                await conn.commit()
+        finally:
+            await self.pool.putconn(conn)
+
+    def pool_status(self) -> dict[str, Any]:
+        return _pool_status(
+            self.pool,
+            self.metrics,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            prepare=self._hot_query_prepare,
+        )
+
+    async def get_job(self, job_id: str) -> JobRecord | None:
+        async with self._connect() as conn, conn.cursor() as cur:
+            await cur.execute(GET_JOB_SQL, (job_id,), prepare=self._hot_query_prepare)
+            row = await cur.fetchone()
+            return JobRecord.model_validate(row) if row else None
+
+    async def get_job_item(self, job_item_id: str) -> JobItemRecord | None:
+        async with self._connect() as conn, conn.cursor() as cur:
+            await cur.execute(GET_JOB_ITEM_SQL, (job_item_id,), prepare=self._hot_query_prepare)
+            row = await cur.fetchone()
+            return JobItemRecord.model_validate(row) if row else None
@@ -26,6 +26,94 @@ OUTBOX_NOTIFY_CHANNEL = "dsx_ng_outbox"
 _TERMINAL_STAGE_STATES = {"completed", "failed", "skipped"}
 _SCHEMA_ADVISORY_LOCK_ID = 0x44535802
 
+_JOB_ITEM_COLUMNS = """
+    job_item_id, job_id, item_index, object_identity, state,
+    payload_json AS payload, content_source_json AS content_source,
+    delivery_requirements_json AS delivery_requirements, error_json AS error,
+    scan_stage_json AS scan_stage,
+    policy_stage_json AS policy_stage,
+    remediation_stage_json AS remediation_stage,
+    delivery_stage_json AS delivery_stage,
+    dianna_stage_json AS dianna_stage,
+    created_at, updated_at, completed_at
+"""
+# `_JOB_ITEM_COLUMNS` qualified with the `item` alias, for UPDATE ... FROM statements.
+_ITEM_ALIAS_JOB_ITEM_COLUMNS = """
+    item.job_item_id, item.job_id, item.item_index, item.object_identity, item.state,
+    item.payload_json AS payload, item.content_source_json AS content_source,
+    item.delivery_requirements_json AS delivery_requirements, item.error_json AS error,
+    item.scan_stage_json AS scan_stage,
+    item.policy_stage_json AS policy_stage,
+    item.remediation_stage_json AS remediation_stage,
+    item.delivery_stage_json AS delivery_stage,
+    item.dianna_stage_json AS dianna_stage,
+    item.created_at, item.updated_at, item.completed_at
+"""
+_STAGE_COLUMNS = {
+    "scan_stage": "scan_stage_json",
+    "policy_stage": "policy_stage_json",
+    "remediation_stage": "remediation_stage_json",
+    "delivery_stage": "delivery_stage_json",
+    "dianna_stage": "dianna_stage_json",
+}
+
+# Hot-path statements shared by the thread-local, pooled, and async repositories.
+# They are module constants so the same query text is reused on every call,
+# which is what lets psycopg prepare them server-side per connection.
+GET_JOB_SQL = """
+    SELECT job_id, job_type, state, integration_id, scope_id, object_identity,
+           idempotency_key, payload_json AS payload, error_json AS error,
+           created_at, updated_at, completed_at
+    FROM cp_jobs
+    WHERE job_id = %s
+"""
+GET_JOB_ITEM_SQL = f"SELECT {_JOB_ITEM_COLUMNS} FROM cp_job_items WHERE job_item_id = %s"
+LOCK_JOB_ITEM_SQL = f"{GET_JOB_ITEM_SQL} FOR UPDATE"
+UPDATE_JOB_ITEM_STAGE_SQL = {
+    stage_name: f"""
+    UPDATE cp_job_items
+    SET {stage_column} = %s::jsonb,
+        state = %s,
+        error_json = %s::jsonb,
+        completed_at = %s,
+        updated_at = NOW()
+    WHERE job_item_id = %s
+    RETURNING {_JOB_ITEM_COLUMNS}
+    """
+    for stage_name, stage_column in _STAGE_COLUMNS.items()
+}
+SUMMARIZE_JOB_ITEMS_SQL = """
+    SELECT state, COUNT(*) AS count
+    FROM cp_job_items
+    WHERE job_id = %s
+    GROUP BY state
+"""
+CLAIM_OUTBOX_RECORDS_SQL = """
+    UPDATE cp_job_outbox
+    SET publish_state = 'publishing',
+        updated_at = NOW()
+    WHERE outbox_id = ANY(%s)
+      AND publish_state = 'pending'
+    RETURNING outbox_id, job_id, topic, payload_json AS payload,
+              publish_state, publish_attempts, last_error_json AS last_error,
+              created_at, updated_at, published_at
+"""
+NOTIFY_OUTBOX_SQL = "SELECT pg_notify(%s, %s)"
+TERMINAL_ITEM_STATES = {"completed", "failed", "cancelled"}
+_SUMMARY_STATES = {
+    "accepted",
+    "publish_pending",
+    "queued",
+    "scanning",
+    "scanned",
+    "remediating",
+    "deliver_pending",
+    "delivering_result",
+    "completed",
+    "failed",
+    "cancelled",
+}
+
 
 def _migration_dir() -> Path:
     return Path(__file__).resolve().parents[2] / "migrations"
@@ -44,7 +132,28 @@ def apply_schema(db_url: str) -> None:
         conn.commit()
 
 
+def job_item_summary_from_rows(rows: list[dict[str, Any]]) -> JobItemSummary:
+    summary = JobItemSummary()
+    for row in rows:
+        count = int(row["count"])
+        summary.total += count
+        if row["state"] in _SUMMARY_STATES:
+            setattr(summary, row["state"], count)
+    return summary
+
+
+def stage_update_is_stale(current_row: dict[str, Any], *, stage_name: str, stage_record: StageRecord) -> bool:
+    """A late `running` update must not reopen a stage that already reached a terminal state."""
+    current_stage = current_row.get(stage_name) or {}
+    current_stage_state = current_stage.get("state") if isinstance(current_stage, dict) else None
+    return stage_record.state == "running" and current_stage_state in _TERMINAL_STAGE_STATES
+
+
 class PostgresJobRepository(JobRepository):
+    # psycopg `prepare=` flag for hot-path statements: None keeps psycopg's
+    # automatic prepare threshold, True prepares on first use.
+    _hot_query_prepare: bool | None = None
+
     def __init__(self, db_url: str) -> None:
         self.db_url = db_url
         self._local = threading.local()
@@ -70,7 +179,7 @@ class PostgresJobRepository(JobRepository):
                 conn.commit()
 
     def _notify_outbox_changed(self, cur, *, job_id: str) -> None:
-        cur.execute("SELECT pg_notify(%s, %s)", (OUTBOX_NOTIFY_CHANNEL, job_id))
+        cur.execute(NOTIFY_OUTBOX_SQL, (OUTBOX_NOTIFY_CHANNEL, job_id))
 
     def list_jobs(
         self,
@@ -101,16 +210,7 @@ class PostgresJobRepository(JobRepository):
 
     def get_job(self, job_id: str) -> JobRecord | None:
         with self._connect() as conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT job_id, job_type, state, integration_id, scope_id, object_identity,
-                       idempotency_key, payload_json AS payload, error_json AS error,
-                       created_at, updated_at, completed_at
-                FROM cp_jobs
-                WHERE job_id = %s
-                """,
-                (job_id,),
-            )
+            cur.execute(GET_JOB_SQL, (job_id,), prepare=self._hot_query_prepare)
             row = cur.fetchone()
             return JobRecord.model_validate(row) if row else None
 
@@ -212,25 +312,20 @@ class PostgresJobRepository(JobRepository):
 
     def get_job_item(self, job_item_id: str) -> JobItemRecord | None:
         with self._connect() as conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT job_item_id, job_id, item_index, object_identity, state,
-                       payload_json AS payload, content_source_json AS content_source,
-                       delivery_requirements_json AS delivery_requirements, error_json AS error,
-                       scan_stage_json AS scan_stage,
-                       policy_stage_json AS policy_stage,
-                       remediation_stage_json AS remediation_stage,
-                       delivery_stage_json AS delivery_stage,
-                       dianna_stage_json AS dianna_stage,
-                       created_at, updated_at, completed_at
-                FROM cp_job_items
-                WHERE job_item_id = %s
-                """,
-                (job_item_id,),
-            )
+            cur.execute(GET_JOB_ITEM_SQL, (job_item_id,), prepare=self._hot_query_prepare)
             row = cur.fetchone()
             return JobItemRecord.model_validate(row) if row else None
 
+    def get_job_items_many(self, job_item_ids: list[str]) -> list[JobItemRecord]:
+        if not job_item_ids:
+            return []
+        order = {job_item_id: index for index, job_item_id in enumerate(job_item_ids)}
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT {_JOB_ITEM_COLUMNS} FROM cp_job_items WHERE job_item_id = ANY(%s)", (job_item_ids,))
+            rows = [JobItemRecord.model_validate(row) for row in cur.fetchall()]
+        rows.sort(key=lambda row: order.get(row.job_item_id, len(order)))
+        return rows
+
     def create_job_item(self, payload: JobItemCreate) -> JobItemRecord:
         job_item_id = payload.job_item_id or f"job_item_{uuid.uuid4().hex}"
         data = payload.model_dump(exclude={"job_item_id"})
@@ -407,60 +502,19 @@ class PostgresJobRepository(JobRepository):
         error: dict[str, Any] | None = None,
         completed_at: datetime | None = None,
     ) -> JobItemRecord | None:
-        stage_column = {
-            "scan_stage": "scan_stage_json",
-            "policy_stage": "policy_stage_json",
-            "remediation_stage": "remediation_stage_json",
-            "delivery_stage": "delivery_stage_json",
-            "dianna_stage": "dianna_stage_json",
-        }.get(stage_name)
-        if stage_column is None:
+        update_sql = UPDATE_JOB_ITEM_STAGE_SQL.get(stage_name)
+        if update_sql is None:
             raise ValueError(f"unsupported_stage:{stage_name}")
         with self._connect() as conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT job_item_id, job_id, item_index, object_identity, state,
-                       payload_json AS payload, content_source_json AS content_source,
-                       delivery_requirements_json AS delivery_requirements, error_json AS error,
-                       scan_stage_json AS scan_stage,
-                       policy_stage_json AS policy_stage,
-                       remediation_stage_json AS remediation_stage,
-                       delivery_stage_json AS delivery_stage,
-                       dianna_stage_json AS dianna_stage,
-                       created_at, updated_at, completed_at
-                FROM cp_job_items
-                WHERE job_item_id = %s
-                FOR UPDATE
-                """,
-                (job_item_id,),
-            )
+            cur.execute(LOCK_JOB_ITEM_SQL, (job_item_id,), prepare=self._hot_query_prepare)
             current_row = cur.fetchone()
             if current_row is None:
                 return None
-            current_stage = current_row.get(stage_name) or {}
-            current_stage_state = current_stage.get("state") if isinstance(current_stage, dict) else None
-            if stage_record.state == "running" and current_stage_state in _TERMINAL_STAGE_STATES:
+            if stage_update_is_stale(current_row, stage_name=stage_name, stage_record=stage_record):
                 conn.commit()
                 return JobItemRecord.model_validate(current_row)
             cur.execute(
-                f"""
-                UPDATE cp_job_items
-                SET {stage_column} = %s::jsonb,
-                    state = %s,
-                    error_json = %s::jsonb,
-                    completed_at = %s,
-                    updated_at = NOW()
-                WHERE job_item_id = %s
-                RETURNING job_item_id, job_id, item_index, object_identity, state,
-                          payload_json AS payload, content_source_json AS content_source,
-                          delivery_requirements_json AS delivery_requirements, error_json AS error,
-                          scan_stage_json AS scan_stage,
-                          policy_stage_json AS policy_stage,
-                          remediation_stage_json AS remediation_stage,
-                          delivery_stage_json AS delivery_stage,
-                          dianna_stage_json AS dianna_stage,
-                          created_at, updated_at, completed_at
-                """,
+                update_sql,
                 (
                     psycopg.types.json.Json(stage_record.model_dump(mode="json")),
                     state,
@@ -468,13 +522,62 @@ class PostgresJobRepository(JobRepository):
                     completed_at,
                     job_item_id,
                 ),
+                prepare=self._hot_query_prepare,
             )
             row = cur.fetchone()
-            if state in {"completed", "failed", "cancelled"} and row is not None:
+            if state in TERMINAL_ITEM_STATES and row is not None:
                 self._notify_outbox_changed(cur, job_id=row["job_id"])
             conn.commit()
             return JobItemRecord.model_validate(row) if row else None
 
+    def update_job_item_stage_many(self, *, stage_name: str, updates: list[dict[str, Any]]) -> list[JobItemRecord]:
+        stage_column = _STAGE_COLUMNS.get(stage_name)
+        if stage_column is None:
+            raise ValueError(f"unsupported_stage:{stage_name}")
+        if not updates:
+            return []
+        params: list[Any] = []
+        value_rows: list[str] = []
+        for update in updates:
+            value_rows.append("(%s, %s::jsonb, %s, %s::jsonb, %s::timestamptz)")
+            params.extend(
+                [
+                    update["job_item_id"],
+                    psycopg.types.json.Json(update["stage_record"].model_dump(mode="json")),
+                    update["state"],
+                    psycopg.types.json.Json(update.get("error")),
+                    update.get("completed_at"),
+                ]
+            )
+        with self._connect() as conn, conn.cursor() as cur:
+            # Same stale-running guard as update_job_item_stage, applied per row in SQL.
+            cur.execute(
+                f"""
+                WITH updates (job_item_id, stage_json, state, error_json, completed_at) AS (
+                    VALUES {", ".join(value_rows)}
+                )
+                UPDATE cp_job_items AS item
+                SET {stage_column} = updates.stage_json,
+                    state = updates.state,
+                    error_json = updates.error_json,
+                    completed_at = updates.completed_at,
+                    updated_at = NOW()
+                FROM updates
+                WHERE item.job_item_id = updates.job_item_id
+                  AND NOT (
+                      updates.stage_json->>'state' = 'running'
+                      AND COALESCE(item.{stage_column}->>'state', '') IN ('completed', 'failed', 'skipped')
+                  )
+                RETURNING {_ITEM_ALIAS_JOB_ITEM_COLUMNS}
+                """,
+                tuple(params),
+            )
+            rows = cur.fetchall()
+            for job_id in sorted({row["job_id"] for row in rows if row["state"] in TERMINAL_ITEM_STATES}):
+                self._notify_outbox_changed(cur, job_id=job_id)
+            conn.commit()
+            return [JobItemRecord.model_validate(row) for row in rows]
+
     def update_job_item_stages(
         self,
         job_item_id: str,
@@ -654,43 +757,8 @@ class PostgresJobRepository(JobRepository):
 
     def summarize_job_items(self, job_id: str) -> JobItemSummary:
         with self._connect() as conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT state, COUNT(*) AS count
-                FROM cp_job_items
-                WHERE job_id = %s
-                GROUP BY state
-                """,
-                (job_id,),
-            )
-            summary = JobItemSummary()
-            for row in cur.fetchall():
-                state = row["state"]
-                count = int(row["count"])
-                summary.total += count
-                if state == "accepted":
-                    summary.accepted = count
-                elif state == "publish_pending":
-                    summary.publish_pending = count
-                elif state == "queued":
-                    summary.queued = count
-                elif state == "scanning":
-                    summary.scanning = count
-                elif state == "scanned":
-                    summary.scanned = count
-                elif state == "remediating":
-                    summary.remediating = count
-                elif state == "deliver_pending":
-                    summary.deliver_pending = count
-                elif state == "delivering_result":
-                    summary.delivering_result = count
-                elif state == "completed":
-                    summary.completed = count
-                elif state == "failed":
-                    summary.failed = count
-                elif state == "cancelled":
-                    summary.cancelled = count
-            return summary
+            cur.execute(SUMMARIZE_JOB_ITEMS_SQL, (job_id,), prepare=self._hot_query_prepare)
+            return job_item_summary_from_rows(cur.fetchall())
 
     def summarize_recent_terminal_job_items(self, job_id: str, *, since: datetime) -> JobItemSummary:
         with self._connect() as conn, conn.cursor() as cur:
@@ -880,19 +948,7 @@ class PostgresJobRepository(JobRepository):
             return []
         order = {outbox_id: index for index, outbox_id in enumerate(outbox_ids)}
         with self._connect() as conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE cp_job_outbox
-                SET publish_state = 'publishing',
-                    updated_at = NOW()
-                WHERE outbox_id = ANY(%s)
-                  AND publish_state = 'pending'
-                RETURNING outbox_id, job_id, topic, payload_json AS payload,
-                          publish_state, publish_attempts, last_error_json AS last_error,
-                          created_at, updated_at, published_at
-                """,
-                (outbox_ids,),
-            )
+            cur.execute(CLAIM_OUTBOX_RECORDS_SQL, (outbox_ids,), prepare=self._hot_query_prepare)
             rows = [OutboxRecord.model_validate(row) for row in cur.fetchall()]
             conn.commit()
         rows.sort(key=lambda row: order.get(row.outbox_id, len(order)))
@@ -963,3 +1019,28 @@ class PostgresJobRepository(JobRepository):
             row = cur.fetchone()
             conn.commit()
             return OutboxRecord.model_validate(row) if row else None
+
+    def mark_outbox_failed_many(self, errors_by_outbox_id: dict[str, dict[str, Any]]) -> list[OutboxRecord]:
+        if not errors_by_outbox_id:
+            return []
+        order = {outbox_id: index for index, outbox_id in enumerate(errors_by_outbox_id)}
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE cp_job_outbox AS outbox
+                SET publish_state = 'pending',
+                    publish_attempts = outbox.publish_attempts + 1,
+                    last_error_json = failure.error,
+                    updated_at = NOW()
+                FROM jsonb_each(%s::jsonb) AS failure(outbox_id, error)
+                WHERE outbox.outbox_id = failure.outbox_id
+                RETURNING outbox.outbox_id, outbox.job_id, outbox.topic, outbox.payload_json AS payload,
+                          outbox.publish_state, outbox.publish_attempts, outbox.last_error_json AS last_error,
+                          outbox.created_at, outbox.updated_at, outbox.published_at
+                """,
+                (psycopg.types.json.Json(errors_by_outbox_id),),
+            )
+            rows = [OutboxRecord.model_validate(row) for row in cur.fetchall()]
+            conn.commit()
+        rows.sort(key=lambda row: order.get(row.outbox_id, len(order)))
+        return rows
@@ -1,13 +1,64 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from typing import Any, Sequence
+import zlib
 
 from dsx_connect_ng.config import AppSettings
 from dsx_connect_ng.jobs.bus import JobBus, PublishableMessage
 from dsx_connect_ng.jobs.contracts import MessageEnvelope
 from dsx_connect_ng.jobs.models import DomainJobEnvelope
 
+_MESSAGE_ROUTING_KEYS = {
+    "scan_item_requested": "scan.requested",
+    "scan_item_completed": "scan.completed",
+    "scan_item_failed": "scan.failed",
+    "policy_evaluation_requested": "policy.requested",
+    "policy_evaluation_completed": "policy.completed",
+    "policy_evaluation_failed": "policy.failed",
+    "dianna_analysis_requested": "dianna.requested",
+    "dianna_analysis_completed": "dianna.completed",
+    "dianna_analysis_failed": "dianna.failed",
+    "remediation_requested": "remediation.requested",
+    "remediation_completed": "remediation.completed",
+    "remediation_failed": "remediation.failed",
+    "result_sink_emit_requested": "result_sink.emit.requested",
+    "result_sink_emit_completed": "result_sink.emit.completed",
+    "result_sink_emit_failed": "result_sink.emit.failed",
+    # Legacy aliases publish on the new result-sink routing keys.
+    "result_delivery_requested": "result_sink.emit.requested",
+    "result_delivery_completed": "result_sink.emit.completed",
+    "result_delivery_failed": "result_sink.emit.failed",
+}
+
+
+def _import_aio_pika():
+    try:
+        import aio_pika
+    except ImportError as exc:
+        raise RuntimeError("aio_pika_not_installed") from exc
+    return aio_pika
+
+
+def routing_key_for(job: PublishableMessage) -> str:
+    if isinstance(job, MessageEnvelope):
+        return _MESSAGE_ROUTING_KEYS[job.message_type]
+    if isinstance(job, DomainJobEnvelope):
+        return job.job_type
+    return "unknown"
+
+
+def encode_message_body(job: PublishableMessage) -> bytes:
+    dump_json = getattr(job, "model_dump_json", None)
+    if callable(dump_json):
+        return dump_json().encode("utf-8")
+    return json.dumps(job.model_dump(mode="json")).encode("utf-8")
+
+
+def _ordering_key(job: PublishableMessage) -> str:
+    return str(getattr(job, "job_item_id", None) or getattr(job, "job_id", None) or "")
+
 
 class RabbitMQJobBus(JobBus):
     def __init__(self, settings: AppSettings) -> None:
@@ -15,73 +66,120 @@ class RabbitMQJobBus(JobBus):
         self._connection: Any | None = None
         self._channel: Any | None = None
         self._exchange: Any | None = None
+        # Extra publisher channels for publish_many; index 0 is always `_channel`.
+        self._pool_channels: list[Any] = []
+        self._pool_exchanges: list[Any] = []
+        self._published_count = 0
+        self._publish_failures = 0
+        self._max_in_flight = 0
 
     async def _ensure_exchange(self):
-        try:
-            import aio_pika
-        except ImportError as exc:
-            raise RuntimeError("aio_pika_not_installed") from exc
+        aio_pika = _import_aio_pika()
 
         if self._connection is None or getattr(self._connection, "is_closed", False):
             self._connection = await aio_pika.connect_robust(self.settings.rabbitmq.url)
             self._channel = None
             self._exchange = None
+            self._pool_channels = []
+            self._pool_exchanges = []
         if self._channel is None or getattr(self._channel, "is_closed", False):
             self._channel = await self._connection.channel(
                 publisher_confirms=self.settings.rabbitmq.publisher_confirms,
             )
             self._exchange = None
         if self._exchange is None:
-            self._exchange = await self._channel.declare_exchange(
-                self.settings.rabbitmq.job_exchange,
-                aio_pika.ExchangeType.TOPIC,
-                durable=True,
-            )
+            self._exchange = await self._declare_exchange(aio_pika, self._channel)
         return self._exchange
 
-    async def publish(self, job: PublishableMessage) -> None:
-        try:
-            import aio_pika
-        except ImportError as exc:
-            raise RuntimeError("aio_pika_not_installed") from exc
+    async def _declare_exchange(self, aio_pika: Any, channel: Any):
+        return await channel.declare_exchange(
+            self.settings.rabbitmq.job_exchange,
+            aio_pika.ExchangeType.TOPIC,
+            durable=True,
+        )
 
-        exchange = await self._ensure_exchange()
-        message = aio_pika.Message(
-            body=json.dumps(job.model_dump(mode="json")).encode("utf-8"),
+    async def _ensure_exchanges(self) -> list[Any]:
+        aio_pika = _import_aio_pika()
+        exchanges = [await self._ensure_exchange()]
+        extra = max(1, self.settings.rabbitmq.publish_channel_pool_size) - 1
+        for index in range(extra):
+            if index < len(self._pool_channels) and not getattr(self._pool_channels[index], "is_closed", False):
+                exchanges.append(self._pool_exchanges[index])
+                continue
+            channel = await self._connection.channel(
+                publisher_confirms=self.settings.rabbitmq.publisher_confirms,
+            )
+            exchange = await self._declare_exchange(aio_pika, channel)
+            if index < len(self._pool_channels):
+                self._pool_channels[index] = channel
+                self._pool_exchanges[index] = exchange
+            else:
+                self._pool_channels.append(channel)
+                self._pool_exchanges.append(exchange)
+            exchanges.append(exchange)
+        return exchanges
+
+    @staticmethod
+    def _message(aio_pika: Any, job: PublishableMessage):
+        return aio_pika.Message(
+            body=encode_message_body(job),
             content_type="application/json",
             delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
         )
-        if isinstance(job, MessageEnvelope):
-            routing_key = {
-                "scan_item_requested": "scan.requested",
-                "scan_item_completed": "scan.completed",
-                "scan_item_failed": "scan.failed",
-                "policy_evaluation_requested": "policy.requested",
-                "policy_evaluation_completed": "policy.completed",
-                "policy_evaluation_failed": "policy.failed",
-                "dianna_analysis_requested": "dianna.requested",
-                "dianna_analysis_completed": "dianna.completed",
-                "dianna_analysis_failed": "dianna.failed",
-                "remediation_requested": "remediation.requested",
-                "remediation_completed": "remediation.completed",
-                "remediation_failed": "remediation.failed",
-                "result_sink_emit_requested": "result_sink.emit.requested",
-                "result_sink_emit_completed": "result_sink.emit.completed",
-                "result_sink_emit_failed": "result_sink.emit.failed",
-                # Legacy aliases publish on the new result-sink routing keys.
-                "result_delivery_requested": "result_sink.emit.requested",
-                "result_delivery_completed": "result_sink.emit.completed",
-                "result_delivery_failed": "result_sink.emit.failed",
-            }[job.message_type]
-        elif isinstance(job, DomainJobEnvelope):
-            routing_key = job.job_type
-        else:
-            routing_key = "unknown"
-        await exchange.publish(message, routing_key=routing_key)
+
+    async def publish(self, job: PublishableMessage) -> None:
+        aio_pika = _import_aio_pika()
+        exchange = await self._ensure_exchange()
+        await exchange.publish(self._message(aio_pika, job), routing_key=routing_key_for(job))
+        self._published_count += 1
+
+    async def publish_many(
+        self,
+        jobs: Sequence[PublishableMessage],
+        *,
+        window: int | None = None,
+    ) -> list[BaseException | None]:
+        """Publish with up to `window` unconfirmed messages in flight.
+
+        Messages are spread over the channel pool by job item (or job), so
+        messages that share one stay on one channel and keep their relative
+        order; the broker only guarantees ordering within a channel.
+        """
+        if not jobs:
+            return []
+        aio_pika = _import_aio_pika()
+        exchanges = await self._ensure_exchanges()
+        semaphore = asyncio.Semaphore(max(1, window or self.settings.rabbitmq.publish_confirm_window))
+        in_flight = 0
+
+        async def publish_one(job: PublishableMessage) -> BaseException | None:
+            nonlocal in_flight
+            exchange = exchanges[zlib.crc32(_ordering_key(job).encode("utf-8")) % len(exchanges)]
+            message = self._message(aio_pika, job)
+            async with semaphore:
+                in_flight += 1
+                self._max_in_flight = max(self._max_in_flight, in_flight)
+                try:
+                    await exchange.publish(message, routing_key=routing_key_for(job))
+                except Exception as exc:
+                    self._publish_failures += 1
+                    return exc
+                finally:
+                    in_flight -= 1
+            self._published_count += 1
+            return None
+
+        return list(await asyncio.gather(*(publish_one(job) for job in jobs)))
 
     async def status(self) -> dict:
         return {
             "backend": "rabbitmq",
             "exchange": self.settings.rabbitmq.job_exchange,
             "url": self.settings.rabbitmq.url,
+            "publisher_confirms": self.settings.rabbitmq.publisher_confirms,
+            "publish_confirm_window": self.settings.rabbitmq.publish_confirm_window,
+            "publish_channel_pool_size": self.settings.rabbitmq.publish_channel_pool_size,
+            "published_count": self._published_count,
+            "publish_failures": self._publish_failures,
+            "max_in_flight": self._max_in_flight,
         }
@@ -66,6 +66,15 @@ class JobRepository(ABC):
     def get_job_item(self, job_item_id: str) -> JobItemRecord | None:
         raise NotImplementedError
 
+    def get_job_items_many(self, job_item_ids: list[str]) -> list[JobItemRecord]:
+        """Return the job items that exist, in `job_item_ids` order."""
+        items: list[JobItemRecord] = []
+        for job_item_id in job_item_ids:
+            item = self.get_job_item(job_item_id)
+            if item is not None:
+                items.append(item)
+        return items
+
     @abstractmethod
     def create_job_item(self, payload: JobItemCreate) -> JobItemRecord:
         raise NotImplementedError
@@ -105,6 +114,23 @@ class JobRepository(ABC):
     ) -> JobItemRecord | None:
         raise NotImplementedError
 
+    def update_job_item_stage_many(self, *, stage_name: str, updates: list[dict[str, Any]]) -> list[JobItemRecord]:
+        """Apply one stage update per item; each update carries `job_item_id`, `stage_record`,
+        `state`, and optional `error`/`completed_at`. Returns the rows that exist."""
+        updated: list[JobItemRecord] = []
+        for update in updates:
+            row = self.update_job_item_stage(
+                update["job_item_id"],
+                stage_name=stage_name,
+                stage_record=update["stage_record"],
+                state=update["state"],
+                error=update.get("error"),
+                completed_at=update.get("completed_at"),
+            )
+            if row is not None:
+                updated.append(row)
+        return updated
+
     @abstractmethod
     def update_job_item_stages(
         self,
@@ -191,6 +217,14 @@ class JobRepository(ABC):
     def mark_outbox_failed(self, outbox_id: str, *, error: dict[str, Any]) -> OutboxRecord | None:
         raise NotImplementedError
 
+    def mark_outbox_failed_many(self, errors_by_outbox_id: dict[str, dict[str, Any]]) -> list[OutboxRecord]:
+        failed: list[OutboxRecord] = []
+        for outbox_id, error in errors_by_outbox_id.items():
+            row = self.mark_outbox_failed(outbox_id, error=error)
+            if row is not None:
+                failed.append(row)
+        return failed
+
 
 class InMemoryJobRepository(JobRepository):
     def __init__(self) -> None:
@@ -3,12 +3,12 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 import math
 import time
+from typing import TYPE_CHECKING, Any
 import uuid
 
 from fastapi import HTTPException, status
 
-from dsx_connect_ng.config import RecoverySettings, RuntimeSettings
-from dsx_connect_ng.control_plane.config_models import resolve_policy_runtime_config
+from dsx_connect_ng.config import OutboxPublishMode, RecoverySettings, RuntimeSettings
 from dsx_connect_ng.control_plane.service import ControlPlaneService
 from dsx_connect_ng.jobs.bus import JobBus
 from dsx_connect_ng.jobs.contracts import (
@@ -38,6 +38,7 @@ from dsx_connect_ng.jobs.models import (
     JobRecord,
     JobSubmitRequest,
     JobThroughputSnapshot,
+    JobVerdictCacheSnapshot,
     LatencySummary,
     OutboxFlushResult,
     OutboxRecord,
@@ -52,6 +53,9 @@ from dsx_connect_ng.jobs.models import (
 from dsx_connect_ng.jobs.repository import JobRepository
 from dsx_connect_ng.recovery import RecoveryMode, ResolvedRecoveryMode
 
+if TYPE_CHECKING:
+    from dsx_connect_ng.jobs.postgres_pool import AsyncPostgresJobRepository
+
 
 class JobService:
     def __init__(
@@ -61,12 +65,15 @@ class JobService:
         control_plane: ControlPlaneService | None = None,
         recovery_settings: RecoverySettings | None = None,
         runtime_settings: RuntimeSettings | None = None,
+        async_repo: AsyncPostgresJobRepository | None = None,
     ) -> None:
         self.repo = repo
         self.bus = bus
         self.control_plane = control_plane
         self.recovery_settings = recovery_settings or RecoverySettings()
         self.runtime_settings = runtime_settings or RuntimeSettings()
+        # Optional async pool for per-message worker reads; see `get_job_item_or_404_async`.
+        self.async_repo = async_repo
 
     def _resolve_effective_recovery_mode(self, requested_mode: RecoveryMode | None) -> tuple[ResolvedRecoveryMode, dict]:
         configured_mode = self.recovery_settings.mode
@@ -200,6 +207,36 @@ class JobService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="job_item_not_found")
         return row
 
+    async def is_job_cancelled_async(self, job_id: str) -> bool:
+        if self.async_repo is None:
+            return self.is_job_cancelled(job_id)
+        job = await self.async_repo.get_job(job_id)
+        return job is not None and (job.state == "cancelled" or (job.error or {}).get("code") == "job_cancelled")
+
+    async def get_job_item_or_404_async(self, job_item_id: str) -> JobItemRecord:
+        if self.async_repo is None:
+            return self.get_job_item_or_404(job_item_id)
+        row = await self.async_repo.get_job_item(job_item_id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="job_item_not_found")
+        return row
+
+    async def open_async_repo(self) -> None:
+        if self.async_repo is not None:
+            await self.async_repo.open()
+
+    async def close_async_repo(self) -> None:
+        if self.async_repo is not None:
+            await self.async_repo.close()
+
+    def repository_pool_status(self) -> dict[str, Any] | None:
+        pool_status = getattr(self.repo, "pool_status", None)
+        sync_status = pool_status() if callable(pool_status) else None
+        async_status = self.async_repo.pool_status() if self.async_repo is not None else None
+        if sync_status is None and async_status is None:
+            return None
+        return {"sync": sync_status, "async": async_status}
+
     def list_job_items(self, *, job_id: str, state: str | None = None, limit: int = 1000) -> list[JobItemRecord]:
         self.get_job_or_404(job_id)
         return self.repo.list_job_items(job_id=job_id, state=state, limit=limit)
@@ -261,6 +298,7 @@ class JobService:
             last_activity_at=last_activity_at,
             throughput=throughput,
             latency=latency,
+            verdict_cache=self._build_verdict_cache_snapshot(items),
             backlog=backlog,
             runtime=runtime,
             bottleneck_hints=hints,
@@ -358,6 +396,28 @@ class JobService:
             queue_wait_ms=self._summarize_latency(queue_wait_values),
         )
 
+    @staticmethod
+    def _build_verdict_cache_snapshot(items: list[JobItemRecord]) -> JobVerdictCacheSnapshot:
+        hits = 0
+        scanner_hash_hits = 0
+        misses = 0
+        for item in items:
+            status = (item.scan_stage.metadata or {}).get("verdictCacheStatus")
+            if status == "hit":
+                hits += 1
+            elif status == "scanner_hash_hit":
+                scanner_hash_hits += 1
+            elif status == "miss":
+                misses += 1
+        lookups = hits + scanner_hash_hits + misses
+        return JobVerdictCacheSnapshot(
+            lookups=lookups,
+            hits=hits,
+            scanner_hash_hits=scanner_hash_hits,
+            misses=misses,
+            hit_rate=round((hits + scanner_hash_hits) / lookups, 4) if lookups else None,
+        )
+
     @staticmethod
     def _append_number(target: list[float], value: object) -> None:
         if isinstance(value, (int, float)):
@@ -504,8 +564,8 @@ class JobService:
             **job_item.payload,
         }
         if self.control_plane is not None:
-            integration = self.control_plane.get_integration_or_404(job.integration_id) if job.integration_id else None
-            scope = self.control_plane.get_scope_or_404(job.scope_id) if job.scope_id else None
+            integration = self.control_plane.get_integration_for_read(job.integration_id) if job.integration_id else None
+            scope = self.control_plane.get_scope_for_read(job.scope_id) if job.scope_id else None
             if integration is not None:
                 scan_options.setdefault("integrationConfig", integration.config)
                 scan_options.setdefault(
@@ -691,11 +751,11 @@ class JobService:
     def _build_policy_handoff_context(self, *, job: JobRecord, job_item: JobItemRecord) -> tuple[dict, dict]:
         if self.control_plane is None:
             return {}, {}
-        integration = self.control_plane.get_integration_or_404(job.integration_id) if job.integration_id else None
-        scope = self.control_plane.get_scope_or_404(job.scope_id) if job.scope_id else None
+        integration = self.control_plane.get_integration_for_read(job.integration_id) if job.integration_id else None
+        scope = self.control_plane.get_scope_for_read(job.scope_id) if job.scope_id else None
         integration_config = integration.config if integration is not None else {}
         scope_policy = scope.post_scan_policy if scope is not None else {}
-        resolved_policy = resolve_policy_runtime_config(integration_config, scope_policy)
+        resolved_policy = self.control_plane.policy_runtime_config(integration, scope)
         policy_context = {
             "integration_config": integration_config,
             "scope_policy": scope_policy,
@@ -1151,18 +1211,7 @@ class JobService:
         existing_stage = getattr(current, stage_name)
         if payload.state == "running" and existing_stage.state in {"completed", "failed", "skipped"}:
             return current
-        started_at = existing_stage.started_at
-        if payload.state == "running" and started_at is None:
-            started_at = datetime.now(timezone.utc)
-        completed_at = datetime.now(timezone.utc) if payload.state in {"completed", "failed", "skipped"} else None
-        stage_record = StageRecord(
-            state=payload.state,
-            started_at=started_at,
-            completed_at=completed_at,
-            result=payload.result,
-            metadata=payload.metadata,
-            error=payload.error,
-        )
+        stage_record = self._build_stage_record(existing_stage, payload)
         item_state, item_error, item_completed_at = self._derive_item_state_from_stages(
             current,
             stage_name=stage_name,
@@ -1185,6 +1234,68 @@ class JobService:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="job_item_state_update_failed")
         return refreshed
 
+    @staticmethod
+    def _build_stage_record(existing_stage: StageRecord, payload: StageUpdateRequest) -> StageRecord:
+        started_at = existing_stage.started_at
+        if payload.state == "running" and started_at is None:
+            started_at = datetime.now(timezone.utc)
+        completed_at = datetime.now(timezone.utc) if payload.state in {"completed", "failed", "skipped"} else None
+        return StageRecord(
+            state=payload.state,
+            started_at=started_at,
+            completed_at=completed_at,
+            result=payload.result,
+            metadata=payload.metadata,
+            error=payload.error,
+        )
+
+    def update_job_item_stage_many(
+        self,
+        stage_name: str,
+        updates: list[tuple[str, StageUpdateRequest]],
+        *,
+        refresh_parent: bool = True,
+    ) -> list[JobItemRecord]:
+        """Batched form of the per-stage update: one repository read and one write for the batch.
+
+        Unlike the single-item path, unknown job items are skipped instead of
+        raising 404, so one missing row cannot fail the rest of a worker batch.
+        """
+        if not updates:
+            return []
+        current_by_id = {
+            item.job_item_id: item
+            for item in self.repo.get_job_items_many([job_item_id for job_item_id, _payload in updates])
+        }
+        rows: list[dict[str, Any]] = []
+        for job_item_id, payload in updates:
+            current = current_by_id.get(job_item_id)
+            if current is None:
+                continue
+            existing_stage = getattr(current, stage_name)
+            if payload.state == "running" and existing_stage.state in {"completed", "failed", "skipped"}:
+                continue
+            stage_record = self._build_stage_record(existing_stage, payload)
+            item_state, item_error, item_completed_at = self._derive_item_state_from_stages(
+                current,
+                stage_name=stage_name,
+                stage_record=stage_record,
+            )
+            rows.append(
+                {
+                    "job_item_id": job_item_id,
+                    "stage_record": stage_record,
+                    "state": item_state,
+                    "error": item_error,
+                    "completed_at": item_completed_at,
+                }
+            )
+        updated = self.repo.update_job_item_stage_many(stage_name=stage_name, updates=rows)
+        if refresh_parent:
+            for job_id in sorted({item.job_id for item in updated}):
+                self._refresh_parent_job_state(job_id)
+        return updated
+
     def update_scan_stage(self, job_item_id: str, payload: StageUpdateRequest, *, refresh_parent: bool = True) -> JobItemRecord:
         return self._update_job_item_stage(job_item_id, stage_name="scan_stage", payload=payload, refresh_parent=refresh_parent)
 
@@ -1574,6 +1685,43 @@ class JobService:
         if claimed_outbox is None:
             existing = self.repo.get_outbox_record(outbox.outbox_id) or outbox
             return True, existing
+        envelope, skipped_outbox = self._prepare_claimed_outbox(claimed_outbox)
+        if skipped_outbox is not None:
+            return True, skipped_outbox
+        try:
+            await self.bus.publish(envelope)
+        except Exception as exc:
+            error = {
+                "code": "job_publish_failed",
+                "message": str(exc),
+            }
+            failed_outbox = self.repo.mark_outbox_failed(claimed_outbox.outbox_id, error=error)
+            return self._apply_outbox_publish_failure(
+                claimed_outbox,
+                envelope,
+                error=error,
+                failed_outbox=failed_outbox,
+                update_item_stage=update_item_stage,
+            )
+
+        published_outbox = self.repo.mark_outbox_published(claimed_outbox.outbox_id)
+        return self._apply_outbox_publish_success(
+            outbox,
+            envelope,
+            published_outbox=published_outbox,
+            update_item_stage=update_item_stage,
+        )
+
+    def _prepare_claimed_outbox(
+        self,
+        claimed_outbox: OutboxRecord,
+    ) -> tuple[MessageEnvelope | DomainJobEnvelope, OutboxRecord | None]:
+        """Parse a claimed record and apply pre-publish item checks.
+
+        Returns the envelope and, when the item no longer needs the message
+        (cancelled, or a scan request for an already terminal item), the
+        outbox record that was marked published without publishing.
+        """
         if "message_type" in claimed_outbox.payload:
             envelope = MessageEnvelope.model_validate(claimed_outbox.payload)
         else:
@@ -1587,65 +1735,78 @@ class JobService:
                     self._refresh_parent_job_state(claimed_outbox.job_id)
                     if skipped_outbox is None:
                         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="outbox_state_update_failed")
-                    return True, skipped_outbox
+                    return envelope, skipped_outbox
                 if isinstance(envelope, MessageEnvelope) and envelope.message_type == "scan_item_requested":
                     if current_item.state in {"completed", "failed", "cancelled"}:
                         skipped_outbox = self.repo.mark_outbox_published(claimed_outbox.outbox_id)
                         self._refresh_parent_job_state(claimed_outbox.job_id)
                         if skipped_outbox is None:
                             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="outbox_state_update_failed")
-                        return True, skipped_outbox
+                        return envelope, skipped_outbox
                     self.repo.update_job_item_state(envelope.job_item_id, state="queued", error=None)
-        try:
-            await self.bus.publish(envelope)
-        except Exception as exc:
-            error = {
-                "code": "job_publish_failed",
-                "message": str(exc),
-            }
-            failed_outbox = self.repo.mark_outbox_failed(claimed_outbox.outbox_id, error=error)
-            if envelope.job_item_id and update_item_stage:
-                current_item = self.repo.get_job_item(envelope.job_item_id)
-                if isinstance(envelope, MessageEnvelope) and envelope.message_type == "policy_evaluation_requested" and current_item is not None:
-                    stage = current_item.policy_stage.model_copy(update={"error": error})
-                    self.repo.update_job_item_stage(
-                        envelope.job_item_id,
-                        stage_name="policy_stage",
-                        stage_record=stage,
-                        state=current_item.state,
-                        error=current_item.error,
-                        completed_at=current_item.completed_at,
-                    )
-                elif isinstance(envelope, MessageEnvelope) and envelope.message_type == "dianna_analysis_requested" and current_item is not None:
-                    stage = current_item.dianna_stage.model_copy(update={"error": error})
-                    self.repo.update_job_item_stage(
-                        envelope.job_item_id,
-                        stage_name="dianna_stage",
-                        stage_record=stage,
-                        state=current_item.state,
-                        error=current_item.error,
-                        completed_at=current_item.completed_at,
-                    )
-                elif isinstance(envelope, MessageEnvelope) and envelope.message_type in {"result_sink_emit_requested", "result_delivery_requested"} and current_item is not None:
-                    stage = current_item.delivery_stage.model_copy(update={"error": error})
-                    self.repo.update_job_item_stage(
-                        envelope.job_item_id,
-                        stage_name="delivery_stage",
-                        stage_record=stage,
-                        state=current_item.state,
-                        error=current_item.error,
-                        completed_at=current_item.completed_at,
-                    )
-                else:
-                    self.repo.update_job_item_state(envelope.job_item_id, state="publish_pending", error=error)
-                self._refresh_parent_job_state(claimed_outbox.job_id)
+        return envelope, None
+
+    def _apply_outbox_publish_failure(
+        self,
+        claimed_outbox: OutboxRecord,
+        envelope: MessageEnvelope | DomainJobEnvelope,
+        *,
+        error: dict,
+        failed_outbox: OutboxRecord | None,
+        update_item_stage: bool = True,
+        refresh_job_ids: set[str] | None = None,
+    ) -> tuple[bool, OutboxRecord]:
+        if envelope.job_item_id and update_item_stage:
+            current_item = self.repo.get_job_item(envelope.job_item_id)
+            if isinstance(envelope, MessageEnvelope) and envelope.message_type == "policy_evaluation_requested" and current_item is not None:
+                stage = current_item.policy_stage.model_copy(update={"error": error})
+                self.repo.update_job_item_stage(
+                    envelope.job_item_id,
+                    stage_name="policy_stage",
+                    stage_record=stage,
+                    state=current_item.state,
+                    error=current_item.error,
+                    completed_at=current_item.completed_at,
+                )
+            elif isinstance(envelope, MessageEnvelope) and envelope.message_type == "dianna_analysis_requested" and current_item is not None:
+                stage = current_item.dianna_stage.model_copy(update={"error": error})
+                self.repo.update_job_item_stage(
+                    envelope.job_item_id,
+                    stage_name="dianna_stage",
+                    stage_record=stage,
+                    state=current_item.state,
+                    error=current_item.error,
+                    completed_at=current_item.completed_at,
+                )
+            elif isinstance(envelope, MessageEnvelope) and envelope.message_type in {"result_sink_emit_requested", "result_delivery_requested"} and current_item is not None:
+                stage = current_item.delivery_stage.model_copy(update={"error": error})
+                self.repo.update_job_item_stage(
+                    envelope.job_item_id,
+                    stage_name="delivery_stage",
+                    stage_record=stage,
+                    state=current_item.state,
+                    error=current_item.error,
+                    completed_at=current_item.completed_at,
+                )
             else:
-                self.repo.update_job_state(claimed_outbox.job_id, state="publish_pending", error=error)
-            if failed_outbox is None:
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="outbox_state_update_failed")
-            return False, failed_outbox
+                self.repo.update_job_item_state(envelope.job_item_id, state="publish_pending", error=error)
+            self._refresh_parent_job_state_later(claimed_outbox.job_id, refresh_job_ids)
+        else:
+            self.repo.update_job_state(claimed_outbox.job_id, state="publish_pending", error=error)
+        if failed_outbox is None:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="outbox_state_update_failed")
+        return False, failed_outbox
 
-        published_outbox = self.repo.mark_outbox_published(claimed_outbox.outbox_id)
+    def _apply_outbox_publish_success(
+        self,
+        outbox: OutboxRecord,
+        envelope: MessageEnvelope | DomainJobEnvelope,
+        *,
+        published_outbox: OutboxRecord | None,
+        update_item_stage: bool = True,
+        refresh_job_ids: set[str] | None = None,
+    ) -> tuple[bool, OutboxRecord]:
+        low_persistence_scan_only = self._is_low_persistence_scan_only_envelope(envelope)
         if envelope.job_item_id and update_item_stage:
             current_item = None if low_persistence_scan_only else self.repo.get_job_item(envelope.job_item_id)
             refresh_parent = True
@@ -1668,13 +1829,114 @@ class JobService:
             else:
                 self.repo.update_job_item_state(envelope.job_item_id, state="queued", error=None)
             if refresh_parent:
-                self._refresh_parent_job_state(outbox.job_id)
+                self._refresh_parent_job_state_later(outbox.job_id, refresh_job_ids)
         else:
             self.repo.update_job_state(outbox.job_id, state="queued", error=None)
         if published_outbox is None:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="outbox_state_update_failed")
         return True, published_outbox
 
+    def _refresh_parent_job_state_later(self, job_id: str, refresh_job_ids: set[str] | None) -> None:
+        if refresh_job_ids is None:
+            self._refresh_parent_job_state(job_id)
+        else:
+            refresh_job_ids.add(job_id)
+
+    async def _publish_outbox_records_pipelined(
+        self,
+        records: list[OutboxRecord],
+        *,
+        concurrency: int | None = None,
+    ) -> list[tuple[bool, OutboxRecord]]:
+        """Publish a mixed-topic outbox batch with bounded concurrency.
+
+        Records are claimed and marked in per-topic batches instead of one
+        round trip each, and published through `JobBus.publish_many` with
+        `concurrency` unconfirmed messages in flight (`None` uses the bus
+        default). Messages for the same job item (or the same job, for
+        job-level envelopes) form one lane and are published in order; if a
+        publish in a lane fails, the rest of that lane is returned to pending
+        behind it rather than overtaking it. Parent job state is refreshed once
+        per job at the end.
+        """
+        by_topic: dict[str, list[str]] = {}
+        for record in records:
+            by_topic.setdefault(record.topic, []).append(record.outbox_id)
+        claimed_by_id: dict[str, OutboxRecord] = {}
+        for outbox_ids in by_topic.values():
+            for claimed in self.repo.claim_outbox_records(outbox_ids):
+                claimed_by_id[claimed.outbox_id] = claimed
+
+        results: dict[str, tuple[bool, OutboxRecord]] = {}
+        lanes: dict[str, list[tuple[OutboxRecord, MessageEnvelope | DomainJobEnvelope]]] = {}
+        for record in records:
+            claimed = claimed_by_id.get(record.outbox_id)
+            if claimed is None:
+                results[record.outbox_id] = (True, self.repo.get_outbox_record(record.outbox_id) or record)
+                continue
+            envelope, skipped_outbox = self._prepare_claimed_outbox(claimed)
+            if skipped_outbox is not None:
+                results[record.outbox_id] = (True, skipped_outbox)
+                continue
+            lanes.setdefault(envelope.job_item_id or claimed.job_id, []).append((claimed, envelope))
+
+        published: list[tuple[OutboxRecord, MessageEnvelope | DomainJobEnvelope]] = []
+        failed: list[tuple[OutboxRecord, MessageEnvelope | DomainJobEnvelope, dict]] = []
+        # Each wave publishes the next message of every open lane in one
+        # confirm window, so a lane never has two unconfirmed messages.
+        open_lanes = list(lanes.values())
+        position = 0
+        while open_lanes:
+            wave = [lane[position] for lane in open_lanes]
+            outcomes = await self.bus.publish_many([envelope for _claimed, envelope in wave], window=concurrency)
+            next_lanes: list[list[tuple[OutboxRecord, MessageEnvelope | DomainJobEnvelope]]] = []
+            for lane, (claimed, envelope), outcome in zip(open_lanes, wave, outcomes):
+                if outcome is None:
+                    published.append((claimed, envelope))
+                    if position + 1 < len(lane):
+                        next_lanes.append(lane)
+                    continue
+                failed.append((claimed, envelope, {"code": "job_publish_failed", "message": str(outcome)}))
+                blocked_error = {
+                    "code": "job_publish_blocked",
+                    "message": f"earlier_publish_failed:{claimed.outbox_id}",
+                }
+                failed.extend((blocked, blocked_envelope, blocked_error) for blocked, blocked_envelope in lane[position + 1 :])
+            open_lanes = next_lanes
+            position += 1
+
+        published_by_topic: dict[str, list[str]] = {}
+        for claimed, _envelope in published:
+            published_by_topic.setdefault(claimed.topic, []).append(claimed.outbox_id)
+        published_rows: dict[str, OutboxRecord] = {}
+        for outbox_ids in published_by_topic.values():
+            for row in self.repo.mark_outbox_published_many(outbox_ids):
+                published_rows[row.outbox_id] = row
+        failed_rows = {
+            row.outbox_id: row
+            for row in self.repo.mark_outbox_failed_many({claimed.outbox_id: error for claimed, _envelope, error in failed})
+        }
+
+        refresh_job_ids: set[str] = set()
+        for claimed, envelope in published:
+            results[claimed.outbox_id] = self._apply_outbox_publish_success(
+                claimed,
+                envelope,
+                published_outbox=published_rows.get(claimed.outbox_id),
+                refresh_job_ids=refresh_job_ids,
+            )
+        for claimed, envelope, error in failed:
+            results[claimed.outbox_id] = self._apply_outbox_publish_failure(
+                claimed,
+                envelope,
+                error=error,
+                failed_outbox=failed_rows.get(claimed.outbox_id),
+                refresh_job_ids=refresh_job_ids,
+            )
+        for job_id in refresh_job_ids:
+            self._refresh_parent_job_state(job_id)
+        return [results[record.outbox_id] for record in records]
+
     @staticmethod
     def _is_low_persistence_scan_only_envelope(envelope: MessageEnvelope | DomainJobEnvelope) -> bool:
         if not isinstance(envelope, MessageEnvelope) or envelope.message_type != "scan_item_requested":
@@ -1707,19 +1969,29 @@ class JobService:
         claimed = claim_many([record.outbox_id for record in records])
         results: list[tuple[bool, OutboxRecord]] = []
         successfully_published: list[OutboxRecord] = []
+        envelopes: list[MessageEnvelope] = []
+        publishable: list[OutboxRecord] = []
+        publish_errors: list[tuple[OutboxRecord, BaseException]] = []
         for outbox in claimed:
             try:
-                envelope = MessageEnvelope.model_validate(outbox.payload)
-                await self.bus.publish(envelope)
+                envelopes.append(MessageEnvelope.model_validate(outbox.payload))
             except Exception as exc:
-                error = {
-                    "code": "job_publish_failed",
-                    "message": str(exc),
-                }
-                failed_outbox = self.repo.mark_outbox_failed(outbox.outbox_id, error=error)
-                results.append((False, failed_outbox or outbox))
+                publish_errors.append((outbox, exc))
                 continue
-            successfully_published.append(outbox)
+            publishable.append(outbox)
+        outcomes = await self.bus.publish_many(envelopes)
+        for outbox, outcome in zip(publishable, outcomes):
+            if outcome is None:
+                successfully_published.append(outbox)
+            else:
+                publish_errors.append((outbox, outcome))
+        for outbox, exc in publish_errors:
+            error = {
+                "code": "job_publish_failed",
+                "message": str(exc),
+            }
+            failed_outbox = self.repo.mark_outbox_failed(outbox.outbox_id, error=error)
+            results.append((False, failed_outbox or outbox))
 
         published_rows = mark_many([outbox.outbox_id for outbox in successfully_published])
         published_by_id = {outbox.outbox_id: outbox for outbox in published_rows}
@@ -1840,6 +2112,7 @@ class JobService:
             self.repo.update_job_state(created.job_id, state="publish_pending", error={"code": "batch_publish_pending"})
             return self.get_batch_job_or_404(created.job_id)
 
+        inline_outbox: list[OutboxRecord] = []
         for index, item in enumerate(payload.items):
             job_item = self.repo.create_job_item(
                 JobItemCreate(
@@ -1857,11 +2130,11 @@ class JobService:
                 topic="scan.requested",
                 payload=queued_envelope.model_dump(mode="json"),
             )
-            if defer_publish:
-                continue
-            published, _ = await self._publish_outbox_record(outbox)
-            if not published:
-                batch_had_publish_failure = True
+            if not defer_publish:
+                inline_outbox.append(outbox)
+        if inline_outbox:
+            publish_results = await self._publish_outbox_records_pipelined(inline_outbox)
+            batch_had_publish_failure = not all(published for published, _ in publish_results)
 
         if defer_publish:
             self.repo.update_job_state(created.job_id, state="publish_pending", error={"code": "batch_publish_pending"})
@@ -1884,7 +2157,14 @@ class JobService:
             active_count += summary.queued + summary.scanning + summary.scanned
         return active_count
 
-    async def flush_outbox(self, *, limit: int = 100, max_active_scan_items: int | None = None) -> OutboxFlushResult:
+    async def flush_outbox(
+        self,
+        *,
+        limit: int = 100,
+        max_active_scan_items: int | None = None,
+        publish_mode: OutboxPublishMode = "serial",
+        publish_concurrency: int = 32,
+    ) -> OutboxFlushResult:
         started = time.perf_counter()
         publish_limit = limit
         active_scan_items: int | None = None
@@ -1909,6 +2189,7 @@ class JobService:
             active_scan_items=active_scan_items,
             max_active_scan_items=max_active_scan_items,
             publish_capacity=publish_capacity,
+            publish_mode=publish_mode,
             list_elapsed_ms=round(list_elapsed_ms, 3),
             selected_job_ids=selected_job_ids[:20],
             selected_topics=selected_topics,
@@ -1929,6 +2210,8 @@ class JobService:
         publish_started = time.perf_counter()
         if records and all(self._is_low_persistence_scan_only_outbox(record) for record in records):
             publish_results = await self._publish_low_persistence_scan_only_outbox_records(records)
+        elif publish_mode == "pipelined":
+            publish_results = await self._publish_outbox_records_pipelined(records, concurrency=publish_concurrency)
         else:
             publish_results = [await self._publish_outbox_record(record) for record in records]
         for record, (published, updated) in zip(records, publish_results):
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import re
 import tempfile
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AsyncIterable, Awaitable, Callable
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterator
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse, urlunparse
 from urllib.request import Request, urlopen
@@ -14,7 +16,6 @@ from urllib.request import Request, urlopen
 import httpx
 
 from dsx_connect_ng.config import settings
-from dsx_connect_ng.control_plane.config_models import parse_integration_runtime_config
 from dsx_connect_ng.control_plane.models import utcnow
 from dsx_connect_ng.control_plane.service import ControlPlaneService
 from dsx_connect_ng.jobs.contracts import ScanItemRequested
@@ -26,6 +27,7 @@ from shared.auth.hmac import make_hmac_header
 ConnectorProxyExecutor = Callable[[ConnectorProxyReadRequest], Awaitable[ConnectorProxyReadResponse | ReadResult]]
 _READ_PATH_KEYS = ("path", "file_path", "filePath", "local_path", "localPath", "selector", "location")
 _ASYNC_PROXY_CLIENTS: dict[tuple[int, float], httpx.AsyncClient] = {}
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
 
 
 @dataclass(frozen=True)
@@ -92,7 +94,7 @@ def _live_connector_proxy_endpoint(
         return None
     instances = [
         instance
-        for instance in control_plane.list_connector_instances(integration_id=request.integration_id)
+        for instance in control_plane.list_connector_instances_for_read(request.integration_id)
         if instance.expires_at > utcnow() and instance.capabilities.get("read") is not False
     ]
     if not instances:
@@ -112,8 +114,8 @@ def resolve_connector_proxy_runtime_config(
             "connector_proxy_config_missing",
             "proxy reader strategy requires integration-level connector proxy configuration",
         )
-    integration = control_plane.get_integration_or_404(request.integration_id)
-    runtime_config = parse_integration_runtime_config(integration.config)
+    integration = control_plane.get_integration_for_read(request.integration_id)
+    runtime_config = control_plane.integration_runtime_config(integration)
     proxy = runtime_config.reader.proxy if runtime_config.reader and runtime_config.reader.proxy else None
 
     endpoint_url = proxy.endpoint_url if proxy else None
@@ -374,17 +376,86 @@ def _raise_httpx_status_error(response: httpx.Response, *, endpoint_url: str, ra
     raise TerminalScanError("connector_proxy_read_failed", f"connector proxy read failed with http {status_code}", details=details)
 
 
+def _parse_content_range(value: str | None) -> tuple[int, int, int] | None:
+    match = _CONTENT_RANGE.fullmatch((value or "").strip())
+    if not match:
+        return None
+    start, end, total = (int(group) for group in match.groups())
+    return start, end, total
+
+
+async def _connector_http_fetch_range(
+    request: ConnectorProxyReadRequest,
+    config: ConnectorProxyRuntimeConfig,
+    *,
+    start: int,
+    end: int,
+    validator: str | None,
+) -> bytes:
+    # Fresh request per part: dsx_hmac headers carry a single-use nonce
+    req, _payload = _connector_http_stream_request(request, config)
+    headers = dict(req.header_items())
+    headers["Range"] = f"bytes={start}-{end}"
+    if validator:
+        headers["If-Range"] = validator
+    client = _get_async_proxy_client(config)
+    try:
+        response = await client.post(config.endpoint_url, content=req.data or b"", headers=headers)
+    except httpx.HTTPError as exc:
+        raise RuntimeError(f"connector proxy transport failure: {exc}") from exc
+    if response.status_code >= 400:
+        _raise_httpx_status_error(response, endpoint_url=config.endpoint_url, raw=response.content)
+    content_range = _parse_content_range(response.headers.get("Content-Range"))
+    if response.status_code != 206 or content_range is None or content_range[:2] != (start, end):
+        # If-Range mismatch (object changed since the first part) or a server that dropped the range
+        raise RuntimeError(
+            f"connector proxy returned http {response.status_code} for bytes {start}-{end}; object changed during ranged read"
+        )
+    return response.content
+
+
 async def _connector_http_stream_chunks(
     request: ConnectorProxyReadRequest,
     config: ConnectorProxyRuntimeConfig,
     *,
     chunk_size: int = 1024 * 1024,
+    range_parallelism: int = 1,
+    range_part_size: int = 8 * 1024 * 1024,
 ) -> AsyncIterable[bytes]:
+    """
+    Stream the object from the connector's read_file endpoint.
+
+    With `range_parallelism` > 1 the first request asks for the first `range_part_size`
+    bytes. A connector that honours Range answers 206 with the total size in
+    Content-Range; the remaining parts are then fetched `range_parallelism` at a time
+    (pinned to the first response's ETag/Last-Modified via If-Range) and yielded in
+    order. A connector that ignores Range answers 200 and is streamed as before.
+    """
     req, _payload = _connector_http_stream_request(request, config)
     client = _get_async_proxy_client(config)
     headers = dict(req.header_items())
+    ranged = range_parallelism > 1
+    if ranged:
+        headers["Range"] = f"bytes=0-{range_part_size - 1}"
+    parts: deque[asyncio.Task[bytes]] = deque()
+    remaining: Iterator[int] = iter(())
+    total = 0
+    validator: str | None = None
+
+    def _schedule_part() -> None:
+        offset = next(remaining, None)
+        if offset is not None:
+            parts.append(asyncio.create_task(_connector_http_fetch_range(
+                request, config, start=offset, end=min(offset + range_part_size, total) - 1, validator=validator,
+            )))
+
     try:
         async with client.stream("POST", config.endpoint_url, content=req.data or b"", headers=headers) as response:
+            if ranged and response.status_code == 416:
+                content_range = response.headers.get("Content-Range", "")
+                if content_range.strip() == "bytes */0":
+                    # Empty object: nothing to satisfy a range from
+                    return
             if response.status_code >= 400:
                 raw = await response.aread()
                 _raise_httpx_status_error(response, endpoint_url=config.endpoint_url, raw=raw)
@@ -400,9 +471,25 @@ async def _connector_http_stream_chunks(
                     "connector proxy returned JSON instead of file content",
                     details={"endpointUrl": config.endpoint_url, "response": payload},
                 )
+            if ranged and response.status_code == 206:
+                first = _parse_content_range(response.headers.get("Content-Range"))
+                if first is None or first[0] != 0:
+                    raise RuntimeError("connector proxy returned a malformed Content-Range for the first part")
+                total = first[2]
+                validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                remaining = iter(range(first[1] + 1, total, range_part_size))
+                # Start the other parts now so they download while the first one streams
+                for _ in range(range_parallelism - 1):
+                    _schedule_part()
             async for chunk in response.aiter_bytes(chunk_size=chunk_size):
                 if chunk:
                     yield chunk
+        _schedule_part()
+        while parts:
+            data = await parts.popleft()
+            _schedule_part()
+            for offset in range(0, len(data), chunk_size):
+                yield data[offset:offset + chunk_size]
     except httpx.HTTPStatusError as exc:
         raw = await exc.response.aread()
         _raise_httpx_status_error(exc.response, endpoint_url=config.endpoint_url, raw=raw)
@@ -410,6 +497,11 @@ async def _connector_http_stream_chunks(
         raise RuntimeError(f"connector proxy transport failure: {exc}") from exc
     except (HTTPError, URLError):
         raise
+    finally:
+        for task in parts:
+            task.cancel()
+        if parts:
+            await asyncio.gather(*parts, return_exceptions=True)
 
 
 async def _connector_http_stream_chunks_urllib(
@@ -467,11 +559,19 @@ async def http_connector_proxy_stream(
     config: ConnectorProxyRuntimeConfig,
     *,
     chunk_size: int = 1024 * 1024,
+    range_parallelism: int = 1,
+    range_part_size: int = 8 * 1024 * 1024,
 ) -> ReadResult:
     _req, payload = _connector_http_stream_request(request, config)
     size_in_bytes = payload.get("size_in_bytes")
     return ReadResult(
-        content_stream=_connector_http_stream_chunks(request, config, chunk_size=chunk_size),
+        content_stream=_connector_http_stream_chunks(
+            request,
+            config,
+            chunk_size=chunk_size,
+            range_parallelism=range_parallelism,
+            range_part_size=range_part_size,
+        ),
         content_length=size_in_bytes if isinstance(size_in_bytes, int) else None,
         details={
             "reader": "connector_proxy",
@@ -573,6 +673,8 @@ def build_connector_proxy_reader(
             proxy_request,
             config,
             chunk_size=settings.readers.chunk_size_bytes,
+            range_parallelism=settings.readers.range_parallelism,
+            range_part_size=settings.readers.range_part_size_bytes,
         ),
         prefer_stream=True,
     )
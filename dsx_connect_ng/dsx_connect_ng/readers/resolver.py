@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dsx_connect_ng.config import settings
-from dsx_connect_ng.control_plane.config_models import parse_integration_runtime_config
 from dsx_connect_ng.control_plane.service import ControlPlaneService
 from dsx_connect_ng.jobs.contracts import ScanItemRequested
 from dsx_connect_ng.readers.base import Reader
@@ -28,8 +27,8 @@ def _reader_strategy_from_integration(
 ) -> ReaderStrategy | None:
     if control_plane is None or not request.integration_id:
         return None
-    integration = control_plane.get_integration_or_404(request.integration_id)
-    runtime_config = parse_integration_runtime_config(integration.config)
+    integration = control_plane.get_integration_for_read(request.integration_id)
+    runtime_config = control_plane.integration_runtime_config(integration)
     return runtime_config.reader.default_strategy if runtime_config.reader and runtime_config.reader.default_strategy else runtime_config.reader_strategy
 
 
@@ -60,7 +59,7 @@ def build_scan_reader(
     if strategy == "cached":
         return CachedArtifactReader()
     if strategy == "native" and control_plane is not None and request.integration_id:
-        integration = control_plane.get_integration_or_404(request.integration_id)
+        integration = control_plane.get_integration_for_read(request.integration_id)
         platform = integration.platform.strip().lower().replace("_", "-")
         if platform in {"gcs", "google-cloud-storage", "google-cloud-storage-connector"}:
             return GCSNativeReader(chunk_size=settings.readers.chunk_size_bytes)
@@ -0,0 +1,17 @@
+from dsx_connect_ng.verdict_cache.base import (
+    CachedVerdict,
+    VerdictCache,
+    VerdictCacheKey,
+    VerdictCacheStats,
+    is_cacheable_scan_result,
+    normalize_content_sha256,
+)
+
+__all__ = [
+    "CachedVerdict",
+    "VerdictCache",
+    "VerdictCacheKey",
+    "VerdictCacheStats",
+    "is_cacheable_scan_result",
+    "normalize_content_sha256",
+]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import re
+import time
+
+from dsx_connect_ng.jobs.models import ScanResult
+
+CACHEABLE_VERDICTS = frozenset({"Benign", "Malicious", "Unsupported File Type", "Non Compliant"})
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def normalize_content_sha256(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    normalized = value.strip().lower()
+    if normalized.startswith("sha256:"):
+        normalized = normalized[len("sha256:"):]
+    return normalized if _SHA256_PATTERN.match(normalized) else None
+
+
+def is_cacheable_scan_result(result: ScanResult) -> bool:
+    return result.verdict in CACHEABLE_VERDICTS
+
+
+@dataclass(frozen=True)
+class VerdictCacheKey:
+    """Cache identity for a verdict.
+
+    Protected entity is part of the key because DSXA policy evaluation (for
+    example Non Compliant verdicts) can differ between protected entities for
+    the same bytes.
+    """
+
+    content_sha256: str
+    scanner_version: str
+    protected_entity: int | None = None
+
+
+@dataclass(frozen=True)
+class CachedVerdict:
+    key: VerdictCacheKey
+    result: ScanResult
+    cached_at: float
+    hit_count: int = 0
+
+
+@dataclass
+class VerdictCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, int | float | None]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class VerdictCache(ABC):
+    """Content-addressed scan verdict cache placed in front of DSXA."""
+
+    backend = "abstract"
+
+    def __init__(self, *, scanner_version: str, ttl_seconds: float | None, max_entries: int) -> None:
+        self.scanner_version = scanner_version.strip()
+        if not self.scanner_version:
+            # Verdicts from an unknown scanner build must never be served as current
+            raise ValueError("verdict_cache_scanner_version_required")
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.max_entries = max(1, max_entries)
+        self.stats = VerdictCacheStats()
+
+    def key_for(self, content_sha256: str, *, protected_entity: int | None = None) -> VerdictCacheKey:
+        return VerdictCacheKey(
+            content_sha256=content_sha256,
+            scanner_version=self.scanner_version,
+            protected_entity=protected_entity,
+        )
+
+    def expires_at(self, cached_at: float) -> float | None:
+        return cached_at + self.ttl_seconds if self.ttl_seconds is not None else None
+
+    async def lookup(self, content_sha256: str, *, protected_entity: int | None = None) -> CachedVerdict | None:
+        normalized = normalize_content_sha256(content_sha256)
+        if normalized is None:
+            return None
+        entry = await self._get(self.key_for(normalized, protected_entity=protected_entity))
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    async def store(self, content_sha256: str, result: ScanResult, *, protected_entity: int | None = None) -> bool:
+        normalized = normalize_content_sha256(content_sha256)
+        if normalized is None or not is_cacheable_scan_result(result):
+            return False
+        entry = CachedVerdict(
+            key=self.key_for(normalized, protected_entity=protected_entity),
+            result=result.model_copy(deep=True),
+            cached_at=time.time(),
+        )
+        await self._put(entry)
+        self.stats.stores += 1
+        return True
+
+    async def purge_other_versions(self, *, older_than_seconds: float) -> int:
+        """Drop verdicts of other scanner versions that have not been stored for `older_than_seconds`.
+
+        A version is only purged once no worker has written a verdict for it within
+        the grace period, so workers still on the previous scanner during a rolling
+        upgrade keep their cache.
+        """
+        cutoff = time.time() - max(0.0, older_than_seconds)
+        removed = await self._purge_other_versions(self.scanner_version, cutoff)
+        self.stats.invalidations += removed
+        return removed
+
+    async def aclose(self) -> None:
+        return None
+
+    @abstractmethod
+    async def _get(self, key: VerdictCacheKey) -> CachedVerdict | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _put(self, entry: CachedVerdict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _purge_other_versions(self, scanner_version: str, cutoff: float) -> int:
+        raise NotImplementedError
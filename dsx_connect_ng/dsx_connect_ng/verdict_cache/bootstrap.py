@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dsx_connect_ng.config import settings
+from dsx_connect_ng.verdict_cache.base import VerdictCache
+from dsx_connect_ng.verdict_cache.memory import InMemoryVerdictCache
+
+
+def build_verdict_cache() -> VerdictCache | None:
+    cache_settings = settings.verdict_cache
+    if cache_settings.backend == "disabled":
+        return None
+    if cache_settings.backend == "memory":
+        return InMemoryVerdictCache(
+            scanner_version=cache_settings.scanner_version,
+            ttl_seconds=cache_settings.ttl_seconds,
+            max_entries=cache_settings.max_entries,
+        )
+    if cache_settings.backend == "postgres":
+        from dsx_connect_ng.verdict_cache.postgres import PostgresVerdictCache
+
+        return PostgresVerdictCache(
+            settings.postgres.url,
+            scanner_version=cache_settings.scanner_version,
+            ttl_seconds=cache_settings.ttl_seconds,
+            max_entries=cache_settings.max_entries,
+            prune_every_stores=cache_settings.prune_every_stores,
+        )
+    raise ValueError(f"unsupported_verdict_cache_backend:{cache_settings.backend}")
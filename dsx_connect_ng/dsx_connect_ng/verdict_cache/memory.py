@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+
+from dsx_connect_ng.verdict_cache.base import CachedVerdict, VerdictCache, VerdictCacheKey
+
+
+class InMemoryVerdictCache(VerdictCache):
+    """Per-process LRU verdict cache with TTL expiry."""
+
+    backend = "memory"
+
+    def __init__(self, *, scanner_version: str, ttl_seconds: float | None, max_entries: int) -> None:
+        super().__init__(scanner_version=scanner_version, ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._entries: OrderedDict[VerdictCacheKey, CachedVerdict] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _get(self, key: VerdictCacheKey) -> CachedVerdict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at = self.expires_at(entry.cached_at)
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            self.stats.evictions += 1
+            return None
+        hit = CachedVerdict(key=key, result=entry.result, cached_at=entry.cached_at, hit_count=entry.hit_count + 1)
+        self._entries[key] = hit
+        self._entries.move_to_end(key)
+        return hit
+
+    async def _put(self, entry: CachedVerdict) -> None:
+        self._entries[entry.key] = entry
+        self._entries.move_to_end(entry.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _purge_other_versions(self, scanner_version: str, cutoff: float) -> int:
+        newest: dict[str, float] = {}
+        for key, entry in self._entries.items():
+            newest[key.scanner_version] = max(newest.get(key.scanner_version, 0.0), entry.cached_at)
+        stale_versions = {v for v, cached_at in newest.items() if v != scanner_version and cached_at < cutoff}
+        stale = [key for key in self._entries if key.scanner_version in stale_versions]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import threading
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+
+from dsx_connect_ng.jobs.models import ScanResult
+from dsx_connect_ng.verdict_cache.base import CachedVerdict, VerdictCache, VerdictCacheKey
+
+
+def _protected_entity_key(protected_entity: int | None) -> str:
+    return "" if protected_entity is None else str(protected_entity)
+
+
+class PostgresVerdictCache(VerdictCache):
+    """Verdict cache shared by every scan worker through `cp_scan_verdict_cache`.
+
+    Lookups refresh `last_hit_at`, which drives size-based eviction. Expired and
+    over-capacity rows are pruned every `prune_every_stores` writes rather than
+    on each write so the hot path stays a single statement.
+    """
+
+    backend = "postgres"
+
+    def __init__(
+        self,
+        db_url: str,
+        *,
+        scanner_version: str,
+        ttl_seconds: float | None,
+        max_entries: int,
+        prune_every_stores: int = 500,
+    ) -> None:
+        super().__init__(scanner_version=scanner_version, ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.db_url = db_url
+        self.prune_every_stores = max(1, prune_every_stores)
+        self._local = threading.local()
+        # Every per-thread connection, so aclose() can reach those opened on to_thread workers
+        self._connections: list[psycopg.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._stores_since_prune = 0
+
+    def _thread_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn.closed:
+            conn = psycopg.connect(self.db_url, row_factory=dict_row, autocommit=True)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections = [c for c in self._connections if not c.closed]
+                self._connections.append(conn)
+        return conn
+
+    async def _get(self, key: VerdictCacheKey) -> CachedVerdict | None:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    def _get_sync(self, key: VerdictCacheKey) -> CachedVerdict | None:
+        with self._thread_connection().cursor() as cur:
+            cur.execute(
+                """
+                UPDATE cp_scan_verdict_cache
+                SET last_hit_at = now(), hit_count = hit_count + 1
+                WHERE content_sha256 = %s
+                  AND scanner_version = %s
+                  AND protected_entity_key = %s
+                  AND (expires_at IS NULL OR expires_at > now())
+                RETURNING result_json, cached_at, hit_count
+                """,
+                (key.content_sha256, key.scanner_version, _protected_entity_key(key.protected_entity)),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return None
+        return CachedVerdict(
+            key=key,
+            result=ScanResult.model_validate(row["result_json"]),
+            cached_at=row["cached_at"].timestamp(),
+            hit_count=int(row["hit_count"]),
+        )
+
+    async def _put(self, entry: CachedVerdict) -> None:
+        self._stores_since_prune += 1
+        prune = self._stores_since_prune >= self.prune_every_stores
+        if prune:
+            self._stores_since_prune = 0
+        await asyncio.to_thread(self._put_sync, entry, prune)
+
+    def _put_sync(self, entry: CachedVerdict, prune: bool) -> None:
+        cached_at = datetime.fromtimestamp(entry.cached_at, tz=timezone.utc)
+        expires_at = cached_at + timedelta(seconds=self.ttl_seconds) if self.ttl_seconds is not None else None
+        with self._thread_connection().cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO cp_scan_verdict_cache (
+                    content_sha256, scanner_version, protected_entity_key, result_json,
+                    cached_at, expires_at, last_hit_at, hit_count
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, 0)
+                ON CONFLICT (content_sha256, scanner_version, protected_entity_key) DO UPDATE
+                SET result_json = EXCLUDED.result_json,
+                    cached_at = EXCLUDED.cached_at,
+                    expires_at = EXCLUDED.expires_at,
+                    last_hit_at = EXCLUDED.last_hit_at
+                """,
+                (
+                    entry.key.content_sha256,
+                    entry.key.scanner_version,
+                    _protected_entity_key(entry.key.protected_entity),
+                    Jsonb(entry.result.model_dump(mode="json")),
+                    cached_at,
+                    expires_at,
+                    cached_at,
+                ),
+            )
+        if prune:
+            self.stats.evictions += self.prune()
+
+    def prune(self) -> int:
+        """Delete expired rows and the least recently hit rows beyond `max_entries`."""
+        with self._thread_connection().cursor() as cur:
+            cur.execute(
+                "DELETE FROM cp_scan_verdict_cache WHERE expires_at IS NOT NULL AND expires_at <= now()"
+            )
+            expired = cur.rowcount or 0
+            cur.execute(
+                """
+                DELETE FROM cp_scan_verdict_cache AS cache
+                USING (
+                    SELECT content_sha256, scanner_version, protected_entity_key
+                    FROM cp_scan_verdict_cache
+                    ORDER BY last_hit_at DESC
+                    OFFSET %s
+                ) AS stale
+                WHERE cache.content_sha256 = stale.content_sha256
+                  AND cache.scanner_version = stale.scanner_version
+                  AND cache.protected_entity_key = stale.protected_entity_key
+                """,
+                (self.max_entries,),
+            )
+            return expired + (cur.rowcount or 0)
+
+    async def _purge_other_versions(self, scanner_version: str, cutoff: float) -> int:
+        return await asyncio.to_thread(self._purge_other_versions_sync, scanner_version, cutoff)
+
+    def _purge_other_versions_sync(self, scanner_version: str, cutoff: float) -> int:
+        with self._thread_connection().cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM cp_scan_verdict_cache
+                WHERE scanner_version IN (
+                    SELECT scanner_version
+                    FROM cp_scan_verdict_cache
+                    WHERE scanner_version <> %s
+                    GROUP BY scanner_version
+                    HAVING max(cached_at) < %s
+                )
+                """,
+                (scanner_version, datetime.fromtimestamp(cutoff, tz=timezone.utc)),
+            )
+            return cur.rowcount or 0
+
+    async def aclose(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            if not conn.closed:
+                conn.close()
@@ -12,7 +12,10 @@ from dsx_connect_ng.workers.errors import TerminalWorkerError
 
 
 EnvelopeHandler = Callable[[MessageEnvelope], Awaitable[None]]
+# Returns one error (or None) per envelope, in order; returning None means every envelope succeeded.
+BatchEnvelopeHandler = Callable[[list[MessageEnvelope]], Awaitable[list[BaseException | None] | None]]
 TerminalFailureHandler = Callable[[MessageEnvelope, Exception, dict[str, Any]], Awaitable[None]]
+MessageFailureHandler = Callable[[Any, MessageEnvelope | None, BaseException], Awaitable[None]]
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -45,6 +48,117 @@ async def dispatch_body(handler: EnvelopeHandler, body: bytes) -> None:
     await handler(decode_envelope(body))
 
 
+class MessageReader:
+    """Read from `next_message` with timeouts that never cancel a read in progress.
+
+    aio-pika's `QueueIterator.__anext__` closes the iterator when it is cancelled,
+    so `asyncio.wait_for` around it ends consumption after the first timeout. A
+    read that times out here stays pending and is picked up by the next call.
+    """
+
+    def __init__(self, next_message: Callable[[], Awaitable[Any]]) -> None:
+        self._next_message = next_message
+        self._pending: asyncio.Future[Any] | None = None
+
+    async def read(self, timeout: float | None = None) -> Any:
+        """Return the next message; raise `asyncio.TimeoutError` if none arrives within `timeout`."""
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._next_message())
+        done, _pending = await asyncio.wait({self._pending}, timeout=timeout)
+        if not done:
+            raise asyncio.TimeoutError
+        read, self._pending = self._pending, None
+        return read.result()
+
+    async def aclose(self) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            await asyncio.gather(self._pending, return_exceptions=True)
+            self._pending = None
+
+
+async def collect_batch(
+    reader: MessageReader,
+    *,
+    batch_size: int,
+    max_wait_seconds: float,
+) -> list[Any]:
+    """Wait for one message, then keep collecting until `batch_size` or `max_wait_seconds` is reached.
+
+    `StopAsyncIteration` from the first read propagates; later reads end the batch early.
+    """
+    batch = [await reader.read()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait_seconds
+    while len(batch) < batch_size:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await reader.read(remaining))
+        except (asyncio.TimeoutError, StopAsyncIteration):
+            break
+    return batch
+
+
+async def dispatch_batch(
+    messages: list[Any],
+    *,
+    batch_handler: BatchEnvelopeHandler,
+    handle_failure: MessageFailureHandler,
+    single_fallback: Callable[[Any], Awaitable[None]] | None = None,
+    queue_name: str = "",
+) -> None:
+    """Hand decoded envelopes to `batch_handler` and settle the messages.
+
+    A fully successful batch is acked with one `multiple=True` ack on its last
+    delivery. Per-envelope errors are settled one message at a time through
+    `handle_failure` (retry, DLQ or nack), while the successful ones are acked
+    individually. If the batch handler raises, each message is re-run through
+    `single_fallback` so one bad item cannot fail its neighbours.
+    """
+    decoded: list[tuple[Any, MessageEnvelope]] = []
+    for message in messages:
+        try:
+            decoded.append((message, decode_envelope(message.body)))
+        except Exception as exc:
+            await handle_failure(message, None, exc)
+    if not decoded:
+        return
+    try:
+        outcomes = await batch_handler([envelope for _message, envelope in decoded])
+    except Exception as exc:
+        log_event(
+            ops_logging,
+            30,
+            "worker_batch_handler_failed",
+            queue=queue_name,
+            batch_size=len(decoded),
+            fallback="single" if single_fallback is not None else "fail_all",
+            error={"code": exc.__class__.__name__, "message": str(exc)},
+        )
+        if single_fallback is not None:
+            for message, _envelope in decoded:
+                await single_fallback(message)
+            return
+        outcomes = [exc] * len(decoded)
+    if outcomes is None:
+        outcomes = [None] * len(decoded)
+    if len(outcomes) != len(decoded):
+        mismatch = RuntimeError(f"batch_handler_outcome_count_mismatch:{len(outcomes)}!={len(decoded)}")
+        outcomes = [mismatch] * len(decoded)
+    if all(outcome is None for outcome in outcomes):
+        await decoded[-1][0].ack(multiple=True)
+        if _WORKER_ACK_LOGGING:
+            log_event(ops_logging, 20, "worker_batch_acked", queue=queue_name, batch_size=len(decoded))
+        return
+    for (message, envelope), outcome in zip(decoded, outcomes):
+        if outcome is None:
+            await message.ack()
+        else:
+            await handle_failure(message, envelope, outcome)
+
+
 def retry_queue_name(queue_name: str) -> str:
     return f"{queue_name}.retry"
 
@@ -112,6 +226,9 @@ async def consume_queue(
     broker_connect_retry_interval_seconds: float = 2.0,
     broker_connect_max_attempts: int | None = None,
     terminal_failure_handler: TerminalFailureHandler | None = None,
+    batch_handler: BatchEnvelopeHandler | None = None,
+    batch_size: int = 1,
+    batch_max_wait_ms: int = 50,
 ) -> None:
     try:
         import aio_pika
@@ -125,8 +242,9 @@ async def consume_queue(
         max_attempts=broker_connect_max_attempts,
     )
     try:
+        batch_mode = batch_handler is not None and batch_size > 1
         channel = await connection.channel()
-        await channel.set_qos(prefetch_count=prefetch_count)
+        await channel.set_qos(prefetch_count=max(prefetch_count, batch_size) if batch_mode else prefetch_count)
         exchange = await channel.declare_exchange(
             exchange_name,
             aio_pika.ExchangeType.TOPIC,
@@ -167,6 +285,122 @@ async def consume_queue(
         semaphore = asyncio.Semaphore(prefetch_count)
         in_flight: set[asyncio.Task[None]] = set()
 
+        async def handle_failure(message, envelope: MessageEnvelope | None, exc: BaseException) -> None:
+            if isinstance(exc, TerminalWorkerError):
+                error_payload = (
+                    exc.as_error_payload()
+                    if hasattr(exc, "as_error_payload")
+                    else {"code": exc.__class__.__name__, "message": str(exc), "retryable": False}
+                )
+                log_event(
+                    ops_logging,
+                    40,
+                    "worker_message_terminal_error",
+                    queue=queue_name,
+                    error=error_payload,
+                    **_envelope_log_fields(envelope),
+                )
+                if terminal_failure_handler is not None and envelope is not None:
+                    try:
+                        await terminal_failure_handler(envelope, exc, dict(message.headers or {}))
+                    except Exception as terminal_exc:
+                        log_event(
+                            ops_logging,
+                            40,
+                            "worker_terminal_failure_handler_failed",
+                            queue=queue_name,
+                            error={
+                                "code": terminal_exc.__class__.__name__,
+                                "message": str(terminal_exc),
+                            },
+                            original_error=error_payload,
+                            **_envelope_log_fields(envelope),
+                        )
+                if dlx_exchange is not None:
+                    headers = dict(message.headers or {})
+                    headers["x-dsx-terminal"] = True
+                    dlq_message = aio_pika.Message(
+                        body=message.body,
+                        headers=headers,
+                        content_type=message.content_type,
+                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    )
+                    await dlx_exchange.publish(dlq_message, routing_key=routing_keys[0])
+                await message.ack()
+                return
+            envelope_fields = _envelope_log_fields(envelope)
+            if retry_exchange is not None and should_retry(headers=message.headers, max_attempts=retry_max_attempts):
+                headers = dict(message.headers or {})
+                headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers)
+                log_event(
+                    ops_logging,
+                    40,
+                    "worker_message_retrying",
+                    queue=queue_name,
+                    retry_attempt=headers["x-dsx-retry-attempt"],
+                    error={
+                        "code": exc.__class__.__name__,
+                        "message": str(exc),
+                    },
+                    **envelope_fields,
+                )
+                retry_message = aio_pika.Message(
+                    body=message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                )
+                await retry_exchange.publish(retry_message, routing_key=routing_keys[0])
+                await message.ack()
+                return
+            log_event(
+                ops_logging,
+                40,
+                "worker_message_retries_exhausted",
+                queue=queue_name,
+                retry_attempt=next_retry_attempt(message.headers) - 1,
+                error={
+                    "code": exc.__class__.__name__,
+                    "message": str(exc),
+                },
+                **envelope_fields,
+            )
+            if terminal_failure_handler is not None and envelope is not None:
+                headers = dict(message.headers or {})
+                headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers) - 1
+                try:
+                    await terminal_failure_handler(envelope, exc, headers)
+                except Exception as terminal_exc:
+                    log_event(
+                        ops_logging,
+                        40,
+                        "worker_terminal_failure_handler_failed",
+                        queue=queue_name,
+                        retry_attempt=headers["x-dsx-retry-attempt"],
+                        error={
+                            "code": terminal_exc.__class__.__name__,
+                            "message": str(terminal_exc),
+                        },
+                        original_error={
+                            "code": exc.__class__.__name__,
+                            "message": str(exc),
+                        },
+                        **envelope_fields,
+                    )
+            if dlx_exchange is not None:
+                headers = dict(message.headers or {})
+                headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers) - 1
+                dlq_message = aio_pika.Message(
+                    body=message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                )
+                await dlx_exchange.publish(dlq_message, routing_key=routing_keys[0])
+                await message.ack()
+                return
+            await message.nack(requeue=True)
+
         async def handle_message(message) -> None:
             async with semaphore:
                 envelope: MessageEnvelope | None = None
@@ -185,122 +419,35 @@ async def consume_queue(
                             job_item_id=envelope.job_item_id,
                             object_identity=envelope.object_identity,
                         )
-                except TerminalWorkerError as exc:
-                    error_payload = (
-                        exc.as_error_payload()
-                        if hasattr(exc, "as_error_payload")
-                        else {"code": exc.__class__.__name__, "message": str(exc), "retryable": False}
-                    )
-                    log_event(
-                        ops_logging,
-                        40,
-                        "worker_message_terminal_error",
-                        queue=queue_name,
-                        error=error_payload,
-                        **_envelope_log_fields(envelope),
-                    )
-                    if terminal_failure_handler is not None and envelope is not None:
-                        try:
-                            await terminal_failure_handler(envelope, exc, dict(message.headers or {}))
-                        except Exception as terminal_exc:
-                            log_event(
-                                ops_logging,
-                                40,
-                                "worker_terminal_failure_handler_failed",
-                                queue=queue_name,
-                                error={
-                                    "code": terminal_exc.__class__.__name__,
-                                    "message": str(terminal_exc),
-                                },
-                                original_error=error_payload,
-                                **_envelope_log_fields(envelope),
-                            )
-                    if dlx_exchange is not None:
-                        headers = dict(message.headers or {})
-                        headers["x-dsx-terminal"] = True
-                        dlq_message = aio_pika.Message(
-                            body=message.body,
-                            headers=headers,
-                            content_type=message.content_type,
-                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                        )
-                        await dlx_exchange.publish(dlq_message, routing_key=routing_keys[0])
-                    await message.ack()
                 except Exception as exc:
-                    envelope_fields = _envelope_log_fields(envelope)
-                    if retry_exchange is not None and should_retry(headers=message.headers, max_attempts=retry_max_attempts):
-                        headers = dict(message.headers or {})
-                        headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers)
-                        log_event(
-                            ops_logging,
-                            40,
-                            "worker_message_retrying",
-                            queue=queue_name,
-                            retry_attempt=headers["x-dsx-retry-attempt"],
-                            error={
-                                "code": exc.__class__.__name__,
-                                "message": str(exc),
-                            },
-                            **envelope_fields,
-                        )
-                        retry_message = aio_pika.Message(
-                            body=message.body,
-                            headers=headers,
-                            content_type=message.content_type,
-                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                        )
-                        await retry_exchange.publish(retry_message, routing_key=routing_keys[0])
-                        await message.ack()
-                        return
-                    log_event(
-                        ops_logging,
-                        40,
-                        "worker_message_retries_exhausted",
-                        queue=queue_name,
-                        retry_attempt=next_retry_attempt(message.headers) - 1,
-                        error={
-                            "code": exc.__class__.__name__,
-                            "message": str(exc),
-                        },
-                        **envelope_fields,
-                    )
-                    if terminal_failure_handler is not None and envelope is not None:
-                        headers = dict(message.headers or {})
-                        headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers) - 1
+                    await handle_failure(message, envelope, exc)
+
+        async with queue.iterator() as iterator:
+            if batch_mode:
+                assert batch_handler is not None
+                # Batches are settled one at a time: a `multiple=True` ack covers
+                # every earlier unacked delivery on the channel.
+                reader = MessageReader(iterator.__anext__)
+                try:
+                    while True:
                         try:
-                            await terminal_failure_handler(envelope, exc, headers)
-                        except Exception as terminal_exc:
-                            log_event(
-                                ops_logging,
-                                40,
-                                "worker_terminal_failure_handler_failed",
-                                queue=queue_name,
-                                retry_attempt=headers["x-dsx-retry-attempt"],
-                                error={
-                                    "code": terminal_exc.__class__.__name__,
-                                    "message": str(terminal_exc),
-                                },
-                                original_error={
-                                    "code": exc.__class__.__name__,
-                                    "message": str(exc),
-                                },
-                                **envelope_fields,
+                            batch = await collect_batch(
+                                reader,
+                                batch_size=batch_size,
+                                max_wait_seconds=batch_max_wait_ms / 1000.0,
                             )
-                    if dlx_exchange is not None:
-                        headers = dict(message.headers or {})
-                        headers["x-dsx-retry-attempt"] = next_retry_attempt(message.headers) - 1
-                        dlq_message = aio_pika.Message(
-                            body=message.body,
-                            headers=headers,
-                            content_type=message.content_type,
-                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                        except StopAsyncIteration:
+                            break
+                        await dispatch_batch(
+                            batch,
+                            batch_handler=batch_handler,
+                            handle_failure=handle_failure,
+                            single_fallback=handle_message,
+                            queue_name=queue_name,
                         )
-                        await dlx_exchange.publish(dlq_message, routing_key=routing_keys[0])
-                        await message.ack()
-                        return
-                    await message.nack(requeue=True)
-
-        async with queue.iterator() as iterator:
+                finally:
+                    await reader.aclose()
+                return
             async for message in iterator:
                 task = asyncio.create_task(handle_message(message))
                 in_flight.add(task)
@@ -166,6 +166,46 @@ async def process_result_sink_message(
     )
 
 
+async def process_result_sink_batch(
+    service: JobService,
+    envelopes: list[MessageEnvelope],
+    *,
+    execute_result_sink: ResultSinkExecutor,
+) -> list[BaseException | None]:
+    """Batch form of `process_result_sink_message` returning one outcome per envelope.
+
+    Workflow-summary requests share one bulk `running` delivery-stage update;
+    sink emits run concurrently and completions advance item by item.
+    """
+    requests = [ResultSinkEmitRequested.from_envelope(envelope) for envelope in envelopes]
+    running = DeliveryStageUpdateRequest(state="running").as_stage_update_request()
+    service.update_job_item_stage_many(
+        "delivery_stage",
+        [(request.job_item_id, running) for request in requests if request.result_type == "workflow_summary"],
+        refresh_parent=False,
+    )
+    results = await asyncio.gather(
+        *(execute_result_sink(request) for request in requests),
+        return_exceptions=True,
+    )
+    outcomes: list[BaseException | None] = []
+    for request, result in zip(requests, results):
+        if isinstance(result, BaseException):
+            outcomes.append(result)
+            continue
+        if request.result_type == "workflow_summary":
+            try:
+                await service.advance_delivery_stage(
+                    request.job_item_id,
+                    DeliveryStageUpdateRequest(state="completed", delivery_result=result).as_stage_update_request(),
+                )
+            except Exception as exc:
+                outcomes.append(exc)
+                continue
+        outcomes.append(None)
+    return outcomes
+
+
 async def stub_result_sink_executor(request: ResultSinkEmitRequested) -> DeliveryResult:
     target = request.delivery_target.delivery_target
     destination = target.get("connector") or target.get("destination") or "unknown"
@@ -202,6 +242,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--queue", default="dsx.ng.result_sink", help="RabbitMQ work queue to consume.")
     parser.add_argument("--routing-key", default="result_sink.emit.requested", help="Primary routing key to bind.")
     parser.add_argument("--prefetch-count", type=int, default=1, help="Consumer prefetch count.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Messages per batch; 1 disables batch consumption.")
+    parser.add_argument("--batch-max-wait-ms", type=int, default=50, help="Longest wait to fill a batch.")
     return parser.parse_args()
 
 
@@ -209,10 +251,26 @@ async def main() -> None:
     args = parse_args()
     service, summary = build_job_service()
     sink = build_result_sink()
-    print(json.dumps({"event": "result_sink_worker_start", **summary, "queue": args.queue}), flush=True)
+    print(
+        json.dumps(
+            {
+                "event": "result_sink_worker_start",
+                **summary,
+                "queue": args.queue,
+                "batch_size": args.batch_size,
+                "batch_max_wait_ms": args.batch_max_wait_ms,
+            }
+        ),
+        flush=True,
+    )
+
+    execute_result_sink = build_result_sink_executor(service, sink)
 
     async def handle(envelope: MessageEnvelope) -> None:
-        await process_result_sink_message(service, envelope, execute_result_sink=build_result_sink_executor(service, sink))
+        await process_result_sink_message(service, envelope, execute_result_sink=execute_result_sink)
+
+    async def handle_batch(envelopes: list[MessageEnvelope]) -> list[BaseException | None]:
+        return await process_result_sink_batch(service, envelopes, execute_result_sink=execute_result_sink)
 
     routing_keys = [args.routing_key]
     if "delivery.requested" not in routing_keys:
@@ -231,6 +289,9 @@ async def main() -> None:
         dead_letter_exchange_name=settings.rabbitmq.dead_letter_exchange,
         retry_delay_ms=settings.rabbitmq.retry_delay_ms,
         retry_max_attempts=settings.rabbitmq.retry_max_attempts,
+        batch_handler=handle_batch,
+        batch_size=args.batch_size,
+        batch_max_wait_ms=args.batch_max_wait_ms,
     )
 
 
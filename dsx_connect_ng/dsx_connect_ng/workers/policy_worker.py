@@ -30,22 +30,79 @@ async def process_policy_message(
         PolicyStageUpdateRequest(state="completed", decision=decision).as_stage_update_request(),
     )
 
+
+async def process_policy_batch(
+    service: JobService,
+    envelopes: list[MessageEnvelope],
+    *,
+    evaluate_policy: PolicyEngine,
+) -> list[BaseException | None]:
+    """Batch form of `process_policy_message` returning one outcome per envelope.
+
+    The `running` marks go out as one bulk stage update and the policy
+    evaluations run concurrently; completions still advance item by item
+    because each one may emit follow-on requests.
+    """
+    requests = [PolicyEvaluationRequested.from_envelope(envelope) for envelope in envelopes]
+    running = PolicyStageUpdateRequest(state="running").as_stage_update_request()
+    service.update_job_item_stage_many(
+        "policy_stage",
+        [(request.job_item_id, running) for request in requests],
+        refresh_parent=False,
+    )
+    decisions = await asyncio.gather(
+        *(evaluate_policy(request.as_policy_handoff_request()) for request in requests),
+        return_exceptions=True,
+    )
+    outcomes: list[BaseException | None] = []
+    for request, decision in zip(requests, decisions):
+        if isinstance(decision, BaseException):
+            outcomes.append(decision)
+            continue
+        try:
+            await service.advance_policy_stage(
+                request.job_item_id,
+                PolicyStageUpdateRequest(state="completed", decision=decision).as_stage_update_request(),
+            )
+        except Exception as exc:
+            outcomes.append(exc)
+            continue
+        outcomes.append(None)
+    return outcomes
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Consume policy work queue and post policy-stage callbacks.")
     parser.add_argument("--queue", default="dsx.ng.policy", help="RabbitMQ work queue to consume.")
     parser.add_argument("--routing-key", default="policy.requested", help="Routing key to bind.")
     parser.add_argument("--prefetch-count", type=int, default=1, help="Consumer prefetch count.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Messages per batch; 1 disables batch consumption.")
+    parser.add_argument("--batch-max-wait-ms", type=int, default=50, help="Longest wait to fill a batch.")
     return parser.parse_args()
 
 
 async def main() -> None:
     args = parse_args()
     service, summary = build_job_service()
-    print(json.dumps({"event": "policy_worker_start", **summary, "queue": args.queue}), flush=True)
+    print(
+        json.dumps(
+            {
+                "event": "policy_worker_start",
+                **summary,
+                "queue": args.queue,
+                "batch_size": args.batch_size,
+                "batch_max_wait_ms": args.batch_max_wait_ms,
+            }
+        ),
+        flush=True,
+    )
 
     async def handle(envelope: MessageEnvelope) -> None:
         await process_policy_message(service, envelope, evaluate_policy=stub_policy_engine)
 
+    async def handle_batch(envelopes: list[MessageEnvelope]) -> list[BaseException | None]:
+        return await process_policy_batch(service, envelopes, evaluate_policy=stub_policy_engine)
+
     await consume_queue(
         amqp_url=settings.rabbitmq.url,
         exchange_name=settings.rabbitmq.job_exchange,
@@ -57,6 +114,9 @@ async def main() -> None:
         dead_letter_exchange_name=settings.rabbitmq.dead_letter_exchange,
         retry_delay_ms=settings.rabbitmq.retry_delay_ms,
         retry_max_attempts=settings.rabbitmq.retry_max_attempts,
+        batch_handler=handle_batch,
+        batch_size=args.batch_size,
+        batch_max_wait_ms=args.batch_max_wait_ms,
     )
 
 
@@ -10,7 +10,7 @@ from typing import Any
 
 from shared.dsx_logging import dsx_logging
 
-from dsx_connect_ng.config import settings
+from dsx_connect_ng.config import OutboxPublishMode, settings
 from dsx_connect_ng.jobs.postgres_repo import OUTBOX_NOTIFY_CHANNEL
 from dsx_connect_ng.jobs.models import OutboxFlushResult
 from dsx_connect_ng.jobs.service import JobService
@@ -96,8 +96,20 @@ def build_outbox_wake_listener(summary: dict[str, Any]) -> PostgresOutboxWakeLis
     return PostgresOutboxWakeListener(settings.postgres.url)
 
 
-async def relay_once(service: JobService, *, limit: int, max_active_scan_items: int | None = None) -> OutboxFlushResult:
-    return await service.flush_outbox(limit=limit, max_active_scan_items=max_active_scan_items)
+async def relay_once(
+    service: JobService,
+    *,
+    limit: int,
+    max_active_scan_items: int | None = None,
+    publish_mode: OutboxPublishMode | None = None,
+    publish_concurrency: int | None = None,
+) -> OutboxFlushResult:
+    return await service.flush_outbox(
+        limit=limit,
+        max_active_scan_items=max_active_scan_items,
+        publish_mode=publish_mode or settings.relay.publish_mode,
+        publish_concurrency=publish_concurrency or settings.relay.publish_concurrency,
+    )
 
 
 def _flush_event_payload(result: OutboxFlushResult) -> dict[str, Any]:
@@ -109,6 +121,7 @@ def _flush_event_payload(result: OutboxFlushResult) -> dict[str, Any]:
         "active_scan_items": result.active_scan_items,
         "max_active_scan_items": result.max_active_scan_items,
         "publish_capacity": result.publish_capacity,
+        "publish_mode": result.publish_mode,
         "list_elapsed_ms": result.list_elapsed_ms,
         "publish_elapsed_ms": result.publish_elapsed_ms,
         "total_elapsed_ms": result.total_elapsed_ms,
@@ -150,12 +163,20 @@ async def relay_forever(
     poll_interval_seconds: float,
     max_active_scan_items: int | None,
     wake_listener: PostgresOutboxWakeListener | None = None,
+    publish_mode: OutboxPublishMode | None = None,
+    publish_concurrency: int | None = None,
 ) -> None:
     try:
         if wake_listener is not None:
             await wake_listener.start()
         while True:
-            result = await relay_once(service, limit=limit, max_active_scan_items=max_active_scan_items)
+            result = await relay_once(
+                service,
+                limit=limit,
+                max_active_scan_items=max_active_scan_items,
+                publish_mode=publish_mode,
+                publish_concurrency=publish_concurrency,
+            )
             _log_flush_result(result)
             if result.attempted > 0:
                 continue
@@ -205,6 +226,18 @@ def parse_args() -> argparse.Namespace:
         default=settings.relay.max_active_scan_items,
         help="Only publish pending scan requests while queued/scanning/scanned items are below this cap.",
     )
+    parser.add_argument(
+        "--publish-mode",
+        choices=["serial", "pipelined"],
+        default=settings.relay.publish_mode,
+        help="serial publishes and marks one record at a time; pipelined publishes concurrently and marks in batches.",
+    )
+    parser.add_argument(
+        "--publish-concurrency",
+        type=int,
+        default=settings.relay.publish_concurrency,
+        help="Maximum in-flight publishes in pipelined mode.",
+    )
     return parser.parse_args()
 
 
@@ -222,6 +255,8 @@ async def main() -> None:
             "outbox_wakeup": "postgres_notify" if wake_listener is not None else "poll_interval",
             "outbox_notify_channel": OUTBOX_NOTIFY_CHANNEL if wake_listener is not None else None,
             "outbox_wakeup_ready": wake_listener is not None,
+            "publish_mode": args.publish_mode,
+            "publish_concurrency": args.publish_concurrency,
         },
     )
     replayed = service.replay_nonterminal_scan_only_batches()
@@ -233,7 +268,13 @@ async def main() -> None:
         },
     )
     if args.once:
-        result = await relay_once(service, limit=args.batch_size, max_active_scan_items=args.max_active_scan_items)
+        result = await relay_once(
+            service,
+            limit=args.batch_size,
+            max_active_scan_items=args.max_active_scan_items,
+            publish_mode=args.publish_mode,
+            publish_concurrency=args.publish_concurrency,
+        )
         _log_flush_result(result)
         return
     await relay_forever(
@@ -242,6 +283,8 @@ async def main() -> None:
         poll_interval_seconds=args.poll_interval_seconds,
         max_active_scan_items=args.max_active_scan_items,
         wake_listener=wake_listener,
+        publish_mode=args.publish_mode,
+        publish_concurrency=args.publish_concurrency,
     )
 
 
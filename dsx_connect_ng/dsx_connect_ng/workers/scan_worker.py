@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
 import sys
@@ -14,12 +15,14 @@ from typing import Any, AsyncIterable, Awaitable, Callable
 from dsx_connect_ng.config import settings
 from dsx_connect_ng.control_plane.config_models import parse_integration_runtime_config
 from dsx_connect_ng.jobs.contracts import MessageEnvelope, ScanItemRequested
-from dsx_connect_ng.jobs.models import ScanResult, ScanStageUpdateRequest, StageUpdateRequest
+from dsx_connect_ng.jobs.models import JobItemRecord, ScanResult, ScanStageUpdateRequest, StageUpdateRequest
 from dsx_connect_ng.ops_logging import log_event, ops_logging
 from dsx_connect_ng.readers.base import Reader, TerminalScanError
 from dsx_connect_ng.readers.local_path import LocalPathReader
 from dsx_connect_ng.readers.resolver import build_scan_reader
 from dsx_connect_ng.jobs.service import JobService
+from dsx_connect_ng.verdict_cache.base import VerdictCache, is_cacheable_scan_result, normalize_content_sha256
+from dsx_connect_ng.verdict_cache.bootstrap import build_verdict_cache
 from dsx_connect_ng.workers.consumer import consume_queue
 from dsx_connect_ng.workers.runtime import build_job_service
 
@@ -30,6 +33,8 @@ _CANCELLED_JOB_SKIP_COUNTS: dict[str, int] = {}
 _DSXA_CLIENT: Any | None = None
 _DSXA_CLIENT_KEY: tuple[Any, ...] | None = None
 _SCANNER_CLIENT_SCOPE = "shared"
+_VERDICT_CACHE: VerdictCache | None = None
+_CONTENT_SHA256_KEYS = ("sha256", "contentSha256", "content_sha256", "fileSha256", "file_sha256")
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -53,6 +58,18 @@ async def _service_io(threaded: bool, func: Callable[..., Any], *args: Any, **kw
     return func(*args, **kwargs)
 
 
+async def _get_job_item(service: JobService, threaded: bool, job_item_id: str) -> JobItemRecord:
+    if getattr(service, "async_repo", None) is not None:
+        return await service.get_job_item_or_404_async(job_item_id)
+    return await _service_io(threaded, service.get_job_item_or_404, job_item_id)
+
+
+async def _is_job_cancelled(service: JobService, threaded: bool, job_id: str) -> bool:
+    if getattr(service, "async_repo", None) is not None:
+        return await service.is_job_cancelled_async(job_id)
+    return await _service_io(threaded, service.is_job_cancelled, job_id)
+
+
 def is_scan_only_request(request: ScanItemRequested) -> bool:
     return request.scan_options.get("scanOnly") is True or request.scan_options.get("scan_only") is True
 
@@ -72,6 +89,8 @@ class StreamTiming:
     elapsed_ms: float = 0.0
     bytes_read: int = 0
     chunks: int = 0
+    digest: Any | None = None
+    completed: bool = False
 
 
 class ScanOnlyCompletionBuffer:
@@ -345,8 +364,8 @@ class ScanOnlyBatchCoordinator:
             if request.job_id in _CANCELLED_JOB_IDS:
                 self._resolve_entry_future(entry, result="cancelled_parent_cached")
                 return None
-            current_item = await _service_io(self.service_io_threaded, self.service.get_job_item_or_404, request.job_item_id)
-            job_cancelled = await _service_io(self.service_io_threaded, self.service.is_job_cancelled, request.job_id)
+            current_item = await _get_job_item(self.service, self.service_io_threaded, request.job_item_id)
+            job_cancelled = await _is_job_cancelled(self.service, self.service_io_threaded, request.job_id)
             if job_cancelled:
                 _CANCELLED_JOB_IDS.add(request.job_id)
                 _CANCELLED_JOB_SKIP_COUNTS.setdefault(request.job_id, 0)
@@ -427,10 +446,10 @@ class ScanOnlyBatchCoordinator:
                 else None,
             )
             if not self.trust_items:
-                current_item = await _service_io(self.service_io_threaded, self.service.get_job_item_or_404, request.job_item_id)
-                job_cancelled = request.job_id in _CANCELLED_JOB_IDS or await _service_io(
+                current_item = await _get_job_item(self.service, self.service_io_threaded, request.job_item_id)
+                job_cancelled = request.job_id in _CANCELLED_JOB_IDS or await _is_job_cancelled(
+                    self.service,
                     self.service_io_threaded,
-                    self.service.is_job_cancelled,
                     request.job_id,
                 )
                 if job_cancelled:
@@ -815,10 +834,13 @@ async def _timed_chunks(chunks: AsyncIterable[bytes], timing: StreamTiming) -> A
             chunk = await iterator.__anext__()
         except StopAsyncIteration:
             timing.elapsed_ms += (time.perf_counter() - started) * 1000.0
+            timing.completed = True
             break
         timing.elapsed_ms += (time.perf_counter() - started) * 1000.0
         timing.bytes_read += len(chunk)
         timing.chunks += 1
+        if timing.digest is not None:
+            timing.digest.update(chunk)
         yield chunk
 
 
@@ -830,9 +852,12 @@ async def _timed_file_chunks(path: Path, timing: StreamTiming, *, chunk_size: in
             chunk = await asyncio.to_thread(source.read, chunk_size)
             timing.elapsed_ms += (time.perf_counter() - started) * 1000.0
             if not chunk:
+                timing.completed = True
                 break
             timing.bytes_read += len(chunk)
             timing.chunks += 1
+            if timing.digest is not None:
+                timing.digest.update(chunk)
             yield chunk
 
 
@@ -843,6 +868,7 @@ async def _scan_file_with_configured_transport(
     protected_entity: int | None,
     custom_metadata: str,
     password: str | None,
+    hash_content: bool = False,
 ) -> tuple[Any, StreamTiming | None]:
     file_path = getattr(read_result, "local_path", None)
     if settings.scanner.transport == "by_path":
@@ -866,7 +892,7 @@ async def _scan_file_with_configured_transport(
             )
         return response, None
     content_stream = getattr(read_result, "content_stream", None)
-    stream_timing = StreamTiming()
+    stream_timing = StreamTiming(digest=hashlib.sha256() if hash_content else None)
     if content_stream is not None:
         response = await client.scan_binary_stream(
             _timed_chunks(content_stream, stream_timing),
@@ -896,6 +922,7 @@ async def _scan_file_with_client_scope(
     protected_entity: int | None,
     custom_metadata: str,
     password: str | None,
+    hash_content: bool = False,
 ) -> tuple[Any, StreamTiming | None]:
     if _SCANNER_CLIENT_SCOPE == "per-task":
         client = new_dsxa_client()
@@ -906,6 +933,7 @@ async def _scan_file_with_client_scope(
                 protected_entity=protected_entity,
                 custom_metadata=custom_metadata,
                 password=password,
+                hash_content=hash_content,
             )
         finally:
             await client.aclose()
@@ -915,9 +943,126 @@ async def _scan_file_with_client_scope(
         protected_entity=protected_entity,
         custom_metadata=custom_metadata,
         password=password,
+        hash_content=hash_content,
     )
 
 
+def _extract_content_sha256(request: ScanItemRequested) -> str | None:
+    """Caller-supplied content hash. Unverified: good for a lookup, never a cache key to store under."""
+    scan_options = getattr(request, "scan_options", {}) or {}
+    read_hint = getattr(request, "read_hint", {}) or {}
+    content_source = getattr(request, "content_source", None)
+    source_details = getattr(content_source, "details", None) or {}
+    attribution = scan_options.get("attribution") or scan_options.get("attributionContext") or {}
+    for source in (read_hint, scan_options, source_details, attribution):
+        if not isinstance(source, dict):
+            continue
+        for key in _CONTENT_SHA256_KEYS:
+            content_sha256 = normalize_content_sha256(source.get(key))
+            if content_sha256 is not None:
+                return content_sha256
+    return None
+
+
+def _sha256_local_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as source:
+        while True:
+            chunk = source.read(settings.readers.chunk_size_bytes)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def _scan_hash_with_client_scope(
+    content_sha256: str,
+    *,
+    protected_entity: int | None,
+    custom_metadata: str,
+) -> Any:
+    if _SCANNER_CLIENT_SCOPE == "per-task":
+        client = new_dsxa_client()
+        try:
+            return await client.scan_hash(content_sha256, protected_entity=protected_entity, custom_metadata=custom_metadata)
+        finally:
+            await client.aclose()
+    return await get_dsxa_client().scan_hash(
+        content_sha256,
+        protected_entity=protected_entity,
+        custom_metadata=custom_metadata,
+    )
+
+
+async def _lookup_cached_verdict(
+    verdict_cache: VerdictCache,
+    content_sha256: str,
+    *,
+    protected_entity: int | None,
+    custom_metadata: str,
+    verified: bool,
+) -> tuple[ScanResult, str] | None:
+    """
+    Resolve a verdict without sending content: local cache first, then DSXA's by-hash lookup.
+
+    A by-hash verdict is cached only when `content_sha256` was computed by this worker.
+    """
+    entry = await verdict_cache.lookup(content_sha256, protected_entity=protected_entity)
+    if entry is not None:
+        return entry.result.model_copy(update={"x_custom_metadata": custom_metadata}), "hit"
+    if not settings.verdict_cache.scanner_hash_lookup:
+        return None
+    _AsyncDSXAClient, _ScanResponse, DSXAError, *_ = _import_dsxa_client()
+    try:
+        response = await _scan_hash_with_client_scope(
+            content_sha256,
+            protected_entity=protected_entity,
+            custom_metadata=custom_metadata,
+        )
+    except DSXAError as exc:
+        log_event(
+            ops_logging,
+            10,
+            "verdict_cache_scanner_hash_lookup_failed",
+            content_sha256=content_sha256,
+            error={"code": exc.__class__.__name__, "message": str(exc)},
+        )
+        return None
+    result = map_dsxa_scan_response(response)
+    if not is_cacheable_scan_result(result):
+        return None
+    if verified:
+        await verdict_cache.store(content_sha256, result, protected_entity=protected_entity)
+    return result, "scanner_hash_hit"
+
+
+def _record_verdict_cache_hit(
+    request: ScanItemRequested,
+    *,
+    verdict_cache: VerdictCache,
+    status: str,
+    content_sha256: str,
+    result: ScanResult,
+    lookup_elapsed_ms: float,
+    read_elapsed_ms: float | None = None,
+    reader_name: str | None = None,
+) -> None:
+    request.scan_options["_dsx_scanner_metadata"] = {
+        "source": "verdict_cache" if status == "hit" else "dsxa_hash",
+        "reader": reader_name,
+        "contentSourceMode": request.content_source.mode,
+        "transport": "verdict_cache" if status == "hit" else "by_hash",
+        "readerElapsedMs": round(read_elapsed_ms, 3) if read_elapsed_ms is not None else None,
+        "requestElapsedMs": round((read_elapsed_ms or 0.0) + lookup_elapsed_ms, 3),
+        "verdictCacheStatus": status,
+        "verdictCacheBackend": verdict_cache.backend,
+        "verdictCacheElapsedMs": round(lookup_elapsed_ms, 3),
+        "contentSha256": content_sha256,
+        "scannerVersion": verdict_cache.scanner_version,
+        "protectedEntity": result.protected_entity,
+    }
+
+
 async def execute_scan_via_dsxa(request: ScanItemRequested, reader: Reader) -> ScanResult:
     base_url = settings.scanner.base_url.rstrip("/")
     if not base_url:
@@ -934,6 +1079,31 @@ async def execute_scan_via_dsxa(request: ScanItemRequested, reader: Reader) -> S
                 "enforcement": "size_hint",
             },
         )
+    verdict_cache = _VERDICT_CACHE if not request.scan_options.get("password") else None
+    hinted_sha256 = _extract_content_sha256(request) if verdict_cache is not None else None
+    # Only a digest this worker computed over the content (or DSXA's file hash) is stored under
+    content_sha256: str | None = None
+    if verdict_cache is not None and hinted_sha256 is not None:
+        protected_entity = resolve_scan_protected_entity(request)
+        lookup_started = time.perf_counter()
+        cached = await _lookup_cached_verdict(
+            verdict_cache,
+            hinted_sha256,
+            protected_entity=protected_entity,
+            custom_metadata=build_scan_custom_metadata(request, reader_name="verdict_cache"),
+            verified=False,
+        )
+        if cached is not None:
+            result, status = cached
+            _record_verdict_cache_hit(
+                request,
+                verdict_cache=verdict_cache,
+                status=status,
+                content_sha256=hinted_sha256,
+                result=result,
+                lookup_elapsed_ms=(time.perf_counter() - lookup_started) * 1000.0,
+            )
+            return result
     read_result = None
     try:
         read_started = time.perf_counter()
@@ -956,6 +1126,35 @@ async def execute_scan_via_dsxa(request: ScanItemRequested, reader: Reader) -> S
             reader_details=read_result.details,
         )
         password = request.scan_options.get("password")
+        local_path = getattr(read_result, "local_path", None)
+        if (
+            verdict_cache is not None
+            and local_path is not None
+            and settings.verdict_cache.hash_local_artifacts
+        ):
+            lookup_started = time.perf_counter()
+            content_sha256 = await asyncio.to_thread(_sha256_local_file, local_path)
+            # The hint already missed; only look up again when the content hashes differently
+            cached = None if content_sha256 == hinted_sha256 else await _lookup_cached_verdict(
+                verdict_cache,
+                content_sha256,
+                protected_entity=protected_entity,
+                custom_metadata=custom_metadata,
+                verified=True,
+            )
+            if cached is not None:
+                result, status = cached
+                _record_verdict_cache_hit(
+                    request,
+                    verdict_cache=verdict_cache,
+                    status=status,
+                    content_sha256=content_sha256,
+                    result=result,
+                    lookup_elapsed_ms=(time.perf_counter() - lookup_started) * 1000.0,
+                    read_elapsed_ms=read_elapsed_ms,
+                    reader_name=read_result.details.get("reader"),
+                )
+                return result
         (
             _AsyncDSXAClient,
             _ScanResponse,
@@ -972,6 +1171,7 @@ async def execute_scan_via_dsxa(request: ScanItemRequested, reader: Reader) -> S
                 protected_entity=protected_entity,
                 custom_metadata=custom_metadata,
                 password=password,
+                hash_content=verdict_cache is not None and content_sha256 is None,
             )
         except AuthenticationError as exc:
             raise TerminalScanError("scanner_auth_failed", str(exc), details={"baseUrl": base_url}) from exc
@@ -1026,6 +1226,33 @@ async def execute_scan_via_dsxa(request: ScanItemRequested, reader: Reader) -> S
             "dsxaElapsedMs": getattr(response, "dsxconnect_dsxa_elapsed_ms", None) or round(dsxa_elapsed_ms, 3),
             "protectedEntity": result.protected_entity,
         }
+        if verdict_cache is not None:
+            if content_sha256 is None and stream_timing is not None and stream_timing.digest is not None and stream_timing.completed:
+                content_sha256 = stream_timing.digest.hexdigest()
+            if content_sha256 is None:
+                content_sha256 = normalize_content_sha256((result.file_info or {}).get("file_hash"))
+            if hinted_sha256 is not None and content_sha256 is not None and hinted_sha256 != content_sha256:
+                log_event(
+                    ops_logging,
+                    30,
+                    "verdict_cache_content_sha256_hint_mismatch",
+                    hinted_sha256=hinted_sha256,
+                    content_sha256=content_sha256,
+                )
+            stored = content_sha256 is not None and await verdict_cache.store(
+                content_sha256,
+                result,
+                protected_entity=protected_entity,
+            )
+            request.scan_options["_dsx_scanner_metadata"].update(
+                {
+                    "verdictCacheStatus": "miss",
+                    "verdictCacheBackend": verdict_cache.backend,
+                    "verdictCacheStored": stored,
+                    "contentSha256": content_sha256,
+                    "scannerVersion": verdict_cache.scanner_version,
+                }
+            )
         return result
     finally:
         if read_result is not None:
@@ -1069,8 +1296,8 @@ async def process_scan_message(
                 skipped_count=skipped_count,
             )
         return
-    current_item = await _service_io(service_io_threaded, service.get_job_item_or_404, request.job_item_id)
-    job_cancelled = await _service_io(service_io_threaded, service.is_job_cancelled, request.job_id)
+    current_item = await _get_job_item(service, service_io_threaded, request.job_item_id)
+    job_cancelled = await _is_job_cancelled(service, service_io_threaded, request.job_id)
     if job_cancelled:
         _CANCELLED_JOB_IDS.add(request.job_id)
         _CANCELLED_JOB_SKIP_COUNTS.setdefault(request.job_id, 0)
@@ -1148,8 +1375,8 @@ async def process_scan_message(
                 },
             )
             raise
-        current_item = await _service_io(service_io_threaded, service.get_job_item_or_404, request.job_item_id)
-        job_cancelled = request.job_id in _CANCELLED_JOB_IDS or await _service_io(service_io_threaded, service.is_job_cancelled, request.job_id)
+        current_item = await _get_job_item(service, service_io_threaded, request.job_item_id)
+        job_cancelled = request.job_id in _CANCELLED_JOB_IDS or await _is_job_cancelled(service, service_io_threaded, request.job_id)
         if job_cancelled:
             _CANCELLED_JOB_IDS.add(request.job_id)
         if current_item.state == "cancelled" or job_cancelled:
@@ -1325,9 +1552,23 @@ def parse_args() -> argparse.Namespace:
 
 async def main() -> None:
     args = parse_args()
-    global _SCANNER_CLIENT_SCOPE
+    global _SCANNER_CLIENT_SCOPE, _VERDICT_CACHE
     _SCANNER_CLIENT_SCOPE = args.scanner_client_scope
     service, summary = build_job_service()
+    await service.open_async_repo()
+    _VERDICT_CACHE = build_verdict_cache()
+    purge_after = settings.verdict_cache.purge_other_versions_after_seconds
+    if _VERDICT_CACHE is not None and purge_after > 0:
+        invalidated = await _VERDICT_CACHE.purge_other_versions(older_than_seconds=purge_after)
+        log_event(
+            ops_logging,
+            20,
+            "verdict_cache_other_versions_purged",
+            backend=_VERDICT_CACHE.backend,
+            scanner_version=_VERDICT_CACHE.scanner_version,
+            older_than_seconds=purge_after,
+            invalidated=invalidated,
+        )
     executor = resolve_scan_executor()
     executor_name = getattr(executor, "__name__", executor.__class__.__name__)
     completion_buffer = (
@@ -1371,6 +1612,8 @@ async def main() -> None:
                 "scan_batch_concurrency": args.scan_batch_concurrency or args.prefetch_count,
                 "scan_batch_ack_mode": args.scan_batch_ack_mode,
                 "scan_batch_trust_items": args.scan_batch_trust_items,
+                "verdict_cache_backend": _VERDICT_CACHE.backend if _VERDICT_CACHE is not None else "disabled",
+                "async_job_repository": service.async_repo is not None,
             }
         ),
         flush=True,
@@ -1425,6 +1668,14 @@ async def main() -> None:
         if batch_coordinator is not None:
             await batch_coordinator.flush_all()
         await close_dsxa_client()
+        if _VERDICT_CACHE is not None:
+            log_event(ops_logging, 20, "verdict_cache_stats", backend=_VERDICT_CACHE.backend, **_VERDICT_CACHE.stats.as_dict())
+            await _VERDICT_CACHE.aclose()
+            _VERDICT_CACHE = None
+        pool_status = service.repository_pool_status()
+        if pool_status is not None:
+            log_event(ops_logging, 20, "job_repository_pool_stats", **pool_status)
+        await service.close_async_repo()
 
 
 def run() -> None:
@@ -0,0 +1,21 @@
+CREATE TABLE IF NOT EXISTS cp_scan_verdict_cache (
+    content_sha256 TEXT NOT NULL,
+    scanner_version TEXT NOT NULL,
+    protected_entity_key TEXT NOT NULL DEFAULT '',
+    result_json JSONB NOT NULL,
+    cached_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NULL,
+    last_hit_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (content_sha256, scanner_version, protected_entity_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cp_scan_verdict_cache_last_hit_at
+    ON cp_scan_verdict_cache (last_hit_at);
+
+CREATE INDEX IF NOT EXISTS idx_cp_scan_verdict_cache_expires_at
+    ON cp_scan_verdict_cache (expires_at)
+    WHERE expires_at IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_cp_scan_verdict_cache_scanner_version
+    ON cp_scan_verdict_cache (scanner_version);
@@ -0,0 +1,43 @@
+CREATE OR REPLACE FUNCTION cp_notify_control_plane_change() RETURNS trigger AS $$
+DECLARE
+    changed_row RECORD;
+    cache_kind TEXT;
+    cache_key TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed_row := OLD;
+    ELSE
+        changed_row := NEW;
+    END IF;
+    IF TG_TABLE_NAME = 'cp_integrations' THEN
+        cache_kind := 'integration';
+        cache_key := changed_row.integration_id;
+    ELSIF TG_TABLE_NAME = 'cp_scopes' THEN
+        cache_kind := 'scope';
+        cache_key := changed_row.scope_id;
+    ELSE
+        cache_kind := 'connector_instances';
+        cache_key := changed_row.integration_id;
+    END IF;
+    PERFORM pg_notify(
+        'dsx_connect_ng_control_plane',
+        json_build_object('kind', cache_kind, 'key', cache_key)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_cp_integrations_notify ON cp_integrations;
+CREATE TRIGGER trg_cp_integrations_notify
+    AFTER INSERT OR UPDATE OR DELETE ON cp_integrations
+    FOR EACH ROW EXECUTE FUNCTION cp_notify_control_plane_change();
+
+DROP TRIGGER IF EXISTS trg_cp_scopes_notify ON cp_scopes;
+CREATE TRIGGER trg_cp_scopes_notify
+    AFTER INSERT OR UPDATE OR DELETE ON cp_scopes
+    FOR EACH ROW EXECUTE FUNCTION cp_notify_control_plane_change();
+
+DROP TRIGGER IF EXISTS trg_cp_connector_instances_notify ON cp_connector_instances;
+CREATE TRIGGER trg_cp_connector_instances_notify
+    AFTER INSERT OR UPDATE OR DELETE ON cp_connector_instances
+    FOR EACH ROW EXECUTE FUNCTION cp_notify_control_plane_change();
@@ -0,0 +1,195 @@
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from dsx_connect_ng.app import create_app
+from dsx_connect_ng.config import settings
+from dsx_connect_ng.control_plane.models import (
+    ConnectorInstanceRegister,
+    IntegrationCreate,
+    IntegrationUpdate,
+    ProtectedScopeCreate,
+    ProtectedScopeUpdate,
+)
+from dsx_connect_ng.control_plane.postgres_notify import apply_change_notification
+from dsx_connect_ng.control_plane.read_cache import ControlPlaneReadCache
+from dsx_connect_ng.control_plane.repository import InMemoryControlPlaneRepository
+from dsx_connect_ng.control_plane.service import ControlPlaneService
+from dsx_connect_ng.jobs.contracts import ContentSource
+from dsx_connect_ng.readers.proxy import resolve_connector_proxy_runtime_config
+
+
+class CountingControlPlaneRepository(InMemoryControlPlaneRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_integration_calls = 0
+        self.list_connector_instances_calls = 0
+
+    def get_integration(self, integration_id):
+        self.get_integration_calls += 1
+        return super().get_integration(integration_id)
+
+    def list_connector_instances(self, integration_id=None):
+        self.list_connector_instances_calls += 1
+        return super().list_connector_instances(integration_id=integration_id)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_cached_service(*, clock=None) -> tuple[ControlPlaneService, CountingControlPlaneRepository]:
+    repo = CountingControlPlaneRepository()
+    cache = ControlPlaneReadCache(ttl_seconds=30, clock=clock or FakeClock())
+    service = ControlPlaneService(repo, read_cache=cache)
+    service.create_integration(
+        IntegrationCreate(
+            integration_id="sharepoint-prod",
+            platform="sharepoint",
+            platform_key="tenant-1",
+            display_name="SharePoint Prod",
+            config={"reader": {"default_strategy": "proxy", "proxy": {"endpoint_url": "http://connector.local/read_file"}}},
+        )
+    )
+    return service, repo
+
+
+def scan_request(integration_id: str = "sharepoint-prod") -> SimpleNamespace:
+    return SimpleNamespace(
+        job_id="job-1",
+        job_item_id="item-1",
+        integration_id=integration_id,
+        scope_id=None,
+        object_identity="drive:1/item:2",
+        content_source=ContentSource(mode="original"),
+        read_hint={},
+        scan_options={},
+    )
+
+
+def test_read_cache_serves_repeated_integration_reads_until_ttl_expires() -> None:
+    clock = FakeClock()
+    service, repo = build_cached_service(clock=clock)
+    repo.get_integration_calls = 0
+
+    first = service.get_integration_for_read("sharepoint-prod")
+    second = service.get_integration_for_read("sharepoint-prod")
+    clock.now += 31
+    service.get_integration_for_read("sharepoint-prod")
+
+    assert first is second
+    assert repo.get_integration_calls == 2
+    stats = service.read_cache_stats()
+    assert stats["enabled"] is True
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+
+
+def test_read_cache_is_invalidated_by_local_integration_update() -> None:
+    service, _repo = build_cached_service()
+    before = service.integration_runtime_config(service.get_integration_for_read("sharepoint-prod"))
+
+    service.update_integration(
+        "sharepoint-prod",
+        IntegrationUpdate(
+            config={"reader": {"default_strategy": "proxy", "proxy": {"endpoint_url": "http://connector-2.local/read_file"}}}
+        ),
+    )
+    after = service.integration_runtime_config(service.get_integration_for_read("sharepoint-prod"))
+
+    assert before.reader.proxy.endpoint_url == "http://connector.local/read_file"
+    assert after.reader.proxy.endpoint_url == "http://connector-2.local/read_file"
+
+
+def test_runtime_configs_are_memoized_per_record_revision() -> None:
+    service, _repo = build_cached_service()
+    integration = service.get_integration_for_read("sharepoint-prod")
+    scope = service.create_scope(
+        ProtectedScopeCreate(
+            integration_id="sharepoint-prod",
+            display_name="Finance",
+            scope_type="path",
+            mode="monitor",
+            resource_selector="/finance",
+            post_scan_policy={"policy_id": "scope-v1"},
+        )
+    )
+
+    assert service.integration_runtime_config(integration) is service.integration_runtime_config(integration)
+    first_policy = service.policy_runtime_config(integration, service.get_scope_for_read(scope.scope_id))
+    assert service.policy_runtime_config(integration, service.get_scope_for_read(scope.scope_id)) is first_policy
+    assert first_policy.policy_id == "scope-v1"
+
+    service.update_scope(scope.scope_id, ProtectedScopeUpdate(post_scan_policy={"policy_id": "scope-v2"}))
+    updated_policy = service.policy_runtime_config(integration, service.get_scope_for_read(scope.scope_id))
+
+    assert updated_policy.policy_id == "scope-v2"
+
+
+def test_load_racing_with_invalidation_is_not_cached() -> None:
+    cache = ControlPlaneReadCache(ttl_seconds=30)
+
+    def stale_loader() -> str:
+        cache.invalidate("integration", "sharepoint-prod")
+        return "stale"
+
+    assert cache.get_or_load("integration", "sharepoint-prod", stale_loader) == "stale"
+    assert cache.get_or_load("integration", "sharepoint-prod", lambda: "fresh") == "fresh"
+
+
+def test_change_notification_invalidates_named_entry() -> None:
+    cache = ControlPlaneReadCache(ttl_seconds=30)
+    cache.get_or_load("connector_instances", "sharepoint-prod", lambda: ["old"])
+    cache.get_or_load("integration", "sharepoint-prod", lambda: "integration")
+
+    apply_change_notification(cache, '{"kind": "connector_instances", "key": "sharepoint-prod"}')
+
+    assert cache.get_or_load("connector_instances", "sharepoint-prod", lambda: ["new"]) == ["new"]
+    assert cache.get_or_load("integration", "sharepoint-prod", lambda: "reloaded") == "integration"
+
+    apply_change_notification(cache, "not-json")
+
+    assert cache.get_or_load("integration", "sharepoint-prod", lambda: "reloaded") == "reloaded"
+
+
+def test_proxy_runtime_config_resolution_hits_cache_on_repeat_messages() -> None:
+    service, repo = build_cached_service()
+    service.update_integration("sharepoint-prod", IntegrationUpdate(config={}))
+    service.register_connector_instance(
+        ConnectorInstanceRegister(
+            connector_instance_id="sharepoint-pod-1",
+            integration_id="sharepoint-prod",
+            platform="sharepoint",
+            platform_key="tenant-1",
+            connector_name="sharepoint-connector",
+            base_url="http://0.0.0.0:8650",
+            capabilities={"read": True},
+            health="healthy",
+        )
+    )
+    repo.get_integration_calls = 0
+    repo.list_connector_instances_calls = 0
+
+    for _ in range(5):
+        config = resolve_connector_proxy_runtime_config(scan_request(), control_plane=service)
+
+    assert config.endpoint_url == "http://127.0.0.1:8650/read_file"
+    assert repo.get_integration_calls == 1
+    assert repo.list_connector_instances_calls == 0
+
+
+def test_execution_status_reports_control_plane_read_cache(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "control_plane_backend", "memory")
+    client = TestClient(create_app())
+
+    response = client.get(f"{settings.api_prefix}/execution/status")
+
+    assert response.status_code == 200
+    cache_status = response.json()["control_plane_read_cache"]
+    assert cache_status["enabled"] is True
+    assert {"hits", "misses", "hit_ratio", "invalidations"} <= set(cache_status)
@@ -1,8 +1,13 @@
 import asyncio
+import json
+import sys
+import types
 
+from dsx_connect_ng.config import AppSettings
 from dsx_connect_ng.jobs.bus import InMemoryJobBus
 from dsx_connect_ng.jobs.contracts import ScanItemRequested
 from dsx_connect_ng.jobs.models import DomainJobEnvelope
+from dsx_connect_ng.jobs.rabbitmq_bus import RabbitMQJobBus
 
 
 def test_in_memory_job_bus_publishes_and_snapshots() -> None:
@@ -42,3 +47,106 @@ def test_in_memory_job_bus_publishes_contract_message() -> None:
     assert len(snapshot) == 1
     assert snapshot[0].message_type == "scan_item_requested"
     assert snapshot[0].job_item_id == "item-2"
+
+
+class FakeExchange:
+    def __init__(self, broker: "FakeBroker", channel_index: int) -> None:
+        self.broker = broker
+        self.channel_index = channel_index
+
+    async def publish(self, message, routing_key: str) -> None:
+        self.broker.in_flight += 1
+        self.broker.max_in_flight = max(self.broker.max_in_flight, self.broker.in_flight)
+        try:
+            await asyncio.sleep(0)
+            body = json.loads(message.body)
+            if body.get("job_item_id") == "item-nack":
+                raise RuntimeError("nack")
+            self.broker.published.append((self.channel_index, routing_key, body["job_item_id"]))
+        finally:
+            self.broker.in_flight -= 1
+
+
+class FakeChannel:
+    def __init__(self, broker: "FakeBroker", index: int) -> None:
+        self.broker = broker
+        self.index = index
+        self.is_closed = False
+
+    async def declare_exchange(self, name, exchange_type, durable: bool):
+        return FakeExchange(self.broker, self.index)
+
+
+class FakeBroker:
+    def __init__(self) -> None:
+        self.published: list[tuple[int, str, str]] = []
+        self.channels: list[FakeChannel] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms: bool):
+        channel = FakeChannel(self, len(self.channels))
+        self.channels.append(channel)
+        return channel
+
+
+def install_fake_aio_pika(monkeypatch) -> FakeBroker:
+    broker = FakeBroker()
+
+    async def connect_robust(url):
+        return broker
+
+    fake = types.SimpleNamespace(
+        connect_robust=connect_robust,
+        Message=lambda body, content_type, delivery_mode: types.SimpleNamespace(body=body, content_type=content_type),
+        DeliveryMode=types.SimpleNamespace(PERSISTENT=2),
+        ExchangeType=types.SimpleNamespace(TOPIC="topic"),
+    )
+    monkeypatch.setitem(sys.modules, "aio_pika", fake)
+    return broker
+
+
+def scan_message(job_item_id: str):
+    return ScanItemRequested(job_id="job-1", job_item_id=job_item_id, object_identity=f"/finance/{job_item_id}.pdf").as_envelope()
+
+
+def test_rabbitmq_publish_many_bounds_confirm_window_and_reports_per_message_errors(monkeypatch) -> None:
+    broker = install_fake_aio_pika(monkeypatch)
+    app_settings = AppSettings()
+    app_settings.rabbitmq.publish_channel_pool_size = 3
+    bus = RabbitMQJobBus(app_settings)
+    messages = [scan_message(f"item-{index}") for index in range(8)] + [scan_message("item-nack")]
+
+    outcomes = asyncio.run(bus.publish_many(messages, window=4))
+
+    assert [outcome is None for outcome in outcomes] == [True] * 8 + [False]
+    assert len(broker.channels) == 3
+    assert 1 < broker.max_in_flight <= 4
+    assert {routing_key for _channel, routing_key, _item in broker.published} == {"scan.requested"}
+    status = asyncio.run(bus.status())
+    assert status["published_count"] == 8
+    assert status["publish_failures"] == 1
+
+
+def test_rabbitmq_publish_many_keeps_one_job_item_on_one_channel(monkeypatch) -> None:
+    broker = install_fake_aio_pika(monkeypatch)
+    app_settings = AppSettings()
+    app_settings.rabbitmq.publish_channel_pool_size = 4
+    bus = RabbitMQJobBus(app_settings)
+
+    asyncio.run(bus.publish_many([scan_message("item-a"), scan_message("item-b"), scan_message("item-a")]))
+
+    channels_for_a = {channel for channel, _routing_key, item in broker.published if item == "item-a"}
+    assert len(channels_for_a) == 1
+    assert [item for _channel, _routing_key, item in broker.published if item == "item-a"] == ["item-a", "item-a"]
+
+
+def test_job_bus_publish_many_default_preserves_order() -> None:
+    bus = InMemoryJobBus()
+    messages = [scan_message(f"item-{index}") for index in range(3)]
+
+    outcomes = asyncio.run(bus.publish_many(messages, window=2))
+
+    assert outcomes == [None, None, None]
+    assert [message.job_item_id for message in bus.snapshot()] == ["item-0", "item-1", "item-2"]
@@ -0,0 +1,301 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from dsx_connect_ng.config import settings
+from dsx_connect_ng.control_plane.bootstrap import ControlPlaneBootstrapResult
+from dsx_connect_ng.control_plane.repository import InMemoryControlPlaneRepository
+from dsx_connect_ng.control_plane.service import ControlPlaneService
+from dsx_connect_ng.jobs import bootstrap, postgres_pool
+from dsx_connect_ng.jobs.bus import InMemoryJobBus
+from dsx_connect_ng.jobs.models import StageRecord
+from dsx_connect_ng.jobs.postgres_pool import AsyncPostgresJobRepository, PooledPostgresJobRepository
+from dsx_connect_ng.jobs.postgres_repo import CLAIM_OUTBOX_RECORDS_SQL, GET_JOB_ITEM_SQL, GET_JOB_SQL, SUMMARIZE_JOB_ITEMS_SQL
+from dsx_connect_ng.jobs.repository import InMemoryJobRepository
+from dsx_connect_ng.jobs.service import JobService
+
+
+def job_item_row(**overrides) -> dict:
+    now = datetime.now(timezone.utc)
+    row = {
+        "job_item_id": "item-1",
+        "job_id": "job-1",
+        "item_index": 0,
+        "object_identity": "/finance/report.pdf",
+        "state": "queued",
+        "payload": {},
+        "content_source": {"mode": "original"},
+        "delivery_requirements": {},
+        "error": None,
+        "scan_stage": {"state": "pending"},
+        "policy_stage": {"state": "pending"},
+        "remediation_stage": {"state": "pending"},
+        "delivery_stage": {"state": "pending"},
+        "dianna_stage": {"state": "pending"},
+        "created_at": now,
+        "updated_at": now,
+        "completed_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection") -> None:
+        self.conn = conn
+        self._rows: list[dict] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, query, params=None, *, prepare=None) -> None:
+        self.conn.executed.append((query, params, prepare))
+        self._rows = list(self.conn.results.pop(0)) if self.conn.results else []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class FakeConnection:
+    def __init__(self, results: list[list[dict]] | None = None) -> None:
+        self.results = list(results or [])
+        self.executed: list[tuple] = []
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+class FakePool:
+    def __init__(self, conn: FakeConnection) -> None:
+        self.conn = conn
+        self.checked_out = 0
+        self.returned = 0
+
+    def getconn(self) -> FakeConnection:
+        self.checked_out += 1
+        return self.conn
+
+    def putconn(self, conn: FakeConnection) -> None:
+        self.returned += 1
+
+    def get_stats(self) -> dict:
+        return {"pool_size": 1, "requests_waiting": 0}
+
+
+class FakeAsyncCursor(FakeCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, query, params=None, *, prepare=None) -> None:
+        FakeCursor.execute(self, query, params, prepare=prepare)
+
+    async def fetchone(self):
+        return FakeCursor.fetchone(self)
+
+    async def fetchall(self):
+        return FakeCursor.fetchall(self)
+
+
+class FakeAsyncConnection(FakeConnection):
+    def cursor(self) -> FakeAsyncCursor:
+        return FakeAsyncCursor(self)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+class FakeAsyncPool(FakePool):
+    async def getconn(self) -> FakeAsyncConnection:
+        return FakePool.getconn(self)
+
+    async def putconn(self, conn: FakeAsyncConnection) -> None:
+        FakePool.putconn(self, conn)
+
+
+def test_pooled_repository_borrows_and_returns_connections_with_prepared_hot_queries() -> None:
+    conn = FakeConnection(results=[[job_item_row()], [{"state": "queued", "count": 3}, {"state": "completed", "count": 2}]])
+    pool = FakePool(conn)
+    repo = PooledPostgresJobRepository("postgresql://unused", min_size=1, max_size=4, pool=pool)
+
+    item = repo.get_job_item("item-1")
+    summary = repo.summarize_job_items("job-1")
+
+    assert item is not None and item.job_item_id == "item-1"
+    assert (summary.total, summary.queued, summary.completed) == (5, 3, 2)
+    assert [(query, prepare) for query, _params, prepare in conn.executed] == [
+        (GET_JOB_ITEM_SQL, True),
+        (SUMMARIZE_JOB_ITEMS_SQL, True),
+    ]
+    assert pool.checked_out == pool.returned == 2
+    assert conn.commits == 2
+    status = repo.pool_status()
+    assert status["acquisitions"] == 2
+    assert status["max_size"] == 4
+    assert status["pool"] == {"pool_size": 1, "requests_waiting": 0}
+
+
+def test_pooled_repository_rolls_back_and_returns_connection_on_error() -> None:
+    conn = FakeConnection()
+    pool = FakePool(conn)
+    repo = PooledPostgresJobRepository("postgresql://unused", pool=pool, prepare_hot_queries=False)
+
+    with pytest.raises(ValueError):
+        repo.update_job_item_stage(
+            "item-1",
+            stage_name="unknown_stage",
+            stage_record=StageRecord(state="running"),
+            state="scanning",
+        )
+    with pytest.raises(RuntimeError):
+        with repo._connect():
+            raise RuntimeError("boom")
+
+    assert conn.rollbacks == 1
+    assert pool.checked_out == pool.returned == 1
+    assert repo.pool_status()["prepare_hot_queries"] is False
+
+
+def test_pooled_repository_skips_stale_running_update() -> None:
+    conn = FakeConnection(results=[[job_item_row(scan_stage={"state": "completed"})]])
+    repo = PooledPostgresJobRepository("postgresql://unused", pool=FakePool(conn))
+
+    updated = repo.update_job_item_stage(
+        "item-1",
+        stage_name="scan_stage",
+        stage_record=StageRecord(state="running"),
+        state="scanning",
+    )
+
+    assert updated is not None
+    assert updated.scan_stage.state == "completed"
+    assert len(conn.executed) == 1
+
+
+def outbox_row(outbox_id: str, **overrides) -> dict:
+    now = datetime.now(timezone.utc)
+    row = {
+        "outbox_id": outbox_id,
+        "job_id": "job-1",
+        "topic": "scan.requested",
+        "payload": {},
+        "publish_state": "publishing",
+        "publish_attempts": 0,
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+        "published_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_pooled_repository_claims_single_and_many_outbox_records() -> None:
+    conn = FakeConnection(results=[[outbox_row("o-1")], [], [outbox_row("o-3"), outbox_row("o-2")]])
+    pool = FakePool(conn)
+    repo = PooledPostgresJobRepository("postgresql://unused", pool=pool)
+
+    claimed = repo.claim_outbox_record("o-1")
+    already_claimed = repo.claim_outbox_record("o-1")
+    claimed_many = repo.claim_outbox_records(["o-2", "o-3"])
+
+    assert claimed is not None and claimed.outbox_id == "o-1"
+    assert already_claimed is None
+    # Rows come back in the order the ids were requested, not the order Postgres returned them
+    assert [record.outbox_id for record in claimed_many] == ["o-2", "o-3"]
+    assert repo.claim_outbox_records([]) == []
+    single_query, single_params, _ = conn.executed[0]
+    assert "WHERE outbox_id = %s" in single_query
+    assert single_params == ("o-1",)
+    assert conn.executed[2] == (CLAIM_OUTBOX_RECORDS_SQL, (["o-2", "o-3"],), True)
+    assert pool.checked_out == pool.returned == 3
+
+
+def test_job_service_async_hot_path_reads_use_async_repo() -> None:
+    now = datetime.now(timezone.utc)
+    conn = FakeAsyncConnection(
+        results=[
+            [job_item_row(state="cancelled")],
+            [
+                {
+                    "job_id": "job-1",
+                    "job_type": "batch.scan.requested",
+                    "state": "cancelled",
+                    "integration_id": None,
+                    "scope_id": None,
+                    "object_identity": None,
+                    "idempotency_key": None,
+                    "payload": {},
+                    "error": None,
+                    "created_at": now,
+                    "updated_at": now,
+                    "completed_at": None,
+                }
+            ],
+        ]
+    )
+    async_repo = AsyncPostgresJobRepository("postgresql://unused", pool=FakeAsyncPool(conn))
+    service = JobService(repo=InMemoryJobRepository(), bus=InMemoryJobBus(), async_repo=async_repo)
+
+    item = asyncio.run(service.get_job_item_or_404_async("item-1"))
+    cancelled = asyncio.run(service.is_job_cancelled_async("job-1"))
+
+    assert item.state == "cancelled"
+    assert cancelled is True
+    assert [query for query, _params, _prepare in conn.executed] == [GET_JOB_ITEM_SQL, GET_JOB_SQL]
+    assert service.repository_pool_status()["async"]["acquisitions"] == 2
+    assert service.repository_pool_status()["sync"] is None
+
+
+def test_bootstrap_uses_pooled_repositories_when_enabled(monkeypatch) -> None:
+    built: list[tuple[str, dict]] = []
+
+    class FakePooledRepo(InMemoryJobRepository):
+        def __init__(self, db_url, **kwargs) -> None:
+            super().__init__()
+            built.append(("sync", kwargs))
+
+    class FakeAsyncRepo:
+        def __init__(self, db_url, **kwargs) -> None:
+            built.append(("async", kwargs))
+
+    monkeypatch.setattr(postgres_pool, "PooledPostgresJobRepository", FakePooledRepo)
+    monkeypatch.setattr(postgres_pool, "AsyncPostgresJobRepository", FakeAsyncRepo)
+    monkeypatch.setattr(settings.postgres, "pool_enabled", True)
+    monkeypatch.setattr(settings.postgres, "async_pool_enabled", True)
+    monkeypatch.setattr(settings.postgres, "pool_max_size", 6)
+
+    result = bootstrap.bootstrap_job_service(
+        ControlPlaneBootstrapResult(
+            service=ControlPlaneService(repo=InMemoryControlPlaneRepository()),
+            backend="postgres",
+            detail="test_postgres",
+        ),
+        bootstrap.JobBusBootstrapResult(bus=InMemoryJobBus(), backend="memory"),
+    )
+
+    assert isinstance(result.service.repo, FakePooledRepo)
+    assert isinstance(result.service.async_repo, FakeAsyncRepo)
+    assert [kind for kind, _kwargs in built] == ["sync", "async"]
+    assert all(kwargs["max_size"] == 6 for _kind, kwargs in built)
@@ -225,6 +225,105 @@ def test_flush_outbox_reports_failed_retry() -> None:
     assert flushed.records[0].publish_state == "pending"
 
 
+class ConcurrencyTrackingJobBus(JobBus):
+    def __init__(self, *, fail_job_ids: set[str] | None = None) -> None:
+        self.fail_job_ids = fail_job_ids or set()
+        self.published: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, job) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if job.job_id in self.fail_job_ids:
+                raise RuntimeError("broker nack")
+            self.published.append(job)
+        finally:
+            self.in_flight -= 1
+
+    async def status(self) -> dict:
+        return {"backend": "tracking"}
+
+
+def test_pipelined_flush_publishes_mixed_topics_concurrently_with_batched_marks() -> None:
+    repo = CountingJobRepository()
+    service = JobService(repo=repo, bus=FailingJobBus())
+    job_types = ["scan.requested", "policy.requested", "remediation.requested"]
+    created = [
+        asyncio.run(service.submit_job(JobSubmitRequest(job_type=job_type, payload={"selector": f"/finance/{index}.pdf"})))
+        for index, job_type in enumerate(job_types * 2)
+    ]
+    repo.bulk_outbox_claims = 0
+    repo.bulk_outbox_published = 0
+    bus = ConcurrencyTrackingJobBus()
+    service.bus = bus
+
+    flushed = asyncio.run(service.flush_outbox(limit=10, publish_mode="pipelined", publish_concurrency=4))
+
+    assert flushed.publish_mode == "pipelined"
+    assert flushed.published == 6
+    assert flushed.failed == 0
+    assert [record.publish_state for record in flushed.records] == ["published"] * 6
+    assert len(bus.published) == 6
+    assert 1 < bus.max_in_flight <= 4
+    assert repo.bulk_outbox_claims == len(job_types)
+    assert repo.bulk_outbox_published == len(job_types)
+    assert all(repo.get_job(job.job_id).state == "queued" for job in created)
+
+
+def test_pipelined_flush_holds_later_records_behind_failed_publish_in_same_lane() -> None:
+    repo = InMemoryJobRepository()
+    job = repo.create_job(JobCreate(job_type="remediation.requested", state="accepted"))
+    other = repo.create_job(JobCreate(job_type="remediation.requested", state="accepted"))
+    first = repo.create_outbox_record(job=job, topic=job.job_type, payload=job.as_envelope(state_override="queued").model_dump(mode="json"))
+    second = repo.create_outbox_record(job=job, topic=job.job_type, payload=job.as_envelope(state_override="queued").model_dump(mode="json"))
+    repo.create_outbox_record(job=other, topic=other.job_type, payload=other.as_envelope(state_override="queued").model_dump(mode="json"))
+    bus = ConcurrencyTrackingJobBus(fail_job_ids={job.job_id})
+    service = JobService(repo=repo, bus=bus)
+
+    flushed = asyncio.run(service.flush_outbox(limit=10, publish_mode="pipelined"))
+
+    assert flushed.published == 1
+    assert flushed.failed == 2
+    assert [envelope.job_id for envelope in bus.published] == [other.job_id]
+    assert repo.get_outbox_record(first.outbox_id).last_error["code"] == "job_publish_failed"
+    assert repo.get_outbox_record(second.outbox_id).last_error["code"] == "job_publish_blocked"
+    assert repo.get_outbox_record(second.outbox_id).publish_state == "pending"
+    assert repo.get_job(job.job_id).state == "publish_pending"
+
+
+class PublishManyCountingJobBus(InMemoryJobBus):
+    def __init__(self) -> None:
+        super().__init__()
+        self.publish_many_calls = 0
+
+    async def publish_many(self, jobs, *, window=None):
+        self.publish_many_calls += 1
+        return await super().publish_many(jobs, window=window)
+
+
+def test_inline_batch_submit_publishes_items_in_one_confirm_window() -> None:
+    repo = InMemoryJobRepository()
+    bus = PublishManyCountingJobBus()
+    service = JobService(repo=repo, bus=bus)
+
+    created = asyncio.run(
+        service.submit_batch_job(
+            BatchJobSubmitRequest(
+                payload={"publishMode": "immediate"},
+                items=[{"object_identity": f"/finance/{index}.pdf"} for index in range(3)],
+            )
+        )
+    )
+
+    assert bus.publish_many_calls == 1
+    assert [message.object_identity for message in bus.snapshot()] == [f"/finance/{index}.pdf" for index in range(3)]
+    assert created.job.state == "queued"
+    assert created.item_summary.queued == 3
+
+
 def test_publish_outbox_record_claim_prevents_duplicate_publish() -> None:
     repo = InMemoryJobRepository()
     bus = InMemoryJobBus()
@@ -863,6 +962,42 @@ def test_job_progress_reports_counts_throughput_and_latency() -> None:
     assert any(hint.code == "scanner_api_latency_dominates" for hint in snapshot.bottleneck_hints)
 
 
+def test_job_progress_reports_verdict_cache_hit_rate() -> None:
+    repo = InMemoryJobRepository()
+    bus = InMemoryJobBus()
+    service = JobService(repo=repo, bus=bus)
+    created = asyncio.run(
+        service.submit_batch_job(
+            BatchJobSubmitRequest(
+                items=[
+                    {"object_identity": "/mail/a.pdf"},
+                    {"object_identity": "/mail/b.pdf"},
+                    {"object_identity": "/mail/c.pdf"},
+                    {"object_identity": "/mail/d.pdf"},
+                ],
+            )
+        )
+    )
+    statuses = ["hit", "scanner_hash_hit", "miss", "hit"]
+    for item, cache_status in zip(service.list_job_items(job_id=created.job.job_id), statuses):
+        service.update_scan_stage(
+            item.job_item_id,
+            StageUpdateRequest(
+                state="completed",
+                result=ScanResult(verdict="Benign", scanGuid=f"scan-{item.item_index}").model_dump(mode="json"),
+                metadata={"verdictCacheStatus": cache_status},
+            ),
+        )
+
+    snapshot = service.get_job_progress(created.job.job_id)
+
+    assert snapshot.verdict_cache.lookups == 4
+    assert snapshot.verdict_cache.hits == 2
+    assert snapshot.verdict_cache.scanner_hash_hits == 1
+    assert snapshot.verdict_cache.misses == 1
+    assert snapshot.verdict_cache.hit_rate == 0.75
+
+
 def test_job_progress_reports_runtime_scan_leases_without_durable_scanning_state() -> None:
     repo = InMemoryJobRepository()
     bus = InMemoryJobBus()
@@ -467,6 +467,108 @@ def test_http_connector_proxy_stream_yields_binary_without_local_artifact(monkey
     assert json.loads(seen["body"])["location"] == "/finance/a.txt"
 
 
+def _ranged_file_app(path: Path, seen_ranges: list[str | None], *, honour_range: bool = True):
+    from starlette.applications import Starlette
+    from starlette.responses import FileResponse, StreamingResponse
+    from starlette.routing import Route
+
+    async def read_file(request):
+        seen_ranges.append(request.headers.get("range"))
+        if honour_range:
+            return FileResponse(path, media_type="application/octet-stream")
+        return StreamingResponse(iter([path.read_bytes()]), media_type="application/octet-stream")
+
+    return Starlette(routes=[Route("/filesystem/read_file", read_file, methods=["POST"])])
+
+
+def _proxy_stream_request() -> tuple[ConnectorProxyReadRequest, ConnectorProxyRuntimeConfig]:
+    request = ConnectorProxyReadRequest(
+        job_id="job-1",
+        job_item_id="item-1",
+        integration_id="filesystem-local",
+        object_identity="/finance/big.bin",
+        content_source=ContentSource(mode="original", locator="/finance/big.bin"),
+    )
+    config = ConnectorProxyRuntimeConfig(endpoint_url="http://connector/filesystem/read_file", timeout_seconds=5.0)
+    return request, config
+
+
+def test_http_connector_proxy_stream_fetches_ranges_in_parallel_and_in_order(monkeypatch, tmp_path) -> None:
+    import httpx
+
+    data = bytes(range(256)) * 41  # 10496 bytes: 10 full parts and a short one
+    source = tmp_path / "big.bin"
+    source.write_bytes(data)
+    seen_ranges: list[str | None] = []
+    transport = httpx.ASGITransport(app=_ranged_file_app(source, seen_ranges))
+    monkeypatch.setattr(proxy_module, "_get_async_proxy_client", lambda config: httpx.AsyncClient(transport=transport))
+    request, config = _proxy_stream_request()
+
+    async def collect() -> bytes:
+        result = await proxy_module.http_connector_proxy_stream(
+            request, config, chunk_size=512, range_parallelism=3, range_part_size=1024,
+        )
+        return b"".join(await _collect_async_chunks(result.content_stream))
+
+    assert asyncio.run(collect()) == data
+    assert seen_ranges[0] == "bytes=0-1023"
+    assert sorted(seen_ranges[1:]) == sorted(f"bytes={o}-{min(o + 1024, len(data)) - 1}" for o in range(1024, len(data), 1024))
+
+
+def test_http_connector_proxy_stream_falls_back_when_connector_ignores_range(monkeypatch, tmp_path) -> None:
+    import httpx
+
+    source = tmp_path / "big.bin"
+    source.write_bytes(b"x" * 5000)
+    seen_ranges: list[str | None] = []
+    transport = httpx.ASGITransport(app=_ranged_file_app(source, seen_ranges, honour_range=False))
+    monkeypatch.setattr(proxy_module, "_get_async_proxy_client", lambda config: httpx.AsyncClient(transport=transport))
+    request, config = _proxy_stream_request()
+
+    async def collect() -> bytes:
+        result = await proxy_module.http_connector_proxy_stream(
+            request, config, range_parallelism=4, range_part_size=1024,
+        )
+        return b"".join(await _collect_async_chunks(result.content_stream))
+
+    assert asyncio.run(collect()) == b"x" * 5000
+    assert seen_ranges == ["bytes=0-1023"]
+
+
+def test_http_connector_proxy_stream_rejects_parts_after_the_object_changes(monkeypatch, tmp_path) -> None:
+    import httpx
+    import os
+
+    source = tmp_path / "big.bin"
+    source.write_bytes(b"a" * 4096)
+    seen_ranges: list[str | None] = []
+    app = _ranged_file_app(source, seen_ranges)
+
+    async def changing_app(scope, receive, send):
+        if len(seen_ranges) == 1:
+            # Rewritten after the first part was served
+            source.write_bytes(b"b" * 4096)
+            os.utime(source, (1, 1))
+        await app(scope, receive, send)
+
+    transport = httpx.ASGITransport(app=changing_app)
+    monkeypatch.setattr(proxy_module, "_get_async_proxy_client", lambda config: httpx.AsyncClient(transport=transport))
+    request, config = _proxy_stream_request()
+
+    async def collect() -> bytes:
+        result = await proxy_module.http_connector_proxy_stream(
+            request, config, range_parallelism=2, range_part_size=1024,
+        )
+        return b"".join(await _collect_async_chunks(result.content_stream))
+
+    try:
+        asyncio.run(collect())
+    except RuntimeError as exc:
+        assert "object changed during ranged read" in str(exc)
+    else:
+        raise AssertionError("expected a changed object to fail the ranged read")
+
+
 def test_http_connector_proxy_read_maps_structured_connector_json_error(monkeypatch) -> None:
     class FakeResponse:
         headers = {"Content-Type": "application/json"}
@@ -151,7 +151,7 @@ def test_relay_forever_logs_postgres_wakeup_result(monkeypatch: pytest.MonkeyPat
     class FakeService:
         calls = 0
 
-        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None) -> OutboxFlushResult:
+        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None, **_publish_options) -> OutboxFlushResult:
             self.calls += 1
             if self.calls > 1:
                 raise StopRelay()
@@ -198,7 +198,7 @@ def test_relay_forever_drains_non_empty_flushes_without_wait(monkeypatch: pytest
     class FakeService:
         calls = 0
 
-        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None) -> OutboxFlushResult:
+        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None, **_publish_options) -> OutboxFlushResult:
             self.calls += 1
             if self.calls == 1:
                 return OutboxFlushResult(attempted=100, published=100)
@@ -248,7 +248,7 @@ def test_relay_forever_suppresses_zero_work_info_logs(monkeypatch: pytest.Monkey
     class FakeService:
         calls = 0
 
-        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None) -> OutboxFlushResult:
+        async def flush_outbox(self, *, limit: int, max_active_scan_items: int | None = None, **_publish_options) -> OutboxFlushResult:
             self.calls += 1
             if self.calls > 1:
                 raise StopRelay()
@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from dsx_connect_ng.jobs.models import ScanResult
+from dsx_connect_ng.verdict_cache import bootstrap as verdict_cache_bootstrap
+from dsx_connect_ng.verdict_cache.base import normalize_content_sha256
+from dsx_connect_ng.verdict_cache.memory import InMemoryVerdictCache
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _result(verdict: str = "Benign", scan_guid: str = "scan-1") -> ScanResult:
+    return ScanResult(verdict=verdict, scanGuid=scan_guid)
+
+
+def test_normalize_content_sha256_accepts_prefixed_uppercase_digest() -> None:
+    digest = _sha(b"abc")
+
+    assert normalize_content_sha256(f"SHA256:{digest.upper()}") == digest
+    assert normalize_content_sha256("abc123") is None
+    assert normalize_content_sha256(None) is None
+
+
+def test_memory_verdict_cache_round_trips_and_counts_hits() -> None:
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=60, max_entries=10)
+    digest = _sha(b"golden image")
+
+    async def scenario():
+        assert await cache.lookup(digest) is None
+        assert await cache.store(digest, _result()) is True
+        return await cache.lookup(digest)
+
+    entry = asyncio.run(scenario())
+
+    assert entry is not None
+    assert entry.result.scan_guid == "scan-1"
+    assert entry.hit_count == 1
+    assert cache.stats.as_dict()["hits"] == 1
+    assert cache.stats.as_dict()["misses"] == 1
+    assert cache.stats.as_dict()["hit_rate"] == 0.5
+
+
+def test_memory_verdict_cache_keys_by_protected_entity() -> None:
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    digest = _sha(b"policy dependent")
+
+    async def scenario():
+        await cache.store(digest, _result("Non Compliant"), protected_entity=1)
+        return await cache.lookup(digest, protected_entity=1), await cache.lookup(digest, protected_entity=2)
+
+    same_entity, other_entity = asyncio.run(scenario())
+
+    assert same_entity is not None
+    assert other_entity is None
+
+
+@pytest.mark.parametrize("verdict", ["Unknown", "Not Scanned", "Scanning"])
+def test_memory_verdict_cache_skips_non_decisive_verdicts(verdict: str) -> None:
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+
+    stored = asyncio.run(cache.store(_sha(b"x"), _result(verdict)))
+
+    assert stored is False
+    assert len(cache) == 0
+
+
+def test_memory_verdict_cache_evicts_least_recently_used() -> None:
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=2)
+    first, second, third = _sha(b"1"), _sha(b"2"), _sha(b"3")
+
+    async def scenario():
+        await cache.store(first, _result(scan_guid="1"))
+        await cache.store(second, _result(scan_guid="2"))
+        await cache.lookup(first)
+        await cache.store(third, _result(scan_guid="3"))
+        return [await cache.lookup(digest) is not None for digest in (first, second, third)]
+
+    assert asyncio.run(scenario()) == [True, False, True]
+    assert cache.stats.evictions == 1
+
+
+def test_memory_verdict_cache_expires_entries_after_ttl(monkeypatch) -> None:
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=10, max_entries=10)
+    digest = _sha(b"ttl")
+    now = [1000.0]
+    monkeypatch.setattr("dsx_connect_ng.verdict_cache.base.time.time", lambda: now[0])
+    monkeypatch.setattr("dsx_connect_ng.verdict_cache.memory.time.time", lambda: now[0])
+
+    asyncio.run(cache.store(digest, _result()))
+    now[0] = 1011.0
+
+    assert asyncio.run(cache.lookup(digest)) is None
+    assert len(cache) == 0
+
+
+def test_memory_verdict_cache_purges_only_versions_idle_past_grace_period() -> None:
+    previous = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    digest = _sha(b"versioned")
+
+    async def scenario():
+        await previous.store(digest, _result())
+        # A worker on the new scanner shares the entries during a rolling upgrade
+        current = InMemoryVerdictCache(scanner_version="3.2.0", ttl_seconds=None, max_entries=10)
+        current._entries = previous._entries
+        kept = await current.purge_other_versions(older_than_seconds=3600)
+        still_cached = await previous.lookup(digest)
+        removed = await current.purge_other_versions(older_than_seconds=0)
+        return kept, still_cached, removed, await previous.lookup(digest)
+
+    kept, still_cached, removed, entry = asyncio.run(scenario())
+
+    assert kept == 0
+    assert still_cached is not None
+    assert removed == 1
+    assert entry is None
+
+
+def test_build_verdict_cache_follows_settings(monkeypatch) -> None:
+    monkeypatch.setattr(verdict_cache_bootstrap.settings.verdict_cache, "backend", "disabled")
+    assert verdict_cache_bootstrap.build_verdict_cache() is None
+
+    monkeypatch.setattr(verdict_cache_bootstrap.settings.verdict_cache, "backend", "memory")
+    monkeypatch.setattr(verdict_cache_bootstrap.settings.verdict_cache, "scanner_version", "")
+    with pytest.raises(ValueError, match="verdict_cache_scanner_version_required"):
+        verdict_cache_bootstrap.build_verdict_cache()
+
+    monkeypatch.setattr(verdict_cache_bootstrap.settings.verdict_cache, "scanner_version", "3.1.0")
+    cache = verdict_cache_bootstrap.build_verdict_cache()
+
+    assert isinstance(cache, InMemoryVerdictCache)
+    assert cache.scanner_version == "3.1.0"
+
+
+def test_postgres_verdict_cache_aclose_closes_every_thread_connection(monkeypatch) -> None:
+    pytest.importorskip("psycopg")
+    from dsx_connect_ng.verdict_cache import postgres as postgres_cache
+
+    class FakeConnection:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+
+    def fake_connect(*args, **kwargs):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(postgres_cache.psycopg, "connect", fake_connect)
+    cache = postgres_cache.PostgresVerdictCache(
+        "postgresql://cache", scanner_version="3.1.0", ttl_seconds=None, max_entries=10
+    )
+
+    async def scenario():
+        await asyncio.gather(*(asyncio.to_thread(cache._thread_connection) for _ in range(8)))
+        cache._thread_connection()
+        await cache.aclose()
+
+    asyncio.run(scenario())
+
+    assert len(opened) >= 2
+    assert all(conn.closed for conn in opened)
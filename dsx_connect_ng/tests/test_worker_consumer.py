@@ -4,8 +4,11 @@ from types import SimpleNamespace
 
 from dsx_connect_ng.jobs.contracts import MessageEnvelope
 from dsx_connect_ng.workers.consumer import (
+    MessageReader,
+    collect_batch,
     connect_robust_with_retry,
     decode_envelope,
+    dispatch_batch,
     dispatch_body,
     dlq_queue_name,
     next_retry_attempt,
@@ -130,3 +133,140 @@ def test_successful_dispatch_should_ack_message() -> None:
     asyncio.run(simulate())
 
     assert state.acked is True
+
+
+class BatchFakeMessage:
+    def __init__(self, job_item_id: str, settled: list[tuple]) -> None:
+        self.job_item_id = job_item_id
+        self.settled = settled
+        self.headers = {}
+        self.body = json.dumps(
+            {
+                "message_type": "policy_evaluation_requested",
+                "job_id": "job-1",
+                "job_item_id": job_item_id,
+                "object_identity": f"/finance/{job_item_id}.pdf",
+                "payload": {},
+            }
+        ).encode("utf-8")
+
+    async def ack(self, multiple: bool = False) -> None:
+        self.settled.append(("ack", self.job_item_id, multiple))
+
+
+def test_collect_batch_stops_at_batch_size_or_deadline() -> None:
+    async def scenario() -> tuple[list[int], list[int]]:
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for value in range(5):
+            queue.put_nowait(value)
+        reader = MessageReader(queue.get)
+        full = await collect_batch(reader, batch_size=3, max_wait_seconds=1.0)
+        queue.put_nowait(9)
+        partial = await collect_batch(reader, batch_size=10, max_wait_seconds=0.01)
+        await reader.aclose()
+        return full, partial
+
+    full, partial = asyncio.run(scenario())
+
+    assert full == [0, 1, 2]
+    assert partial == [3, 4, 9]
+
+
+class ClosingOnCancelIterator:
+    """Mimics aio-pika's QueueIterator: cancelling `__anext__` closes the iterator."""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[int] = asyncio.Queue()
+        self.closed = False
+
+    async def __anext__(self) -> int:
+        if self.closed:
+            raise StopAsyncIteration
+        try:
+            return await self.queue.get()
+        except asyncio.CancelledError:
+            self.closed = True
+            raise
+
+
+def test_collect_batch_keeps_consuming_after_an_underfilled_batch() -> None:
+    async def scenario() -> list[list[int]]:
+        iterator = ClosingOnCancelIterator()
+        reader = MessageReader(iterator.__anext__)
+        iterator.queue.put_nowait(1)
+        first = await collect_batch(reader, batch_size=5, max_wait_seconds=0.01)
+        # The timed-out read is still pending; a later message completes it
+        iterator.queue.put_nowait(2)
+        iterator.queue.put_nowait(3)
+        second = await collect_batch(reader, batch_size=2, max_wait_seconds=0.01)
+        assert not iterator.closed
+        await reader.aclose()
+        return [first, second]
+
+    assert asyncio.run(scenario()) == [[1], [2, 3]]
+
+
+def test_dispatch_batch_acks_full_success_with_one_multiple_ack() -> None:
+    settled: list[tuple] = []
+    seen: list[list[str]] = []
+    messages = [BatchFakeMessage(f"item-{index}", settled) for index in range(3)]
+
+    async def batch_handler(envelopes):
+        seen.append([envelope.job_item_id for envelope in envelopes])
+        return None
+
+    async def handle_failure(_message, _envelope, exc) -> None:
+        raise AssertionError(f"unexpected failure: {exc}")
+
+    asyncio.run(dispatch_batch(messages, batch_handler=batch_handler, handle_failure=handle_failure))
+
+    assert seen == [["item-0", "item-1", "item-2"]]
+    assert settled == [("ack", "item-2", True)]
+
+
+def test_dispatch_batch_settles_partial_failure_per_message() -> None:
+    settled: list[tuple] = []
+    messages = [BatchFakeMessage(f"item-{index}", settled) for index in range(3)]
+    messages[1].body = b"not-json"
+
+    async def batch_handler(envelopes):
+        return [None if envelope.job_item_id == "item-0" else RuntimeError("policy failed") for envelope in envelopes]
+
+    async def handle_failure(message, envelope, exc) -> None:
+        settled.append(("failure", message.job_item_id, envelope is not None, type(exc).__name__))
+
+    asyncio.run(dispatch_batch(messages, batch_handler=batch_handler, handle_failure=handle_failure))
+
+    assert settled[0][:3] == ("failure", "item-1", False)
+    assert settled[1:] == [
+        ("ack", "item-0", False),
+        ("failure", "item-2", True, "RuntimeError"),
+    ]
+
+
+def test_dispatch_batch_falls_back_to_single_handler_when_batch_handler_raises() -> None:
+    settled: list[tuple] = []
+    fallback: list[str] = []
+    messages = [BatchFakeMessage(f"item-{index}", settled) for index in range(2)]
+
+    async def batch_handler(_envelopes):
+        raise RuntimeError("bulk update failed")
+
+    async def handle_failure(_message, _envelope, exc) -> None:
+        raise AssertionError(f"unexpected failure: {exc}")
+
+    async def single_fallback(message) -> None:
+        fallback.append(message.job_item_id)
+        await message.ack()
+
+    asyncio.run(
+        dispatch_batch(
+            messages,
+            batch_handler=batch_handler,
+            handle_failure=handle_failure,
+            single_fallback=single_fallback,
+        )
+    )
+
+    assert fallback == ["item-0", "item-1"]
+    assert settled == [("ack", "item-0", False), ("ack", "item-1", False)]
@@ -33,13 +33,14 @@ from dsx_connect_ng.readers.proxy import ConnectorProxyReader, build_connector_p
 from dsx_connect_ng.readers.gcs_native import GCSNativeReader
 from dsx_connect_ng.readers.local_path import LocalPathReader
 from dsx_connect_ng.readers.resolver import build_scan_reader, resolve_reader_strategy
-from dsx_connect_ng.workers.delivery_worker import process_result_sink_message
+from dsx_connect_ng.workers.delivery_worker import process_result_sink_batch, process_result_sink_message
 from dsx_connect_ng.workers.dianna_worker import process_dianna_message
-from dsx_connect_ng.workers.policy_worker import process_policy_message
+from dsx_connect_ng.workers.policy_worker import process_policy_batch, process_policy_message
 from dsx_connect_ng.workers.policy_engine import stub_policy_engine
 from dsx_connect_ng.workers.connector_actions import build_legacy_connector_action_payload
 from dsx_connect_ng.workers.connector_actions import normalize_connector_remediation_response
 from dsx_connect_ng.workers.remediation_worker import build_remediation_executor, process_remediation_message
+from dsx_connect_ng.verdict_cache.memory import InMemoryVerdictCache
 from dsx_connect_ng.workers import scan_worker as scan_worker_module
 from dsx_connect_ng.workers.scan_worker import (
     ScanOnlyBatchCoordinator,
@@ -83,8 +84,10 @@ def reset_scan_worker_dsxa_client_cache():
     previous_scope = scan_worker_module._SCANNER_CLIENT_SCOPE
     previous_transport = scan_worker_module.settings.scanner.transport
     scan_worker_module._SCANNER_CLIENT_SCOPE = "shared"
+    scan_worker_module._VERDICT_CACHE = None
     scan_worker_module.settings.scanner.transport = "binary_stream"
     yield
+    scan_worker_module._VERDICT_CACHE = None
     scan_worker_module._DSXA_CLIENT = None
     scan_worker_module._DSXA_CLIENT_KEY = None
     scan_worker_module._SCANNER_CLIENT_SCOPE = previous_scope
@@ -1118,6 +1121,36 @@ def test_policy_worker_processes_message_and_requests_follow_on_work() -> None:
     assert "remediation_requested" in published_types
 
 
+def test_policy_worker_batch_reports_per_item_outcomes() -> None:
+    repo = InMemoryJobRepository()
+    bus = InMemoryJobBus()
+    service = JobService(repo=repo, bus=bus)
+    created = asyncio.run(
+        service.submit_batch_job(
+            BatchJobSubmitRequest(items=[{"object_identity": "/finance/bad.exe"}, {"object_identity": "/finance/boom.exe"}])
+        )
+    )
+    for scan_message in [message for message in bus.snapshot() if message.message_type == "scan_item_requested"]:
+        asyncio.run(process_scan_message(service, scan_message, execute_scan=_fake_scan))
+    policy_messages = [
+        message for message in bus.snapshot() if isinstance(message, MessageEnvelope) and message.message_type == "policy_evaluation_requested"
+    ]
+
+    async def engine(request):
+        if request.object_identity.endswith("boom.exe"):
+            raise RuntimeError("policy engine unavailable")
+        return await _fake_policy_engine(request)
+
+    outcomes = asyncio.run(process_policy_batch(service, policy_messages, evaluate_policy=engine))
+
+    assert outcomes[0] is None
+    assert isinstance(outcomes[1], RuntimeError)
+    items = {item.object_identity: item for item in service.list_job_items(job_id=created.job.job_id)}
+    assert items["/finance/bad.exe"].policy_stage.state == "completed"
+    assert items["/finance/boom.exe"].policy_stage.state == "running"
+    assert items["/finance/boom.exe"].policy_stage.started_at is not None
+
+
 def test_remediation_worker_processes_message_and_requests_delivery() -> None:
     repo = InMemoryJobRepository()
     bus = InMemoryJobBus()
@@ -1333,6 +1366,35 @@ def test_result_sink_worker_processes_message_and_completes_item() -> None:
     assert parent.job.state == "completed"
 
 
+def test_result_sink_worker_batch_completes_items() -> None:
+    repo = InMemoryJobRepository()
+    bus = InMemoryJobBus()
+    service = JobService(repo=repo, bus=bus)
+    created = asyncio.run(
+        service.submit_batch_job(BatchJobSubmitRequest(items=[{"object_identity": "/finance/bad.exe"}]))
+    )
+    asyncio.run(process_scan_message(service, bus.snapshot()[0], execute_scan=_fake_scan))
+    policy_message = next(
+        message for message in reversed(bus.snapshot()) if isinstance(message, MessageEnvelope) and message.message_type == "policy_evaluation_requested"
+    )
+    asyncio.run(process_policy_message(service, policy_message, evaluate_policy=_fake_policy_engine_without_dianna))
+    remediation_message = next(
+        message for message in reversed(bus.snapshot()) if isinstance(message, MessageEnvelope) and message.message_type == "remediation_requested"
+    )
+    asyncio.run(process_remediation_message(service, remediation_message, execute_remediation=_fake_remediation))
+    delivery_message = next(
+        message for message in reversed(bus.snapshot()) if isinstance(message, MessageEnvelope) and message.message_type == "result_sink_emit_requested"
+    )
+
+    outcomes = asyncio.run(process_result_sink_batch(service, [delivery_message], execute_result_sink=_fake_delivery))
+
+    assert outcomes == [None]
+    item = service.list_job_items(job_id=created.job.job_id)[0]
+    assert item.delivery_stage.result["externalReference"] == "delivery-ref-1"
+    assert item.state == "completed"
+    assert service.get_batch_job_or_404(created.job.job_id).job.state == "completed"
+
+
 def test_result_sink_worker_handles_stage_result_delivery_without_advancing_delivery_stage() -> None:
     repo = InMemoryJobRepository()
     bus = InMemoryJobBus()
@@ -2484,3 +2546,195 @@ def test_execute_scan_via_dsxa_skips_oversize_after_read(monkeypatch, tmp_path)
     assert exc.value.code == "content_too_large"
     assert exc.value.details["enforcement"] == "read_result"
     assert not artifact.exists()
+
+
+def test_execute_scan_via_dsxa_serves_known_hash_from_verdict_cache_without_reading(monkeypatch) -> None:
+    import hashlib
+
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.scanner.base_url", "http://scanner.local")
+    content_sha256 = hashlib.sha256(b"golden").hexdigest()
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    asyncio.run(cache.store(content_sha256, ScanResult(verdict="Malicious", scanGuid="scan-original")))
+    monkeypatch.setattr(scan_worker_module, "_VERDICT_CACHE", cache)
+
+    class FakeReader:
+        async def acquire(self, _request):
+            raise AssertionError("reader should not be called for a cached verdict")
+
+    request = SimpleNamespace(
+        job_id="job-2",
+        scan_options={"sha256": content_sha256},
+        content_source=ContentSource(mode="cached"),
+    )
+    result = asyncio.run(execute_scan_via_dsxa(request, FakeReader()))
+
+    metadata = request.scan_options["_dsx_scanner_metadata"]
+    assert result.verdict == "Malicious"
+    assert result.scan_guid == "scan-original"
+    assert "job-id:job-2" in result.x_custom_metadata
+    assert metadata["source"] == "verdict_cache"
+    assert metadata["verdictCacheStatus"] == "hit"
+    assert metadata["contentSha256"] == content_sha256
+
+
+def test_execute_scan_via_dsxa_uses_scanner_hash_lookup_before_streaming(monkeypatch) -> None:
+    import hashlib
+
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.scanner.base_url", "http://scanner.local")
+    content_sha256 = hashlib.sha256(b"known to dsxa").hexdigest()
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    monkeypatch.setattr(scan_worker_module, "_VERDICT_CACHE", cache)
+    hashes: list[str] = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        async def scan_hash(self, file_hash, **kwargs):
+            hashes.append(file_hash)
+            return _fake_benign_dsxa_response(scan_guid="scan-by-hash")
+
+        async def scan_binary_stream(self, data, **kwargs):
+            raise AssertionError("content should not be streamed after a by-hash verdict")
+
+    monkeypatch.setattr(
+        "dsx_connect_ng.workers.scan_worker._import_dsxa_client",
+        lambda: (FakeClient, object, RuntimeError, RuntimeError, RuntimeError, RuntimeError, RuntimeError),
+    )
+
+    class FakeReader:
+        async def acquire(self, _request):
+            raise AssertionError("reader should not be called after a by-hash verdict")
+
+    request = SimpleNamespace(
+        read_hint={"sha256": content_sha256},
+        scan_options={},
+        content_source=ContentSource(mode="original"),
+    )
+    result = asyncio.run(execute_scan_via_dsxa(request, FakeReader()))
+
+    assert result.scan_guid == "scan-by-hash"
+    assert hashes == [content_sha256]
+    assert request.scan_options["_dsx_scanner_metadata"]["verdictCacheStatus"] == "scanner_hash_hit"
+    # The hint was never checked against the content, so the verdict is not cached under it
+    assert asyncio.run(cache.lookup(content_sha256)) is None
+
+
+def test_execute_scan_via_dsxa_hashes_streamed_content_into_verdict_cache(monkeypatch) -> None:
+    import hashlib
+
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.scanner.base_url", "http://scanner.local")
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    monkeypatch.setattr(scan_worker_module, "_VERDICT_CACHE", cache)
+    scans: list[bytes] = []
+
+    async def content_stream():
+        yield b"attach"
+        yield b"ment"
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        async def scan_binary_stream(self, data, **kwargs):
+            scans.append(b"".join([chunk async for chunk in data]))
+            return _fake_benign_dsxa_response(scan_guid="scan-streamed")
+
+    monkeypatch.setattr(
+        "dsx_connect_ng.workers.scan_worker._import_dsxa_client",
+        lambda: (FakeClient, object, RuntimeError, RuntimeError, RuntimeError, RuntimeError, RuntimeError),
+    )
+
+    class FakeReader:
+        async def acquire(self, _request):
+            return SimpleNamespace(local_path=None, content_stream=content_stream(), content_length=10, details={"reader": "connector_proxy"})
+
+    request = SimpleNamespace(scan_options={}, content_source=ContentSource(mode="original"))
+    asyncio.run(execute_scan_via_dsxa(request, FakeReader()))
+
+    content_sha256 = hashlib.sha256(b"attachment").hexdigest()
+    metadata = request.scan_options["_dsx_scanner_metadata"]
+    assert scans == [b"attachment"]
+    assert metadata["verdictCacheStatus"] == "miss"
+    assert metadata["verdictCacheStored"] is True
+    assert metadata["contentSha256"] == content_sha256
+    assert asyncio.run(cache.lookup(content_sha256)).result.scan_guid == "scan-streamed"
+
+
+def test_execute_scan_via_dsxa_never_stores_under_an_unverified_hint(monkeypatch) -> None:
+    import hashlib
+
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.scanner.base_url", "http://scanner.local")
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.verdict_cache.scanner_hash_lookup", False)
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    monkeypatch.setattr(scan_worker_module, "_VERDICT_CACHE", cache)
+    forged_sha256 = hashlib.sha256(b"someone else's file").hexdigest()
+
+    async def content_stream():
+        yield b"actual bytes"
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        async def scan_binary_stream(self, data, **kwargs):
+            [chunk async for chunk in data]
+            return _fake_benign_dsxa_response(scan_guid="scan-streamed")
+
+    monkeypatch.setattr(
+        "dsx_connect_ng.workers.scan_worker._import_dsxa_client",
+        lambda: (FakeClient, object, RuntimeError, RuntimeError, RuntimeError, RuntimeError, RuntimeError),
+    )
+
+    class FakeReader:
+        async def acquire(self, _request):
+            return SimpleNamespace(local_path=None, content_stream=content_stream(), content_length=12, details={"reader": "connector_proxy"})
+
+    request = SimpleNamespace(
+        read_hint={"sha256": forged_sha256},
+        scan_options={},
+        content_source=ContentSource(mode="original"),
+    )
+    asyncio.run(execute_scan_via_dsxa(request, FakeReader()))
+
+    actual_sha256 = hashlib.sha256(b"actual bytes").hexdigest()
+    metadata = request.scan_options["_dsx_scanner_metadata"]
+    assert metadata["contentSha256"] == actual_sha256
+    assert asyncio.run(cache.lookup(forged_sha256)) is None
+    assert asyncio.run(cache.lookup(actual_sha256)).result.scan_guid == "scan-streamed"
+
+
+def test_execute_scan_via_dsxa_checks_cache_with_local_artifact_hash(monkeypatch, tmp_path) -> None:
+    import hashlib
+
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.scanner.base_url", "http://scanner.local")
+    monkeypatch.setattr("dsx_connect_ng.workers.scan_worker.settings.verdict_cache.scanner_hash_lookup", False)
+    artifact = tmp_path / "copy-of-golden.bin"
+    artifact.write_bytes(b"golden")
+    cache = InMemoryVerdictCache(scanner_version="3.1.0", ttl_seconds=None, max_entries=10)
+    asyncio.run(cache.store(hashlib.sha256(b"golden").hexdigest(), ScanResult(verdict="Benign", scanGuid="scan-golden")))
+    monkeypatch.setattr(scan_worker_module, "_VERDICT_CACHE", cache)
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        async def scan_binary_stream(self, data, **kwargs):
+            raise AssertionError("cached local artifact should not be streamed")
+
+    monkeypatch.setattr(
+        "dsx_connect_ng.workers.scan_worker._import_dsxa_client",
+        lambda: (FakeClient, object, RuntimeError, RuntimeError, RuntimeError, RuntimeError, RuntimeError),
+    )
+
+    class FakeReader:
+        async def acquire(self, _request):
+            return SimpleNamespace(local_path=artifact, content_length=6, cleanup_local_path=True, details={"reader": "connector_proxy"})
+
+    request = SimpleNamespace(scan_options={}, content_source=ContentSource(mode="original"))
+    result = asyncio.run(execute_scan_via_dsxa(request, FakeReader()))
+
+    assert result.scan_guid == "scan-golden"
+    assert request.scan_options["_dsx_scanner_metadata"]["verdictCacheStatus"] == "hit"
+    assert request.scan_options["_dsx_scanner_metadata"]["reader"] == "connector_proxy"
+    assert not artifact.exists()
@@ -1,5 +1,5 @@
 from dsx_transfer.audit import JsonLinesAuditSink
-from dsx_transfer.checkpoint import JsonCheckpointStore
+from dsx_transfer.checkpoint import JsonCheckpointStore, LogCheckpointStore
 from dsx_transfer.adapters.sftpgo import SftpGoEventContext, SftpGoTransferPlatformAdapter, sftpgo_context_from_payload
 from dsx_transfer.contracts import (
     AuditSink,
@@ -20,18 +20,22 @@ from dsx_transfer.models import (
     TransferItemOutcome,
     TransferPlatformContext,
     TransferPlan,
+    TransferPlanStream,
     TransferReport,
     TransferVerdict,
 )
 from dsx_transfer.policy import GuardedTransferPolicy
+from dsx_transfer.spool import ContentSpool
 
 __all__ = [
     "AuditSink",
     "CheckpointStore",
     "CommitDecision",
+    "ContentSpool",
     "DsxaStreamScanGate",
     "JsonCheckpointStore",
     "JsonLinesAuditSink",
+    "LogCheckpointStore",
     "GuardedTransferPolicy",
     "FILE_TYPE_GROUPS",
     "expand_file_type_actions",
@@ -50,6 +54,7 @@ __all__ = [
     "TransferPlatformAdapter",
     "TransferPlatformContext",
     "TransferPlan",
+    "TransferPlanStream",
     "TransferReport",
     "TransferVerdict",
 ]
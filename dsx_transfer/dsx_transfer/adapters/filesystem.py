@@ -1,50 +1,79 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 from typing import AsyncIterator
 
 from dsx_transfer.contracts import SinkAdapter, SourceAdapter
-from dsx_transfer.models import TransferItem, TransferPlan
+from dsx_transfer.models import TransferItem, TransferPlan, TransferPlanStream
 
 
 def _file_uri(path: Path) -> str:
     return path.resolve().as_uri()
 
 
+def _sorted_entries(directory: Path) -> list[os.DirEntry]:
+    """List a directory in reverse name order so callers can pop() entries in ascending order."""
+    with os.scandir(directory) as iterator:
+        return sorted(iterator, key=lambda entry: entry.name, reverse=True)
+
+
 class FilesystemSourceAdapter(SourceAdapter):
     def __init__(self, root: str | Path, *, chunk_size: int = 1024 * 1024) -> None:
         self.root = Path(root).resolve()
         self.chunk_size = chunk_size
 
     async def plan(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferPlan:
-        items: list[TransferItem] = []
-        for path in sorted(self.root.rglob("*")):
-            if not path.is_file():
-                continue
-            relative = path.relative_to(self.root).as_posix()
-            stat = path.stat()
-            destination = destination_uri.rstrip("/") + "/" + relative
-            items.append(
-                TransferItem(
-                    source_uri=_file_uri(path),
-                    destination_uri=destination,
-                    object_identity=relative,
-                    size_bytes=stat.st_size,
-                    metadata={
-                        "source_path": str(path),
-                        "relative_path": relative,
-                        "mtime_ns": stat.st_mtime_ns,
-                    },
-                )
-            )
+        stream = await self.stream_plan(destination_uri=destination_uri, transfer_id=transfer_id, policy_id=policy_id)
         return TransferPlan(
+            transfer_id=transfer_id,
+            source_uri=stream.source_uri,
+            destination_uri=destination_uri,
+            policy_id=policy_id,
+            items=[item async for item in stream.items],
+        )
+
+    async def stream_plan(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferPlanStream:
+        return TransferPlanStream(
             transfer_id=transfer_id,
             source_uri=_file_uri(self.root),
             destination_uri=destination_uri,
             policy_id=policy_id,
-            items=items,
+            items=self._iter_items(destination_uri),
         )
 
+    async def _iter_items(self, destination_uri: str) -> AsyncIterator[TransferItem]:
+        # Depth-first walk with per-directory sorting yields the same order as
+        # sorted(rglob("*")) while only holding one directory listing per level.
+        pending: list[list[os.DirEntry]] = [await asyncio.to_thread(_sorted_entries, self.root)]
+        while pending:
+            entries = pending[-1]
+            if not entries:
+                pending.pop()
+                continue
+            entry = entries.pop()
+            if entry.is_dir() and not entry.is_symlink():
+                pending.append(await asyncio.to_thread(_sorted_entries, Path(entry.path)))
+                continue
+            if not entry.is_file():
+                continue
+            path = Path(entry.path)
+            relative = path.relative_to(self.root).as_posix()
+            stat = entry.stat()
+            destination = destination_uri.rstrip("/") + "/" + relative
+            yield TransferItem(
+                source_uri=_file_uri(path),
+                destination_uri=destination,
+                object_identity=relative,
+                size_bytes=stat.st_size,
+                metadata={
+                    "source_path": str(path),
+                    "relative_path": relative,
+                    "mtime_ns": stat.st_mtime_ns,
+                },
+            )
+
     async def open_item(self, item: TransferItem) -> AsyncIterator[bytes]:
         source_path = item.metadata.get("source_path")
         if not source_path:
@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 from pathlib import Path
+from typing import IO, Literal
 
 from dsx_transfer.contracts import CheckpointStore
 from dsx_transfer.models import CheckpointRecord, TransferItem, TransferItemOutcome, utcnow
 
+CheckpointBackend = Literal["json", "log"]
+
+DEFAULT_LOG_FSYNC_EVERY = 256
+DEFAULT_LOG_COMPACT_MIN_RECORDS = 10_000
+DEFAULT_LOG_COMPACT_RATIO = 2.0
+
 
 def _fingerprint(item: TransferItem) -> str:
     return "|".join(
@@ -22,6 +30,21 @@ def _checkpoint_key(transfer_id: str, item: TransferItem) -> str:
     return f"{transfer_id}:{item.object_identity}"
 
 
+def _checkpoint_record(transfer_id: str, outcome: TransferItemOutcome) -> CheckpointRecord:
+    item = outcome.item
+    return CheckpointRecord(
+        transfer_id=transfer_id,
+        object_identity=item.object_identity,
+        source_uri=item.source_uri,
+        destination_uri=item.destination_uri,
+        state=outcome.state,
+        size_bytes=item.size_bytes,
+        metadata_fingerprint=_fingerprint(item),
+        outcome=outcome,
+        updated_at=utcnow(),
+    )
+
+
 class JsonCheckpointStore(CheckpointStore):
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
@@ -39,18 +62,7 @@ class JsonCheckpointStore(CheckpointStore):
     async def put(self, *, transfer_id: str, outcome: TransferItemOutcome) -> None:
         async with self._lock:
             data = self._load()
-            item = outcome.item
-            data[_checkpoint_key(transfer_id, item)] = CheckpointRecord(
-                transfer_id=transfer_id,
-                object_identity=item.object_identity,
-                source_uri=item.source_uri,
-                destination_uri=item.destination_uri,
-                state=outcome.state,
-                size_bytes=item.size_bytes,
-                metadata_fingerprint=_fingerprint(item),
-                outcome=outcome,
-                updated_at=utcnow(),
-            ).model_dump(mode="json")
+            data[_checkpoint_key(transfer_id, outcome.item)] = _checkpoint_record(transfer_id, outcome).model_dump(mode="json")
             self.path.parent.mkdir(parents=True, exist_ok=True)
             self.path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
 
@@ -58,3 +70,152 @@ class JsonCheckpointStore(CheckpointStore):
         if not self.path.exists():
             return {}
         return json.loads(self.path.read_text(encoding="utf-8") or "{}")
+
+
+class LogCheckpointStore(CheckpointStore):
+    """Append-only JSON Lines checkpoint log with an in-memory index.
+
+    Each `put` appends one `{"key": ..., "record": ...}` line and updates a
+    dict keyed by `transfer_id:object_identity`, so lookups never re-read the
+    file. Appends are flushed to the OS immediately and fsynced every
+    `fsync_every` records (and on `flush()`). Once the log holds more than
+    `compact_ratio` lines per live key, and at least `compact_min_records`
+    lines, it is rewritten with only the latest record for each key.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fsync_every: int = DEFAULT_LOG_FSYNC_EVERY,
+        compact_min_records: int = DEFAULT_LOG_COMPACT_MIN_RECORDS,
+        compact_ratio: float = DEFAULT_LOG_COMPACT_RATIO,
+    ) -> None:
+        self.path = Path(path)
+        self.fsync_every = max(1, int(fsync_every))
+        self.compact_min_records = max(1, int(compact_min_records))
+        self.compact_ratio = max(1.0, float(compact_ratio))
+        self._lock = asyncio.Lock()
+        self._index: dict[str, dict] | None = None
+        self._handle: IO[str] | None = None
+        self._log_records = 0
+        self._unsynced = 0
+
+    async def get(self, *, transfer_id: str, item: TransferItem) -> CheckpointRecord | None:
+        raw = self._load_index().get(_checkpoint_key(transfer_id, item))
+        if raw is None:
+            return None
+        record = CheckpointRecord.model_validate(raw)
+        if record.metadata_fingerprint != _fingerprint(item):
+            return None
+        return record
+
+    async def put(self, *, transfer_id: str, outcome: TransferItemOutcome) -> None:
+        async with self._lock:
+            record = _checkpoint_record(transfer_id, outcome)
+            self.put_record(_checkpoint_key(transfer_id, outcome.item), record.model_dump(mode="json"))
+
+    async def flush(self) -> None:
+        async with self._lock:
+            self._sync()
+
+    def put_record(self, key: str, record: dict) -> None:
+        index = self._load_index()
+        handle = self._open_for_append()
+        handle.write(json.dumps({"key": key, "record": record}, sort_keys=True, separators=(",", ":")))
+        handle.write("\n")
+        handle.flush()
+        index[key] = record
+        self._log_records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self._sync()
+        if self._log_records >= self.compact_min_records and self._log_records > len(index) * self.compact_ratio:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per live key."""
+        index = self._load_index()
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.compact")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for key, record in index.items():
+                handle.write(json.dumps({"key": key, "record": record}, sort_keys=True, separators=(",", ":")))
+                handle.write("\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.path)
+        self._log_records = len(index)
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        self._sync()
+        self._handle.close()
+        self._handle = None
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+    def _sync(self) -> None:
+        if self._handle is not None and self._unsynced:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+
+    def _open_for_append(self) -> IO[str]:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        return self._handle
+
+    def _load_index(self) -> dict[str, dict]:
+        if self._index is not None:
+            return self._index
+        index: dict[str, dict] = {}
+        records = 0
+        if self.path.exists():
+            data = self.path.read_bytes()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                # A torn final append after a crash. Cut it off so the next append
+                # starts on a fresh line instead of being glued onto the fragment.
+                with self.path.open("r+b") as handle:
+                    handle.truncate(end)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            for line in data[:end].decode("utf-8").splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                index[entry["key"]] = entry["record"]
+                records += 1
+        self._index = index
+        self._log_records = records
+        return index
+
+
+def build_checkpoint_store(path: str | Path, *, backend: CheckpointBackend = "json") -> CheckpointStore:
+    if backend == "json":
+        return JsonCheckpointStore(path)
+    if backend == "log":
+        return LogCheckpointStore(path)
+    raise ValueError(f"unsupported checkpoint backend: {backend}")
+
+
+def convert_json_checkpoint(source: str | Path, destination: str | Path) -> int:
+    """Copy a `JsonCheckpointStore` file into a `LogCheckpointStore` log and return the record count."""
+    data = json.loads(Path(source).read_text(encoding="utf-8") or "{}")
+    store = LogCheckpointStore(destination)
+    try:
+        for key, raw in data.items():
+            store.put_record(key, CheckpointRecord.model_validate(raw).model_dump(mode="json"))
+        store.compact()
+    finally:
+        store.close()
+    return len(data)
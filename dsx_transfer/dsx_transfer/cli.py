@@ -10,7 +10,7 @@ import typer
 
 from dsx_transfer.adapters import FilesystemSinkAdapter, FilesystemSourceAdapter, GcsSinkAdapter, parse_gcs_uri
 from dsx_transfer.audit import JsonLinesAuditSink
-from dsx_transfer.checkpoint import JsonCheckpointStore
+from dsx_transfer.checkpoint import CheckpointBackend, build_checkpoint_store, convert_json_checkpoint
 from dsx_transfer.config import (
     DsxTransferConfig,
     TransferConfigError,
@@ -21,7 +21,7 @@ from dsx_transfer.config import (
 from dsx_transfer.dsxa_file_types import FILE_TYPE_GROUPS
 from dsx_transfer.dsxa_scan_gate import DsxaStreamScanGate
 from dsx_transfer.engine import TransferEngine
-from dsx_transfer.models import TransferAction, TransferVerdict
+from dsx_transfer.models import TransferAction, TransferPlanMode, TransferReadMode, TransferVerdict
 from dsx_transfer.policy import GuardedTransferPolicy
 from dsx_transfer.scan_gates import StaticVerdictScanGate
 
@@ -35,6 +35,11 @@ config_app = typer.Typer(
     help="Create, validate, and inspect DSX-Transfer config files.",
 )
 app.add_typer(config_app, name="config")
+checkpoint_app = typer.Typer(
+    add_completion=False,
+    help="Inspect and convert DSX-Transfer checkpoint state.",
+)
+app.add_typer(checkpoint_app, name="checkpoint")
 
 
 @app.callback()
@@ -79,6 +84,27 @@ def config_validate(
         raise typer.Exit(1)
 
 
+@checkpoint_app.command("convert")
+def checkpoint_convert(
+    source: Annotated[Path, typer.Option("--from", help="Existing JSON checkpoint file.")],
+    destination: Annotated[Path, typer.Option("--to", help="Append-only checkpoint log to create.")],
+    force: Annotated[bool, typer.Option("--force", help="Overwrite an existing checkpoint log.")] = False,
+) -> None:
+    """Convert a JSON checkpoint file into an append-only checkpoint log."""
+    if not source.exists():
+        raise typer.BadParameter(f"checkpoint not found: {source}")
+    if destination.exists():
+        if not force:
+            raise typer.BadParameter(f"checkpoint log already exists: {destination}; pass --force to overwrite")
+        destination.unlink()
+    try:
+        records = convert_json_checkpoint(source, destination)
+    except ValueError as exc:
+        raise typer.BadParameter(f"invalid JSON checkpoint {source}: {exc}") from exc
+    sys.stdout.write(json.dumps({"source": str(source), "destination": str(destination), "records": records}, sort_keys=True))
+    sys.stdout.write("\n")
+
+
 def _verdict_choices() -> set[str]:
     return {"benign", "malicious", "suspicious", "unknown", "error"}
 
@@ -91,6 +117,18 @@ def _scanner_modes() -> set[str]:
     return {"static", "dsxa"}
 
 
+def _read_modes() -> set[str]:
+    return {"double", "single"}
+
+
+def _checkpoint_backends() -> set[str]:
+    return {"json", "log"}
+
+
+def _plan_modes() -> set[str]:
+    return {"materialized", "streaming"}
+
+
 def _destination_kinds() -> set[str]:
     return {"auto", "filesystem", "gcs"}
 
@@ -201,6 +239,10 @@ def _resolve_migrate_settings(
     audit_jsonl: Path | None,
     checkpoint: Path | None,
     concurrency: int | None,
+    read_mode: str | None = None,
+    checkpoint_backend: str | None = None,
+    plan_mode: str | None = None,
+    report_outcome_limit: int | None = None,
 ) -> dict:
     settings = {
         "source": source,
@@ -222,6 +264,10 @@ def _resolve_migrate_settings(
         "audit_jsonl": audit_jsonl,
         "checkpoint": checkpoint,
         "concurrency": concurrency or 1,
+        "read_mode": read_mode or "double",
+        "checkpoint_backend": checkpoint_backend or "json",
+        "plan_mode": plan_mode or "materialized",
+        "report_outcome_limit": report_outcome_limit,
     }
 
     if config is not None:
@@ -248,6 +294,10 @@ def _resolve_migrate_settings(
                 "audit_jsonl": transfer_config.runtime.audit_jsonl,
                 "checkpoint": transfer_config.runtime.checkpoint,
                 "concurrency": transfer_config.runtime.concurrency,
+                "read_mode": transfer_config.runtime.read_mode,
+                "checkpoint_backend": transfer_config.runtime.checkpoint_backend,
+                "plan_mode": transfer_config.runtime.plan_mode,
+                "report_outcome_limit": transfer_config.runtime.report_outcome_limit,
             }
         )
 
@@ -289,6 +339,14 @@ def _resolve_migrate_settings(
             settings["checkpoint"] = checkpoint
         if concurrency is not None:
             settings["concurrency"] = concurrency
+        if read_mode is not None:
+            settings["read_mode"] = read_mode
+        if checkpoint_backend is not None:
+            settings["checkpoint_backend"] = checkpoint_backend
+        if plan_mode is not None:
+            settings["plan_mode"] = plan_mode
+        if report_outcome_limit is not None:
+            settings["report_outcome_limit"] = report_outcome_limit
 
     missing = [name for name in ("source", "destination", "transfer_id") if settings[name] is None]
     if missing:
@@ -347,8 +405,24 @@ def migrate(
         ),
     ] = False,
     audit_jsonl: Annotated[Path | None, typer.Option("--audit-jsonl", help="Path to append JSONL audit events.")] = None,
-    checkpoint: Annotated[Path | None, typer.Option("--checkpoint", help="Path to JSON checkpoint state.")] = None,
+    checkpoint: Annotated[Path | None, typer.Option("--checkpoint", help="Path to checkpoint state.")] = None,
+    checkpoint_backend: Annotated[
+        str | None,
+        typer.Option("--checkpoint-backend", help="Checkpoint backend: json (single JSON document) or log (append-only, indexed)."),
+    ] = None,
     concurrency: Annotated[int | None, typer.Option("--concurrency", min=1, help="Maximum file transfer concurrency.")] = None,
+    read_mode: Annotated[
+        str | None,
+        typer.Option("--read-mode", help="Source read mode: double (scan read + commit read) or single (tee into a spool)."),
+    ] = None,
+    plan_mode: Annotated[
+        str | None,
+        typer.Option("--plan-mode", help="Plan mode: materialized (list all items first) or streaming (transfer while listing)."),
+    ] = None,
+    report_outcome_limit: Annotated[
+        int | None,
+        typer.Option("--report-outcome-limit", min=0, help="Maximum per-item outcomes kept in a streaming transfer report."),
+    ] = None,
     progress_jsonl: Annotated[
         bool,
         typer.Option("--progress-jsonl/--no-progress-jsonl", help="Emit transfer progress events as JSON Lines on stderr."),
@@ -376,6 +450,10 @@ def migrate(
             audit_jsonl=audit_jsonl,
             checkpoint=checkpoint,
             concurrency=concurrency,
+            read_mode=read_mode,
+            checkpoint_backend=checkpoint_backend,
+            plan_mode=plan_mode,
+            report_outcome_limit=report_outcome_limit,
         )
     except TransferConfigError as exc:
         raise typer.BadParameter(str(exc)) from exc
@@ -390,6 +468,18 @@ def migrate(
         raise typer.BadParameter(
             f"invalid destination kind {settings['destination_kind']!r}; expected one of {', '.join(sorted(_destination_kinds()))}"
         )
+    if settings["read_mode"] not in _read_modes():
+        raise typer.BadParameter(
+            f"invalid read mode {settings['read_mode']!r}; expected one of {', '.join(sorted(_read_modes()))}"
+        )
+    if settings["checkpoint_backend"] not in _checkpoint_backends():
+        raise typer.BadParameter(
+            f"invalid checkpoint backend {settings['checkpoint_backend']!r}; expected one of {', '.join(sorted(_checkpoint_backends()))}"
+        )
+    if settings["plan_mode"] not in _plan_modes():
+        raise typer.BadParameter(
+            f"invalid plan mode {settings['plan_mode']!r}; expected one of {', '.join(sorted(_plan_modes()))}"
+        )
     if settings["scanner_mode"] == "dsxa" and not settings["dsxa_base_url"]:
         raise typer.BadParameter("--dsxa-base-url is required when --scanner-mode dsxa")
     try:
@@ -401,7 +491,7 @@ def migrate(
         )
     except RuntimeError as exc:
         raise typer.BadParameter(str(exc)) from exc
-    if not report.outcomes:
+    if not report.planned_count:
         sys.stderr.write(f"warning: transfer plan contains no files under source {settings['source']}\n")
     sys.stdout.write(report.model_dump_json())
     sys.stdout.write("\n")
@@ -566,17 +656,25 @@ async def _run_migrate(
     audit_jsonl: Path | None,
     checkpoint: Path | None,
     concurrency: int,
+    read_mode: TransferReadMode,
+    checkpoint_backend: CheckpointBackend,
+    plan_mode: TransferPlanMode,
+    report_outcome_limit: int | None,
     progress_jsonl: bool,
 ):
-    async def emit_progress(completed: int, total: int, outcome) -> None:
+    async def emit_progress(completed: int, total: int | None, outcome) -> None:
         if not progress_jsonl:
             return
+        if total is None:
+            percent_complete = None
+        else:
+            percent_complete = round((completed / total) * 100, 3) if total else 100.0
         event = {
             "event": "transfer_progress",
             "transfer_id": transfer_id,
             "completed_items": completed,
             "total_items": total,
-            "percent_complete": round((completed / total) * 100, 3) if total else 100.0,
+            "percent_complete": percent_complete,
             "state": outcome.state,
             "object_identity": outcome.item.object_identity,
         }
@@ -609,7 +707,11 @@ async def _run_migrate(
                 ),
                 audit_jsonl=audit_jsonl,
                 checkpoint=checkpoint,
+                checkpoint_backend=checkpoint_backend,
                 concurrency=concurrency,
+                read_mode=read_mode,
+                plan_mode=plan_mode,
+                report_outcome_limit=report_outcome_limit,
                 progress_callback=emit_progress if progress_jsonl else None,
             )
             return await engine.run(
@@ -632,7 +734,11 @@ async def _run_migrate(
         scan_gate=scan_gate,
         audit_jsonl=audit_jsonl,
         checkpoint=checkpoint,
+        checkpoint_backend=checkpoint_backend,
         concurrency=concurrency,
+        read_mode=read_mode,
+        plan_mode=plan_mode,
+        report_outcome_limit=report_outcome_limit,
         progress_callback=emit_progress if progress_jsonl else None,
     )
     return await engine.run(
@@ -674,6 +780,10 @@ def _build_engine(
     audit_jsonl: Path | None,
     checkpoint: Path | None,
     concurrency: int,
+    checkpoint_backend: CheckpointBackend = "json",
+    read_mode: TransferReadMode = "double",
+    plan_mode: TransferPlanMode = "materialized",
+    report_outcome_limit: int | None = None,
     progress_callback=None,
 ) -> TransferEngine:
     engine = TransferEngine(
@@ -681,9 +791,12 @@ def _build_engine(
         sink=_build_sink(destination=destination, destination_kind=destination_kind),
         scan_gate=scan_gate,
         audit_sink=JsonLinesAuditSink(audit_jsonl) if audit_jsonl else None,
-        checkpoint_store=JsonCheckpointStore(checkpoint) if checkpoint else None,
+        checkpoint_store=build_checkpoint_store(checkpoint, backend=checkpoint_backend) if checkpoint else None,
         concurrency=concurrency,
         progress_callback=progress_callback,
+        read_mode=read_mode,
+        plan_mode=plan_mode,
+        report_outcome_limit=report_outcome_limit,
     )
     return engine
 
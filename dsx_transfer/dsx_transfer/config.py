@@ -6,7 +6,8 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from dsx_transfer.models import TransferAction, TransferVerdict
+from dsx_transfer.checkpoint import CheckpointBackend
+from dsx_transfer.models import TransferAction, TransferPlanMode, TransferReadMode, TransferVerdict
 
 
 class TransferConfigError(ValueError):
@@ -66,7 +67,11 @@ class RuntimeSection(BaseModel):
 
     audit_jsonl: Path | None = None
     checkpoint: Path | None = None
+    checkpoint_backend: CheckpointBackend = "json"
     concurrency: int = Field(default=1, ge=1)
+    read_mode: TransferReadMode = "double"
+    plan_mode: TransferPlanMode = "materialized"
+    report_outcome_limit: int | None = Field(default=None, ge=0)
 
 
 class DsxTransferConfig(BaseModel):
@@ -12,6 +12,7 @@ from dsx_transfer.models import (
     TransferItemOutcome,
     TransferPlatformContext,
     TransferPlan,
+    TransferPlanStream,
 )
 from shared.object_storage import ObjectDiscoverer, ObjectInfo, ObjectReader, ObjectRef, ObjectScope, ObjectWriter
 
@@ -21,6 +22,22 @@ class SourceAdapter(ABC):
     async def plan(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferPlan:
         raise NotImplementedError
 
+    async def stream_plan(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferPlanStream:
+        """Return the plan as a lazy item stream. Adapters that can enumerate incrementally should override this."""
+        plan = await self.plan(destination_uri=destination_uri, transfer_id=transfer_id, policy_id=policy_id)
+
+        async def items() -> AsyncIterator[TransferItem]:
+            for item in plan.items:
+                yield item
+
+        return TransferPlanStream(
+            transfer_id=plan.transfer_id,
+            source_uri=plan.source_uri,
+            destination_uri=plan.destination_uri,
+            policy_id=plan.policy_id,
+            items=items(),
+        )
+
     @abstractmethod
     async def open_item(self, item: TransferItem) -> AsyncIterator[bytes]:
         raise NotImplementedError
@@ -58,3 +75,7 @@ class CheckpointStore(ABC):
     @abstractmethod
     async def put(self, *, transfer_id: str, outcome: TransferItemOutcome) -> None:
         raise NotImplementedError
+
+    async def flush(self) -> None:
+        """Make buffered checkpoint writes durable. Stores that write through need not override this."""
+        return None
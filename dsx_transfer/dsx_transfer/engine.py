@@ -2,12 +2,42 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator
 
 from dsx_transfer.contracts import AuditSink, CheckpointStore, ScanGate, SinkAdapter, SourceAdapter
-from dsx_transfer.models import AuditEvent, TransferAction, TransferItem, TransferItemOutcome, TransferItemState, TransferPlan, TransferReport, utcnow
+from dsx_transfer.models import (
+    AuditEvent,
+    TransferAction,
+    TransferItem,
+    TransferItemOutcome,
+    TransferItemState,
+    TransferPlan,
+    TransferPlanMode,
+    TransferPlanStream,
+    TransferReadMode,
+    TransferReport,
+    TransferReportTotals,
+    utcnow,
+)
+from dsx_transfer.spool import DEFAULT_SPOOL_MEMORY_BYTES, ContentSpool
 
-ProgressCallback = Callable[[int, int, TransferItemOutcome], Awaitable[None]]
+# Called with (completed_items, total_items, outcome); total_items is None for streaming plans.
+ProgressCallback = Callable[[int, int | None, TransferItemOutcome], Awaitable[None]]
+
+
+@dataclass
+class _SourceReadCounter:
+    reads: int = 0
+    bytes_read: int = 0
+
+    async def wrap(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        self.reads += 1
+        async for chunk in chunks:
+            self.bytes_read += len(chunk)
+            yield chunk
 
 
 class TransferEngine:
@@ -21,6 +51,12 @@ class TransferEngine:
         checkpoint_store: CheckpointStore | None = None,
         concurrency: int = 1,
         progress_callback: ProgressCallback | None = None,
+        read_mode: TransferReadMode = "double",
+        spool_memory_bytes: int = DEFAULT_SPOOL_MEMORY_BYTES,
+        spool_max_bytes: int | None = None,
+        spool_dir: str | Path | None = None,
+        plan_mode: TransferPlanMode = "materialized",
+        report_outcome_limit: int | None = None,
     ) -> None:
         self.source = source
         self.sink = sink
@@ -29,6 +65,16 @@ class TransferEngine:
         self.checkpoint_store = checkpoint_store
         self.concurrency = max(1, int(concurrency))
         self.progress_callback = progress_callback
+        if read_mode not in {"double", "single"}:
+            raise ValueError(f"unsupported transfer read mode: {read_mode}")
+        self.read_mode: TransferReadMode = read_mode
+        self.spool_memory_bytes = spool_memory_bytes
+        self.spool_max_bytes = spool_max_bytes
+        self.spool_dir = spool_dir
+        if plan_mode not in {"materialized", "streaming"}:
+            raise ValueError(f"unsupported transfer plan mode: {plan_mode}")
+        self.plan_mode: TransferPlanMode = plan_mode
+        self.report_outcome_limit = None if report_outcome_limit is None else max(0, int(report_outcome_limit))
 
     async def build_plan(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferPlan:
         return await self.source.plan(
@@ -67,17 +113,81 @@ class TransferEngine:
                     return outcome
 
             outcomes = await asyncio.gather(*(execute_with_limit(item) for item in plan.items))
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.flush()
         return TransferReport(
             transfer_id=plan.transfer_id,
             source_uri=plan.source_uri,
             destination_uri=plan.destination_uri,
             policy_id=plan.policy_id,
+            read_mode=self.read_mode,
             outcomes=outcomes,
             started_at=started_at,
             completed_at=utcnow(),
         )
 
+    async def execute_stream(self, plan: TransferPlanStream) -> TransferReport:
+        """Execute a lazily produced plan through a bounded worker pool.
+
+        Items are pulled from the source only as workers free up, and the report
+        keeps running totals plus at most `report_outcome_limit` outcomes, so
+        memory stays flat regardless of how many items the source yields.
+        """
+        started_at = utcnow()
+        totals = TransferReportTotals()
+        outcomes: list[TransferItemOutcome] = []
+        progress_lock = asyncio.Lock()
+        queue: asyncio.Queue[TransferItem | None] = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def record_outcome(outcome: TransferItemOutcome) -> None:
+            async with progress_lock:
+                totals.add(outcome)
+                if self.report_outcome_limit is None or len(outcomes) < self.report_outcome_limit:
+                    outcomes.append(outcome)
+                if self.progress_callback is not None:
+                    await self.progress_callback(totals.planned_count, None, outcome)
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                await record_outcome(await self._execute_item(plan.transfer_id, item))
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            async for item in plan.items:
+                await queue.put(item)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.flush()
+        return TransferReport(
+            transfer_id=plan.transfer_id,
+            source_uri=plan.source_uri,
+            destination_uri=plan.destination_uri,
+            policy_id=plan.policy_id,
+            read_mode=self.read_mode,
+            outcomes=outcomes,
+            totals=totals,
+            started_at=started_at,
+            completed_at=utcnow(),
+        )
+
     async def run(self, *, destination_uri: str, transfer_id: str, policy_id: str | None = None) -> TransferReport:
+        if self.plan_mode == "streaming":
+            stream = await self.source.stream_plan(
+                destination_uri=destination_uri,
+                transfer_id=transfer_id,
+                policy_id=policy_id,
+            )
+            return await self.execute_stream(stream)
         plan = await self.build_plan(
             destination_uri=destination_uri,
             transfer_id=transfer_id,
@@ -101,26 +211,16 @@ class TransferEngine:
                 await self._emit_audit(transfer_id, outcome)
                 return outcome
 
-            decision = await self.scan_gate.decide(item, self.source.open_item(item))
+            if self.read_mode == "single":
+                return await self._scan_and_write_single_read(transfer_id, item, started_at)
+            counter = _SourceReadCounter()
+            decision = await self.scan_gate.decide(item, counter.wrap(self.source.open_item(item)))
             if not decision.allowed:
-                outcome = TransferItemOutcome(
-                    item=item,
-                    state=_state_for_non_allow_action(decision.action),
-                    decision=decision,
-                    started_at=started_at,
-                    completed_at=utcnow(),
-                )
+                outcome = self._non_allow_outcome(item, decision, counter, started_at)
                 await self._record_outcome(transfer_id, outcome)
                 return outcome
-            bytes_written = await self.sink.write_item(item, self.source.open_item(item))
-            outcome = TransferItemOutcome(
-                item=item,
-                state="allowed",
-                decision=decision,
-                bytes_written=bytes_written,
-                started_at=started_at,
-                completed_at=utcnow(),
-            )
+            bytes_written = await self.sink.write_item(item, counter.wrap(self.source.open_item(item)))
+            outcome = self._allowed_outcome(item, decision, bytes_written, counter, started_at)
             await self._record_outcome(transfer_id, outcome)
             return outcome
         except Exception as exc:
@@ -137,6 +237,67 @@ class TransferEngine:
             await self._record_outcome(transfer_id, outcome)
             return outcome
 
+    async def _scan_and_write_single_read(
+        self,
+        transfer_id: str,
+        item: TransferItem,
+        started_at: datetime,
+    ) -> TransferItemOutcome:
+        counter = _SourceReadCounter()
+        spool = ContentSpool(
+            memory_threshold_bytes=self.spool_memory_bytes,
+            max_bytes=self.spool_max_bytes,
+            spool_dir=self.spool_dir,
+        )
+        try:
+            decision = await self.scan_gate.decide(item, spool.tee(counter.wrap(self.source.open_item(item))))
+            if not decision.allowed:
+                outcome = self._non_allow_outcome(item, decision, counter, started_at)
+                await self._record_outcome(transfer_id, outcome)
+                return outcome
+            await spool.drain()
+            if spool.complete:
+                chunks = spool.replay()
+            else:
+                chunks = counter.wrap(self.source.open_item(item))
+            bytes_written = await self.sink.write_item(item, chunks)
+        finally:
+            spool.close()
+        outcome = self._allowed_outcome(item, decision, bytes_written, counter, started_at)
+        await self._record_outcome(transfer_id, outcome)
+        return outcome
+
+    @staticmethod
+    def _non_allow_outcome(item: TransferItem, decision, counter: _SourceReadCounter, started_at: datetime) -> TransferItemOutcome:
+        return TransferItemOutcome(
+            item=item,
+            state=_state_for_non_allow_action(decision.action),
+            decision=decision,
+            source_reads=counter.reads,
+            source_bytes_read=counter.bytes_read,
+            started_at=started_at,
+            completed_at=utcnow(),
+        )
+
+    @staticmethod
+    def _allowed_outcome(
+        item: TransferItem,
+        decision,
+        bytes_written: int,
+        counter: _SourceReadCounter,
+        started_at: datetime,
+    ) -> TransferItemOutcome:
+        return TransferItemOutcome(
+            item=item,
+            state="allowed",
+            decision=decision,
+            bytes_written=bytes_written,
+            source_reads=counter.reads,
+            source_bytes_read=counter.bytes_read,
+            started_at=started_at,
+            completed_at=utcnow(),
+        )
+
     async def _get_checkpoint(self, transfer_id: str, item: TransferItem):
         if self.checkpoint_store is None:
             return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Literal
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -13,6 +14,8 @@ def utcnow() -> datetime:
 TransferVerdict = Literal["benign", "malicious", "suspicious", "unknown", "error"]
 TransferAction = Literal["allow", "block", "exclude", "quarantine", "manual_review", "error"]
 TransferItemState = Literal["planned", "allowed", "blocked", "excluded", "failed", "skipped"]
+TransferReadMode = Literal["double", "single"]
+TransferPlanMode = Literal["materialized", "streaming"]
 
 
 class TransferItem(BaseModel):
@@ -34,6 +37,17 @@ class TransferPlan(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+@dataclass
+class TransferPlanStream:
+    """A transfer plan whose items are produced lazily by the source adapter."""
+
+    transfer_id: str
+    source_uri: str
+    destination_uri: str
+    items: AsyncIterator[TransferItem]
+    policy_id: str | None = None
+
+
 class ScanDecision(BaseModel):
     verdict: TransferVerdict
     action: TransferAction
@@ -110,49 +124,114 @@ class TransferItemOutcome(BaseModel):
     state: TransferItemState
     decision: ScanDecision | None = None
     bytes_written: int = 0
+    source_reads: int = 0
+    source_bytes_read: int = 0
     started_at: datetime = Field(default_factory=utcnow)
     completed_at: datetime = Field(default_factory=utcnow)
     error: dict[str, Any] | None = None
 
 
+class TransferReportTotals(BaseModel):
+    """Running counters for reports that do not retain every item outcome."""
+
+    planned_count: int = 0
+    state_counts: dict[str, int] = Field(default_factory=dict)
+    transferred_bytes: int = 0
+    source_bytes_read: int = 0
+
+    def add(self, outcome: TransferItemOutcome) -> None:
+        self.planned_count += 1
+        self.state_counts[outcome.state] = self.state_counts.get(outcome.state, 0) + 1
+        if outcome.state == "allowed":
+            self.transferred_bytes += outcome.bytes_written
+        self.source_bytes_read += outcome.source_bytes_read
+
+
 class TransferReport(BaseModel):
     transfer_id: str
     source_uri: str
     destination_uri: str
     policy_id: str | None = None
+    read_mode: TransferReadMode = "double"
     outcomes: list[TransferItemOutcome] = Field(default_factory=list)
+    totals: TransferReportTotals | None = None
     started_at: datetime = Field(default_factory=utcnow)
     completed_at: datetime = Field(default_factory=utcnow)
 
+    def _state_count(self, state: TransferItemState) -> int:
+        if self.totals is not None:
+            return self.totals.state_counts.get(state, 0)
+        return sum(1 for outcome in self.outcomes if outcome.state == state)
+
     @computed_field
     @property
     def planned_count(self) -> int:
+        if self.totals is not None:
+            return self.totals.planned_count
         return len(self.outcomes)
 
+    @computed_field
+    @property
+    def outcomes_omitted(self) -> int:
+        return self.planned_count - len(self.outcomes)
+
     @computed_field
     @property
     def allowed_count(self) -> int:
-        return sum(1 for outcome in self.outcomes if outcome.state == "allowed")
+        return self._state_count("allowed")
 
     @computed_field
     @property
     def blocked_count(self) -> int:
-        return sum(1 for outcome in self.outcomes if outcome.state == "blocked")
+        return self._state_count("blocked")
 
     @computed_field
     @property
     def failed_count(self) -> int:
-        return sum(1 for outcome in self.outcomes if outcome.state == "failed")
+        return self._state_count("failed")
 
     @computed_field
     @property
     def skipped_count(self) -> int:
-        return sum(1 for outcome in self.outcomes if outcome.state == "skipped")
+        return self._state_count("skipped")
 
     @computed_field
     @property
     def excluded_count(self) -> int:
-        return sum(1 for outcome in self.outcomes if outcome.state == "excluded")
+        return self._state_count("excluded")
+
+    @computed_field
+    @property
+    def elapsed_seconds(self) -> float:
+        return max(0.0, (self.completed_at - self.started_at).total_seconds())
+
+    @computed_field
+    @property
+    def transferred_bytes(self) -> int:
+        if self.totals is not None:
+            return self.totals.transferred_bytes
+        return sum(outcome.bytes_written for outcome in self.outcomes if outcome.state == "allowed")
+
+    @computed_field
+    @property
+    def source_bytes_read(self) -> int:
+        if self.totals is not None:
+            return self.totals.source_bytes_read
+        return sum(outcome.source_bytes_read for outcome in self.outcomes)
+
+    @computed_field
+    @property
+    def throughput_bytes_per_second(self) -> float | None:
+        if self.elapsed_seconds <= 0:
+            return None
+        return round(self.transferred_bytes / self.elapsed_seconds, 3)
+
+    @computed_field
+    @property
+    def source_read_amplification(self) -> float | None:
+        if not self.transferred_bytes:
+            return None
+        return round(self.source_bytes_read / self.transferred_bytes, 3)
 
 
 class CheckpointRecord(BaseModel):
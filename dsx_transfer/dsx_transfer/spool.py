@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+from typing import AsyncIterator
+
+DEFAULT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+DEFAULT_SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+class ContentSpool:
+    """Stage one source read so the scan gate and the sink see the same bytes.
+
+    `tee()` forwards source chunks to the scan gate while copying them into a
+    spool that stays in memory up to `memory_threshold_bytes` and rolls over to
+    a temporary file beyond that. `replay()` then streams the staged bytes to
+    the sink. When `max_bytes` is exceeded the spool stops staging and reports
+    itself incomplete so the caller can fall back to re-reading the source.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_threshold_bytes: int = DEFAULT_SPOOL_MEMORY_BYTES,
+        max_bytes: int | None = None,
+        spool_dir: str | Path | None = None,
+        chunk_size: int = DEFAULT_SPOOL_CHUNK_SIZE,
+    ) -> None:
+        self.memory_threshold_bytes = max(0, int(memory_threshold_bytes))
+        self.max_bytes = max_bytes
+        self.chunk_size = max(1, int(chunk_size))
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=self.memory_threshold_bytes,
+            dir=str(spool_dir) if spool_dir is not None else None,
+        )
+        self._source: AsyncIterator[bytes] | None = None
+        self.bytes_spooled = 0
+        self.exhausted = False
+        self.overflowed = False
+
+    @property
+    def complete(self) -> bool:
+        return self.exhausted and not self.overflowed
+
+    @property
+    def spilled_to_disk(self) -> bool:
+        return bool(getattr(self._file, "_rolled", False))
+
+    async def tee(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        self._source = chunks.__aiter__()
+        async for chunk in self._source:
+            self._stage(chunk)
+            yield chunk
+        self.exhausted = True
+
+    async def drain(self) -> None:
+        """Stage whatever the scan gate left unread from the source."""
+        if self._source is None or self.exhausted or self.overflowed:
+            return
+        async for chunk in self._source:
+            self._stage(chunk)
+            if self.overflowed:
+                return
+        self.exhausted = True
+
+    async def replay(self) -> AsyncIterator[bytes]:
+        if not self.complete:
+            raise RuntimeError("content_spool_incomplete")
+        self._file.seek(0)
+        while True:
+            chunk = self._file.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _stage(self, chunk: bytes) -> None:
+        if self.overflowed:
+            return
+        if self.max_bytes is not None and self.bytes_spooled + len(chunk) > self.max_bytes:
+            self.overflowed = True
+            self._file.truncate(0)
+            return
+        self._file.write(chunk)
+        self.bytes_spooled += len(chunk)
@@ -397,3 +397,18 @@ def test_cli_serve_rejects_invalid_sftpgo_block_response() -> None:
 
     assert result.exit_code != 0
     assert "invalid SFTPGo block response" in result.output
+
+
+def test_cli_checkpoint_convert_writes_log(tmp_path: Path) -> None:
+    json_path = tmp_path / "checkpoint.json"
+    log_path = tmp_path / "checkpoint.log"
+    json_path.write_text("{}", encoding="utf-8")
+
+    result = runner.invoke(app, ["checkpoint", "convert", "--from", str(json_path), "--to", str(log_path)])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["records"] == 0
+    assert log_path.exists()
+
+    result = runner.invoke(app, ["checkpoint", "convert", "--from", str(json_path), "--to", str(log_path)])
+    assert result.exit_code != 0
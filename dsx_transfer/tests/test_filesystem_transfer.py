@@ -113,3 +113,145 @@ def test_transfer_engine_blocks_malicious_files_before_destination_write(tmp_pat
     assert outcomes["bad.exe"].decision is not None
     assert outcomes["bad.exe"].decision.verdict == "malicious"
     assert outcomes["bad.exe"].decision.action == "block"
+
+
+def test_transfer_engine_single_read_mode_reads_source_once(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    write_file(source_root / "a.txt", b"alpha")
+    write_file(source_root / "nested" / "b.txt", b"bravo-charlie")
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root, chunk_size=2),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign", policy_id="policy-allow"),
+        read_mode="single",
+        spool_memory_bytes=4,
+        spool_dir=tmp_path,
+    )
+
+    report = asyncio.run(
+        engine.run(
+            destination_uri=destination_root.as_uri(),
+            transfer_id="transfer-single-read",
+            policy_id="policy-allow",
+        )
+    )
+
+    assert report.read_mode == "single"
+    assert report.allowed_count == 2
+    assert (destination_root / "a.txt").read_bytes() == b"alpha"
+    assert (destination_root / "nested" / "b.txt").read_bytes() == b"bravo-charlie"
+    assert [outcome.source_reads for outcome in report.outcomes] == [1, 1]
+    assert report.source_bytes_read == report.transferred_bytes == 18
+    assert report.source_read_amplification == 1.0
+
+
+def test_transfer_engine_double_read_mode_reports_read_amplification(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    write_file(source_root / "a.txt", b"alpha")
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign"),
+    )
+
+    report = asyncio.run(engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-double-read"))
+
+    assert report.read_mode == "double"
+    assert report.outcomes[0].source_reads == 2
+    assert report.source_bytes_read == 10
+    assert report.source_read_amplification == 2.0
+    assert report.throughput_bytes_per_second is None or report.throughput_bytes_per_second > 0
+
+
+def test_transfer_engine_single_read_mode_falls_back_when_spool_limit_exceeded(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    write_file(source_root / "large.bin", b"0123456789")
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root, chunk_size=3),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign"),
+        read_mode="single",
+        spool_max_bytes=4,
+    )
+
+    report = asyncio.run(engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-spool-limit"))
+
+    assert report.allowed_count == 1
+    assert (destination_root / "large.bin").read_bytes() == b"0123456789"
+    assert report.outcomes[0].source_reads == 2
+
+
+def test_transfer_engine_single_read_mode_does_not_write_blocked_files(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    write_file(source_root / "bad.exe", b"malware")
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign", verdicts_by_identity={"bad.exe": "malicious"}),
+        read_mode="single",
+    )
+
+    report = asyncio.run(engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-single-block"))
+
+    assert report.blocked_count == 1
+    assert report.outcomes[0].source_reads == 1
+    assert not (destination_root / "bad.exe").exists()
+
+
+def test_filesystem_stream_plan_matches_materialized_plan_order(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    for relative in ["b.txt", "a/z.txt", "a.txt", "a/b/c.txt", "c/d.txt"]:
+        write_file(source_root / relative, relative.encode())
+
+    source = FilesystemSourceAdapter(source_root)
+
+    async def collect() -> list[str]:
+        stream = await source.stream_plan(destination_uri="file:///tmp/destination", transfer_id="transfer-stream")
+        return [item.object_identity async for item in stream.items]
+
+    streamed = asyncio.run(collect())
+    expected = [
+        path.relative_to(source_root).as_posix() for path in sorted(source_root.rglob("*")) if path.is_file()
+    ]
+    assert streamed == expected
+
+
+def test_transfer_engine_streaming_plan_mode_bounds_report_outcomes(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    for index in range(6):
+        write_file(source_root / f"file-{index}.txt", b"data")
+    write_file(source_root / "bad.exe", b"malware")
+    progress: list[tuple[int, int | None]] = []
+
+    async def on_progress(completed: int, total: int | None, outcome) -> None:
+        progress.append((completed, total))
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign", verdicts_by_identity={"bad.exe": "malicious"}),
+        concurrency=3,
+        plan_mode="streaming",
+        report_outcome_limit=2,
+        progress_callback=on_progress,
+    )
+
+    report = asyncio.run(engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-streaming"))
+
+    assert report.planned_count == 7
+    assert report.allowed_count == 6
+    assert report.blocked_count == 1
+    assert report.transferred_bytes == 24
+    assert len(report.outcomes) == 2
+    assert report.outcomes_omitted == 5
+    assert progress == [(count, None) for count in range(1, 8)]
+    assert len(list(destination_root.iterdir())) == 6
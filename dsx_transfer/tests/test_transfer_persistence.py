@@ -6,7 +6,7 @@ from pathlib import Path
 
 from dsx_transfer.adapters import FilesystemSinkAdapter, FilesystemSourceAdapter
 from dsx_transfer.audit import JsonLinesAuditSink
-from dsx_transfer.checkpoint import JsonCheckpointStore
+from dsx_transfer.checkpoint import JsonCheckpointStore, LogCheckpointStore, convert_json_checkpoint
 from dsx_transfer.engine import TransferEngine
 from dsx_transfer.scan_gates import StaticVerdictScanGate
 
@@ -103,3 +103,101 @@ def test_checkpoint_store_skips_already_allowed_items_on_rerun(tmp_path: Path) -
     assert (destination_root / "clean.txt").read_bytes() == b"already-present"
     events = load_jsonl(audit_path)
     assert [event["state"] for event in events] == ["allowed", "skipped"]
+
+
+def test_log_checkpoint_store_skips_already_allowed_items_on_rerun(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    checkpoint_path = tmp_path / "checkpoint.log"
+    write_file(source_root / "clean.txt", b"clean")
+    write_file(source_root / "bad.exe", b"malware")
+
+    first_engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign", verdicts_by_identity={"bad.exe": "malicious"}),
+        checkpoint_store=LogCheckpointStore(checkpoint_path, fsync_every=100),
+    )
+    asyncio.run(first_engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-log"))
+
+    assert len(load_jsonl(checkpoint_path)) == 2
+    second_engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="malicious"),
+        checkpoint_store=LogCheckpointStore(checkpoint_path),
+    )
+    second_report = asyncio.run(second_engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-log"))
+
+    states = {outcome.item.object_identity: outcome.state for outcome in second_report.outcomes}
+    assert states == {"bad.exe": "blocked", "clean.txt": "skipped"}
+
+
+def test_log_checkpoint_store_compacts_superseded_records(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.log"
+    store = LogCheckpointStore(checkpoint_path, compact_min_records=4, compact_ratio=2.0)
+    for attempt in range(5):
+        store.put_record("transfer-1:a.txt", {"attempt": attempt})
+    store.put_record("transfer-1:b.txt", {"attempt": 0})
+    store.close()
+
+    entries = load_jsonl(checkpoint_path)
+    assert len(entries) <= 3
+    reopened = LogCheckpointStore(checkpoint_path)
+    assert len(reopened) == 2
+    assert reopened._load_index()["transfer-1:a.txt"] == {"attempt": 4}
+
+
+def test_log_checkpoint_store_ignores_torn_final_line(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.log"
+    store = LogCheckpointStore(checkpoint_path)
+    store.put_record("transfer-1:a.txt", {"attempt": 0})
+    store.close()
+    with checkpoint_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "transfer-1:b.txt", "rec')
+
+    assert len(LogCheckpointStore(checkpoint_path)) == 1
+
+
+def test_log_checkpoint_store_appends_after_torn_final_line(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.log"
+    store = LogCheckpointStore(checkpoint_path)
+    store.put_record("transfer-1:a.txt", {"attempt": 0})
+    store.close()
+    with checkpoint_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "transfer-1:b.txt", "rec')
+
+    resumed = LogCheckpointStore(checkpoint_path)
+    resumed.put_record("transfer-1:c.txt", {"attempt": 0})
+    resumed.close()
+
+    reloaded = LogCheckpointStore(checkpoint_path)._load_index()
+    assert reloaded == {"transfer-1:a.txt": {"attempt": 0}, "transfer-1:c.txt": {"attempt": 0}}
+    assert len(load_jsonl(checkpoint_path)) == 2
+
+
+def test_convert_json_checkpoint_preserves_resume_state(tmp_path: Path) -> None:
+    source_root = tmp_path / "source"
+    destination_root = tmp_path / "destination"
+    json_path = tmp_path / "checkpoint.json"
+    log_path = tmp_path / "checkpoint.log"
+    write_file(source_root / "clean.txt", b"clean")
+
+    engine = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="benign"),
+        checkpoint_store=JsonCheckpointStore(json_path),
+    )
+    asyncio.run(engine.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-convert"))
+
+    assert convert_json_checkpoint(json_path, log_path) == 1
+    resumed = TransferEngine(
+        source=FilesystemSourceAdapter(source_root),
+        sink=FilesystemSinkAdapter(destination_root),
+        scan_gate=StaticVerdictScanGate(default_verdict="malicious"),
+        checkpoint_store=LogCheckpointStore(log_path),
+    )
+    report = asyncio.run(resumed.run(destination_uri=destination_root.as_uri(), transfer_id="transfer-convert"))
+
+    assert report.skipped_count == 1
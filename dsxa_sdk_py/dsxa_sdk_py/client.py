@@ -118,6 +118,7 @@ class DSXAClient(_BaseDSXAClient):
     Client SDK for DSX Application Scanner REST APIs (scan/binary, scan/base64, scan/by_hash, scan/by_path).
 
     The client maintains an httpx.Client underneath; close it via `close()` or use `with DSXAClient(...) as client: ...`.
+    Pass `http_client` to reuse a caller-owned, pooled httpx.Client; `close()` then leaves it open.
     """
 
     def __init__(
@@ -130,6 +131,7 @@ class DSXAClient(_BaseDSXAClient):
         http_proxy: Optional[str] = None,
         default_protected_entity: Optional[int] = None,
         default_metadata: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
         **_legacy_kwargs: Any,
     ):
         super().__init__(
@@ -139,6 +141,10 @@ class DSXAClient(_BaseDSXAClient):
             default_metadata=default_metadata,
             **_legacy_kwargs,
         )
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self._client = http_client
+            return
         client_kwargs: Dict[str, Any] = {
             "timeout": timeout,
             "verify": verify_tls,
@@ -148,7 +154,8 @@ class DSXAClient(_BaseDSXAClient):
         self._client = httpx.Client(**client_kwargs)
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
 
     # -------- Public API --------
     def scan_binary(
@@ -378,6 +385,7 @@ class AsyncDSXAClient(_BaseDSXAClient):
         http_proxy: Optional[str] = None,
         default_protected_entity: Optional[int] = None,
         default_metadata: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
         **_legacy_kwargs: Any,
     ):
         super().__init__(
@@ -387,6 +395,10 @@ class AsyncDSXAClient(_BaseDSXAClient):
             default_metadata=default_metadata,
             **_legacy_kwargs,
         )
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self._client = http_client
+            return
         client_kwargs: Dict[str, Any] = {
             "timeout": timeout,
             "verify": verify_tls,
@@ -402,10 +414,12 @@ class AsyncDSXAClient(_BaseDSXAClient):
         await self.aclose()
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def scan_binary(
         self,
@@ -181,3 +181,14 @@ def test_poll_by_path_breaks_on_scanning(monkeypatch, client, transport):
     monkeypatch.setattr("dsxa_sdk_py.client.DSXAClient._request", fake_request)
     resp = client.poll_scan_by_path("guid-123", interval_seconds=0.01, timeout_seconds=1)
     assert resp.verdict.value == "Benign"
+
+
+def test_shared_http_client_is_not_closed(transport):
+    shared = httpx.Client(transport=transport)
+    client = DSXAClient(base_url="https://scanner.example.com", http_client=shared)
+    client.scan_binary(b"abc")
+    client.close()
+
+    assert not shared.is_closed
+    assert transport.calls[0]["url"] == "https://scanner.example.com/scan/binary/v2"
+    shared.close()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compare peak worker memory for the DIANNA hand-off: buffering the whole connector
+response versus streaming it through a bounded spool file.
+
+A local HTTP server plays both the connector (serves --size-mib of data on POST
+/read_file) and the DIANNA upload endpoint (accepts and discards chunk uploads).
+Each mode runs in its own subprocess so ru_maxrss is not shared between them.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+
+MiB = 1024 * 1024
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    size = 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.path == "/read_file":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(self.size))
+            self.end_headers()
+            block = b"\xa5" * MiB
+            remaining = self.size
+            while remaining > 0:
+                n = min(remaining, len(block))
+                self.wfile.write(block[:n])
+                remaining -= n
+            return
+        body = b'{"status": "UPLOADING", "upload_id": "bench"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return None
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (MiB if sys.platform == "darwin" else 1024), 1)
+
+
+def _upload(client, base_url: str, chunks, total: int) -> int:
+    offset = 0
+    for chunk in chunks:
+        client.post(f"{base_url}/api/v1/dianna/analyzeFile", json={
+            "start_byte": offset,
+            "end_byte": offset + len(chunk) - 1,
+            "total_bytes": total,
+            "file_chunk": base64.b64encode(chunk).decode("ascii"),
+        }).raise_for_status()
+        offset += len(chunk)
+    return offset
+
+
+def run_mode(mode: str, base_url: str, chunk_size: int, spool_memory: int) -> dict[str, Any]:
+    import hashlib
+
+    import httpx
+
+    from dsx_connect.taskworkers.file_spool import iter_spool, spool_stream
+
+    baseline = _peak_rss_mib()
+    started = time.perf_counter()
+    with httpx.Client(timeout=120) as client:
+        if mode == "buffered":
+            data = client.post(f"{base_url}/read_file", json={}).content
+            sha256 = hashlib.sha256(data).hexdigest()
+            sent = _upload(client, base_url, (data[i:i + chunk_size] for i in range(0, len(data), chunk_size)), len(data))
+        else:
+            with client.stream("POST", f"{base_url}/read_file", json={}) as response:
+                response.raise_for_status()
+                spooled = spool_stream(response.iter_bytes(chunk_size=chunk_size), max_memory_bytes=spool_memory)
+            with spooled:
+                sha256 = spooled.sha256
+                sent = _upload(client, base_url, iter_spool(spooled, chunk_size), spooled.size)
+    return {
+        "mode": mode,
+        "bytes": sent,
+        "sha256": sha256,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "baseline_rss_mib": baseline,
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mib", type=int, default=256)
+    parser.add_argument("--chunk-size", type=int, default=4 * MiB)
+    parser.add_argument("--spool-memory", type=int, default=8 * MiB)
+    parser.add_argument("--modes", default="buffered,spooled")
+    parser.add_argument("--child-mode", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_mode:
+        print(json.dumps(run_mode(args.child_mode, args.base_url, args.chunk_size, args.spool_memory)))
+        return 0
+
+    _Handler.size = args.size_mib * MiB
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    results = []
+    try:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            proc = subprocess.run(
+                [
+                    sys.executable, __file__,
+                    "--child-mode", mode,
+                    "--base-url", base_url,
+                    "--chunk-size", str(args.chunk_size),
+                    "--spool-memory", str(args.spool_memory),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(json.dumps({"size_mib": args.size_mib, "chunk_size": args.chunk_size, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
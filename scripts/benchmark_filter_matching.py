@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+DSXCONNECTOR_FILTER evaluation throughput over synthetic object keys.
+
+Compares the per-call path (parse the filter and build PurePosixPath objects for
+every key, as relpath_matches_filter did) with a CompiledFilter built once and
+reused for every key, as the cloud listings now do.
+
+Keys look like 'dept-07/2024/q3/batch-0412/file-0000123.pdf'. Several filters are
+measured, from a single glob to a mix of includes and excludes.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DEFAULT_FILTERS = [
+    "**/*.pdf",
+    "dept-01 dept-02/** -tmp",
+    "**/*.pdf **/*.docx -**/archive/** --exclude tmp",
+]
+_EXTENSIONS = ["pdf", "docx", "txt", "exe", "zip", "bin"]
+
+
+def _keys(count: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    out = []
+    for i in range(count):
+        parts = [f"dept-{rnd.randrange(20):02d}", str(rnd.choice([2023, 2024, 2025])), f"q{rnd.randrange(1, 5)}"]
+        if rnd.random() < 0.1:
+            parts.append(rnd.choice(["tmp", "archive"]))
+        parts.append(f"batch-{rnd.randrange(1000):04d}")
+        parts.append(f"file-{i:07d}.{rnd.choice(_EXTENSIONS)}")
+        out.append("/".join(parts[: rnd.randint(2, len(parts) - 1)] + parts[-1:]))
+    return out
+
+
+def _per_call_match(rel_posix: str, filter_str: str) -> bool:
+    """The pre-CompiledFilter relpath_matches_filter: parse per call, PurePosixPath.match per pattern."""
+    from shared.file_ops import _has_glob, _split_excludes, parse_filter_spec
+
+    rel = rel_posix.strip("/")
+    pp = PurePosixPath(rel)
+    includes, excludes, include_all, top_level_only = parse_filter_spec(filter_str)
+    bare_ex_dirs, glob_ex_paths = _split_excludes(excludes)
+    if any(pp.match(pat) for pat in glob_ex_paths):
+        return False
+    if bare_ex_dirs and any(part in bare_ex_dirs for part in pp.parts[:-1]):
+        return False
+    if include_all:
+        return len(pp.parts) == 1 if top_level_only else True
+
+    def matches_include(tok: str) -> bool:
+        if tok == "*":
+            return len(pp.parts) == 1
+        if tok.endswith("/*") and not _has_glob(tok[:-2]):
+            parent = tok[:-2].strip("/")
+            if not parent:
+                return len(pp.parts) == 1
+            return pp.parts[:-1] == PurePosixPath(parent).parts
+        if not _has_glob(tok) and "/" not in tok:
+            return rel == tok or rel.startswith(tok + "/")
+        if pp.match(tok):
+            return True
+        if tok.startswith("**/"):
+            return PurePosixPath(pp.name).match(tok[3:])
+        return False
+
+    return any(matches_include(t) for t in includes)
+
+
+def _time(fn: Callable[[str], bool], keys: list[str]) -> tuple[float, int]:
+    started = time.perf_counter()
+    hits = sum(1 for k in keys if fn(k))
+    return time.perf_counter() - started, hits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--filter", action="append", dest="filters",
+                        help="Filter string to measure (repeatable); defaults to a representative set")
+    parser.add_argument("--skip-per-call", action="store_true", help="Only time the compiled matcher")
+    args = parser.parse_args()
+
+    from shared.file_ops import CompiledFilter
+
+    keys = _keys(args.keys, args.seed)
+    results: list[dict[str, Any]] = []
+    for filter_str in args.filters or DEFAULT_FILTERS:
+        started = time.perf_counter()
+        cf = CompiledFilter(filter_str)
+        compile_ms = (time.perf_counter() - started) * 1000.0
+        compiled_s, compiled_hits = _time(cf.match, keys)
+        row: dict[str, Any] = {
+            "filter": filter_str,
+            "matched": compiled_hits,
+            "compile_ms": round(compile_ms, 3),
+            "compiled_seconds": round(compiled_s, 3),
+            "compiled_keys_per_second": round(len(keys) / compiled_s) if compiled_s > 0 else None,
+        }
+        if not args.skip_per_call:
+            per_call_s, per_call_hits = _time(lambda k: _per_call_match(k, filter_str), keys)
+            row.update({
+                "per_call_seconds": round(per_call_s, 3),
+                "per_call_keys_per_second": round(len(keys) / per_call_s) if per_call_s > 0 else None,
+                "speedup": round(per_call_s / compiled_s, 1) if compiled_s > 0 else None,
+                "same_result": per_call_hits == compiled_hits,
+            })
+        results.append(row)
+
+    print(json.dumps({"keys": len(keys), "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
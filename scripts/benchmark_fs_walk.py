@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Filesystem full-scan enumeration: the old get_filepaths_async + Path.stat loop vs
+the parallel scandir walker (shared.fs_walk.aiter_walk).
+
+Both modes produce what full_scan_handler needs per file: location, size and mtime.
+A ticker task records the longest event-loop stall during each run.
+
+Without --root a synthetic tree is generated in a temp directory. Local disks answer
+scandir from cache, so --latency-ms adds a delay to every os.scandir call to stand in
+for NFS/SMB round trips. For real numbers, point --root at a network mount.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _populate(root: Path, dirs: int, files_per_dir: int, fanout: int) -> None:
+    for d in range(dirs):
+        # Spread directories over a few levels: d0/, d0/d3/, ...
+        parts, n = [], d
+        while True:
+            parts.append(f"d{n % fanout}")
+            n //= fanout
+            if not n:
+                break
+        sub = root.joinpath(*parts)
+        sub.mkdir(parents=True, exist_ok=True)
+        for i in range(files_per_dir):
+            (sub / f"f{i:05d}.bin").write_bytes(b"x")
+
+
+def _add_scandir_latency(latency_ms: float) -> None:
+    if latency_ms <= 0:
+        return
+    real_scandir = os.scandir
+
+    def _slow_scandir(path="."):
+        time.sleep(latency_ms / 1000.0)
+        return real_scandir(path)
+
+    os.scandir = _slow_scandir
+
+
+async def _measure(mode: str, root: Path, filter_str: str, workers: int) -> dict[str, Any]:
+    from shared.file_ops import get_filepaths_async
+    from shared.fs_walk import aiter_walk
+
+    max_gap = 0.0
+    stop = False
+
+    async def _ticker():
+        nonlocal max_gap
+        last = time.perf_counter()
+        while not stop:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    count = 0
+    total = 0
+    if mode == "legacy":
+        async for p in get_filepaths_async(root, filter_str):
+            st = p.stat()
+            total += st.st_size
+            count += 1
+    else:
+        async for rec in aiter_walk(root, filter_str, workers=workers):
+            total += rec.size
+            count += 1
+    elapsed = time.perf_counter() - started
+    stop = True
+    await ticker
+    return {
+        "mode": mode,
+        "files": count,
+        "bytes": total,
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(count / elapsed, 1) if elapsed > 0 else None,
+        "max_event_loop_stall_ms": round(max_gap * 1000.0, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=None, help="Existing directory to walk instead of a generated tree")
+    parser.add_argument("--dirs", type=int, default=400)
+    parser.add_argument("--files-per-dir", type=int, default=50)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated delay per os.scandir call")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--modes", default="legacy,walker")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.root:
+        root = Path(args.root).expanduser()
+    else:
+        tmp = tempfile.TemporaryDirectory(prefix="fs-walk-bench-")
+        root = Path(tmp.name)
+        _populate(root, args.dirs, args.files_per_dir, args.fanout)
+    _add_scandir_latency(args.latency_ms)
+
+    results = []
+    try:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            results.append(asyncio.run(_measure(mode, root, args.filter, args.workers)))
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    print(json.dumps({
+        "root": str(root) if args.root else None,
+        "dirs": None if args.root else args.dirs,
+        "files_per_dir": None if args.root else args.files_per_dir,
+        "latency_ms": args.latency_ms,
+        "workers": args.workers,
+        "filter": args.filter,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Filesystem monitor event handling: one scan request per event (the old
+MonitorCallback) vs the coalescing MonitorPipeline.
+
+A bulk copy is simulated by writing --files files in --chunks appends each and
+reporting a modify event after every append, the way watchfiles does for a slow
+writer. The scan sink only counts what it receives and sleeps --sink-latency-ms
+per call to stand in for the dsx-connect round trip.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _copy(root: Path, files: int, chunks: int, chunk_size: int, on_event) -> None:
+    payload = b"x" * chunk_size
+    paths = [root / f"f{i:05d}.bin" for i in range(files)]
+    for _ in range(chunks):
+        for p in paths:
+            with p.open("ab") as f:
+                f.write(payload)
+            on_event(p)
+
+
+def _run(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    from connectors.filesystem.monitor_pipeline import MonitorPipeline
+
+    calls = {"sink_calls": 0, "scan_requests": 0}
+    lock = threading.Lock()
+
+    async def sink(requests):
+        await asyncio.sleep(args.sink_latency_ms / 1000.0)
+        with lock:
+            calls["sink_calls"] += 1
+            calls["scan_requests"] += len(requests)
+
+    with tempfile.TemporaryDirectory(prefix="monitor-bench-") as tmp:
+        root = Path(tmp)
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        stats: dict[str, Any] = {}
+        if mode == "per_event":
+            from shared.models.connector_models import ScanRequestModel
+
+            def on_event(p: Path):
+                size = p.stat().st_size
+                asyncio.run(sink([ScanRequestModel(location=str(p), metainfo=p.name, size_in_bytes=size)]))
+
+            _copy(root, args.files, args.chunks, args.chunk_size, on_event)
+        else:
+            pipeline = MonitorPipeline(sink, debounce_ms=args.debounce_ms, batch_size=args.batch_size)
+            pipeline.start()
+            _copy(root, args.files, args.chunks, args.chunk_size, pipeline.submit)
+            deadline = time.monotonic() + 60
+            while pipeline.stats()["flushed"] < args.files and time.monotonic() < deadline:
+                time.sleep(0.01)
+            pipeline.stop()
+            stats = pipeline.stats()
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+    out: dict[str, Any] = {
+        "mode": mode,
+        "events": args.files * args.chunks,
+        **calls,
+        "elapsed_seconds": round(elapsed, 3),
+        "cpu_seconds": round(cpu, 3),
+    }
+    if stats:
+        out["pipeline"] = {k: stats[k] for k in ("coalesced", "unstable", "batches", "max_pending_seen")}
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=20, help="Appends (and modify events) per file")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--sink-latency-ms", type=float, default=2.0)
+    parser.add_argument("--debounce-ms", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--modes", default="per_event,pipeline")
+    args = parser.parse_args()
+
+    results = [_run(m.strip(), args) for m in args.modes.split(",") if m.strip()]
+    print(json.dumps({
+        "files": args.files,
+        "chunks": args.chunks,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Connector CPU per GiB served by the filesystem connector's read_file endpoint.
+
+Modes:
+  stream        the old handler: StreamingResponse over a 1 MiB read() generator
+  file          the current handler: FileResponse (Range-capable)
+  file_ranged   the current handler, read by the NG proxy reader with parallel ranges
+
+Each mode starts a uvicorn server in a child process that serves a generated file,
+downloads it --repeat times, and reads the child's user+system CPU from
+/proc/<pid>/stat before and after (Linux only). Client CPU is not counted.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+MiB = 1024 * 1024
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _serve(mode: str, path: str, port: int) -> None:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.responses import FileResponse, StreamingResponse
+    from starlette.routing import Route
+
+    def stream_file(file_like, chunk_size: int = MiB):
+        while True:
+            chunk = file_like.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    async def read_file(request):
+        await request.body()
+        if mode == "stream":
+            return StreamingResponse(stream_file(open(path, "rb")), media_type="application/octet-stream")
+        response = FileResponse(path, media_type="application/octet-stream")
+        response.chunk_size = MiB
+        return response
+
+    app = Starlette(routes=[Route("/filesystem/read_file", read_file, methods=["POST"])])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime and stime are fields 14 and 15 of the full line
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _download(url: str, mode: str, parallelism: int, part_size: int) -> int:
+    from dsx_connect_ng.jobs.models import ContentSource
+    from dsx_connect_ng.readers import proxy as proxy_module
+    from dsx_connect_ng.readers.contracts import ConnectorProxyReadRequest
+
+    request = ConnectorProxyReadRequest(
+        job_id="bench",
+        job_item_id="bench-1",
+        integration_id="filesystem-bench",
+        object_identity="bench.bin",
+        content_source=ContentSource(mode="original", locator="bench.bin"),
+    )
+    config = proxy_module.ConnectorProxyRuntimeConfig(endpoint_url=url, timeout_seconds=120.0)
+    ranged = mode == "file_ranged"
+    total = 0
+    async for chunk in proxy_module._connector_http_stream_chunks(
+        request,
+        config,
+        chunk_size=MiB,
+        range_parallelism=parallelism if ranged else 1,
+        range_part_size=part_size,
+    ):
+        total += len(chunk)
+    await proxy_module.close_async_proxy_clients()
+    return total
+
+
+def _measure(mode: str, path: Path, size: int, repeat: int, parallelism: int, part_size: int) -> dict[str, Any]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "file" if mode == "file_ranged" else mode, "--path", str(path),
+         "--port", str(port)],
+    )
+    try:
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        url = f"http://127.0.0.1:{port}/filesystem/read_file"
+        cpu_before = _cpu_seconds(server.pid)
+        started = time.perf_counter()
+        served = 0
+        for _ in range(repeat):
+            got = asyncio.run(_download(url, mode, parallelism, part_size))
+            if got != size:
+                raise RuntimeError(f"{mode}: downloaded {got} bytes, expected {size}")
+            served += got
+        elapsed = time.perf_counter() - started
+        cpu = _cpu_seconds(server.pid) - cpu_before
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    gib = served / (1024 * MiB)
+    return {
+        "mode": mode,
+        "served_gib": round(gib, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_mib_s": round(served / MiB / elapsed, 1) if elapsed > 0 else None,
+        "connector_cpu_seconds": round(cpu, 3),
+        "connector_cpu_seconds_per_gib": round(cpu / gib, 3) if gib else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mib", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--part-size-mib", type=int, default=8)
+    parser.add_argument("--modes", default="stream,file,file_ranged")
+    parser.add_argument("--serve", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--path", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.path, args.port)
+        return 0
+
+    size = args.size_mib * MiB
+    results = []
+    with tempfile.TemporaryDirectory(prefix="read-file-bench-") as tmp:
+        path = Path(tmp) / "bench.bin"
+        with path.open("wb") as f:
+            block = os.urandom(MiB)
+            for _ in range(args.size_mib):
+                f.write(block)
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            results.append(_measure(mode, path, size, args.repeat, args.parallelism, args.part_size_mib * MiB))
+
+    print(json.dumps({
+        "size_mib": args.size_mib,
+        "repeat": args.repeat,
+        "parallelism": args.parallelism,
+        "part_size_mib": args.part_size_mib,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
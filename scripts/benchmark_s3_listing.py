@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Listing throughput and event-loop stall for the S3 connector's full-scan enumeration.
+
+Modes:
+  sync        iterate AWSS3Client.keys() inside a coroutine (the old full-scan path)
+  async       AWSS3Client.keys_async(concurrency=1): listing pool + next-page prefetch
+  parallel    AWSS3Client.keys_async(concurrency=N): prefix hints listed in parallel
+
+A ticker task measures the longest gap the event loop went without running, a
+stand-in for how long read_file requests would stall during a full scan.
+
+By default the bucket lives in moto's in-process S3 mock, and --latency-ms adds a
+per-page delay to stand in for network round trips. Use --endpoint-url to run
+against MinIO or another S3-compatible service instead; there the bucket must
+already exist and --populate uploads the keys.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _populate(s3, bucket: str, prefixes: int, keys_per_prefix: int) -> None:
+    for p in range(prefixes):
+        for i in range(keys_per_prefix):
+            s3.put_object(Bucket=bucket, Key=f"p{p}/obj-{i:06d}.bin", Body=b"x")
+
+
+def _add_latency(s3, latency_ms: float) -> None:
+    if latency_ms <= 0:
+        return
+
+    def _sleep(**_kwargs):
+        time.sleep(latency_ms / 1000.0)
+
+    s3.meta.events.register("before-call.s3.ListObjectsV2", _sleep)
+
+
+async def _measure(mode: str, client, bucket: str, filter_str: str, concurrency: int) -> dict[str, Any]:
+    max_gap = 0.0
+    stop = False
+
+    async def _ticker():
+        nonlocal max_gap
+        last = time.perf_counter()
+        while not stop:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    count = 0
+    if mode == "sync":
+        for _ in client.keys(bucket, filter_str=filter_str):
+            count += 1
+            await asyncio.sleep(0)
+    else:
+        async for _ in client.keys_async(bucket, filter_str=filter_str,
+                                         concurrency=1 if mode == "async" else concurrency):
+            count += 1
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    stop = True
+    await ticker
+    return {
+        "mode": mode,
+        "keys": count,
+        "elapsed_seconds": round(elapsed, 3),
+        "keys_per_second": round(count / elapsed, 1) if elapsed > 0 else None,
+        "max_event_loop_stall_ms": round(max_gap * 1000.0, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bucket", default="listing-bench")
+    parser.add_argument("--prefixes", type=int, default=4)
+    parser.add_argument("--keys-per-prefix", type=int, default=2500)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated delay per ListObjectsV2 page")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--modes", default="sync,async,parallel")
+    parser.add_argument("--endpoint-url", default=None, help="S3-compatible endpoint (e.g. MinIO) instead of moto")
+    parser.add_argument("--populate", action="store_true", help="Upload keys to --endpoint-url before measuring")
+    args = parser.parse_args()
+
+    from connectors.aws_s3.aws_s3_client import AWSS3Client
+
+    if args.endpoint_url:
+        mock = contextlib.nullcontext()
+    else:
+        from moto import mock_aws
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        mock = mock_aws()
+
+    filter_str = " ".join(f"p{p}/**" for p in range(args.prefixes))
+    results = []
+    with mock:
+        client = AWSS3Client(concurrent_processing_max=max(10, args.concurrency * 2), s3_endpoint_url=args.endpoint_url)
+        if not args.endpoint_url:
+            client.s3_client.create_bucket(Bucket=args.bucket)
+        if not args.endpoint_url or args.populate:
+            _populate(client.s3_client, args.bucket, args.prefixes, args.keys_per_prefix)
+        _add_latency(client.s3_client, args.latency_ms)
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            results.append(asyncio.run(_measure(mode, client, args.bucket, filter_str, args.concurrency)))
+
+    print(json.dumps({
+        "prefixes": args.prefixes,
+        "keys_per_prefix": args.keys_per_prefix,
+        "latency_ms": args.latency_ms,
+        "concurrency": args.concurrency,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import functools
 import hashlib
 import io
 import os
 import pathlib
+import re
 import shutil
 import shlex
 import time
@@ -239,28 +241,121 @@ def _split_excludes(excludes: Tuple[str, ...]) -> tuple[set[str], Tuple[str, ...
     return bare_dirs, tuple(glob_paths)
 
 
-def _is_excluded_rel(rel_posix: str, glob_paths: Tuple[str, ...]) -> bool:
-    p = PurePosixPath(rel_posix)           # enforces path-aware globbing
-    return any(p.match(pat) for pat in glob_paths)  # '?' won't match '/'
+def _pattern_parts(pat: str) -> tuple[bool, Tuple[str, ...]]:
+    # Split a glob the way PurePosixPath does: '' and '.' components vanish.
+    return pat.startswith("/"), tuple(p for p in pat.split("/") if p and p != ".")
 
 
-def _should_descend(dir_abs: Path, base: Path,
-                    include_all: bool,
-                    include_prefixes: Tuple[str, ...],
-                    bare_ex_dirs: set[str],
-                    glob_ex_paths: Tuple[str, ...]) -> bool:
-    # prune by bare dir name first
-    if dir_abs.name in bare_ex_dirs:
-        return False
-    rel = dir_abs.relative_to(base).as_posix() if dir_abs != base else "."
-    # prune by glob/path excludes
-    if _is_excluded_rel(rel, glob_ex_paths):
+def _glob_part_regex(part: str) -> str:
+    """
+    Regex for one path component of a glob, with PurePath.match semantics.
+
+    '*' and '**' both match within a single component. Character classes are
+    translated by fnmatch and may not match '/'.
+    """
+    out: list[str] = []
+    i, n = 0, len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == "*":
+            while i < n and part[i] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and part[j] == "!":
+                j += 1
+            if j < n and part[j] == "]":
+                j += 1
+            while j < n and part[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+                continue
+            cls = fnmatch.translate(part[i - 1:j + 1])
+            cls = cls[cls.index(":") + 1:cls.rindex(")")]
+            out.append(f"(?!/)(?:{cls})")
+            i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _glob_regex(pat: str) -> Optional[tuple[bool, str]]:
+    """
+    Regex equivalent to PurePosixPath.match(pat), as (anchored, regex).
+
+    Relative patterns match the trailing components of the path, so their regex is
+    floating: it may start at any component boundary. Absolute patterns must match
+    the whole path and are anchored. Returns None for empty patterns.
+    """
+    absolute, parts = _pattern_parts(pat)
+    if not parts:
+        return None
+    body = "/".join(_glob_part_regex(p) for p in parts) + r"\Z"
+    return (True, "/" + body) if absolute else (False, body)
+
+
+def _rglob_regex(pat: str) -> Optional[re.Pattern]:
+    """
+    Regex matching the base-relative file paths that Path.rglob(pat) yields.
+
+    Unlike PurePath.match, '**' here is recursive: as a whole component it spans zero or
+    more directories. A pattern ending in '**' selects directories only, so it matches no
+    file. Returns None for those, for empty patterns, and for absolute patterns (which
+    rglob rejects).
+    """
+    absolute, parts = _pattern_parts(pat)
+    parts = ("**",) + parts
+    if absolute or parts[-1] == "**":
+        return None
+    out: list[str] = []
+    for part in parts[:-1]:
+        out.append("(?:[^/]+/)*" if part == "**" else _glob_part_regex(part) + "/")
+    out.append(_glob_part_regex(parts[-1]) + r"\Z")
+    return re.compile("".join(out), re.DOTALL)
+
+
+def _alternation(alternatives: Iterable[Optional[tuple[bool, str]]]) -> Optional[re.Pattern]:
+    """
+    One regex for a set of (anchored, regex) alternatives, to be applied with .match().
+
+    Floating alternatives share a single leading '(?:.*/)?', which lets the engine try
+    each component boundary without re.search rescanning the key from every offset.
+    """
+    floating: list[str] = []
+    anchored: list[str] = []
+    for alt in dict.fromkeys(a for a in alternatives if a is not None):
+        (anchored if alt[0] else floating).append(alt[1])
+    branches = []
+    if floating:
+        branches.append("(?:.*/)?(?:" + "|".join(floating) + ")")
+    branches.extend(anchored)
+    return re.compile("|".join(f"(?:{b})" for b in branches), re.DOTALL) if branches else None
+
+
+def _normalize_rel(rel: str) -> str:
+    if "//" in rel or "/./" in rel or rel == "." or rel.startswith("./") or rel.endswith(("/.", "/")):
+        lead = "/" if rel.startswith("/") else ""
+        return lead + "/".join(p for p in rel.split("/") if p and p != ".")
+    return rel
+
+
+@functools.lru_cache(maxsize=64)
+def _glob_paths_regex(glob_paths: Tuple[str, ...]) -> Optional[re.Pattern]:
+    return _alternation(_glob_regex(p) for p in glob_paths)
+
+
+def _is_excluded_rel(rel_posix: str, glob_paths: Tuple[str, ...]) -> bool:
+    # Same answer as any(PurePosixPath(rel).match(pat)), from one cached regex per exclude set.
+    rx = _glob_paths_regex(glob_paths) if glob_paths else None
+    if rx is None:
         return False
-    if include_all:
-        return True
-    # descend if this dir is on the path to any include (prefix match)
-    prefix = rel.rstrip("/") + "/"
-    return any(p.startswith(prefix) or p == rel for p in include_prefixes)
+    rel = _normalize_rel(rel_posix)
+    return bool(rel) and rel != "/" and rx.match(rel) is not None
 
 
 def _expand_includes(base: Path, token: str) -> Iterator[Path]:
@@ -304,17 +399,13 @@ def _expand_includes(base: Path, token: str) -> Iterator[Path]:
 
 def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
     base = Path(base_dir)
-    includes, excludes, include_all, top_level_only = parse_filter_spec(filter_str)
+    cf = compile_filter(filter_str or "")
+    top_level_only = cf.top_level_only
 
     # If only excludes were given → start from whole tree
-    include_tokens: List[str] = list(includes) if not include_all else [""]
-
-    bare_ex_dirs, glob_ex_paths = _split_excludes(excludes)
+    include_tokens: List[str] = list(cf.includes) if not cf.include_all else [""]
 
-    # Precompute include prefixes for pruning (dirs only)
-    include_prefixes: Tuple[str, ...] = tuple(
-        tok.rstrip("/") for tok in include_tokens if tok not in ("", "*")
-    )
+    bare_ex_dirs = cf.bare_exclude_dirs
 
     seen: set[Path] = set()
 
@@ -330,19 +421,14 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
 
             for cur, subdirs, files in os.walk(base):
                 cur_path = Path(cur)
+                rel_dir = "." if cur_path == base else cur_path.relative_to(base).as_posix()
                 # prune subdirs in-place
-                keep = []
-                for d in subdirs:
-                    child = cur_path / d
-                    if _should_descend(child, base, True, (), bare_ex_dirs, glob_ex_paths):
-                        keep.append(d)
-                subdirs[:] = keep
+                subdirs[:] = [d for d in subdirs if cf.should_descend(d if rel_dir == "." else f"{rel_dir}/{d}")]
 
-                rel_dir = "." if cur_path == base else cur_path.relative_to(base).as_posix()
                 for fname in files:
                     f = cur_path / fname
                     rel = fname if rel_dir == "." else f"{rel_dir}/{fname}"
-                    if _is_excluded_rel(rel, glob_ex_paths) or f.parent.name in bare_ex_dirs:
+                    if cf.is_excluded(rel) or f.parent.name in bare_ex_dirs:
                         continue
                     if f not in seen:
                         seen.add(f)
@@ -362,7 +448,7 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
             sub = base / inc
             if sub.is_file():
                 rel = sub.relative_to(base).as_posix()
-                if not _is_excluded_rel(rel, glob_ex_paths) and sub.parent.name not in bare_ex_dirs:
+                if not cf.is_excluded(rel) and sub.parent.name not in bare_ex_dirs:
                     if sub not in seen:
                         seen.add(sub); yield sub
                 continue
@@ -380,7 +466,7 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
                         continue
                     # glob/path exclude on the child dir's rel path
                     child_rel = child.relative_to(base).as_posix()
-                    if _is_excluded_rel(child_rel, glob_ex_paths):
+                    if cf.is_excluded(child_rel):
                         continue
                     pruned.append(d)
                 subdirs[:] = pruned
@@ -389,7 +475,7 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
                 for fname in files:
                     f = cur_path / fname
                     rel = f"{rel_dir}/{fname}"
-                    if _is_excluded_rel(rel, glob_ex_paths) or f.parent.name in bare_ex_dirs:
+                    if cf.is_excluded(rel) or f.parent.name in bare_ex_dirs:
                         continue
                     if f not in seen:
                         seen.add(f); yield f
@@ -401,7 +487,7 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
             if sub.is_dir():
                 for f in (q for q in sub.glob("*") if q.is_file()):
                     rel = f.relative_to(base).as_posix()
-                    if _is_excluded_rel(rel, glob_ex_paths) or f.parent.name in bare_ex_dirs:
+                    if cf.is_excluded(rel) or f.parent.name in bare_ex_dirs:
                         continue
                     if f not in seen:
                         seen.add(f); yield f
@@ -414,7 +500,7 @@ def iter_files(base_dir: str | os.PathLike, filter_str: str) -> Iterator[Path]:
             if top_level_only and f.parent != base:
                 continue
             rel = f.relative_to(base).as_posix()
-            if _is_excluded_rel(rel, glob_ex_paths) or f.parent.name in bare_ex_dirs:
+            if cf.is_excluded(rel) or f.parent.name in bare_ex_dirs:
                 continue
             if f not in seen:
                 seen.add(f); yield f
@@ -499,6 +585,110 @@ def get_filepaths(path: str | Path, filter_str: str = "") -> List[Path]:
 # Single-path filter evaluation
 # ==============================
 
+class CompiledFilter:
+    """
+    A DSXCONNECTOR_FILTER string parsed once, for evaluating many paths.
+
+    `match(rel)` gives the same answer as `relpath_matches_filter(rel, filter_str)`, but the
+    parse happens here instead of per call, and the include and exclude globs are each
+    compiled into a single regex alternation, so a key costs two regex searches instead of
+    a PurePosixPath per pattern.
+
+    Use `compile_filter()` to get a cached instance for a filter string.
+    """
+
+    def __init__(self, filter_str: str = ""):
+        self.filter_str = filter_str or ""
+        self.includes, self.excludes, self.include_all, self.top_level_only = parse_filter_spec(self.filter_str)
+        bare_ex_dirs, glob_ex_paths = _split_excludes(self.excludes)
+        self.bare_exclude_dirs: frozenset[str] = frozenset(bare_ex_dirs)
+        self.glob_exclude_paths = glob_ex_paths
+
+        # Bare directory excludes hit any ancestor directory with that name.
+        self._exclude_re = _alternation(
+            [_glob_regex(p) for p in glob_ex_paths]
+            + [(False, re.escape(d) + "/") for d in sorted(self.bare_exclude_dirs)]
+        )
+
+        include_res: list[Optional[tuple[bool, str]]] = []
+        bare_includes: list[str] = []
+        for tok in self.includes:
+            if tok == "*":
+                include_res.append((True, r"[^/]+\Z"))
+            elif tok.endswith("/*") and not _has_glob(tok[:-2]):
+                _, parent = _pattern_parts(tok[:-2].strip("/"))
+                include_res.append((True, "".join(re.escape(p) + "/" for p in parent) + r"[^/]+\Z"))
+            elif not _has_glob(tok) and "/" not in tok:
+                bare_includes.append(tok)
+            else:
+                include_res.append(_glob_regex(tok))
+                if tok.startswith("**/"):
+                    # '**/*.ext' also matches top-level files: the tail is matched against the file name alone
+                    absolute, tail = _pattern_parts(tok[3:])
+                    if not absolute and len(tail) == 1:
+                        include_res.append(_glob_regex(tail[0]))
+        self._include_re = _alternation(include_res)
+        self._bare_includes = frozenset(bare_includes)
+        self._bare_include_prefixes = tuple(f"{tok}/" for tok in bare_includes)
+
+    def __repr__(self) -> str:
+        return f"CompiledFilter({self.filter_str!r})"
+
+    def is_excluded(self, rel_posix: str) -> bool:
+        """True if a glob/path exclude matches rel_posix (bare directory names are not checked)."""
+        return _is_excluded_rel(rel_posix, self.glob_exclude_paths)
+
+    def match(self, rel_posix: str) -> bool:
+        """Whether a base-relative POSIX path (e.g. an object key) passes the filter."""
+        rel = rel_posix.strip("/")
+        norm = _normalize_rel(rel)
+        if not norm:
+            return self.include_all
+        if self._exclude_re is not None and self._exclude_re.match(norm):
+            return False
+        if self.include_all:
+            return True
+        if rel in self._bare_includes or rel.startswith(self._bare_include_prefixes):
+            return True
+        return self._include_re is not None and self._include_re.match(norm) is not None
+
+    def should_descend(self, rel_dir: str) -> bool:
+        """
+        Whether a directory (base-relative, '' or '.' for the base) can hold matching files.
+
+        False when the directory itself is excluded, or when every include is anchored
+        ('*', 'sub1/*', bare subtrees) somewhere this directory does not lead to.
+        """
+        rel = _normalize_rel(rel_dir.strip("/"))
+        if not rel:
+            return True
+        if rel.rsplit("/", 1)[-1] in self.bare_exclude_dirs or self.is_excluded(rel):
+            return False
+        if self.include_all:
+            return True
+        prefix = rel + "/"
+        for tok in self.includes:
+            if tok == "*":
+                continue
+            if tok.endswith("/*") and not _has_glob(tok[:-2]):
+                parent = "/".join(_pattern_parts(tok[:-2].strip("/"))[1])
+                if parent == rel or parent.startswith(prefix):
+                    return True
+            elif not _has_glob(tok) and "/" not in tok:
+                if rel == tok or rel.startswith(tok + "/") or tok.startswith(prefix):
+                    return True
+            else:
+                # Globs match trailing components, so a match can sit under any directory.
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=64)
+def compile_filter(filter_str: str = "") -> CompiledFilter:
+    """Cached CompiledFilter for a filter string; filters come from config, so there are only a few."""
+    return CompiledFilter(filter_str)
+
+
 def path_matches_filter(base_dir: Path | str, file_path: Path | str, filter_str: str = "") -> bool:
     """
     Check if a single file path under base_dir should be included according to
@@ -526,62 +716,7 @@ def path_matches_filter(base_dir: Path | str, file_path: Path | str, filter_str:
     except Exception:
         return False
 
-    includes, excludes, include_all, top_level_only = parse_filter_spec(filter_str)
-    bare_ex_dirs, glob_ex_paths = _split_excludes(excludes)
-
-    # Apply excludes first
-    if _is_excluded_rel(rel, glob_ex_paths):
-        return False
-
-    # Bare directory excludes apply if any ancestor directory name matches
-    rel_pp = PurePosixPath(rel)
-    rel_parts = rel_pp.parts[:-1]  # directories only
-    if bare_ex_dirs and any(part in bare_ex_dirs for part in rel_parts):
-        return False
-
-    # Include-all cases
-    if include_all:
-        if top_level_only:
-            # Only files directly under base
-            return len(rel_pp.parts) == 1
-        return True
-
-    # Otherwise, must match at least one include token
-    def matches_include(tok: str) -> bool:
-        # Top-level only
-        if tok == "*":
-            return len(rel_pp.parts) == 1
-
-        # Direct-children shorthand 'sub1/*' without glob in parent
-        if tok.endswith("/*") and not _has_glob(tok[:-2]):
-            parent = tok[:-2].strip("/")
-            # Parent must match directories exactly and file must be one level below
-            if not parent:
-                return len(rel_pp.parts) == 1
-            # Expect rel to be 'parent/filename' (exactly two parts if parent has no path)
-            parent_parts = PurePosixPath(parent).parts
-            return rel_parts == tuple(parent_parts)
-
-        # Bare subtree name (no globs or slashes): any file under that subtree
-        if not _has_glob(tok) and "/" not in tok:
-            # Accept if rel is in that subtree (e.g., tok == 'sub1' and rel startswith 'sub1/')
-            return rel == tok or rel.startswith(tok + "/")
-
-        # General case: treat tok as a glob/path pattern relative to base
-        try:
-            # Primary check: pattern against relative path
-            if rel_pp.match(tok):
-                return True
-            # Allow common '**/*.ext' style to match top-level files too
-            if tok.startswith("**/"):
-                tail = tok[3:]
-                if PurePosixPath(rel_pp.name).match(tail):
-                    return True
-            return False
-        except Exception:
-            return False
-
-    return any(matches_include(t) for t in includes)
+    return compile_filter(filter_str or "").match(rel)
 
 
 def relpath_matches_filter(rel_posix: str, filter_str: str = "") -> bool:
@@ -591,46 +726,10 @@ def relpath_matches_filter(rel_posix: str, filter_str: str = "") -> bool:
 
     - rel_posix: path relative to a virtual base (e.g., 'sub1/file.txt'). Use forward slashes.
     - filter_str: DSXCONNECTOR_FILTER string.
-    """
-    # Normalize to posix path semantics
-    rel = rel_posix.strip("/")
-    pp = PurePosixPath(rel)
-
-    includes, excludes, include_all, top_level_only = parse_filter_spec(filter_str)
-    bare_ex_dirs, glob_ex_paths = _split_excludes(excludes)
-
-    # Exclude checks
-    if _is_excluded_rel(rel, glob_ex_paths):
-        return False
-    if bare_ex_dirs and any(part in bare_ex_dirs for part in pp.parts[:-1]):
-        return False
-
-    # Include-all cases
-    if include_all:
-        if top_level_only:
-            return len(pp.parts) == 1
-        return True
-
-    def matches_include(tok: str) -> bool:
-        if tok == "*":
-            return len(pp.parts) == 1
-        if tok.endswith("/*") and not _has_glob(tok[:-2]):
-            parent = tok[:-2].strip("/")
-            if not parent:
-                return len(pp.parts) == 1
-            return pp.parts[:-1] == PurePosixPath(parent).parts
-        if not _has_glob(tok) and "/" not in tok:
-            return rel == tok or rel.startswith(tok + "/")
-        # General glob/path pattern
-        if pp.match(tok):
-            return True
-        if tok.startswith("**/"):
-            tail = tok[3:]
-            if PurePosixPath(pp.name).match(tail):
-                return True
-        return False
 
-    return any(matches_include(t) for t in includes)
+    Loops over many keys should hold on to `compile_filter(filter_str)` and call `.match()`.
+    """
+    return compile_filter(filter_str or "").match(rel_posix)
 
 
 def compute_prefix_hints(filter_str: str) -> List[str]:
@@ -678,6 +777,24 @@ def compute_prefix_hints(filter_str: str) -> List[str]:
     return out
 
 
+def disjoint_prefixes(prefixes: List[str]) -> List[str]:
+    """
+    Reduce listing prefixes to a sorted set in which no prefix starts with another.
+
+    Listing under 'a/' already returns every key under 'a/b/', so nested hints are
+    dropped. The remaining listings can never return the same key twice, which lets
+    callers skip de-duplication entirely instead of remembering every key they emitted.
+    """
+    out: list[str] = []
+    for prefix in sorted(set(prefixes)):
+        # Sorted order puts a prefix right before the strings it prefixes, so comparing
+        # against the last kept entry is enough.
+        if out and prefix.startswith(out[-1]):
+            continue
+        out.append(prefix)
+    return out
+
+
 # =======================
 # Async path enumeration
 # =======================
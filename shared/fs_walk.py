@@ -0,0 +1,358 @@
+"""
+Parallel directory walker for filesystem full scans.
+
+`iter_files` walks with os.walk and rglob on one thread, builds a Path for every
+file, and leaves the caller to stat each one again. On NFS/SMB mounts every
+scandir and stat is a network round trip, so a walk over millions of files is
+bound by latency on a single thread. `ParallelWalker` walks differently:
+
+- A fixed set of threads scans directories with os.scandir. Each worker keeps
+  its own deque of directories to visit and pops from it depth-first. An idle
+  worker steals the oldest directory from another worker's deque, which is
+  usually the shallowest and so the largest piece of remaining work.
+- Directories are pruned as they are discovered, using the same rules as
+  `iter_files`. The whole filter is evaluated in a single pass over the tree,
+  so overlapping includes no longer walk a subtree twice or need a set of the
+  paths already yielded.
+- Each matching file becomes a `WalkRecord` with the size and mtime from
+  DirEntry.stat() taken on the worker thread. The consumer builds a scan
+  request without touching the filesystem again.
+- Records reach the consumer in batches through a bounded queue. A slow
+  consumer therefore pauses the walk instead of buffering the tree in memory.
+
+`aiter_walk` feeds the batches to an async consumer through
+`shared.listing.aiter_pages`, so the event loop never blocks on the queue.
+Files come out in no particular order.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+from shared.dsx_logging import dsx_logging
+from shared.file_ops import _has_glob, _pattern_parts, _rglob_regex, compile_filter
+from shared.listing import aiter_pages
+
+DEFAULT_WORKERS = 8
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 32
+
+_DONE = object()
+
+
+@dataclass(slots=True)
+class WalkRecord:
+    path: str       # base_dir joined with rel, as given (not resolved)
+    rel: str        # base-relative POSIX path
+    name: str
+    size: int
+    mtime_ns: int
+
+
+class WalkFilter:
+    """
+    DSXCONNECTOR_FILTER as per-directory and per-file decisions that give the same
+    files as `iter_files`.
+
+    `iter_files` handles each include token separately, each with slightly different
+    rules:
+      - ""        whole tree; prune dirs by bare name or glob exclude
+      - "*"       top-level files, no exclude checks
+      - bare path subtree under base/path; prune dirs below it the same way
+      - "sub/*"   direct children of base/sub
+      - glob      Path.rglob(token), no pruning
+
+    Every token except "*" then drops files that match a glob exclude or whose parent
+    directory has a bare excluded name. A directory carries two flags: whether the
+    whole-tree walk would reach it, and whether some bare-subtree walk would. Both
+    flags are derived from the parent's flags.
+
+    Tokens that reach outside the base (absolute, or containing '..') are not
+    supported; see `supported`.
+    """
+
+    def __init__(self, filter_str: str = ""):
+        self.cf = compile_filter(filter_str or "")
+        cf = self.cf
+        self.supported = True
+        self.include_all = cf.include_all
+        self.top_level = False
+        bare_roots: set[str] = set()
+        direct_dirs: set[str] = set()
+        globs = []
+        for tok in (cf.includes if not cf.include_all else ()):
+            if tok == "*":
+                self.top_level = True
+                continue
+            if not _has_glob(tok) and not tok.endswith("/*"):
+                rel = self._inside_rel(tok)
+                if rel is not None:
+                    bare_roots.add(rel)
+                continue
+            if tok.endswith("/*") and not _has_glob(tok[:-2]):
+                rel = self._inside_rel(tok[:-2])
+                if rel is not None:
+                    direct_dirs.add(rel)
+                continue
+            absolute, parts = _pattern_parts(tok)
+            if absolute or ".." in parts:
+                self.supported = False
+                continue
+            rx = _rglob_regex(tok)
+            if rx is not None:
+                globs.append(rx)
+        self.bare_roots = frozenset(bare_roots)
+        self.direct_dirs = frozenset(direct_dirs)
+        self.globs = tuple(globs)
+        # Directories on the way to a bare subtree or a 'sub/*' directory
+        ancestors: set[str] = set()
+        for rel in bare_roots | direct_dirs:
+            parts = rel.split("/") if rel else []
+            ancestors.update("/".join(parts[:i]) for i in range(len(parts) + 1))
+        self._ancestors = frozenset(ancestors)
+
+    def _inside_rel(self, tok: str) -> Optional[str]:
+        absolute, parts = _pattern_parts(tok.strip("/") if not tok.startswith("/") else tok)
+        if absolute or ".." in parts:
+            self.supported = False
+            return None
+        return "/".join(parts)
+
+    def root_state(self) -> tuple[bool, bool]:
+        return self.include_all, "" in self.bare_roots
+
+    def descend(self, rel: str, name: str, state: tuple[bool, bool]) -> Optional[tuple[bool, bool]]:
+        """State for child directory `rel` of a directory in `state`, or None to prune it."""
+        whole, in_bare = state
+        passes = name not in self.cf.bare_exclude_dirs and not self.cf.is_excluded(rel)
+        whole = whole and passes
+        in_bare = (in_bare and passes) or rel in self.bare_roots
+        if whole or in_bare or self.globs or rel in self._ancestors:
+            return whole, in_bare
+        return None
+
+    def accept(self, rel: str, dir_rel: str, parent_name: str, state: tuple[bool, bool]) -> bool:
+        """Whether file `rel`, directly inside `dir_rel` (a directory in `state`), is yielded."""
+        if self.top_level and not dir_rel:
+            return True
+        whole, in_bare = state
+        if not (whole or in_bare or dir_rel in self.direct_dirs or rel in self.bare_roots
+                or any(rx.match(rel) for rx in self.globs)):
+            return False
+        return parent_name not in self.cf.bare_exclude_dirs and not self.cf.is_excluded(rel)
+
+
+class ParallelWalker:
+    """
+    Walk `base_dir` on `workers` threads and yield batches of `WalkRecord` for the files
+    that pass `filter_str`.
+
+    `skip_dirs` are base-relative directories that are never entered (e.g. a quarantine
+    folder inside the scanned tree). Iterate `batches()` once; closing the generator early
+    stops the workers.
+    """
+
+    def __init__(
+            self,
+            base_dir: str | os.PathLike,
+            filter_str: str = "",
+            *,
+            workers: int = DEFAULT_WORKERS,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            skip_dirs: Iterable[str] = (),
+    ):
+        self.base = os.fspath(Path(base_dir).expanduser())
+        self.filter = WalkFilter(filter_str)
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size))
+        self._out: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._skip = frozenset(s.strip("/") for s in skip_dirs)
+        self._deques = [deque() for _ in range(self.workers)]
+        self._lock = threading.Lock()
+        self._has_work = threading.Condition(self._lock)
+        self._outstanding = 0
+        self._stop = threading.Event()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._live = 0
+        self.dirs_scanned = 0
+        self.errors = 0
+
+    @property
+    def supported(self) -> bool:
+        return self.filter.supported
+
+    def batches(self) -> Iterator[list[WalkRecord]]:
+        if self._live:
+            raise RuntimeError("ParallelWalker can only be iterated once")
+        if not os.path.isdir(self.base):
+            return
+        self._outstanding = 1
+        self._deques[0].append(("", os.path.basename(self.base), self.filter.root_state()))
+        self._live = self.workers
+        threads = [
+            threading.Thread(target=self._run, args=(i,), name=f"fs-walk-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                item = self._out.get()
+                if item is _DONE:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                yield item
+        finally:
+            self._closed = True
+            self._stop.set()
+            with self._has_work:
+                self._has_work.notify_all()
+
+    def __iter__(self) -> Iterator[WalkRecord]:
+        for batch in self.batches():
+            yield from batch
+
+    # -- workers -------------------------------------------------------------
+
+    def _take(self, index: int):
+        own = self._deques[index]
+        try:
+            return own.pop()
+        except IndexError:
+            pass
+        n = self.workers
+        for k in range(1, n):
+            try:
+                return self._deques[(index + k) % n].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, index: int) -> None:
+        batch: list[WalkRecord] = []
+        try:
+            while not self._stop.is_set():
+                work = self._take(index)
+                if work is None:
+                    if batch:
+                        if not self._put(batch):
+                            return
+                        batch = []
+                    with self._has_work:
+                        if self._outstanding == 0:
+                            return
+                        self._has_work.wait(0.05)
+                    continue
+                try:
+                    batch = self._scan(index, work, batch)
+                finally:
+                    with self._has_work:
+                        self._outstanding -= 1
+                        if self._outstanding == 0:
+                            self._has_work.notify_all()
+        except BaseException as e:
+            # Surface to the consumer instead of dying silently; the other workers stop too.
+            self._error = e
+            self._stop.set()
+        finally:
+            with self._lock:
+                self._live -= 1
+                last = self._live == 0
+            if last:
+                self._put_done()
+
+    def _put_done(self) -> None:
+        # Unlike batches, the end marker is delivered even after a stop, unless the consumer is gone.
+        while not self._closed:
+            try:
+                self._out.put(_DONE, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _scan(self, index: int, work, batch: list[WalkRecord]) -> list[WalkRecord]:
+        dir_rel, dir_name, state = work
+        flt = self.filter
+        abs_dir = os.path.join(self.base, dir_rel) if dir_rel else self.base
+        prefix = dir_rel + "/" if dir_rel else ""
+        new_dirs = []
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            rel = prefix + entry.name
+                            if rel in self._skip:
+                                continue
+                            child = flt.descend(rel, entry.name, state)
+                            if child is not None:
+                                new_dirs.append((rel, entry.name, child))
+                            continue
+                        if not entry.is_file():
+                            continue
+                        rel = prefix + entry.name
+                        if not flt.accept(rel, dir_rel, dir_name, state):
+                            continue
+                        st = entry.stat()
+                    except OSError as e:
+                        self.errors += 1
+                        dsx_logging.debug(f"fs_walk: skipping {entry.path}: {e}")
+                        continue
+                    batch.append(WalkRecord(
+                        path=os.path.join(self.base, rel),
+                        rel=rel,
+                        name=entry.name,
+                        size=st.st_size,
+                        mtime_ns=st.st_mtime_ns,
+                    ))
+                    if len(batch) >= self.batch_size:
+                        if not self._put(batch):
+                            return []
+                        batch = []
+        except OSError as e:
+            # Same as os.walk: unreadable directories are skipped
+            self.errors += 1
+            dsx_logging.debug(f"fs_walk: cannot scan {abs_dir}: {e}")
+        self.dirs_scanned += 1
+        if new_dirs:
+            with self._has_work:
+                self._outstanding += len(new_dirs)
+                self._deques[index].extend(new_dirs)
+                self._has_work.notify(len(new_dirs))
+        return batch
+
+
+async def aiter_walk(
+        base_dir: str | os.PathLike,
+        filter_str: str = "",
+        *,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        skip_dirs: Iterable[str] = (),
+) -> AsyncIterator[WalkRecord]:
+    """Yield the walk's records without blocking the event loop."""
+    walker = ParallelWalker(base_dir, filter_str, workers=workers, batch_size=batch_size,
+                            queue_size=queue_size, skip_dirs=skip_dirs)
+    if not walker.supported:
+        raise ValueError(f"filter {filter_str!r} reaches outside the base directory; use iter_files")
+    async for batch in aiter_pages(walker.batches()):
+        for record in batch:
+            yield record
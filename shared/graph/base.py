@@ -5,6 +5,7 @@ import base64
 import importlib
 import json
 import time
+from email.utils import parsedate_to_datetime
 from typing import Optional, Sequence, Tuple
 
 import httpx
@@ -40,6 +41,8 @@ class MSGraphClientBase:
         self._client_session: Optional[httpx.AsyncClient] = None
         self._token_cache: dict[Tuple[str, ...], Tuple[str, float]] = {}
         self._claims_logged_scopes: set[Tuple[str, ...]] = set()
+        # Adaptive pacing for throttled calls (see get_paced)
+        self._pace_delay: float = 0.0
 
     # ---------------------- MSAL helpers ----------------------
     def _ensure_msal_app(self):
@@ -129,3 +132,51 @@ class MSGraphClientBase:
         if extra:
             headers.update(extra)
         return headers
+
+    # ---------------------- Throttling ----------------------
+    THROTTLE_STATUS = (429, 503)
+    MAX_PACE_DELAY = 10.0
+
+    @staticmethod
+    def _retry_after_seconds(resp: httpx.Response) -> Optional[float]:
+        raw = (resp.headers.get("Retry-After") or "").strip()
+        if not raw:
+            return None
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+        except Exception:
+            return None
+
+    async def get_paced(self, url: str, *, headers: dict, max_retries: int = 6) -> httpx.Response:
+        """
+        GET that honours Graph throttling (429/503 + Retry-After) with adaptive pacing.
+
+        A throttled response is retried after Retry-After seconds (exponential backoff when the
+        header is missing), and every later request through this client waits a pacing delay
+        that doubles on each throttle and halves on each success. Long enumerations thus slow
+        down to what the tenant allows instead of tripping the throttle on every page.
+        """
+        http_client = await self.get_client()
+        attempt = 0
+        while True:
+            if self._pace_delay > 0:
+                await asyncio.sleep(self._pace_delay)
+            resp = await http_client.get(url, headers=headers)
+            if resp.status_code not in self.THROTTLE_STATUS or attempt >= max_retries:
+                if resp.status_code not in self.THROTTLE_STATUS:
+                    self._pace_delay = self._pace_delay / 2 if self._pace_delay > 0.05 else 0.0
+                return resp
+            attempt += 1
+            wait = self._retry_after_seconds(resp)
+            if wait is None:
+                wait = min(60.0, 2.0 ** attempt)
+            self._pace_delay = min(self.MAX_PACE_DELAY, max(self._pace_delay * 2, 0.25))
+            dsx_logging.info(
+                f"Graph throttled (HTTP {resp.status_code}); retry {attempt}/{max_retries} in {wait:.1f}s, "
+                f"pacing {self._pace_delay:.2f}s between requests"
+            )
+            await asyncio.sleep(wait)
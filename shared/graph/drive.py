@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from shared.graph.base import MSGraphClientBase
 from shared.dsx_logging import dsx_logging
@@ -14,7 +16,22 @@ def build_drive_item_path(parent_reference: dict, name: str) -> str:
     return (path.strip("/") + "/" + name).strip("/") if path else name
 
 
-async def delta_changes(
+@dataclass
+class DeltaPage:
+    """One page of a drive delta query."""
+    items: List[dict]
+    # Set while more pages follow: resuming from it continues this enumeration.
+    next_link: Optional[str] = None
+    # Set on the last page: the cursor for the next sync.
+    delta_link: Optional[str] = None
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """The URL to resume from after this page has been processed."""
+        return self.next_link or self.delta_link
+
+
+async def iter_delta_pages(
     client: MSGraphClientBase,
     drive_resource: str,
     cursor: Optional[str],
@@ -22,13 +39,14 @@ async def delta_changes(
     page_size: int = 200,
     select: Optional[str] = None,
     skip_deleted: bool = True,
-) -> Tuple[List[dict], Optional[str]]:
+) -> AsyncIterator[DeltaPage]:
     """
-    Fetch drive changes since the provided delta cursor.
+    Yield drive changes since the provided cursor, one page at a time.
 
-    Returns (items, new_cursor).
+    The cursor may be a delta link from a finished sync or a next link checkpointed mid-way
+    through one; Graph resumes either. Requests go through `get_paced`, so throttling
+    (429/503 + Retry-After) slows the enumeration down instead of failing it.
     """
-    http_client = await client.get_client()
     headers = await client.auth_headers(
         extra={
             "Prefer": f"odata.maxpagesize={page_size}",
@@ -36,16 +54,14 @@ async def delta_changes(
         }
     )
     select_clause = select or "id,name,file,folder,parentReference,lastModifiedDateTime,eTag,webUrl"
-    url = cursor or client.graph_url(f"{drive_resource.rstrip('/')}/root/delta?$select={select_clause}")
-
-    collected: List[dict] = []
-    new_cursor: Optional[str] = None
+    url: Optional[str] = cursor or client.graph_url(f"{drive_resource.rstrip('/')}/root/delta?$select={select_clause}")
 
     while url:
-        resp = await http_client.get(url, headers=headers)
+        resp = await client.get_paced(url, headers=headers)
         resp.raise_for_status()
         data = resp.json()
 
+        items: List[dict] = []
         for item in data.get("value", []):
             if skip_deleted and item.get("deleted"):
                 continue
@@ -53,18 +69,65 @@ async def delta_changes(
             item_path = build_drive_item_path(item.get("parentReference") or {}, name)
             if item_path:
                 item = {**item, "path": item_path}
-            collected.append(item)
+            items.append(item)
 
         next_url = data.get("@odata.nextLink")
         if next_url:
+            yield DeltaPage(items=items, next_link=next_url)
             url = next_url
             continue
-        new_cursor = data.get("@odata.deltaLink")
-        break
+        yield DeltaPage(items=items, delta_link=data.get("@odata.deltaLink"))
+        return
+
+
+async def delta_changes(
+    client: MSGraphClientBase,
+    drive_resource: str,
+    cursor: Optional[str],
+    *,
+    page_size: int = 200,
+    select: Optional[str] = None,
+    skip_deleted: bool = True,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Fetch drive changes since the provided delta cursor.
 
+    Returns (items, new_cursor). Holds every item in memory; large syncs should use
+    iter_delta_pages with run_drive_delta instead.
+    """
+    collected: List[dict] = []
+    new_cursor: Optional[str] = None
+    async for page in iter_delta_pages(
+        client, drive_resource, cursor, page_size=page_size, select=select, skip_deleted=skip_deleted
+    ):
+        collected.extend(page.items)
+        new_cursor = page.delta_link
     return collected, new_cursor
 
 
+async def run_drive_delta(
+    pages: AsyncIterator[DeltaPage],
+    *,
+    process_items: Callable[[List[dict]], Awaitable[object]],
+    checkpoint: Callable[[str], Awaitable[None]],
+) -> int:
+    """
+    Process delta pages as they arrive, checkpointing the cursor after each page.
+
+    The cursor is saved only once the page's items have been handed to process_items, so a
+    crash re-processes at most one page (at-least-once) and a restart resumes from the last
+    checkpoint instead of from the previous delta link. Returns the number of items seen.
+    """
+    seen = 0
+    async for page in pages:
+        if page.items:
+            await process_items(page.items)
+            seen += len(page.items)
+        if page.cursor:
+            await checkpoint(page.cursor)
+    return seen
+
+
 async def process_drive_delta_items(
     items: Sequence[dict],
     *,
@@ -76,10 +139,12 @@ async def process_drive_delta_items(
     filter_text: str,
     sample_limit: int = 5,
     metainfo_fn: Optional[Callable[[str, dict, str], str]] = None,
+    concurrency: int = 1,
 ) -> Tuple[int, Dict[str, int]]:
     """
     Apply scoped filtering and enqueue callbacks for delta items common to SharePoint/OneDrive connectors.
 
+    Up to `concurrency` enqueue_file calls run at once; all have finished when this returns.
     Returns a tuple of (enqueued_count, skip_counts).
     """
     exclude: Set[str] = set(exclude_ids or ())
@@ -87,6 +152,23 @@ async def process_drive_delta_items(
     enqueued = 0
     sampler_limit = max(0, sample_limit)
     metainfo = metainfo_fn or (lambda normalized, item, item_id: normalized or item.get("name") or item_id)
+    limit = max(1, int(concurrency or 1))
+    pending: Set[asyncio.Task] = set()
+
+    async def _enqueue(item_id: str, info: str, item: dict) -> bool:
+        try:
+            await enqueue_file(item_id, info, item)
+            return True
+        except Exception as exc:
+            dsx_logging.warning(f"{log_prefix} delta enqueue failed for item {item_id}: {exc}")
+            return False
+
+    async def _drain(wait_for_all: bool) -> None:
+        nonlocal enqueued, pending
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.ALL_COMPLETED if wait_for_all else asyncio.FIRST_COMPLETED
+        )
+        enqueued += sum(1 for task in done if task.result())
 
     for item in items:
         item_id = str(item.get("id") or "").strip()
@@ -112,11 +194,16 @@ async def process_drive_delta_items(
             if skip_counts["no_file"] <= sampler_limit:
                 dsx_logging.debug(f"{log_prefix} delta skip (no file) item_id={item_id} path='{path}'")
             continue
-        try:
-            await enqueue_file(item_id, metainfo(normalized, item, item_id), item)
-            enqueued += 1
-        except Exception as exc:
-            dsx_logging.warning(f"{log_prefix} delta enqueue failed for item {item_id}: {exc}")
+        if limit == 1:
+            if await _enqueue(item_id, metainfo(normalized, item, item_id), item):
+                enqueued += 1
+            continue
+        pending.add(asyncio.create_task(_enqueue(item_id, metainfo(normalized, item, item_id), item)))
+        if len(pending) >= limit:
+            await _drain(wait_for_all=False)
+
+    if pending:
+        await _drain(wait_for_all=True)
 
     if any(skip_counts.values()):
         dsx_logging.debug(
@@ -0,0 +1,179 @@
+"""
+Non-blocking object listing for cloud storage connectors.
+
+The storage SDKs (boto3, azure-storage-blob, google-cloud-storage) paginate
+synchronously. Calling them from an async full-scan handler blocks the
+connector's event loop for every page fetch, and that stalls the read_file
+requests dsx-connect sends while the scan is running. This module moves listing
+onto a dedicated thread pool:
+
+- A client describes a listing as a `ListingPlan`. The plan holds one source per
+  provider prefix and an `emit` function that filters and maps raw SDK objects.
+  `emit` runs on the listing thread, so filter matching does not run on the
+  event loop either. Sources must not overlap (see
+  `shared.file_ops.disjoint_prefixes`), so no key is emitted twice and nothing
+  needs to remember the keys already emitted.
+- `aiter_pages` pulls pages from a blocking iterator on the listing pool. The next
+  page is already being fetched while the caller handles the current one.
+- `aiter_plan` lists up to `concurrency` sources in parallel and yields their
+  items as pages arrive. The interleaving across prefixes is arbitrary.
+  `iter_plan` is the synchronous, sequential equivalent used by `keys()`.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CONCURRENCY = 4
+
+_DONE = object()
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def listing_executor(max_workers: int = 16) -> ThreadPoolExecutor:
+    """Process-wide pool reserved for listing, so slow listings cannot starve asyncio.to_thread users."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="listing")
+    return _EXECUTOR
+
+
+@dataclass
+class ListingPlan:
+    # One callable per provider listing (e.g. per prefix hint); each returns raw SDK objects.
+    sources: list[Callable[[], Iterable[Any]]]
+    # Raw SDK object -> key dict ({'Key', 'Size', ...}), or None to skip it.
+    emit: Callable[[Any], Optional[dict]]
+
+
+def _item_pages(source: Callable[[], Iterable[Any]], emit: Callable[[Any], Optional[dict]], page_size: int) -> Iterator[list[dict]]:
+    page: list[dict] = []
+    for raw in source():
+        item = emit(raw)
+        if item is None:
+            continue
+        page.append(item)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def iter_plan(plan: ListingPlan) -> Iterator[dict]:
+    """Sequential, blocking iteration over every source of a plan."""
+    for source in plan.sources:
+        for raw in source():
+            item = plan.emit(raw)
+            if item is not None:
+                yield item
+
+
+async def aiter_pages(
+        pages: Iterable[list],
+        *,
+        executor: Optional[ThreadPoolExecutor] = None,
+) -> AsyncIterator[list]:
+    """
+    Iterate a blocking page iterator from the listing pool, one page ahead of the consumer.
+
+    Each page fetch runs in the pool; as soon as a page arrives the fetch of the next one is
+    started, then the page is handed to the caller.
+    """
+    loop = asyncio.get_running_loop()
+    executor = executor or listing_executor()
+    it = iter(pages)
+
+    def _next():
+        return next(it, _DONE)
+
+    pending = loop.run_in_executor(executor, _next)
+    try:
+        while True:
+            page = await pending
+            pending = None
+            if page is _DONE:
+                return
+            pending = loop.run_in_executor(executor, _next)
+            yield page
+    finally:
+        if pending is not None:
+            # Consumer stopped early: let the in-flight fetch finish in the pool, then close the iterator there.
+            def _close(_fut):
+                close = getattr(it, "close", None)
+                if close is not None:
+                    executor.submit(close)
+            pending.add_done_callback(_close)
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list]:
+    page: list = []
+    for item in items:
+        page.append(item)
+        if len(page) >= size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+async def aiter_blocking(
+        items: Iterable[Any],
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        executor: Optional[ThreadPoolExecutor] = None,
+) -> AsyncIterator[Any]:
+    """Iterate any blocking item iterator (e.g. a client's sync `keys()`) from the listing pool, in pages."""
+    async for page in aiter_pages(_batched(items, page_size), executor=executor):
+        for item in page:
+            yield item
+
+
+async def aiter_plan(
+        plan: ListingPlan,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        executor: Optional[ThreadPoolExecutor] = None,
+) -> AsyncIterator[dict]:
+    """Yield the plan's items without blocking the event loop, listing up to `concurrency` sources at once."""
+    if len(plan.sources) <= 1 or concurrency <= 1:
+        for source in plan.sources:
+            async for page in aiter_pages(_item_pages(source, plan.emit, page_size), executor=executor):
+                for item in page:
+                    yield item
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(2, concurrency * 2))
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _list(source) -> None:
+        try:
+            async with sem:
+                async for page in aiter_pages(_item_pages(source, plan.emit, page_size), executor=executor):
+                    await queue.put(page)
+            await queue.put(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put(e)
+
+    tasks = [asyncio.create_task(_list(source)) for source in plan.sources]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            page = await queue.get()
+            if page is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(page, BaseException):
+                raise page
+            for item in page:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
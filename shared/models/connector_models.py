@@ -104,3 +104,6 @@ class ScanRequestModel(BaseModel):
     job_item_id: str | None = None
     # Optional origin hint for control-plane jobs created through connector-side enqueueing.
     scan_source: str | None = None
+    # Optional change token (mtime, ETag, generation) for incremental full scans.
+    # Used only by the connector-side object state index; never sent to dsx-connect.
+    object_fingerprint: str | None = Field(default=None, exclude=True)
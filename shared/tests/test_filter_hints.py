@@ -1,9 +1,13 @@
+from pathlib import PurePosixPath
+
 import pytest
 
 from shared.file_ops import parse_filter_spec
 from shared.file_ops import _has_glob
 from shared.file_ops import relpath_matches_filter
 from shared.file_ops import compute_prefix_hints
+from shared.file_ops import disjoint_prefixes
+from shared.file_ops import compile_filter
 
 
 @pytest.mark.parametrize(
@@ -28,6 +32,7 @@ from shared.file_ops import compute_prefix_hints
 )
 def test_relpath_matches_filter(filt, path, expect):
     assert relpath_matches_filter(path, filt) is expect
+    assert compile_filter(filt).match(path) is expect
 
 
 @pytest.mark.parametrize(
@@ -45,3 +50,39 @@ def test_relpath_matches_filter(filt, path, expect):
 )
 def test_compute_prefix_hints(filt, expected):
     assert compute_prefix_hints(filt) == expected
+
+
+@pytest.mark.parametrize(
+    "prefixes, expect",
+    [
+        ([], []),
+        (["b/", "a/"], ["a/", "b/"]),
+        (["a/", "a/b/", "a/b/c/"], ["a/"]),
+        (["a/b/", "a/", "ab/", "a0/"], ["a/", "a0/", "ab/"]),
+        (["x/y/", "x/z/", "x/y/", "x/y/w/"], ["x/y/", "x/z/"]),
+    ],
+)
+def test_disjoint_prefixes_drops_nested_hints(prefixes, expect):
+    assert disjoint_prefixes(prefixes) == expect
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["*.txt", "a/*", "**/*.pdf", "a/**/*", "[!a]*", "x/[b-c]?.log", "*/tmp", "/a/*"],
+)
+def test_compiled_globs_follow_purepath_match(pattern):
+    cf = compile_filter(f"-{pattern}")
+    for rel in ["a.txt", "a/b.txt", "a/b/c.pdf", "b/a.pdf", "x/bb.log", "x/c1.log", "q/tmp", "q/tmp/z"]:
+        assert cf.is_excluded(rel) is PurePosixPath(rel).match(pattern), rel
+
+
+def test_compiled_filter_should_descend():
+    cf = compile_filter("reports exports/* -tmp")
+    assert cf.should_descend("reports")
+    assert cf.should_descend("reports/2024/q1")
+    assert cf.should_descend("exports")
+    assert not cf.should_descend("exports/nested")
+    assert not cf.should_descend("other")
+    assert not cf.should_descend("reports/2024/tmp")
+    # Globs match trailing components, so any directory may hold a match
+    assert compile_filter("**/*.pdf").should_descend("any/where")
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from shared.file_ops import iter_files
+from shared.fs_walk import ParallelWalker, aiter_walk
+
+_FILES = [
+    "top.txt", "top.pdf",
+    "a/1.txt", "a/b/2.pdf", "a/tmp/3.txt", "a/b/c/4.txt",
+    "tmp/5.txt", "reports/2024/6.pdf", "reports/tmp/7.txt", "ab/8.txt",
+]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel in _FILES:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "filt",
+    ["", "*", "a", "a/*", "a/**", "**/*.pdf", "-tmp", "reports -tmp", "*.txt -a/b/*", "a **/*.txt", "tmp/*"],
+)
+def test_walker_yields_the_same_files_as_iter_files(tree, filt):
+    walked = sorted(r.path for r in ParallelWalker(tree, filt, workers=3, batch_size=2, queue_size=1))
+    assert walked == sorted(str(p) for p in iter_files(tree, filt))
+
+
+@pytest.mark.asyncio
+async def test_aiter_walk_records_carry_stat_and_honour_skip_dirs(tree):
+    records = [r async for r in aiter_walk(tree, "", workers=2, skip_dirs=["a"])]
+    by_rel = {r.rel: r for r in records}
+    assert sorted(by_rel) == sorted(rel for rel in _FILES if not rel.startswith("a/"))
+    st = (tree / "reports/2024/6.pdf").stat()
+    rec = by_rel["reports/2024/6.pdf"]
+    assert (rec.name, rec.size, rec.mtime_ns) == ("6.pdf", st.st_size, st.st_mtime_ns)
+
+
+def test_closing_the_walk_early_stops_the_workers(tmp_path):
+    for d in range(50):
+        (tmp_path / f"d{d}").mkdir()
+        for i in range(20):
+            (tmp_path / f"d{d}" / f"f{i}").write_text("x")
+    before = threading.active_count()
+    walker = ParallelWalker(tmp_path, "", workers=4, batch_size=5, queue_size=1)
+    batches = walker.batches()
+    assert len(next(batches)) == 5
+    batches.close()
+    for t in [t for t in threading.enumerate() if t.name.startswith("fs-walk-")]:
+        t.join(timeout=2)
+    assert threading.active_count() <= before
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+import pytest
+
+from shared.graph.base import MSGraphClientBase
+from shared.graph.drive import iter_delta_pages, process_drive_delta_items, run_drive_delta
+
+
+class _FakeGraph(MSGraphClientBase):
+    def __init__(self, handler):
+        super().__init__("tenant", "client", "secret")
+        self._client_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_access_token(self, scopes=None) -> str:
+        return "token"
+
+
+def _page(n: int, last: bool) -> dict:
+    body = {"value": [{"id": f"i{n}", "name": f"f{n}.txt", "file": {"mimeType": "text/plain"}, "parentReference": {"path": "/drive/root:/docs"}}]}
+    body["@odata.deltaLink" if last else "@odata.nextLink"] = (
+        "https://graph/delta?token=final" if last else f"https://graph/delta?page={n + 1}"
+    )
+    return body
+
+
+@pytest.mark.asyncio
+async def test_delta_pages_stream_checkpoint_and_resume():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        n = int(request.url.params.get("page", 0))
+        return httpx.Response(200, json=_page(n, last=n == 2))
+
+    graph = _FakeGraph(handler)
+    checkpoints = []
+    processed = []
+    fail_on = {"docs/f1.txt"}
+
+    async def process(items):
+        processed.append([i["path"] for i in items])
+        if fail_on & {i["path"] for i in items}:
+            fail_on.clear()
+            raise RuntimeError("enqueue failed")
+
+    async def checkpoint(cursor):
+        checkpoints.append(cursor)
+
+    with pytest.raises(RuntimeError):
+        await run_drive_delta(iter_delta_pages(graph, "drives/d", None), process_items=process, checkpoint=checkpoint)
+    # Only the page that was fully processed is checkpointed
+    assert processed == [["docs/f0.txt"], ["docs/f1.txt"]]
+    assert checkpoints == ["https://graph/delta?page=1"]
+
+    processed.clear()
+    seen = await run_drive_delta(iter_delta_pages(graph, "drives/d", checkpoints[-1]),
+                                 process_items=process, checkpoint=checkpoint)
+    assert seen == 2
+    assert processed == [["docs/f1.txt"], ["docs/f2.txt"]]
+    assert checkpoints[-1] == "https://graph/delta?token=final"
+    assert requested[-2:] == ["https://graph/delta?page=1", "https://graph/delta?page=2"]
+    await graph.close()
+
+
+@pytest.mark.asyncio
+async def test_throttled_pages_wait_for_retry_after(monkeypatch):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "3"})
+        return httpx.Response(200, json=_page(0, last=True))
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    graph = _FakeGraph(handler)
+    pages = [p async for p in iter_delta_pages(graph, "drives/d", None)]
+
+    assert [p.delta_link for p in pages] == ["https://graph/delta?token=final"]
+    # Retry-After honoured, then the paced retry
+    assert sleeps == [3.0, 0.25]
+    assert graph._pace_delay == 0.125
+    await graph.close()
+
+
+@pytest.mark.asyncio
+async def test_process_drive_delta_items_bounds_concurrent_enqueues():
+    in_flight = 0
+    peak = 0
+
+    async def enqueue(item_id, metainfo, item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    items = [{"id": f"i{n}", "name": f"f{n}", "file": {"mimeType": "text/plain"}, "path": f"f{n}"} for n in range(10)]
+    enqueued, _ = await process_drive_delta_items(
+        items,
+        path_in_scope=lambda p: (True, p),
+        enqueue_file=enqueue,
+        log_prefix="test",
+        base_path="",
+        filter_text="",
+        concurrency=3,
+    )
+    assert enqueued == 10
+    assert peak == 3
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from shared.listing import ListingPlan, aiter_blocking, aiter_plan
+
+
+def _slow_source(keys, delay=0.01):
+    def _objects():
+        for key in keys:
+            time.sleep(delay)
+            yield {"Key": key}
+    return _objects
+
+
+def _emit(obj):
+    return None if obj["Key"].endswith(".tmp") else obj
+
+
+@pytest.mark.asyncio
+async def test_plan_lists_sources_in_parallel_without_blocking_the_loop():
+    plan = ListingPlan(
+        sources=[_slow_source([f"p{p}/k{i}" for i in range(10)] + [f"p{p}/x.tmp"]) for p in range(4)],
+        emit=_emit,
+    )
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker = asyncio.create_task(_ticker())
+    started = time.perf_counter()
+    keys = [item["Key"] async for item in aiter_plan(plan, concurrency=4, page_size=3)]
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+
+    assert sorted(keys) == sorted(f"p{p}/k{i}" for p in range(4) for i in range(10))
+    # Four 110 ms listings in parallel, not 440 ms in sequence, and the loop kept running meanwhile.
+    assert elapsed < 0.35
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_source_errors_propagate_and_early_stop_closes_the_listing():
+    def _broken():
+        yield {"Key": "ok"}
+        raise RuntimeError("listing failed")
+
+    with pytest.raises(RuntimeError):
+        async for _ in aiter_plan(ListingPlan(sources=[_broken, _slow_source(["b"])], emit=_emit), concurrency=2):
+            pass
+
+    closed = threading.Event()
+
+    def _endless():
+        try:
+            i = 0
+            while True:
+                i += 1
+                yield i
+        finally:
+            closed.set()
+
+    async for item in aiter_blocking(_endless(), page_size=5):
+        if item >= 12:
+            break
+    assert await asyncio.to_thread(closed.wait, 2)
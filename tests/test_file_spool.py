@@ -0,0 +1,40 @@
+import hashlib
+
+import pytest
+
+from dsx_connect.taskworkers.file_spool import iter_spool, spool_stream
+
+
+def _chunks(total: int, size: int):
+    data = bytes(range(256)) * (total // 256 + 1)
+    data = data[:total]
+    return data, [data[i:i + size] for i in range(0, total, size)]
+
+
+def test_spool_small_stream_stays_in_memory():
+    data, chunks = _chunks(10_000, 1000)
+    with spool_stream(iter(chunks + [b""]), max_memory_bytes=64 * 1024) as spooled:
+        assert spooled.size == len(data)
+        assert spooled.sha256 == hashlib.sha256(data).hexdigest()
+        assert not spooled.on_disk
+        assert b"".join(iter_spool(spooled, 4096)) == data
+
+
+def test_spool_large_stream_rolls_to_disk_and_rereads(tmp_path):
+    data, chunks = _chunks(300_000, 7000)
+    with spool_stream(chunks, max_memory_bytes=64 * 1024, spool_dir=str(tmp_path)) as spooled:
+        assert spooled.on_disk
+        parts = list(iter_spool(spooled, 100_000))
+        assert [len(p) for p in parts] == [100_000, 100_000, 100_000]
+        assert b"".join(parts) == data
+        # A second pass (e.g. a retried upload) starts from the beginning again.
+        assert b"".join(iter_spool(spooled, 100_000)) == data
+
+
+def test_spool_closes_file_when_source_fails():
+    def failing():
+        yield b"abc"
+        raise ConnectionError("connector went away")
+
+    with pytest.raises(ConnectionError):
+        spool_stream(failing(), max_memory_bytes=16)
@@ -0,0 +1,59 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dsx_connect.taskworkers import http_pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return None
+
+
+@pytest.fixture()
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_client_reuses_connection_and_counts_handshakes(server_url):
+    client = http_pool.build_pooled_client("test_reuse", timeout=5.0, max_connections=4)
+    try:
+        for _ in range(3):
+            assert client.get(f"{server_url}/").text == "ok"
+    finally:
+        client.close()
+
+    stats = http_pool.http_pool_stats()["test_reuse"]
+    assert stats["requests"] == 3
+    assert stats["tcp_connects"] == 1
+    assert stats["reused"] == 2
+
+
+def test_connector_client_pool_is_built_once_per_url(monkeypatch):
+    import dsx_connect.connectors.client as client_mod
+
+    monkeypatch.setattr(client_mod, "_sync_pool", {})
+    with client_mod.get_connector_client("http://svc:9000"):
+        first = client_mod._sync_pool["http://svc:9000"]
+    with client_mod.get_connector_client("http://svc:9000"):
+        second = client_mod._sync_pool["http://svc:9000"]
+
+    assert first is second
+    client_mod.close_connector_clients()
+    assert first.is_closed
+    assert client_mod._sync_pool == {}
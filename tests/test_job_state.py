@@ -0,0 +1,74 @@
+import pytest
+
+from dsx_connect.taskworkers import job_state
+
+
+@pytest.fixture
+def job_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    r = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(job_state, "_REDIS", r)
+    return r
+
+
+def test_terminal_counts_outcomes_and_completes_exactly_once(job_redis):
+    job_state.record_scan_request_enqueued_many([("job-1", "t1"), ("job-1", "t2"), ("job-1", "t3")])
+    # Items may finish before the enqueuer marks the job done; that must not complete it
+    data = job_state.record_scan_request_terminal("job-1", "success")
+    assert data["status"] == "running" and "finished_at" not in data
+
+    job_redis.hset("dsxconnect:job:job-1", "enqueue_done", "1")
+    data = job_state.record_scan_request_terminal("job-1", "failed")
+    assert data["status"] == "running"
+    data = job_state.record_scan_request_terminal("job-1", "skipped")
+    assert data["status"] == "completed"
+    finished_at = data["finished_at"]
+
+    # A late duplicate is counted but does not complete the job again
+    data = job_state.record_scan_request_terminal("job-1", "success")
+    assert data["finished_at"] == finished_at
+    assert (data["succeeded_count"], data["failed_count"], data["skipped_count"]) == ("2", "1", "1")
+    assert (data["terminal_count"], data["processed_count"], data["enqueued_total"]) == ("4", "4", "3")
+    assert job_redis.ttl("dsxconnect:job:job-1") > 0
+    assert job_state.record_scan_request_terminal("job-1", "bogus") is None
+
+
+def test_terminal_keeps_a_cancelled_job_cancelled(job_redis):
+    job_state.record_scan_request_enqueued("job-c", task_id="t1")
+    job_redis.hset("dsxconnect:job:job-c", mapping={"enqueue_done": "1", "status": "cancelled"})
+
+    data = job_state.record_scan_request_terminal("job-c", "cancelled")
+
+    assert data["status"] == "cancelled"
+    assert data["cancelled_count"] == "1" and "finished_at" in data
+
+
+def test_batched_enqueue_groups_per_job_in_one_pipeline(job_redis, monkeypatch):
+    pipelines = []
+    pipeline = job_redis.pipeline
+
+    def recording_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        def counted_execute(*a, **k):
+            pipelines.append(len(pipe.command_stack))
+            return execute(*a, **k)
+
+        pipe.execute = counted_execute
+        return pipe
+
+    monkeypatch.setattr(job_redis, "pipeline", recording_pipeline)
+
+    result = job_state.record_scan_request_enqueued_many(
+        [("job-a", "t1"), ("job-b", "t2"), ("job-a", "t3"), (None, "t4")]
+    )
+
+    # One script call per job, both in a single round trip
+    assert pipelines == [2]
+    assert result["job-a"]["enqueued_count"] == "2"
+    assert result["job-a"]["expected_total"] == "2"
+    assert result["job-b"]["enqueued_count"] == "1"
+    assert job_redis.lrange("dsxconnect:job:job-a:tasks", 0, -1) == ["t1", "t3"]
+    assert job_redis.lrange("dsxconnect:job:job-b:tasks", 0, -1) == ["t2"]
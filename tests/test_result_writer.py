@@ -0,0 +1,152 @@
+import time
+
+from dsx_connect.database import scan_results_redis
+from dsx_connect.models.scan_result import ScanResultModel
+from dsx_connect.taskworkers.result_writer import ScanResultWriter
+
+
+class _RecordingDB:
+    def __init__(self):
+        self.batches = []
+
+    def insert_many(self, results):
+        self.batches.append([r.scan_request_task_id for r in results])
+
+
+def _result(i: int) -> ScanResultModel:
+    return ScanResultModel(scan_request_task_id=f"t{i}", scan_job_id="job-1")
+
+
+def test_writer_flushes_full_batches_then_on_timer():
+    db = _RecordingDB()
+    writer = ScanResultWriter(db, max_batch=3, flush_ms=50)
+    for i in range(4):
+        writer.add(_result(i))
+    assert db.batches == [["t0", "t1", "t2"]]
+
+    deadline = time.monotonic() + 2
+    while len(db.batches) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert db.batches == [["t0", "t1", "t2"], ["t3"]]
+
+    writer.add(_result(4))
+    writer.close()
+    assert db.batches[-1] == ["t4"]
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        self._redis.round_trips += 1
+        self._redis.pipelines.append(self.commands)
+        return [None] * len(self.commands)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.seq = 0
+        self.round_trips = 0
+        self.pipelines = []
+
+    def register_script(self, lua):
+        return lambda keys, args: None
+
+    def type(self, key):
+        return b"none"
+
+    def incrby(self, key, n):
+        self.round_trips += 1
+        self.seq += n
+        return self.seq
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+def test_redis_insert_many_is_two_round_trips_and_stores_payload_once(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(scan_results_redis.redis, "from_url", lambda *a, **k: fake)
+    db = scan_results_redis.ScanResultsRedisDB()
+
+    batch = [_result(i) for i in range(5)]
+    db.insert_many(batch)
+
+    assert [r.id for r in batch] == [1, 2, 3, 4, 5]
+    assert fake.round_trips == 2
+    commands = fake.pipelines[0]
+    hsets = [c for c in commands if c[0] == "hset"]
+    assert len(hsets) == 1 and sorted(hsets[0][2]["mapping"]) == [1, 2, 3, 4, 5]
+    # Task lookups and job index hold ids only
+    task_sets = [c for c in commands if c[0] == "set"]
+    assert [c[1] for c in task_sets][:2] == [("dsxconnect:scan_result_by_task:t0", 1),
+                                             ("dsxconnect:scan_result_by_task:t1", 2)]
+    job_adds = [c for c in commands if c[0] == "zadd" and ":by_job:" in c[1][0]]
+    assert job_adds == [("zadd", ("dsxconnect:scan_results:by_job:job-1", {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}), {})]
+
+
+class _LegacyRedis(_FakeRedis):
+    """Holds the pre-index layout: a newest-first list of full payloads."""
+
+    def __init__(self, legacy_payloads):
+        super().__init__()
+        self.lists = {"dsxconnect:scan_results": list(legacy_payloads)}
+        self.keys = {"dsxconnect:scan_results_by_job:job-1": b"[...]"}
+
+    def type(self, key):
+        return b"list" if self.lists.get(key) else b"none"
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    def expire(self, key, seconds):
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.keys.pop(key, None)
+            self.lists.pop(key, None)
+
+    def lrange(self, key, start, end):
+        assert end == -1
+        return self.lists.get(key, [])[start:]
+
+    def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:len(items) + end + 1]
+
+    def scan_iter(self, pattern):
+        prefix = pattern.rstrip("*")
+        return [k for k in list(self.keys) if k.startswith(prefix)]
+
+
+def test_redis_migrates_legacy_list_once_oldest_first(monkeypatch):
+    legacy = [_result(i) for i in range(3)]
+    for i, sr in enumerate(legacy, start=1):
+        sr.id = i
+    # Legacy list is newest-first
+    fake = _LegacyRedis([sr.model_dump_json().encode() for sr in reversed(legacy)])
+    monkeypatch.setattr(scan_results_redis, "_MIGRATE_BATCH", 2)
+    monkeypatch.setattr(scan_results_redis.redis, "from_url", lambda *a, **k: fake)
+
+    scan_results_redis.ScanResultsRedisDB()
+
+    hsets = [c[2]["mapping"] for p in fake.pipelines for c in p if c[0] == "hset"]
+    # Two batches, oldest first, ids kept
+    assert [sorted(m) for m in hsets] == [[1, 2], [3]]
+    assert fake.lists["dsxconnect:scan_results"] == []
+    assert ("delete", ("dsxconnect:scan_results_by_job:job-1",), {}) in fake.pipelines[-1]
+    assert "dsxconnect:scan_results:migrate_lock" not in fake.keys
+
+    # Nothing left to move on the next start
+    pipelines = len(fake.pipelines)
+    scan_results_redis.ScanResultsRedisDB()
+    assert len(fake.pipelines) == pipelines
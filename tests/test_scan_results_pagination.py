@@ -0,0 +1,82 @@
+import pytest
+
+from dsx_connect.database import scan_results_redis
+from dsx_connect.database.scan_results_collection import ScanResultsCollection
+from dsx_connect.models.scan_result import ScanResultModel
+from dsxa_sdk_py.models import FileInfo, ScanResponse, VerdictDetails, VerdictEnum
+
+
+def _result(i: int) -> ScanResultModel:
+    return ScanResultModel(
+        scan_request_task_id=f"t{i}",
+        scan_job_id=f"job-{i % 2}",
+        verdict=ScanResponse(
+            scan_guid="g",
+            verdict=VerdictEnum.MALICIOUS if i % 3 == 0 else VerdictEnum.BENIGN,
+            verdict_details=VerdictDetails(event_description=""),
+            file_info=FileInfo(file_type="x", file_size_in_bytes=1, file_hash=""),
+        ),
+    )
+
+
+@pytest.fixture(params=["collection", "redis"])
+def db(request, monkeypatch):
+    if request.param == "collection":
+        return ScanResultsCollection()
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    fake = fakeredis.FakeRedis()
+    monkeypatch.setattr(scan_results_redis.redis, "from_url", lambda *a, **k: fake)
+    return scan_results_redis.ScanResultsRedisDB()
+
+
+def test_cursor_pages_walk_all_matching_results_newest_first(db):
+    for i in range(25):
+        db.insert(_result(i))
+
+    seen, cursor = [], None
+    while True:
+        items, cursor = db.page(4, cursor=cursor, job_id="job-0")
+        seen.extend(r.id for r in items)
+        if cursor is None:
+            break
+
+    assert seen == sorted((i + 1 for i in range(25) if i % 2 == 0), reverse=True)
+
+    malicious, cursor = db.page(100, verdict=VerdictEnum.MALICIOUS.value)
+    assert [r.id for r in malicious] == [i + 1 for i in reversed(range(25)) if i % 3 == 0]
+    assert cursor is None
+
+
+def test_no_cursor_when_exactly_limit_results_remain(db):
+    for i in range(25):
+        db.insert(_result(i))
+
+    # job-0 holds 13 results
+    items, cursor = db.page(13, job_id="job-0")
+    assert len(items) == 13 and cursor is None
+
+    items, cursor = db.page(12, job_id="job-0")
+    assert len(items) == 12 and cursor == items[-1].id
+    rest, cursor = db.page(12, cursor=cursor, job_id="job-0")
+    assert [r.id for r in rest] == [1] and cursor is None
+
+
+def test_redis_delete_removes_ids_from_every_index(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    fake = fakeredis.FakeRedis()
+    monkeypatch.setattr(scan_results_redis.redis, "from_url", lambda *a, **k: fake)
+    db = scan_results_redis.ScanResultsRedisDB()
+    for i in range(6):
+        db.insert(_result(i))
+
+    removed = db.delete("id", 4)  # task t3: job-1, malicious
+
+    assert removed.scan_request_task_id == "t3"
+    assert 4 not in [r.id for r in db.find("scan_job_id", "job-1")]
+    assert 4 not in [r.id for r in db.find("verdict", VerdictEnum.MALICIOUS.value)]
+    for key in fake.keys("dsxconnect:scan_results:by_*"):
+        assert fake.zscore(key, 4) is None, key
+    items, cursor = db.page(10, verdict=VerdictEnum.MALICIOUS.value)
+    assert [r.id for r in items] == [1] and cursor is None
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from dsx_connect.database import scan_stats_redis
+from dsx_connect.database.scan_stats_collection import ScanStatsCollection
+from dsx_connect.database.scan_stats_sketch import QuantileSketch
+from dsx_connect.database.scan_stats_worker import ScanStatsWorker
+from dsx_connect.models.scan_result import ScanResultModel
+from dsxa_sdk_py.models import FileInfo, ScanResponse, VerdictDetails, VerdictEnum
+
+
+def _result(scan_us: int, size: int, verdict=VerdictEnum.BENIGN, reason: str | None = None) -> ScanResultModel:
+    return ScanResultModel(
+        scan_request_task_id="t",
+        metadata_tag=f"file-{scan_us}",
+        verdict=ScanResponse(
+            scan_guid="g",
+            verdict=verdict,
+            verdict_details=VerdictDetails(event_description="", reason=reason),
+            file_info=FileInfo(file_type="x", file_size_in_bytes=size, file_hash=""),
+            scan_duration_in_microseconds=scan_us,
+        ),
+    )
+
+
+def test_sketch_quantiles_are_within_relative_accuracy_and_mergeable():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(8, 2) for _ in range(20000)]
+    left, right = QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        (left if i % 2 else right).add(value)
+    left.merge(right)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(left.quantile(q) - exact) <= 0.011 * exact
+    assert left.count == len(values)
+    assert len(left.counts) < 2000
+
+
+def test_collection_records_counters_longest_and_quantiles():
+    db = ScanStatsCollection()
+    worker = ScanStatsWorker(db)
+    for scan_us in range(1, 101):
+        worker.insert(_result(scan_us * 1000, scan_us * 10))
+    worker.insert(_result(5, 0, VerdictEnum.NOT_SCANNED, reason="Encrypted File"))
+
+    stats = worker.get_scan_stats()
+
+    assert stats.files_scanned == 101
+    assert stats.benign_count == 100
+    assert stats.not_scanned_count == 1 and stats.encrypted_count == 1
+    assert stats.total_scan_time_in_microseconds == sum(i * 1000 for i in range(1, 101)) + 5
+    assert stats.longest_scan_time_in_microseconds == 100000
+    assert stats.longest_scan_time_file == "file-100000"
+    assert abs(stats.p50_scan_time_in_microseconds - 50000) <= 1000
+    assert abs(stats.p99_scan_time_in_microseconds - 99000) <= 2000
+    assert stats.median_file_size_in_bytes == stats.p50_file_size_in_bytes
+
+
+@pytest.fixture
+def redis_stats(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        scan_stats_redis.redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs),
+    )
+    return scan_stats_redis.ScanStatsRedisDB(shards=4, window_seconds=3600, window_retention_seconds=24 * 3600)
+
+
+def test_redis_record_script_aggregates_across_shards_and_windows(redis_stats, monkeypatch):
+    clock = {"now": 1_700_000_000.0}
+    monkeypatch.setattr(scan_stats_redis.time, "time", lambda: clock["now"])
+    pids = iter(range(1000))
+    monkeypatch.setattr(scan_stats_redis.os, "getpid", lambda: next(pids))
+
+    # Two hours ago: slow scans; this hour: fast scans
+    clock["now"] -= 2 * 3600
+    for scan_us in range(1, 51):
+        redis_stats.record(_result(scan_us * 100_000, scan_us * 10))
+    clock["now"] += 2 * 3600
+    for scan_us in range(1, 51):
+        redis_stats.record(_result(scan_us * 1000, scan_us * 10))
+    redis_stats.record(_result(5, 0, VerdictEnum.NOT_SCANNED, reason="Encrypted File"))
+
+    # Counters went to several shard hashes and are summed back together
+    assert len(redis_stats._r.keys("dsxconnect:scan_stats:counters:*")) == 4
+    overall = redis_stats.get()
+    assert overall.files_scanned == 101
+    assert overall.benign_count == 100
+    assert overall.not_scanned_count == 1 and overall.encrypted_count == 1
+    assert overall.longest_scan_time_in_microseconds == 5_000_000
+    assert overall.longest_scan_time_file == "file-5000000"
+    assert abs(overall.p99_scan_time_in_microseconds - 5_000_000) <= 0.02 * 5_000_000
+
+    recent = redis_stats.get(window_hours=1)
+    assert recent.files_scanned == 101
+    # Only this hour's fast scans are in the one-hour window
+    assert recent.p99_scan_time_in_microseconds <= 51_000
+    # Older windows are merged in once the range covers them
+    wider = redis_stats.get(window_hours=3)
+    assert wider.p99_scan_time_in_microseconds >= 4_800_000
+    assert redis_stats._r.ttl("dsxconnect:scan_stats:sketch:scan_time:" + str(redis_stats._window(clock["now"]))) > 0
+
+
+def test_redis_get_clamps_window_hours_to_retention(redis_stats, monkeypatch):
+    fetched = []
+    pipeline = redis_stats._r.pipeline
+
+    def counting_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        hgetall = pipe.hgetall
+        pipe.hgetall = lambda key: fetched.append(key) or hgetall(key)
+        return pipe
+
+    monkeypatch.setattr(redis_stats._r, "pipeline", counting_pipeline)
+    redis_stats.get(window_hours=10**9)
+
+    sketch_keys = [k for k in fetched if ":sketch:" in k]
+    # 24 hourly windows per metric
+    assert len(sketch_keys) == 2 * 24
+
+
+def test_scan_stats_route_rejects_window_beyond_retention():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from dsx_connect.app.routers import scan_results
+    from shared.routes import Action, DSXConnectAPI, ScanPath, route_name
+
+    app = FastAPI()
+    app.include_router(scan_results.router)
+    client = TestClient(app)
+    path = app.url_path_for(route_name(DSXConnectAPI.SCAN_PREFIX, ScanPath.STATS, Action.GET))
+
+    assert client.get(path, params={"window_hours": 169}).status_code == 422
+    assert client.get(path, params={"window_hours": 0}).status_code == 422
@@ -0,0 +1,85 @@
+from dsx_connect.taskworkers import scanner_admission
+from dsx_connect.taskworkers.scanner_admission import ScannerAdmission, wait_bucket
+
+
+class _FakeRedis:
+    """Grants a lease only after `free_after` denied attempts; each denial is followed by a BLPOP."""
+
+    def __init__(self, free_after: int):
+        self.free_after = free_after
+        self.attempts = []
+        self.blpops = []
+        self.released = []
+        self.blocked = {}
+        self.calls = []
+
+    def register_script(self, lua):
+        if "ZREM" in lua and "LPUSH" in lua:
+            return lambda keys, args: self.released.append((keys, args[0])) or 1
+
+        def admit(keys, args):
+            self.calls.append("admit")
+            self.attempts.append(args)
+            if len(self.attempts) > self.free_after:
+                return [1, 3]
+            return [0, 4]
+
+        return admit
+
+    def blpop(self, keys, timeout=0):
+        self.calls.append("blpop")
+        self.blpops.append((keys, timeout))
+        return None
+
+    def zadd(self, key, mapping):
+        self.calls.append("zadd")
+        self.blocked.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.calls.append("zrem")
+        self.blocked.get(key, {}).pop(member, None)
+
+
+def test_acquire_blocks_on_wakeup_list_until_a_lease_is_free():
+    r = _FakeRedis(free_after=2)
+    admission = ScannerAdmission(r, max_inflight=4, max_wait_seconds=5, poll_seconds=0.2, fair_share=True)
+
+    lease, inflight = admission.acquire("conn-a")
+
+    assert lease is not None and inflight == 3
+    # Registered as blocked before waiting, re-tried once, and unregistered once admitted.
+    assert r.calls == ["admit", "zadd", "admit", "blpop", "admit", "zrem"]
+    assert r.blpops == [(["dsxconnect:scanner:wakeup"], 0.2)]
+    assert r.blocked == {"dsxconnect:scanner:blocked": {}}
+    # The same lease id is retried, and the fair-share flag and connector are passed through.
+    assert {args[0] for args in r.attempts} == {lease.lease_id}
+    assert r.attempts[0][4:6] == ["1", "conn-a"]
+
+    admission.release(lease)
+    assert r.released == [(
+        [
+            "dsxconnect:scanner:leases",
+            "dsxconnect:scanner:leases:conn-a",
+            "dsxconnect:scanner:wakeup",
+            "dsxconnect:scanner:blocked",
+        ],
+        lease.lease_id,
+    )]
+
+
+def test_acquire_gives_up_after_max_wait():
+    r = _FakeRedis(free_after=10**6)
+    admission = ScannerAdmission(r, max_inflight=4, max_wait_seconds=0)
+
+    lease, inflight = admission.acquire("conn-a")
+
+    assert lease is None and inflight == 4
+    assert r.blpops == []
+    assert r.blocked == {}
+
+
+def test_wait_buckets():
+    assert wait_bucket(0) == "le_0"
+    assert wait_bucket(42) == "le_50"
+    assert wait_bucket(10**6) == "le_inf"
+    assert scanner_admission.WAIT_BUCKETS_MS[-1] == 30000
@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+from dsx_connect.messaging.fanout import FanoutHub, job_status_coalesce_key
+
+
+def _job_status(job_id, processed):
+    return json.dumps({"type": "scan_result", "scan_result": {"type": "job_status"},
+                       "job": {"job_id": job_id, "processed_count": processed}})
+
+
+class _Source:
+    """Stands in for one Redis pub/sub subscription; counts how often the hub subscribes."""
+
+    def __init__(self):
+        self.subscriptions = 0
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def __call__(self):
+        self.subscriptions += 1
+        return self._listen()
+
+    async def _listen(self):
+        while True:
+            yield await self.queue.get()
+
+
+@pytest.mark.asyncio
+async def test_hub_uses_one_subscription_for_many_clients():
+    source = _Source()
+    hub = FanoutHub(source, client_queue_size=10)
+    clients = [hub.subscribe() for _ in range(50)]
+    await asyncio.sleep(0)
+    for i in range(3):
+        source.queue.put_nowait(json.dumps({"n": i}).encode())
+    await asyncio.sleep(0.05)
+    try:
+        assert source.subscriptions == 1
+        for client in clients:
+            got = [json.loads((await client.get(0.1)).data)["n"] for _ in range(3)]
+            assert got == [0, 1, 2]
+    finally:
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_drops_oldest_and_coalesces_job_status():
+    hub = FanoutHub(lambda: None, client_queue_size=3, coalesce_key=job_status_coalesce_key)
+    client = hub.subscribe()
+    try:
+        hub.publish_raw(_job_status("j1", 1))
+        hub.publish_raw(json.dumps({"n": 1}))
+        hub.publish_raw(_job_status("j1", 2))
+        assert len(client) == 2
+        hub.publish_raw(json.dumps({"n": 2}))
+        hub.publish_raw(json.dumps({"n": 3}))
+        hub.publish_raw("not json")
+        assert client.dropped == 1
+        got = [json.loads((await client.get(0.1)).data) for _ in range(3)]
+        assert got[0]["job"]["processed_count"] == 2
+        assert got[1:] == [{"n": 2}, {"n": 3}]
+        assert await client.get(0.01) is None
+    finally:
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_events_keep_delivered_ids_increasing():
+    hub = FanoutHub(lambda: None, client_queue_size=10, coalesce_key=job_status_coalesce_key)
+    client = hub.subscribe()
+    try:
+        hub.publish_raw(_job_status("j1", 1))
+        hub.publish_raw(json.dumps({"n": 1}))
+        hub.publish_raw(_job_status("j2", 1))
+        hub.publish_raw(json.dumps({"n": 2}))
+        latest = hub.publish_raw(_job_status("j1", 2))
+
+        delivered = []
+        while (event := await client.get(0.01)) is not None:
+            delivered.append(event)
+
+        seqs = [e.seq for e in delivered]
+        assert seqs == sorted(seqs) == [2, 3, 4, 5]
+        # The newest j1 state moved behind everything queued after the state it replaced
+        assert delivered[-1].id == latest.id
+    finally:
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_history_from_same_process():
+    hub = FanoutHub(lambda: None, history_size=3)
+    try:
+        events = [hub.publish_raw(json.dumps({"n": i})) for i in range(5)]
+        client = hub.subscribe(last_event_id=events[2].id)
+        assert [json.loads((await client.get(0.1)).data)["n"] for _ in range(2)] == [3, 4]
+        assert hub.replay_since("otherepoch-1") == []
+        assert [e.seq for e in hub.replay_since(events[0].id)] == [3, 4, 5]
+    finally:
+        await hub.stop()